@@ -268,6 +268,15 @@ def _drop_unused_qt_artifacts(items):
     return kept
 
 
+# Compile the locale JSONs into the memory-mapped binary catalog (locales/locales.bin) that the
+# runtime reads instead of parsing JSON at startup. Generated at build time, never committed; the
+# locales folder below ships both, so the JSON files remain a fallback.
+import sys as _sys
+_sys.path.insert(0, os.path.join(_spec_dir, '..', 'src'))
+from netspeedtray.constants.locale_catalog import compile_catalog
+_catalog = compile_catalog(os.path.join(_spec_dir, '..', 'src', 'netspeedtray', 'constants', 'locales'))
+print(f'[netspeedtray.spec] Locale catalog compiled: {_catalog}')
+
 a = Analysis(
     ['..\\src\\monitor.py'],
     pathex=[],
@@ -19,6 +19,11 @@ import sys
 import os
 from typing import Optional
 
+# `--profile-startup` must hook the import system before the heavy imports below, so it is checked
+# here rather than in main(). The profiler is stdlib-only; when the flag is absent this is a no-op.
+from netspeedtray.utils import startup_profiler
+startup_profiler.enable_from_argv(sys.argv)
+
 import win32gui
 import win32con
 import win32api
@@ -203,11 +208,13 @@ def main() -> int:
         # 2. Use the context manager to ensure only one instance is running.
         with SingleInstanceChecker():
             # 3. Load the application configuration from the file.
-            config_manager = ConfigManager()
-            config = config_manager.load()
+            with startup_profiler.profiler.phase("config_load"):
+                config_manager = ConfigManager()
+                config = config_manager.load()
 
             # 4. Initialize the internationalization module with the user's saved language.
-            i18n_strings = constants.i18n.get_i18n(config.get("language"))
+            with startup_profiler.profiler.phase("i18n_load"):
+                i18n_strings = constants.i18n.get_i18n(config.get("language"))
 
             # 4b. Flip the whole app to right-to-left when a Hebrew/RTL locale is active. This mirrors
             # every Qt layout (settings pages, Monitor, flyouts) for free; the widget's pixel-positioned
@@ -219,11 +226,12 @@ def main() -> int:
 
             # 5. Create and configure the main widget.
             taskbar_height = get_taskbar_height()
-            widget = NetworkSpeedWidget(
-                taskbar_height=taskbar_height,
-                config=config,
-                i18n=i18n_strings
-            )
+            with startup_profiler.profiler.phase("widget_construct"):
+                widget = NetworkSpeedWidget(
+                    taskbar_height=taskbar_height,
+                    config=config,
+                    i18n=i18n_strings
+                )
             widget.set_app_version(constants.app.VERSION)
             
             # 6. Configure the application to behave like a tray utility.
@@ -241,8 +249,14 @@ def main() -> int:
             signal.signal(signal.SIGINT, lambda s, f: QApplication.instance().quit())
             signal.signal(signal.SIGTERM, lambda s, f: QApplication.instance().quit())
 
-            # 8. Show the widget after a short delay to ensure the event loop is running.
-            QTimer.singleShot(500, widget.show)
+            # 8. Show the widget as soon as the event loop runs. The widget's own initial visibility
+            # check was queued first (in its constructor), so this still lands after it. There is no
+            # reason to wait longer: the DB opens on its worker thread and the first samples are
+            # buffered in memory until it is ready, so the first paint only needs config + fonts.
+            QTimer.singleShot(0, widget.show)
+            if startup_profiler.profiler.enabled:
+                # Write the report even if no speed ever arrives (e.g. no active interface).
+                QTimer.singleShot(startup_profiler.REPORT_TIMEOUT_MS, startup_profiler.profiler.finish)
 
             # 9. Start the application event loop.
             return app.exec()
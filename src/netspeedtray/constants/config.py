@@ -167,6 +167,7 @@ class ConfigConstants:
         "show_usage_on_hover": True,       # the hover card's data-usage rows (Today / This month)
         "show_hover_tips": True,           # the hover card's right-click/double-click gesture hint
         "pause_in_menu": False,            # opt-in: surface Pause/Resume in the right-click menu
+        "diagnostics_enabled": False,      # opt-in: hot-path timings (utils.instrumentation) + Monitor Diagnostics tab
         "dark_mode": DEFAULT_DARK_MODE,
         "history_period": data.history_period.DEFAULT_PERIOD,
         "legend_position": DEFAULT_LEGEND_POSITION,
@@ -199,6 +200,7 @@ class ConfigConstants:
         "app_activity_window_pos": None,
         "monitor_window_pos": None,
         "monitor_active_tab": None,    # last Monitor tab the user left (overview/network/hardware)
+        "monitor_recent_views": [],    # recent "tab:TIMELINE_*" choices the Monitor's prefetcher learns from
         # Monitor Hardware graph (6.x). Colors None == vendor-auto (AMD red / Intel blue / Nvidia green).
         "monitor_hw_graph_mode": "combined",   # combined | separate | toggle
         "monitor_cpu_graph_color": None,
@@ -301,6 +303,7 @@ class ConfigConstants:
         "show_usage_on_hover": {"type": bool, "default": True},
         "show_hover_tips": {"type": bool, "default": True},
         "pause_in_menu": {"type": bool, "default": False},
+        "diagnostics_enabled": {"type": bool, "default": False},
         "dark_mode": {"type": bool, "default": DEFAULT_DARK_MODE},
         "history_period": {"type": str, "default": data.history_period.DEFAULT_PERIOD, "choices": list(data.history_period.PERIOD_MAP.values())},
         "legend_position": {"type": str, "default": DEFAULT_LEGEND_POSITION, "choices": data.legend_position.UI_OPTIONS},
@@ -352,6 +355,7 @@ class ConfigConstants:
         "app_activity_window_pos": {"type": (dict, type(None)), "default": None},
         "monitor_window_pos": {"type": (dict, type(None)), "default": None},
         "monitor_active_tab": {"type": (str, type(None)), "default": None},
+        "monitor_recent_views": {"type": list, "default": [], "item_type": str},
         "monitor_hw_graph_mode": {"type": str, "default": "combined", "choices": ["combined", "separate", "toggle"]},
         "monitor_cpu_graph_color": {"type": (str, type(None)), "default": None},
         "monitor_gpu_graph_color": {"type": (str, type(None)), "default": None},
@@ -98,6 +98,9 @@ class HistoryPeriodConstants:
     RES_RAW_THRESHOLD: Final[int] = 6 * 3600       # Use Raw for < 6 hours (~21k pts max)
     RES_MINUTE_THRESHOLD: Final[int] = 3 * 86400   # Use Minute for < 3 days (~4.3k pts max)
     RES_HOUR_THRESHOLD: Final[int] = 90 * 86400    # Use Hour for < 90 days (Month=720 pts, Week=168 pts)
+
+    # Bin width (seconds) of each resolution get_target_resolution can pick.
+    RESOLUTION_SECONDS: Final[Dict[str, int]] = {'raw': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
     
     # Plotting resolution thresholds (seconds) - unused by current logic but kept for reference
     PLOT_MINUTE_THRESHOLD: Final[int] = 30 * 86400 # Use minute bins for < 30 days
@@ -181,6 +184,15 @@ class DataConstants:
     HARDWARE_STATS_TABLE_RAW: Final[str] = "hardware_stats_raw"
     HARDWARE_STATS_TABLE_MINUTE: Final[str] = "hardware_stats_minute"
     HARDWARE_STATS_TABLE_HOUR: Final[str] = "hardware_stats_hour"
+
+    # Partitioned raw tiers (v10+). The two raw tables above are the HOT partition every write lands in;
+    # maintenance seals it about once a day into <raw>_p<first timestamp>, listed in RAW_PARTITIONS_TABLE,
+    # and drops a sealed partition once it has been rolled up. Readers go through the *_ALL views, which
+    # union the hot table with every sealed partition.
+    SPEED_TABLE_RAW_ALL: Final[str] = "speed_history_raw_all"
+    HARDWARE_STATS_TABLE_RAW_ALL: Final[str] = "hardware_stats_raw_all"
+    RAW_PARTITIONS_TABLE: Final[str] = "raw_partitions"
+    RAW_PARTITION_SPAN_SEC: Final[int] = 86400
     
     # Legacy Schema (v1) - To be removed after full transition
     SPEED_TABLE: Final[str] = "speed_history"
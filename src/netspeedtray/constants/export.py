@@ -12,6 +12,7 @@ class ExportConstants:
     # Filename templates, using a clear timestamp format.
     CSV_SUGGESTED_NAME_TEMPLATE: Final[str] = "nst_history_{timestamp}.csv"
     IMAGE_SUGGESTED_NAME_TEMPLATE: Final[str] = "nst_graph_{timestamp}.png"
+    ARCHIVE_SUGGESTED_NAME_TEMPLATE: Final[str] = "nst_archive_{timestamp}.npz"
     
     # The format used to generate the {timestamp} placeholder.
     TIMESTAMP_FORMAT: Final[str] = "%Y%m%d_%H%M%S"
@@ -19,6 +20,14 @@ class ExportConstants:
     # Resolution for exported graph images.
     IMAGE_DPI: Final[int] = 150
 
+    # Rows per column chunk in a history archive (utils.history_archive): the most any export or import
+    # holds in memory at once, per tier.
+    ARCHIVE_CHUNK_ROWS: Final[int] = 65536
+
+    # Rows fetched per cursor step by the streaming history readers (WidgetState.iter_speed_history /
+    # iter_hardware_history) that feed the CSV export.
+    EXPORT_FETCH_ROWS: Final[int] = 4096
+
     def __init__(self) -> None:
         self.validate()
 
@@ -27,8 +36,14 @@ class ExportConstants:
              raise ValueError("CSV_SUGGESTED_NAME_TEMPLATE must contain {timestamp}")
         if "{timestamp}" not in self.IMAGE_SUGGESTED_NAME_TEMPLATE:
              raise ValueError("IMAGE_SUGGESTED_NAME_TEMPLATE must contain {timestamp}")
+        if "{timestamp}" not in self.ARCHIVE_SUGGESTED_NAME_TEMPLATE:
+             raise ValueError("ARCHIVE_SUGGESTED_NAME_TEMPLATE must contain {timestamp}")
         if self.IMAGE_DPI <= 0:
             raise ValueError("IMAGE_DPI must be positive")
+        if self.ARCHIVE_CHUNK_ROWS <= 0:
+            raise ValueError("ARCHIVE_CHUNK_ROWS must be positive")
+        if self.EXPORT_FETCH_ROWS <= 0:
+            raise ValueError("EXPORT_FETCH_ROWS must be positive")
 
 # Singleton instance for easy access
 export = ExportConstants()
\ No newline at end of file
@@ -20,6 +20,26 @@ class GraphConstants:
     MAX_DATA_POINTS: Final[int] = 500
     STATS_UPDATE_INTERVAL: Final[float] = 1.0
 
+    # --- Progressive loading (long hour/day-resolution timelines, see views/graph/progressive.py) ---
+    # A missing span longer than this is painted from the rollup tiers first, then refined.
+    PROGRESSIVE_MIN_SPAN_SEC: Final[int] = 86400
+    # Exact refinement chunks per progressive load (newest first; each one re-renders).
+    PROGRESSIVE_CHUNKS: Final[int] = 3
+    # How long bins loaded for one (interface, resolution) are reused before a full reload.
+    SERIES_CACHE_TTL_SEC: Final[float] = 300.0
+
+    # --- Idle prefetch (the Monitor's likely next views, see views/monitor/prefetch.py) ---
+    # Delay after the Monitor's first paint before the first speculative load.
+    PREFETCH_START_DELAY_MS: Final[int] = 1500
+    # Quiet time after a real load (period switch, live refresh, Overview reload) before prefetch resumes.
+    PREFETCH_IDLE_MS: Final[int] = 300
+    # How many predicted views are warmed per idle period.
+    PREFETCH_MAX_VIEWS: Final[int] = 3
+    # How long a prefetched (or last-rendered) view may be painted before its fresh load lands.
+    PREFETCH_CACHE_TTL_SEC: Final[float] = 120.0
+    # Recent view choices remembered (in config) to learn from.
+    PREFETCH_HISTORY_LEN: Final[int] = 40
+
     # --- Plotting and Theming ---
     MINIMUM_Y_AXIS_MBPS: Final[float] = 0.1 # Represents 100 Kbps
     # Use the master color palette as the single source of truth
@@ -42,6 +62,14 @@ class GraphConstants:
     def validate(self) -> None:
         if not self.WINDOW_TITLE:
             raise ValueError("WINDOW_TITLE must not be empty")
+        if self.PROGRESSIVE_CHUNKS < 1:
+            raise ValueError("PROGRESSIVE_CHUNKS must be at least 1")
+        if self.PROGRESSIVE_MIN_SPAN_SEC <= 0 or self.SERIES_CACHE_TTL_SEC <= 0:
+            raise ValueError("PROGRESSIVE_MIN_SPAN_SEC and SERIES_CACHE_TTL_SEC must be positive")
+        if self.PREFETCH_MAX_VIEWS < 0 or self.PREFETCH_HISTORY_LEN < 2:
+            raise ValueError("PREFETCH_MAX_VIEWS must be >= 0 and PREFETCH_HISTORY_LEN at least 2")
+        if self.PREFETCH_CACHE_TTL_SEC <= 0 or self.PREFETCH_IDLE_MS < 0 or self.PREFETCH_START_DELAY_MS < 0:
+            raise ValueError("PREFETCH_CACHE_TTL_SEC must be positive and the prefetch delays non-negative")
 
 # Singleton instance for easy access
 graph = GraphConstants()
\ No newline at end of file
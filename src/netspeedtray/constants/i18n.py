@@ -4,6 +4,10 @@ Internationalization strings for the NetSpeedTray application.
 This module loads user-facing strings from language-specific JSON files. It
 initializes a singleton `strings` instance which provides translated strings
 with a fallback to English (en_US).
+
+When the build has compiled the JSON files into `locales/locales.bin` (see
+`locale_catalog`), languages are served from that memory-mapped catalog instead:
+strings are decoded on first use rather than parsed up front.
 """
 
 import logging
@@ -11,7 +15,9 @@ import locale
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
+
+from netspeedtray.constants.locale_catalog import open_catalog
 
 logger = logging.getLogger("NetSpeedTray.I18n")
 strings: Optional["I18nStrings"] = None
@@ -77,12 +83,13 @@ class I18nStrings:
         Initialize the I18nStrings instance by loading language files.
         """
         self._locales_path = get_locales_path()
-        self._fallback_strings: Dict[str, str] = self._load_language("en_US")
+        self._catalog = open_catalog(self._locales_path)
+        self._fallback_strings: Mapping[str, str] = self._load_language("en_US")
 
         if not self._fallback_strings:
             raise RuntimeError("Failed to load base English (en_US) language file. Application cannot continue.")
 
-        self._strings: Dict[str, str] = {}
+        self._strings: Mapping[str, str] = {}
         self.language = ""
         self._determine_and_set_language(language_code)
 
@@ -96,8 +103,12 @@ class I18nStrings:
             except ValueError as e:
                 logger.error(f"I18n validation failed on initialization: {e}")
 
-    def _load_language(self, lang_code: str) -> Dict[str, str]:
-        """Loads a language dictionary from its JSON file."""
+    def _load_language(self, lang_code: str) -> Mapping[str, str]:
+        """Loads a language mapping: from the compiled catalog when available, else its JSON file."""
+        if self._catalog is not None:
+            view = self._catalog.language(lang_code)
+            if view is not None:
+                return view
         lang_file = self._locales_path / f"{lang_code}.json"
         if not lang_file.exists():
             logger.error(f"Language file not found: {lang_file}")
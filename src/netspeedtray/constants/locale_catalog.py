@@ -0,0 +1,291 @@
+"""
+Compiled, memory-mapped locale catalog.
+
+At build time every ``locales/*.json`` file is compiled into one binary file, ``locales/locales.bin``:
+the union of all keys is interned to integer ids (sorted, so the ids are stable), and every translated
+string lives once in a single UTF-8 blob. At runtime the file is memory-mapped and a lookup is a dict
+hit (key -> id), two integers read from the language's offset table, and a slice decode - done only for
+strings actually used, and cached after the first access. Nothing is parsed up front beyond the key
+table, so startup no longer pays for ``json.load`` of the active locale plus the en_US fallback, and
+untouched strings never become Python objects.
+
+The JSON files stay the source of truth. ``I18nStrings`` reads them directly when the catalog is
+missing or older than any JSON file (editing a locale from source), or when ``NST_I18N_JSON=1``.
+
+File layout (little-endian)::
+
+    header   magic "NSTL" | u16 version | u16 lang_count | u32 key_count
+             | u32 keys_offset | u32 langs_offset | u32 blob_offset | u32 blob_size
+    keys     key_count x (u16 byte_len, utf-8 bytes)          - sorted, id = position
+    langs    lang_count x (8-byte ascii code, u32 table_offset)
+    table    per language: key_count x (u32 blob_offset, u32 byte_len); len 0xFFFFFFFF = missing
+    blob     all strings, utf-8, concatenated
+
+Built by ``build/netspeedtray.spec`` via ``compile_catalog(locales_dir)``; the file is not committed.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("NetSpeedTray.I18n.Catalog")
+
+CATALOG_FILENAME = "locales.bin"
+FORCE_JSON_ENV = "NST_I18N_JSON"
+
+_MAGIC = b"NSTL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIII")
+_KEY_LEN = struct.Struct("<H")
+_LANG_ENTRY = struct.Struct("<8sI")
+_SLOT = struct.Struct("<II")
+_MISSING = 0xFFFFFFFF
+
+
+class CatalogError(ValueError):
+    """The catalog file is malformed or was written by an incompatible version."""
+
+
+# --- build time ----------------------------------------------------------------------------------
+def compile_catalog(locales_dir: Path, out_file: Optional[Path] = None) -> Path:
+    """Compile every ``*.json`` in ``locales_dir`` into one binary catalog. Returns the written path."""
+    locales_dir = Path(locales_dir)
+    out_file = Path(out_file) if out_file else locales_dir / CATALOG_FILENAME
+
+    languages: Dict[str, Dict[str, str]] = {}
+    for path in sorted(locales_dir.glob("*.json")):
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        strings = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                strings[key] = value
+            else:
+                logger.warning("%s: value for %r is not a string; left out of the catalog", path.name, key)
+        languages[path.stem] = strings
+    if not languages:
+        raise CatalogError(f"No locale JSON files found in {locales_dir}")
+
+    keys = sorted({k for strings in languages.values() for k in strings})
+    key_ids = {k: i for i, k in enumerate(keys)}
+
+    keys_section = bytearray()
+    for key in keys:
+        raw = key.encode("utf-8")
+        keys_section += _KEY_LEN.pack(len(raw)) + raw
+
+    blob = bytearray()
+    interned: Dict[str, Tuple[int, int]] = {}     # identical strings are stored once
+    tables: List[bytes] = []
+    for code, strings in languages.items():
+        slots = [(0, _MISSING)] * len(keys)
+        for key, value in strings.items():
+            loc = interned.get(value)
+            if loc is None:
+                raw = value.encode("utf-8")
+                loc = (len(blob), len(raw))
+                blob += raw
+                interned[value] = loc
+            slots[key_ids[key]] = loc
+        tables.append(b"".join(_SLOT.pack(off, ln) for off, ln in slots))
+
+    keys_offset = _HEADER.size
+    langs_offset = keys_offset + len(keys_section)
+    first_table = langs_offset + len(languages) * _LANG_ENTRY.size
+    table_size = len(keys) * _SLOT.size
+    blob_offset = first_table + len(languages) * table_size
+
+    langs_section = bytearray()
+    for i, code in enumerate(languages):
+        raw = code.encode("ascii")
+        if len(raw) > 8:
+            raise CatalogError(f"Locale code {code!r} is longer than 8 bytes")
+        langs_section += _LANG_ENTRY.pack(raw.ljust(8, b"\0"), first_table + i * table_size)
+
+    header = _HEADER.pack(_MAGIC, _VERSION, len(languages), len(keys),
+                          keys_offset, langs_offset, blob_offset, len(blob))
+    tmp = out_file.with_suffix(out_file.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(keys_section)
+        f.write(langs_section)
+        for table in tables:
+            f.write(table)
+        f.write(blob)
+    os.replace(tmp, out_file)
+    logger.info("Compiled %d locales / %d keys into %s (%d bytes of text)",
+                len(languages), len(keys), out_file, len(blob))
+    return out_file
+
+
+# --- runtime -------------------------------------------------------------------------------------
+class LocaleCatalog:
+    """A read-only, memory-mapped view of a compiled catalog."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse_index()
+        except Exception:
+            self._mm.close()
+            raise
+        self._views: Dict[str, "CatalogLanguage"] = {}
+        self._lock = threading.Lock()
+
+    def _parse_index(self) -> None:
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise CatalogError("catalog is truncated")
+        (magic, version, lang_count, key_count,
+         keys_offset, langs_offset, blob_offset, blob_size) = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise CatalogError(f"unsupported catalog (magic={magic!r}, version={version})")
+        if blob_offset + blob_size > len(mm):
+            raise CatalogError("catalog blob runs past the end of the file")
+
+        key_ids: Dict[str, int] = {}
+        pos = keys_offset
+        for i in range(key_count):
+            (n,) = _KEY_LEN.unpack_from(mm, pos)
+            pos += _KEY_LEN.size
+            key_ids[mm[pos:pos + n].decode("utf-8")] = i
+            pos += n
+        self._key_ids = key_ids
+
+        tables: Dict[str, int] = {}
+        for i in range(lang_count):
+            raw_code, table_offset = _LANG_ENTRY.unpack_from(mm, langs_offset + i * _LANG_ENTRY.size)
+            tables[raw_code.rstrip(b"\0").decode("ascii")] = table_offset
+        self._tables = tables
+        self._blob_offset = blob_offset
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self._tables)
+
+    @property
+    def key_count(self) -> int:
+        return len(self._key_ids)
+
+    def has_language(self, code: str) -> bool:
+        return code in self._tables
+
+    def language(self, code: str) -> Optional["CatalogLanguage"]:
+        """A lazily-decoding mapping for one language, or None if the catalog doesn't carry it."""
+        view = self._views.get(code)
+        if view is None and code in self._tables:
+            with self._lock:
+                view = self._views.setdefault(code, CatalogLanguage(self, self._tables[code]))
+        return view
+
+    def _lookup(self, table_offset: int, key: str) -> Optional[str]:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            return None
+        offset, length = _SLOT.unpack_from(self._mm, table_offset + key_id * _SLOT.size)
+        if length == _MISSING:
+            return None
+        start = self._blob_offset + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _has(self, table_offset: int, key: str) -> bool:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            return False
+        _, length = _SLOT.unpack_from(self._mm, table_offset + key_id * _SLOT.size)
+        return length != _MISSING
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class CatalogLanguage(Mapping):
+    """``Mapping[str, str]`` over one language of a catalog; strings are decoded on first access."""
+
+    __slots__ = ("_catalog", "_table", "_cache")
+
+    def __init__(self, catalog: LocaleCatalog, table_offset: int) -> None:
+        self._catalog = catalog
+        self._table = table_offset
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def get(self, key, default=None):
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._catalog._lookup(self._table, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self._catalog._has(self._table, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self._catalog._key_ids if self._catalog._has(self._table, k))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return self._catalog.key_count > 0
+
+
+def is_catalog_current(catalog_path: Path, locales_dir: Path) -> bool:
+    """Whether ``catalog_path`` can stand in for the JSON files.
+
+    A frozen build ships the catalog it was built with, so it is trusted as-is. From source, it must be
+    at least as new as every JSON file - otherwise a translator's edit would be masked by a stale
+    catalog - which costs one ``stat`` per locale, not a parse."""
+    try:
+        built = catalog_path.stat().st_mtime_ns
+    except OSError:
+        return False
+    if getattr(sys, "frozen", False):
+        return True
+    try:
+        return all(p.stat().st_mtime_ns <= built for p in locales_dir.glob("*.json"))
+    except OSError:
+        return False
+
+
+_catalogs: Dict[Path, Optional[LocaleCatalog]] = {}
+_catalogs_lock = threading.Lock()
+
+
+def open_catalog(locales_dir: Path) -> Optional[LocaleCatalog]:
+    """The shared catalog for ``locales_dir``, or None if it is absent, stale, disabled or unreadable
+    (the caller then reads the JSON files)."""
+    locales_dir = Path(locales_dir)
+    with _catalogs_lock:
+        if locales_dir in _catalogs:
+            return _catalogs[locales_dir]
+        catalog: Optional[LocaleCatalog] = None
+        path = locales_dir / CATALOG_FILENAME
+        if os.environ.get(FORCE_JSON_ENV):
+            logger.debug("%s set; reading locale JSON files directly.", FORCE_JSON_ENV)
+        elif not path.exists():
+            logger.debug("No compiled locale catalog at %s; reading JSON files.", path)
+        elif not is_catalog_current(path, locales_dir):
+            logger.info("Locale catalog %s is older than the JSON sources; reading JSON files.", path)
+        else:
+            try:
+                catalog = LocaleCatalog(path)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not open locale catalog %s (%s); reading JSON files.", path, e)
+        _catalogs[locales_dir] = catalog
+        return catalog
@@ -13,6 +13,32 @@ class TimeoutConstants:
     # Database related timeouts (seconds)
     DB_FLUSH_BATCH_SYNC_SLEEP: Final[float] = 0.1
     DB_BUSY_TIMEOUT_MS: Final[int] = 250
+    # Adaptive write scheduler (core.write_scheduler). The flush check runs every tick; pending rows go
+    # to disk once the oldest has waited out the deadline, which is STEADY normally, shrinks to MIN
+    # while something is reading history (a Monitor graph refresh) and grows to MAX after IDLE_AFTER
+    # without a read. MAX_ROWS bounds the in-memory batch whatever the deadline.
+    DB_FLUSH_TICK_MS: Final[int] = 1000
+    DB_FLUSH_DEADLINE_SEC: Final[float] = 10.0
+    DB_FLUSH_DEADLINE_MIN_SEC: Final[float] = 1.0
+    DB_FLUSH_DEADLINE_MAX_SEC: Final[float] = 30.0
+    DB_READ_PRESSURE_WINDOW_SEC: Final[float] = 15.0
+    DB_IDLE_AFTER_SEC: Final[float] = 120.0
+    DB_FLUSH_MAX_ROWS: Final[int] = 2000
+    # Read-connection pool (core.read_pool): at most POOL_SIZE connections shared by every reader;
+    # a read waits up to CHECKOUT_TIMEOUT for one to come back. STATEMENT_CACHE is sqlite3's
+    # per-connection prepared-statement cache (entries keyed by SQL text).
+    DB_READ_POOL_SIZE: Final[int] = 4
+    DB_READ_POOL_CHECKOUT_TIMEOUT_SEC: Final[float] = 5.0
+    DB_READ_STATEMENT_CACHE: Final[int] = 64
+    # Rows per fetchmany() when core.row_decoder decodes a result set into NumPy columns: bounds the
+    # transient tuples alive at once, however long the window.
+    DB_READ_FETCH_ROWS: Final[int] = 4096
+    # Incremental reclaim (auto_vacuum=INCREMENTAL): once maintenance leaves at least MIN_FREE_PAGES
+    # on the freelist, the DB worker returns them to the filesystem STEP_PAGES at a time whenever its
+    # queue has been idle for IDLE_SEC - never a full VACUUM rewrite blocking the write path.
+    DB_VACUUM_MIN_FREE_PAGES: Final[int] = 1000
+    DB_VACUUM_STEP_PAGES: Final[int] = 256
+    DB_VACUUM_IDLE_SEC: Final[float] = 0.5
 
     # System Event related intervals (milliseconds)
     TASKBAR_VALIDITY_CHECK_INTERVAL_MS: Final[int] = 3000
@@ -28,15 +54,31 @@ class TimeoutConstants:
     # Widget / UI Delays (milliseconds)
     WIDGET_INIT_DELAY_MS: Final[int] = 500
     GRAPH_CLOSE_REFRESH_DELAY_MS: Final[int] = 300
+
+    # Staged startup (milliseconds). Nothing here is needed to paint the first number, so it runs
+    # after it: the update checker + usage alerts are built once the widget is live, and the startup
+    # maintenance pass (aggregation/prune/VACUUM) waits until the DB worker has been ready a while.
+    DEFERRED_SERVICES_DELAY_MS: Final[int] = 3000
+    STARTUP_MAINTENANCE_DELAY_MS: Final[int] = 30000
+    UPDATE_CHECK_DELAY_MS: Final[int] = 5000
     
     # Thread / App Lifecycle (milliseconds/seconds)
     APP_CLOSE_WAIT_MS: Final[int] = 2000
     MONITOR_THREAD_STOP_WAIT_MS: Final[int] = 1000
     DB_INITIALIZATION_RETRY_DELAY_SEC: Final[float] = 2.0
 
-    # Hardware monitoring subprocess timeouts (seconds). 0.5s was too tight -
-    # a cold nvidia-smi can exceed it, intermittently dropping temp/power.
+    # Hardware monitoring subprocess timeouts (seconds). 0.5s was too tight for a one-shot query -
+    # a cold nvidia-smi can exceed it. Now the grace given to the streaming session to exit on stop.
     NVIDIA_SMI_TIMEOUT_SEC: Final[float] = 1.5
+    # The streaming nvidia-smi session (core.nvidia_smi_stream): one looping process prints a row per
+    # interval; a row older than the stale limit reads as N/A (and a silent process is restarted), and
+    # a session that dies without output is retried with doubling backoff up to the cap. The interval
+    # is the old one-shot poll's 5 s cadence - a faster loop keeps a discrete GPU from idling - and the
+    # stale limit allows three missed rows.
+    NVIDIA_SMI_STREAM_INTERVAL_MS: Final[int] = 5000
+    NVIDIA_SMI_STREAM_STALE_SEC: Final[float] = 15.0
+    NVIDIA_SMI_RESTART_BACKOFF_SEC: Final[float] = 1.0
+    NVIDIA_SMI_RESTART_BACKOFF_MAX_SEC: Final[float] = 60.0
 
     def __init__(self) -> None:
         self.validate()
@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional, TYPE_CHECKING
 from PyQt6.QtGui import QColor
 
 from netspeedtray import constants
+from netspeedtray.utils.instrumentation import registry as instrumentation
 from netspeedtray.utils.window_state import set_window_always_on_top
 from netspeedtray.utils.config import ConfigManager
 
@@ -222,7 +223,15 @@ class ConfigController:
             # _last_keep_on_top - this method runs on every throttled live-preview tick.
             self._apply_keep_on_top(w.config.get("keep_windows_on_top", False))
 
-            # 6. Schedule a repaint to reflect all changes.
+            # 6. Hot-path instrumentation on/off (Settings > Advanced > Diagnostics). Takes effect on
+            # the next measured call - no thread needs restarting. The same switch shows the open
+            # Monitor's Diagnostics tab, so re-gate its tabs now rather than on the next open.
+            instrumentation.set_enabled(bool(w.config.get("diagnostics_enabled", False)))
+            monitor = getattr(w, "monitor_window", None)
+            if monitor is not None:
+                monitor.refresh_tab_visibility()
+
+            # 7. Schedule a repaint to reflect all changes.
             w.update()
             
             self.logger.info("All settings applied successfully.")
@@ -7,12 +7,14 @@ including network speeds, CPU utilization, and GPU utilization.
 
 import logging
 import time
-from typing import Dict, Any, List, Optional, TYPE_CHECKING, Tuple
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional, TYPE_CHECKING, Tuple
 
 from PyQt6.QtCore import pyqtSignal, QObject
 import psutil
 
 from netspeedtray import constants
+from netspeedtray.utils.instrumentation import timed
 from netspeedtray.utils.network_utils import get_primary_interface_name
 
 if TYPE_CHECKING:
@@ -44,6 +46,15 @@ class StatsController(QObject):
     # can render the band tag and detect the Location-gated SSID case. Sub-polled ~5s, not per tick.
     network_identity_updated = pyqtSignal(object)
 
+    # Replay hooks (core.stats_trace). None = the live sources: time.monotonic(), datetime.now() and the
+    # routing lookup. A trace replay points them at the trace so a compressed replay sees exactly the
+    # recorded intervals, timestamps and primary interface. ``trace_recorder`` (when recording) is told
+    # about primary-interface changes, which the stats payload doesn't carry.
+    clock: Optional[Callable[[], float]] = None
+    wall_clock: Optional[Callable[[], datetime]] = None
+    primary_resolver: Optional[Callable[[], Optional[str]]] = None
+    trace_recorder = None
+
 
     def __init__(self, config: Dict[str, Any], widget_state: 'WidgetState') -> None:
         super().__init__()
@@ -59,6 +70,9 @@ class StatsController(QObject):
         self.primary_interface: Optional[str] = None
         self.last_primary_check_time: float = 0.0
         self.repriming_needed: int = 0
+        # Monotonic time of the previous hardware tick, so each hardware sample is stored with the
+        # interval it actually covers (0.0 = no previous tick yet).
+        self._last_hw_time: float = 0.0
         
         from collections import deque
         self.recent_speeds: Dict[str, deque] = {}
@@ -100,6 +114,17 @@ class StatsController(QObject):
         self.logger.debug("View set and signals connected.")
 
 
+    def _monotonic(self) -> float:
+        clock = getattr(self, "clock", None)
+        return clock() if clock is not None else time.monotonic()
+
+
+    def _wall_now(self) -> Optional[datetime]:
+        """The sample timestamp to store, or None to let WidgetState stamp it with datetime.now()."""
+        return self.wall_clock() if self.wall_clock is not None else None
+
+
+    @timed("controller.handle_stats")
     def handle_stats(self, stats: Dict[str, Any]) -> None:
         """
         Unified handler for all hardware statistics.
@@ -114,6 +139,8 @@ class StatsController(QObject):
             self.network_identity_updated.emit(stats['network_identity'])
 
         if 'cpu' in stats or 'gpu' in stats:
+            hw_interval = self._hardware_interval()
+            stamp = self._wall_now()
             cpu = stats.get('cpu')
             gpu = stats.get('gpu')
             ram_used = stats.get('ram_used')
@@ -125,11 +152,11 @@ class StatsController(QObject):
             if cpu is not None:
                 self.cpu_usage_updated.emit(cpu)
                 if self.widget_state:
-                    self.widget_state.add_hardware_stat('cpu', cpu)
+                    self.widget_state.add_hardware_stat('cpu', cpu, interval=hw_interval, now=stamp)
             if gpu is not None:
                 self.gpu_usage_updated.emit(gpu)
                 if self.widget_state:
-                    self.widget_state.add_hardware_stat('gpu', gpu)
+                    self.widget_state.add_hardware_stat('gpu', gpu, interval=hw_interval, now=stamp)
             # GPU presence (no-GPU boxes enumerate zero Engine counters): let the Monitor's at-a-glance
             # tiles hide the GPU rather than show a permanent 0%. LATCH it - only ever set True, never
             # back to False - so a transient empty-counter poll (re-init, driver hiccup) can't flicker
@@ -166,10 +193,11 @@ class StatsController(QObject):
                 for key in ('cpu_temp', 'gpu_temp', 'cpu_power', 'gpu_power', 'system_power'):
                     v = stats.get(key)
                     if v is not None and v > 0:
-                        self.widget_state.add_hardware_stat(key, float(v))
+                        self.widget_state.add_hardware_stat(key, float(v), interval=hw_interval, now=stamp)
                 cp, gp = stats.get('cpu_power'), stats.get('gpu_power')
                 if (cp is not None and cp > 0) or (gp is not None and gp > 0):
-                    self.widget_state.add_hardware_stat('total_power', float(cp or 0.0) + float(gp or 0.0))
+                    self.widget_state.add_hardware_stat('total_power', float(cp or 0.0) + float(gp or 0.0),
+                                                        interval=hw_interval, now=stamp)
 
             # 4. Handle RAM / VRAM Info
             if stats.get('ram_used') is not None and stats.get('ram_total') is not None:
@@ -177,7 +205,7 @@ class StatsController(QObject):
                 # Persist RAM% to the same 3-tier history as cpu/gpu (the pipeline is stat_type-generic)
                 # so the Monitor can graph RAM over time and the Overview RAM sparkline is DB-backed.
                 if self.widget_state and ram_total and ram_total > 0:
-                    self.widget_state.add_hardware_stat('ram', (ram_used / ram_total) * 100.0)
+                    self.widget_state.add_hardware_stat('ram', (ram_used / ram_total) * 100.0, interval=hw_interval, now=stamp)
                 
             if stats.get('vram_used') is not None:
                 v_total = stats.get('vram_total')
@@ -185,9 +213,24 @@ class StatsController(QObject):
                 self.vram_info_updated.emit(stats['vram_used'], v_total_val)
 
 
+    def _hardware_interval(self) -> Optional[float]:
+        """Seconds since the previous hardware tick, or None for the first tick and after a gap
+        (sleep, a stalled thread) - the same validity window the network path uses to re-prime, so a
+        resume doesn't credit the hours asleep as sampled time."""
+        now = self._monotonic()
+        last, self._last_hw_time = self._last_hw_time, now
+        if last <= 0.0:
+            return None
+        elapsed = now - last
+        update_interval = self.config.get("update_rate", 1.0)
+        if elapsed <= 0.0 or elapsed > max(10.0, update_interval * 5.0):
+            return None
+        return elapsed
+
+
     def _handle_network_counters(self, current_counters: Dict[str, Any]) -> None:
         """Processes raw network counters (logic moved from handle_network_counters)."""
-        current_time = time.monotonic()
+        current_time = self._monotonic()
         
         if not current_counters:
             self.display_speed_updated.emit(0.0, 0.0)
@@ -296,7 +339,11 @@ class StatsController(QObject):
         agg_upload, agg_download = self._aggregate_for_display(self.current_speed_data)
 
         if self.current_speed_data and self.widget_state:
-            self.widget_state.add_speed_data(self.current_speed_data, aggregated_up=agg_upload, aggregated_down=agg_download)
+            # time_diff is the monotonic span these rates were measured over; storing it with the row
+            # makes the DB's byte totals rate × the real interval (SMART mode, rate changes, jitter).
+            self.widget_state.add_speed_data(self.current_speed_data, aggregated_up=agg_upload,
+                                             aggregated_down=agg_download, interval=time_diff,
+                                             now=self._wall_now())
 
         # Feed the odometer the exact aggregated bytes transferred this poll (same interface selection
         # as the display, but raw deltas not rates). Gated on byte_deltas, NOT current_speed_data: when
@@ -372,7 +419,8 @@ class StatsController(QObject):
         every _PRIMARY_REFRESH_SEC instead of every poll - keeping the GUI thread
         responsive in the default 'auto' mode (H1). A NIC change is picked up within the
         refresh window (the speed briefly attributes to the old primary)."""
-        now = time.monotonic()
+        # (Attributes read via getattr/unbound calls: this method is also exercised on bare stand-ins.)
+        now = StatsController._monotonic(self)
         # Throttle on ELAPSED TIME ALONE. This used to also require `primary_interface is not None`,
         # which meant the cache stopped applying in exactly the case it was built for: with no route
         # (offline, VPN dropping, waking up), the lookup returns None, so the guard fell through and
@@ -384,13 +432,15 @@ class StatsController(QObject):
         self.last_primary_check_time = now
         previous = self.primary_interface
         try:
-            self.primary_interface = get_primary_interface_name()
+            self.primary_interface = (getattr(self, "primary_resolver", None) or get_primary_interface_name)()
         except Exception:
             self.primary_interface = None
         if previous != self.primary_interface:
             self.logger.info(
                 "Primary network interface changed: %r -> %r", previous, self.primary_interface
             )
+            if getattr(self, "trace_recorder", None) is not None:
+                self.trace_recorder.note_primary(self.primary_interface)
 
 
     def get_available_interfaces(self) -> List[str]:
@@ -13,11 +13,16 @@ import shutil
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
 from netspeedtray import constants
+from netspeedtray.core.write_scheduler import WriteBatch, WriteMetrics
+from netspeedtray.utils.instrumentation import registry as instrumentation
+
+if TYPE_CHECKING:   # numpy-backed; imported lazily by _import_archive
+    from netspeedtray.utils.history_archive import ArchiveImport
 
 # Logger Setup
 logger = logging.getLogger("NetSpeedTray.Core.Database")
@@ -30,8 +35,11 @@ class DatabaseWorker(QThread):
     """
     error = pyqtSignal(str)
     database_updated = pyqtSignal()
+    # Emitted once, from the worker thread, after the connection is open and the schema is migrated /
+    # indexed. Until then WidgetState keeps its samples in memory instead of queueing them (staged boot).
+    ready = pyqtSignal()
 
-    _DB_VERSION = 7  # Covering indexes, metadata, eager aggregation, sample_count, hardware stats, hardware hourly, usage_counter (data-cap odometer)
+    _DB_VERSION = 10  # Covering indexes, metadata, eager aggregation, sample_count, hardware stats, hardware hourly, usage_counter (data-cap odometer), per-sample capture interval, incremental auto-vacuum, partitioned raw tiers
 
     def __init__(self, db_path: Path, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -41,7 +49,25 @@ class DatabaseWorker(QThread):
         # no 100ms busy-poll, lower latency, near-zero idle CPU. None is a wake-up sentinel.
         self._queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
         self._stop_event = threading.Event()
+        self._ready_event = threading.Event()
         self.logger = logging.getLogger(f"NetSpeedTray.{self.__class__.__name__}")
+        # Batched-write accounting: what each persist transaction cost, and how many persist tasks are
+        # queued or running (a reader with nothing outstanding needs no FIFO barrier).
+        self.write_metrics = WriteMetrics()
+        self._outstanding_writes = 0
+        self._outstanding_lock = threading.Lock()
+        # WriteBatches queued or mid-commit, by id. Readers merge their rows into query results (the
+        # read-your-writes overlay in WidgetState) so a read never has to wait for them to land.
+        self._inflight: Dict[int, WriteBatch] = {}
+        # Idle-time space reclaim (see _reclaim_step): set when maintenance leaves enough free pages,
+        # cleared once the freelist is empty. The counters are written here and read from any thread.
+        self._reclaim_due = False
+        # Set when a roll-up DROPs a sealed raw partition: those pages are released whole and the hot
+        # table never grows back into them, so the next freelist refresh queues reclaim for any of them.
+        self._partitions_dropped = False
+        self._reclaim_lock = threading.Lock()
+        self._reclaim_stats: Dict[str, Any] = {"reclaimed_pages": 0, "reclaim_steps": 0,
+                                               "free_pages": 0, "last_reclaim_ms": 0.0}
 
 
     def run(self) -> None:
@@ -70,25 +96,44 @@ class DatabaseWorker(QThread):
             return
 
         self.logger.debug("Database worker thread started successfully.")
+        self._ready_event.set()
+        self.ready.emit()
+        self._refresh_free_pages()
         # Drain fully before exiting: tasks already enqueued (incl. the final flush/odometer
         # tail) are processed before we honor the stop flag - we only break when the queue is
-        # empty AND stop is set. The blocking get() replaces the old 100ms busy-poll.
+        # empty AND stop is set. The blocking get() replaces the old 100ms busy-poll. Only while
+        # free pages are waiting to be reclaimed does get() time out: that idle gap between write
+        # batches is where a reclaim step runs. Otherwise the thread sleeps until a task (or stop()'s
+        # sentinel) arrives - _refresh_free_pages sets _reclaim_due on this thread, before the next get().
         while True:
+            if self._stop_event.is_set() and self._queue.empty():
+                break
             try:
-                item = self._queue.get(timeout=0.5)
+                if self._reclaim_due:
+                    item = self._queue.get(timeout=constants.timeouts.DB_VACUUM_IDLE_SEC)
+                else:
+                    item = self._queue.get()
             except queue.Empty:
-                if self._stop_event.is_set():
-                    break
+                try:
+                    self._reclaim_step()
+                except sqlite3.Error as e:
+                    self.logger.warning("Incremental vacuum step failed; pausing reclaim: %s", e)
+                    self._reclaim_due = False
                 continue
             if item is None:
                 continue  # wake-up sentinel from stop(); re-check the loop condition
             task, data = item
+            started = instrumentation.begin()
             try:
                 self._execute_task(task, data)
             except sqlite3.Error as e:
                 self.logger.error("Database error during task execution: %s", e)
                 if "closed" in str(e).lower() or "database is locked" in str(e).lower():
                     self._reconnect()
+            if started:
+                # Per task type: a maintenance pass and a 60-row persist are different animals.
+                instrumentation.end(f"database.{task}", started)
+                instrumentation.level("database.queue_depth", self.queue_depth())
 
         self._close_connection()
 
@@ -103,10 +148,36 @@ class DatabaseWorker(QThread):
             pass
 
 
+    def is_ready(self) -> bool:
+        """True once the schema is initialized and the worker is draining its queue. Thread-safe."""
+        return self._ready_event.is_set()
+
+
     def enqueue_task(self, task: str, data: Any = None) -> None:
         """Adds a task to the worker's queue for asynchronous execution."""
+        if task in self._WRITE_TASKS:
+            with self._outstanding_lock:
+                self._outstanding_writes += 1
+                if isinstance(data, WriteBatch):
+                    self._inflight[id(data)] = data
         self._queue.put((task, data))
 
+    _WRITE_TASKS = frozenset({"persist_batch", "persist_speed", "persist_hardware", "persist_usage"})
+
+    def outstanding_writes(self) -> int:
+        """Persist tasks enqueued but not yet committed. Thread-safe."""
+        with self._outstanding_lock:
+            return self._outstanding_writes
+
+    def queue_depth(self) -> int:
+        """Tasks waiting in the worker's queue (approximate, like ``Queue.qsize``). Thread-safe."""
+        return self._queue.qsize()
+
+    def inflight_batches(self) -> List[WriteBatch]:
+        """WriteBatches enqueued but not yet committed (or rolled back). Thread-safe."""
+        with self._outstanding_lock:
+            return list(self._inflight.values())
+
 
     def _execute_task(self, task: str, data: Any) -> None:
         """Dispatches a task to the appropriate handler method."""
@@ -120,10 +191,12 @@ class DatabaseWorker(QThread):
                 pass
             return
         handlers = {
+            "persist_batch": self._persist_write_batch,
             "persist_speed": self._persist_speed_batch,
             "persist_hardware": self._persist_hardware_batch,
             "persist_usage": self._persist_usage,
             "maintenance": self._run_maintenance,
+            "import_archive": self._import_archive,
         }
         handler = handlers.get(task)
         if handler:
@@ -135,7 +208,13 @@ class DatabaseWorker(QThread):
                     handler(data)
             except sqlite3.Error as e:
                 self.logger.error("Database error executing task '%s': %s", task, e)
+                instrumentation.count("database.task_errors")
                 self.error.emit(f"Database error: {e}")
+            finally:
+                if task in self._WRITE_TASKS:
+                    with self._outstanding_lock:
+                        self._outstanding_writes = max(0, self._outstanding_writes - 1)
+                        self._inflight.pop(id(data), None)
         else:
             self.logger.warning("Unknown database task requested: %s", task)
 
@@ -144,6 +223,9 @@ class DatabaseWorker(QThread):
         """Establishes the SQLite connection and sets PRAGMAs for performance."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.db_path, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        # Must precede journal_mode (and the first CREATE TABLE) to take effect on a new file; on an
+        # existing one it only arms the next VACUUM, which is how _migrate_v8_to_v9 converts it.
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
         self.conn.execute("PRAGMA journal_mode = WAL;")
         self.conn.execute("PRAGMA foreign_keys = ON;")
         self.conn.execute("PRAGMA busy_timeout = 5000;")
@@ -288,6 +370,265 @@ class DatabaseWorker(QThread):
             self.conn.rollback()
             raise 
 
+    def _migrate_v9_to_v10(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Migration v9 to v10: partition the raw tiers (see _seal_raw_partitions).
+
+        The existing raw tables become the hot partitions, unchanged. This adds the partition catalogue
+        and the *_ALL reader views, and starts the first partition's span now. Rows already past the
+        24h cutoff are rolled up by the next maintenance pass through the old DELETE path, once.
+        """
+        self.logger.info("Executing v9->v10 migration: partitioning the raw tiers.")
+        cursor.execute(self._RAW_PARTITIONS_DDL)
+        cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('raw_sealed_at', ?)",
+                       (str(int(datetime.now().timestamp())),))
+        self._create_raw_views(cursor)
+
+    # --- partitioned raw tiers (v10) -----------------------------------------------------------------
+    # Retention used to DELETE every raw row past the 24h cutoff, hour by hour: B-tree page churn, a
+    # growing freelist and the VACUUMs that followed. Now the raw tables are only the HOT partition.
+    # About once a day (RAW_PARTITION_SPAN_SEC) maintenance seals it: ALTER TABLE ... RENAME to
+    # <raw>_p<first timestamp>, a catalogue row with its time range, and a fresh empty hot table. A sealed
+    # partition whose newest row is past the cutoff is rolled up into the minute tier in one sequential
+    # read and DROPped. The *_ALL views union hot + sealed for readers. So the raw tier holds the last 24h
+    # rounded out to whole partitions - 24 to 48h - and never loses a row to a DELETE.
+    _RAW_TIERS = (
+        ("speed", constants.data.SPEED_TABLE_RAW, constants.data.SPEED_TABLE_RAW_ALL,
+         "timestamp, interface_name, upload_bytes_sec, download_bytes_sec, interval_sec"),
+        ("hardware", constants.data.HARDWARE_STATS_TABLE_RAW, constants.data.HARDWARE_STATS_TABLE_RAW_ALL,
+         "timestamp, stat_type, value, interval_sec"),
+    )
+
+    # The hot raw tables: DDL shared by the fresh build and every seal.
+    _RAW_TABLE_DDL = {
+        "speed": f"""
+            CREATE TABLE {constants.data.SPEED_TABLE_RAW} (
+                timestamp INTEGER NOT NULL, interface_name TEXT NOT NULL,
+                upload_bytes_sec REAL NOT NULL, download_bytes_sec REAL NOT NULL,
+                interval_sec REAL,
+                PRIMARY KEY (timestamp, interface_name)
+            );
+            CREATE INDEX idx_raw_timestamp ON {constants.data.SPEED_TABLE_RAW} (timestamp DESC);
+            CREATE INDEX idx_{constants.data.SPEED_TABLE_RAW}_iface_ts ON {constants.data.SPEED_TABLE_RAW} (interface_name, timestamp);
+        """,
+        "hardware": f"""
+            CREATE TABLE {constants.data.HARDWARE_STATS_TABLE_RAW} (
+                timestamp INTEGER NOT NULL, stat_type TEXT NOT NULL, value REAL NOT NULL,
+                interval_sec REAL,
+                PRIMARY KEY (timestamp, stat_type)
+            );
+            CREATE INDEX idx_hw_raw_timestamp ON {constants.data.HARDWARE_STATS_TABLE_RAW} (timestamp DESC);
+            CREATE INDEX idx_{constants.data.HARDWARE_STATS_TABLE_RAW}_type_ts ON {constants.data.HARDWARE_STATS_TABLE_RAW} (stat_type, timestamp);
+        """,
+    }
+
+    _RAW_PARTITIONS_DDL = f"""
+        CREATE TABLE IF NOT EXISTS {constants.data.RAW_PARTITIONS_TABLE} (
+            name TEXT PRIMARY KEY, tier TEXT NOT NULL,
+            min_ts INTEGER NOT NULL, max_ts INTEGER NOT NULL, sealed_at INTEGER NOT NULL
+        )"""
+
+    def _sealed_partitions(self, cursor: sqlite3.Cursor, tier: str, before: Optional[int] = None) -> List[str]:
+        """Sealed partitions of ``tier``, oldest first; only those entirely older than ``before`` if given."""
+        if before is None:
+            cursor.execute(f"SELECT name FROM {constants.data.RAW_PARTITIONS_TABLE} WHERE tier = ? ORDER BY min_ts",
+                           (tier,))
+        else:
+            cursor.execute(f"SELECT name FROM {constants.data.RAW_PARTITIONS_TABLE} "
+                           f"WHERE tier = ? AND max_ts < ? ORDER BY min_ts", (tier, before))
+        return [r[0] for r in cursor.fetchall()]
+
+    def _drop_raw_views(self, cursor: sqlite3.Cursor) -> None:
+        for _, _, view, _ in self._RAW_TIERS:
+            cursor.execute(f"DROP VIEW IF EXISTS {view}")
+
+    def _create_raw_views(self, cursor: sqlite3.Cursor) -> None:
+        """(Re)create the *_ALL views over the hot table and every sealed partition of each raw tier."""
+        self._drop_raw_views(cursor)
+        for tier, hot, view, cols in self._RAW_TIERS:
+            sources = [hot] + self._sealed_partitions(cursor, tier)
+            cursor.execute(f"CREATE VIEW {view} AS " +
+                           " UNION ALL ".join(f"SELECT {cols} FROM {t}" for t in sources))
+
+    def _seal_raw_partitions(self, cursor: sqlite3.Cursor, now: datetime) -> bool:
+        """
+        Seal the hot raw tables once they have been filling for RAW_PARTITION_SPAN_SEC: rename each to a
+        partition, record its range, and recreate an empty hot table. Only schema operations - no row is
+        copied or deleted. The views are dropped first so the RENAME doesn't rewrite them. Returns True
+        if the span had elapsed.
+        """
+        now_ts = int(now.timestamp())
+        row = cursor.execute("SELECT value FROM metadata WHERE key = 'raw_sealed_at'").fetchone()
+        sealed_at = int(row[0]) if (row and str(row[0]).isdigit()) else 0
+        if now_ts - sealed_at < constants.data.RAW_PARTITION_SPAN_SEC:
+            return False
+        if not self.conn.in_transaction:
+            cursor.execute("BEGIN")          # rename + recreate must be all-or-nothing
+        self._drop_raw_views(cursor)
+        for tier, hot, _, _ in self._RAW_TIERS:
+            lo, hi = cursor.execute(f"SELECT MIN(timestamp), MAX(timestamp) FROM {hot}").fetchone()
+            if lo is None:
+                continue                     # nothing written this span: keep the empty hot table
+            name = f"{hot}_p{int(lo)}"
+            if cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone():
+                name = f"{name}_{now_ts}"
+            cursor.execute(f"ALTER TABLE {hot} RENAME TO {name}")
+            # The hot table's secondary indexes moved with it; their names belong to the new hot table.
+            # A sealed partition keeps its primary key (timestamp-leading, so window reads still seek)
+            # plus, for hardware, the per-stat index the history reads use.
+            for (idx,) in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                         "AND sql IS NOT NULL", (name,)).fetchall():
+                cursor.execute(f"DROP INDEX {idx}")
+            if tier == "hardware":
+                cursor.execute(f"CREATE INDEX idx_{name}_type_ts ON {name} (stat_type, timestamp)")
+            for statement in self._RAW_TABLE_DDL[tier].split(";"):
+                if statement.strip():
+                    cursor.execute(statement)
+            cursor.execute(f"INSERT INTO {constants.data.RAW_PARTITIONS_TABLE} (name, tier, min_ts, max_ts, sealed_at) "
+                           "VALUES (?, ?, ?, ?, ?)", (name, tier, int(lo), int(hi), now_ts))
+            self.logger.info("Sealed raw %s partition %s (%d..%d).", tier, name, int(lo), int(hi))
+        cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('raw_sealed_at', ?)", (str(now_ts),))
+        self._create_raw_views(cursor)
+        return True
+
+    def _roll_up_raw_tier(self, cursor: sqlite3.Cursor, tier: str, rollup_sql: str, cutoff: int) -> None:
+        """
+        Roll raw rows older than ``cutoff`` into the minute tier. ``rollup_sql`` is an INSERT ... SELECT
+        with a ``{source}`` placeholder and one ``?`` for the cutoff.
+
+        Sealed partitions entirely past the cutoff are read whole and DROPped. The hot table only holds
+        such rows when it predates partitioning (a pre-v10 backlog) or missed its seal; those still take
+        the old aggregate-then-DELETE path.
+        """
+        hot = next(t[1] for t in self._RAW_TIERS if t[0] == tier)
+        sealed = self._sealed_partitions(cursor, tier, before=cutoff)
+        if sealed:
+            self._drop_raw_views(cursor)
+            for name in sealed:
+                cursor.execute(rollup_sql.format(source=name), (cutoff,))
+                rolled = cursor.rowcount
+                cursor.execute(f"DROP TABLE {name}")
+                cursor.execute(f"DELETE FROM {constants.data.RAW_PARTITIONS_TABLE} WHERE name = ?", (name,))
+                self._partitions_dropped = True
+                self.logger.debug("Rolled up raw %s partition %s into %d minute rows and dropped it.",
+                                  tier, name, rolled)
+            self._create_raw_views(cursor)
+
+        cursor.execute(rollup_sql.format(source=hot), (cutoff,))
+        if cursor.rowcount > 0: self.logger.debug("Aggregated %d per-minute %s records.", cursor.rowcount, tier)
+        cursor.execute(f"DELETE FROM {hot} WHERE timestamp < ?", (cutoff,))
+        if cursor.rowcount > 0: self.logger.debug("Pruned %d raw %s records after aggregation.", cursor.rowcount, tier)
+
+    def _migrate_v8_to_v9(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Migration v8 to v9: switch the file to auto_vacuum=INCREMENTAL.
+
+        Maintenance used to reclaim pruned space with a full VACUUM on the worker thread, holding every
+        queued write and flush barrier behind a whole-file rewrite. With incremental auto-vacuum the
+        freelist is handed back a few pages at a time between write batches (_reclaim_step). Changing
+        the mode of an existing file needs one last VACUUM, done here - at startup, on the worker, while
+        the staged boot buffers samples in memory - and never again.
+        """
+        self._enable_incremental_vacuum()
+
+    def _enable_incremental_vacuum(self) -> None:
+        """Make the open database incremental-auto-vacuum, rewriting it once if it isn't yet."""
+        if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:   # 2 = INCREMENTAL
+            return
+        if self.conn.in_transaction:
+            self.conn.commit()        # VACUUM can't run inside a transaction
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+        self.logger.info("Converting database to incremental auto-vacuum (one-time VACUUM)...")
+        self.conn.execute("VACUUM;")
+
+    def _refresh_free_pages(self) -> int:
+        """Re-read the freelist and decide whether the idle reclaimer has work.
+
+        A small freelist is normally left for new rows to reuse, but not after a raw partition was
+        dropped (``_partitions_dropped``): then any free page is reclaimed."""
+        if self.conn is None:
+            return 0
+        try:
+            free_pages = int(self.conn.execute("PRAGMA freelist_count").fetchone()[0])
+            incremental = self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        except sqlite3.Error as e:
+            self.logger.debug("Could not read the freelist: %s", e)
+            return 0
+        with self._reclaim_lock:
+            self._reclaim_stats["free_pages"] = free_pages
+        dropped, self._partitions_dropped = self._partitions_dropped, False
+        threshold = 1 if dropped else constants.timeouts.DB_VACUUM_MIN_FREE_PAGES
+        if incremental and free_pages >= threshold:
+            self._reclaim_due = True
+        return free_pages
+
+    def _reclaim_step(self, pages: int = constants.timeouts.DB_VACUUM_STEP_PAGES) -> int:
+        """
+        Return up to ``pages`` free pages to the filesystem, if maintenance left a freelist worth
+        reclaiming. Runs on the worker between write batches; each step is one short write transaction,
+        so a persist queued behind it waits milliseconds, not a full-file rewrite. Returns the pages
+        reclaimed (0 when there is nothing to do).
+        """
+        if not self._reclaim_due or self.conn is None:
+            return 0
+        started = time.perf_counter()
+        before = int(self.conn.execute("PRAGMA freelist_count").fetchone()[0])
+        # executescript steps the pragma to completion; a plain execute() frees a single page.
+        self.conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        after = int(self.conn.execute("PRAGMA freelist_count").fetchone()[0])
+        reclaimed = max(0, before - after)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._reclaim_lock:
+            self._reclaim_stats["reclaimed_pages"] += reclaimed
+            self._reclaim_stats["reclaim_steps"] += 1
+            self._reclaim_stats["free_pages"] = after
+            self._reclaim_stats["last_reclaim_ms"] = elapsed_ms
+        if after == 0 or reclaimed == 0:
+            self._reclaim_due = False
+            self.logger.info("Incremental vacuum done: %d pages reclaimed in total.",
+                             self._reclaim_stats["reclaimed_pages"])
+        else:
+            self.logger.debug("Reclaimed %d pages in %.1f ms (%d still free).", reclaimed, elapsed_ms, after)
+        return reclaimed
+
+    def reclaim_stats(self) -> Dict[str, Any]:
+        """Space-reclaim counters: pages reclaimed so far, steps taken, current freelist. Thread-safe."""
+        with self._reclaim_lock:
+            return dict(self._reclaim_stats)
+
+    def _migrate_v7_to_v8(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Migration v7 to v8: record the capture interval of every sample.
+
+        - interval_sec on both raw tiers: the monotonic seconds the sample actually covers.
+        - upload_bytes / download_bytes on the speed rollups: the integrated byte count of the bucket.
+        - covered_sec on every rollup: the seconds of the bucket that samples actually covered.
+
+        All nullable: pre-v8 rows have no recorded interval and stay NULL, and the readers fall back to
+        the old nominal-interval estimate for exactly those rows.
+        """
+        self.logger.info("Executing v7->v8 migration: Adding per-sample capture interval columns.")
+        columns = [
+            (constants.data.SPEED_TABLE_RAW, "interval_sec"),
+            (constants.data.HARDWARE_STATS_TABLE_RAW, "interval_sec"),
+            (constants.data.SPEED_TABLE_MINUTE, "upload_bytes"),
+            (constants.data.SPEED_TABLE_MINUTE, "download_bytes"),
+            (constants.data.SPEED_TABLE_MINUTE, "covered_sec"),
+            (constants.data.SPEED_TABLE_HOUR, "upload_bytes"),
+            (constants.data.SPEED_TABLE_HOUR, "download_bytes"),
+            (constants.data.SPEED_TABLE_HOUR, "covered_sec"),
+            (constants.data.HARDWARE_STATS_TABLE_MINUTE, "covered_sec"),
+            (constants.data.HARDWARE_STATS_TABLE_HOUR, "covered_sec"),
+        ]
+        for table, column in columns:
+            try:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} REAL")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" in str(e).lower():
+                    self.logger.warning("%s.%s column already exists.", table, column)
+                else:
+                    raise
+
     def _migrate_v6_to_v7(self, cursor: sqlite3.Cursor) -> None:
         """Migration v6 to v7: Add the usage_counter odometer table for the data-cap feature."""
         self.logger.info("Executing v6->v7 migration: Adding usage_counter table.")
@@ -444,6 +785,8 @@ class DatabaseWorker(QThread):
                       constants.data.HARDWARE_STATS_TABLE_RAW, constants.data.HARDWARE_STATS_TABLE_MINUTE,
                       constants.data.HARDWARE_STATS_TABLE_HOUR, constants.data.USAGE_COUNTER_TABLE]:
             cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        self._drop_raw_views(cursor)
+        cursor.execute(f"DROP TABLE IF EXISTS {constants.data.RAW_PARTITIONS_TABLE}")
         cursor.execute("DROP TABLE IF EXISTS metadata")
         cursor.execute("PRAGMA foreign_keys = ON;")
 
@@ -453,19 +796,17 @@ class DatabaseWorker(QThread):
             CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
             INSERT INTO metadata (key, value) VALUES ('db_version', '{self._DB_VERSION}');
             INSERT INTO metadata (key, value) VALUES ('created_at', '{now_ts}');
+            INSERT INTO metadata (key, value) VALUES ('raw_sealed_at', '{now_ts}');
+            {self._RAW_PARTITIONS_DDL};
 
-            CREATE TABLE {constants.data.SPEED_TABLE_RAW} (
-                timestamp INTEGER NOT NULL, interface_name TEXT NOT NULL,
-                upload_bytes_sec REAL NOT NULL, download_bytes_sec REAL NOT NULL,
-                PRIMARY KEY (timestamp, interface_name)
-            );
-            CREATE INDEX idx_raw_timestamp ON {constants.data.SPEED_TABLE_RAW} (timestamp DESC);
+            {self._RAW_TABLE_DDL["speed"]}
 
             CREATE TABLE {constants.data.SPEED_TABLE_MINUTE} (
                 timestamp INTEGER NOT NULL, interface_name TEXT NOT NULL,
                 upload_avg REAL NOT NULL, download_avg REAL NOT NULL,
                 upload_max REAL NOT NULL, download_max REAL NOT NULL,
                 sample_count INTEGER NOT NULL DEFAULT 1,
+                upload_bytes REAL, download_bytes REAL, covered_sec REAL,
                 PRIMARY KEY (timestamp, interface_name)
             );
             CREATE INDEX idx_minute_covering ON {constants.data.SPEED_TABLE_MINUTE} (timestamp DESC, interface_name, upload_avg, download_avg);
@@ -475,6 +816,7 @@ class DatabaseWorker(QThread):
                 upload_avg REAL NOT NULL, download_avg REAL NOT NULL,
                 upload_max REAL NOT NULL, download_max REAL NOT NULL,
                 sample_count INTEGER NOT NULL DEFAULT 1,
+                upload_bytes REAL, download_bytes REAL, covered_sec REAL,
                 PRIMARY KEY (timestamp, interface_name)
             );
             CREATE INDEX idx_hour_covering ON {constants.data.SPEED_TABLE_HOUR} (timestamp DESC, interface_name, upload_avg, download_avg);
@@ -495,16 +837,12 @@ class DatabaseWorker(QThread):
                 updated_ts INTEGER NOT NULL DEFAULT 0
             );
 
-            CREATE TABLE {constants.data.HARDWARE_STATS_TABLE_RAW} (
-                timestamp INTEGER NOT NULL, stat_type TEXT NOT NULL, value REAL NOT NULL,
-                PRIMARY KEY (timestamp, stat_type)
-            );
-            CREATE INDEX idx_hw_raw_timestamp ON {constants.data.HARDWARE_STATS_TABLE_RAW} (timestamp DESC);
+            {self._RAW_TABLE_DDL["hardware"]}
 
             CREATE TABLE {constants.data.HARDWARE_STATS_TABLE_MINUTE} (
                 timestamp INTEGER NOT NULL, stat_type TEXT NOT NULL,
                 avg_value REAL NOT NULL, max_value REAL NOT NULL,
-                sample_count INTEGER NOT NULL,
+                sample_count INTEGER NOT NULL, covered_sec REAL,
                 PRIMARY KEY (timestamp, stat_type)
             );
             CREATE INDEX idx_hw_minute_timestamp ON {constants.data.HARDWARE_STATS_TABLE_MINUTE} (timestamp DESC);
@@ -512,26 +850,55 @@ class DatabaseWorker(QThread):
             CREATE TABLE {constants.data.HARDWARE_STATS_TABLE_HOUR} (
                 timestamp INTEGER NOT NULL, stat_type TEXT NOT NULL,
                 avg_value REAL NOT NULL, max_value REAL NOT NULL,
-                sample_count INTEGER NOT NULL,
+                sample_count INTEGER NOT NULL, covered_sec REAL,
                 PRIMARY KEY (timestamp, stat_type)
             );
             CREATE INDEX idx_hw_hour_timestamp ON {constants.data.HARDWARE_STATS_TABLE_HOUR} (timestamp DESC);
         """)
+        self._create_raw_views(cursor)
         self.conn.commit()
+        # A brand-new file got auto_vacuum at connect; a rebuilt one (tables dropped above) still needs
+        # the one-time conversion - cheap here, the file is empty.
+        self._enable_incremental_vacuum()
         self.logger.info("New database schema created successfully.")
 
 
-    def _persist_speed_batch(self, batch: List[Tuple[int, str, float, float]]) -> None:
-        """Persists network speed data."""
+    def _persist_write_batch(self, batch: WriteBatch) -> None:
+        """
+        Persists one scheduler flush - speed rows, hardware rows and the usage odometer - in a SINGLE
+        transaction: one commit (one fsync) and one database_updated per flush, instead of one of each
+        per table. All-or-nothing: a failure rolls the whole batch back, as a per-table failure did.
+        """
+        if batch is None or self.conn is None: return
+        rows = batch.rows
+        if not rows: return
+        started = time.perf_counter()
+        cursor = self.conn.cursor()
+        try:
+            self._write_speed_rows(cursor, batch.speed)
+            self._write_hardware_rows(cursor, batch.hardware)
+            if batch.usage is not None:
+                self._write_usage_row(cursor, batch.usage)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error("Failed to persist write batch (%d rows): %s", rows, e)
+            self.conn.rollback()
+            return
+        commit_ms = (time.perf_counter() - started) * 1000.0
+        self.write_metrics.record(rows, commit_ms, self.queue_depth())
+        self.logger.debug("Persisted batch of %d rows in %.1f ms.", rows, commit_ms)
+        if batch.speed or batch.hardware:
+            self.database_updated.emit()
+
+
+    def _persist_speed_batch(self, batch: List[Tuple[int, str, float, float, Optional[float]]]) -> None:
+        """Persists network speed data on its own (see _write_speed_rows)."""
         if not batch or self.conn is None: return
         
         self.logger.debug("Persisting batch of %d speed records...", len(batch))
         cursor = self.conn.cursor()
         try:
-            cursor.executemany(
-                f"INSERT OR IGNORE INTO {constants.data.SPEED_TABLE_RAW} (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, ?, ?, ?)",
-                batch
-            )
+            self._write_speed_rows(cursor, batch)
             self.conn.commit()
             self.database_updated.emit()
         except sqlite3.Error as e:
@@ -539,16 +906,13 @@ class DatabaseWorker(QThread):
             self.conn.rollback()
 
 
-    def _persist_hardware_batch(self, batch: List[Tuple[int, str, float]]) -> None:
-        """Persists hardware utilization data."""
+    def _persist_hardware_batch(self, batch: List[Tuple[int, str, float, Optional[float]]]) -> None:
+        """Persists hardware utilization data on its own (see _write_hardware_rows)."""
         if not batch or self.conn is None: return
         self.logger.debug("Persisting batch of %d hardware records...", len(batch))
         cursor = self.conn.cursor()
         try:
-            cursor.executemany(
-                f"INSERT OR IGNORE INTO {constants.data.HARDWARE_STATS_TABLE_RAW} (timestamp, stat_type, value) VALUES (?, ?, ?)",
-                batch
-            )
+            self._write_hardware_rows(cursor, batch)
             self.conn.commit()
             self.database_updated.emit()
         except sqlite3.Error as e:
@@ -556,6 +920,53 @@ class DatabaseWorker(QThread):
             self.conn.rollback()
 
 
+    @staticmethod
+    def _write_speed_rows(cursor: sqlite3.Cursor, batch: List[Tuple]) -> None:
+        """
+        Inserts (timestamp, interface, up B/s, down B/s, interval_sec) rows; the caller commits.
+
+        interval_sec is the monotonic time the sample covers (None if unknown; 4-tuples are accepted as
+        unknown). Two samples landing in the same whole second for one interface - poll jitter around a
+        second boundary - used to lose the second one to OR IGNORE. Their bytes are real, so the row now
+        absorbs it: the intervals add up and the rate becomes the time-weighted mean, which keeps
+        rate × interval equal to the bytes both samples saw. Without a known interval on both sides
+        there is nothing to weight by and the first row wins, as before.
+        """
+        if not batch:
+            return
+        rows = [r if len(r) >= 5 else (*r, None) for r in batch]
+        cursor.executemany(
+            f"""INSERT INTO {constants.data.SPEED_TABLE_RAW}
+                (timestamp, interface_name, upload_bytes_sec, download_bytes_sec, interval_sec)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(timestamp, interface_name) DO UPDATE SET
+                    upload_bytes_sec = (upload_bytes_sec * interval_sec + excluded.upload_bytes_sec * excluded.interval_sec)
+                                       / (interval_sec + excluded.interval_sec),
+                    download_bytes_sec = (download_bytes_sec * interval_sec + excluded.download_bytes_sec * excluded.interval_sec)
+                                         / (interval_sec + excluded.interval_sec),
+                    interval_sec = interval_sec + excluded.interval_sec
+                WHERE interval_sec > 0 AND excluded.interval_sec > 0""",
+            rows
+        )
+
+
+    @staticmethod
+    def _write_hardware_rows(cursor: sqlite3.Cursor, batch: List[Tuple]) -> None:
+        """Inserts (timestamp, stat_type, value, interval_sec) rows; the caller commits. A same-second
+        collision keeps the first value but adds the interval, so coverage stays exact."""
+        if not batch:
+            return
+        rows = [r if len(r) >= 4 else (*r, None) for r in batch]
+        cursor.executemany(
+            f"""INSERT INTO {constants.data.HARDWARE_STATS_TABLE_RAW} (timestamp, stat_type, value, interval_sec)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(timestamp, stat_type) DO UPDATE SET
+                    interval_sec = interval_sec + excluded.interval_sec
+                WHERE interval_sec > 0 AND excluded.interval_sec > 0""",
+            rows
+        )
+
+
     def _persist_usage(self, data: Tuple[float, float, float, float, str, int]) -> None:
         """
         Upsert the single-row data-usage odometer. `data` is
@@ -563,27 +974,32 @@ class DatabaseWorker(QThread):
         """
         if data is None or self.conn is None:
             return
-        cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts = data
         cursor = self.conn.cursor()
         try:
-            cursor.execute(
-                f"""INSERT INTO {constants.data.USAGE_COUNTER_TABLE}
-                    (id, cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts)
-                    VALUES (1, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        cumulative_up=excluded.cumulative_up,
-                        cumulative_down=excluded.cumulative_down,
-                        anchor_up=excluded.anchor_up,
-                        anchor_down=excluded.anchor_down,
-                        period_key=excluded.period_key,
-                        updated_ts=excluded.updated_ts""",
-                (cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts),
-            )
+            DatabaseWorker._write_usage_row(cursor, data)
             self.conn.commit()
         except sqlite3.Error as e:
             self.logger.error("Failed to persist usage counter: %s", e)
             self.conn.rollback()
 
+    @staticmethod
+    def _write_usage_row(cursor: sqlite3.Cursor, data: Tuple[float, float, float, float, str, int]) -> None:
+        """The odometer upsert itself; the caller commits."""
+        cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts = data
+        cursor.execute(
+            f"""INSERT INTO {constants.data.USAGE_COUNTER_TABLE}
+                (id, cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts)
+                VALUES (1, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    cumulative_up=excluded.cumulative_up,
+                    cumulative_down=excluded.cumulative_down,
+                    anchor_up=excluded.anchor_up,
+                    anchor_down=excluded.anchor_down,
+                    period_key=excluded.period_key,
+                    updated_ts=excluded.updated_ts""",
+            (cumulative_up, cumulative_down, anchor_up, anchor_down, period_key, updated_ts),
+        )
+
     def _run_maintenance(self, data: Dict[str, Any], now: Optional[datetime] = None) -> None:
         """Runs maintenance."""
         if self.conn is None: return
@@ -594,6 +1010,7 @@ class DatabaseWorker(QThread):
         self.logger.debug("Starting periodic database maintenance...")
         cursor = self.conn.cursor()
         try:
+            self._seal_raw_partitions(cursor, _now)
             self._aggregate_raw_to_minute(cursor, _now)
             self._aggregate_minute_to_hour(cursor, _now)
             self._aggregate_hardware_raw_to_minute(cursor, _now)
@@ -617,30 +1034,15 @@ class DatabaseWorker(QThread):
             except sqlite3.Error as e:
                 self.logger.debug("WAL checkpoint skipped: %s", e)
             
-            if pruned:
-                # VACUUM is a full-DB rewrite under a write lock. On a long-running install the
-                # rolling 24h/30d/1yr windows mean `pruned` is ~always truthy, so this ran every
-                # maintenance cycle (hourly). Gate it to at most once/day AND only when there's
-                # real fragmentation to reclaim (M2 + audit #25). Its own try: a VACUUM failure
-                # must not roll back the pruning that already committed above.
-                try:
-                    row = cursor.execute("SELECT value FROM metadata WHERE key='last_vacuum_at'").fetchone()
-                    last_vac = int(row[0]) if (row and str(row[0]).isdigit()) else 0
-                    if int(_now.timestamp()) - last_vac >= 86400:
-                        free_row = cursor.execute("PRAGMA freelist_count").fetchone()
-                        free_pages = int(free_row[0]) if free_row else 0
-                        if free_pages >= 1000:  # ~4 MB of slack - below that it's not worth it
-                            self.logger.info("Running VACUUM (%d free pages, >= 1 day since last)...", free_pages)
-                            self.conn.execute("VACUUM;")
-                            self.conn.execute(
-                                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_vacuum_at', ?)",
-                                (str(int(_now.timestamp())),))
-                            self.conn.commit()
-                            self.logger.info("VACUUM complete.")
-                        else:
-                            self.logger.debug("Skipping VACUUM - only %d free pages.", free_pages)
-                except sqlite3.Error as e:
-                    self.logger.warning("VACUUM skipped (maintenance already committed): %s", e)
+            # Every pass frees pages, not only a retention prune: the raw->minute and minute->hour
+            # roll-ups DELETE what they aggregate, so re-read the freelist each time. No VACUUM here
+            # any more - it rewrote the whole file on this thread, stalling every queued write. The
+            # idle reclaimer returns the pages to the filesystem a step at a time between batches
+            # (_reclaim_step).
+            free_pages = self._refresh_free_pages()
+            self.logger.debug("Maintenance left %d free pages%s%s.", free_pages,
+                              " after a retention prune" if pruned else "",
+                              " - reclaiming incrementally" if self._reclaim_due else "")
 
             self.database_updated.emit()
         except sqlite3.Error as e:
@@ -649,19 +1051,25 @@ class DatabaseWorker(QThread):
 
 
     def _aggregate_hardware_raw_to_minute(self, cursor: sqlite3.Cursor, now: datetime) -> None:
-        """Aggregates hardware stats older than 24 hours."""
+        """Aggregates hardware stats older than 24 hours (see _roll_up_raw_tier)."""
         cutoff = self._bucket_floored_cutoff(now, timedelta(hours=24), 60)
         self.logger.debug("Aggregating raw hardware data older than %s...", datetime.fromtimestamp(cutoff))
-        cursor.execute(f"""
-            INSERT OR IGNORE INTO {constants.data.HARDWARE_STATS_TABLE_MINUTE} (timestamp, stat_type, avg_value, max_value, sample_count)
-            SELECT (timestamp / 60) * 60, stat_type, AVG(value), MAX(value), COUNT(*)
-            FROM {constants.data.HARDWARE_STATS_TABLE_RAW}
+        # A minute that straddles a partition seal is rolled up from both sides, so an existing bucket is
+        # MERGED (count-weighted average, max of maxes, summed count/coverage), never ignored or replaced.
+        self._roll_up_raw_tier(cursor, "hardware", f"""
+            INSERT INTO {constants.data.HARDWARE_STATS_TABLE_MINUTE} (timestamp, stat_type, avg_value, max_value, sample_count, covered_sec)
+            SELECT (timestamp / 60) * 60, stat_type, AVG(value), MAX(value), COUNT(*),
+                   {self._EXACT_SUM.format(col="interval_sec")}
+            FROM {{source}}
             WHERE timestamp < ?
             GROUP BY (timestamp / 60) * 60, stat_type
-        """, (cutoff,))
-        if cursor.rowcount > 0: self.logger.debug("Aggregated %d per-minute hardware records.", cursor.rowcount)
-        cursor.execute(f"DELETE FROM {constants.data.HARDWARE_STATS_TABLE_RAW} WHERE timestamp < ?", (cutoff,))
-        if cursor.rowcount > 0: self.logger.debug("Pruned %d raw hardware records after aggregation.", cursor.rowcount)
+            ON CONFLICT (timestamp, stat_type) DO UPDATE SET
+                avg_value = (avg_value * sample_count + excluded.avg_value * excluded.sample_count)
+                            / (sample_count + excluded.sample_count),
+                max_value = MAX(max_value, excluded.max_value),
+                sample_count = sample_count + excluded.sample_count,
+                covered_sec = covered_sec + excluded.covered_sec
+        """, cutoff)
 
 
     def _aggregate_hardware_minute_to_hour(self, cursor: sqlite3.Cursor, now: datetime) -> None:
@@ -672,13 +1080,14 @@ class DatabaseWorker(QThread):
         # complete, so there is never a conflicting row to replace - and IGNORE can't overwrite a full
         # bucket with a partial remainder if maintenance ever re-runs. Matches the speed-table path.
         cursor.execute(f"""
-            INSERT OR IGNORE INTO {constants.data.HARDWARE_STATS_TABLE_HOUR} (timestamp, stat_type, avg_value, max_value, sample_count)
+            INSERT OR IGNORE INTO {constants.data.HARDWARE_STATS_TABLE_HOUR} (timestamp, stat_type, avg_value, max_value, sample_count, covered_sec)
             SELECT
                 (timestamp / 3600) * 3600 AS hour_timestamp,
                 stat_type,
                 SUM(avg_value * sample_count) / NULLIF(SUM(sample_count), 0),
                 MAX(max_value),
-                SUM(sample_count)
+                SUM(sample_count),
+                {self._EXACT_SUM.format(col="covered_sec")}
             FROM {constants.data.HARDWARE_STATS_TABLE_MINUTE}
             WHERE timestamp < ?
             GROUP BY hour_timestamp, stat_type
@@ -687,6 +1096,12 @@ class DatabaseWorker(QThread):
         cursor.execute(f"DELETE FROM {constants.data.HARDWARE_STATS_TABLE_MINUTE} WHERE timestamp < ?", (cutoff,))
         if cursor.rowcount > 0: self.logger.debug("Pruned %d minute hardware records after aggregation.", cursor.rowcount)
 
+    # Rollup of an integrated quantity (bytes, covered seconds) that is only EXACT when every row in the
+    # bucket carries it. A bucket holding any pre-v8 row (no recorded interval) stores NULL rather than a
+    # silent under-count, and the readers estimate that bucket from its averages exactly as they did
+    # before v8. COUNT(expr) skips NULLs, so it equals COUNT(*) only when nothing is missing.
+    _EXACT_SUM = "CASE WHEN COUNT({col}) = COUNT(*) THEN SUM({col}) END"
+
     @staticmethod
     def _retention_cutoff(now: datetime, retention_days: float) -> int:
         """Unix-seconds cutoff ``retention_days`` before ``now``, computed arithmetically and floored at
@@ -726,12 +1141,12 @@ class DatabaseWorker(QThread):
 
 
     def _aggregate_raw_to_minute(self, cursor: sqlite3.Cursor, now: datetime) -> None:
-        """Aggregates per-second data older than 24 hours into per-minute averages/maxes."""
+        """Aggregates per-second data older than 24 hours into per-minute averages/maxes (see
+        _roll_up_raw_tier). A minute straddling a partition seal is merged, as in the hardware path."""
         cutoff = self._bucket_floored_cutoff(now, timedelta(hours=24), 60)
         self.logger.debug("Aggregating raw data older than %s...", datetime.fromtimestamp(cutoff))
-        
-        cursor.execute(f"""
-            INSERT OR IGNORE INTO {constants.data.SPEED_TABLE_MINUTE} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count)
+        self._roll_up_raw_tier(cursor, "speed", f"""
+            INSERT INTO {constants.data.SPEED_TABLE_MINUTE} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count, upload_bytes, download_bytes, covered_sec)
             SELECT
                 (timestamp / 60) * 60 AS minute_timestamp,
                 interface_name,
@@ -739,15 +1154,25 @@ class DatabaseWorker(QThread):
                 AVG(download_bytes_sec),
                 MAX(upload_bytes_sec),
                 MAX(download_bytes_sec),
-                COUNT(*)
-            FROM {constants.data.SPEED_TABLE_RAW}
+                COUNT(*),
+                {self._EXACT_SUM.format(col="upload_bytes_sec * interval_sec")},
+                {self._EXACT_SUM.format(col="download_bytes_sec * interval_sec")},
+                {self._EXACT_SUM.format(col="interval_sec")}
+            FROM {{source}}
             WHERE timestamp < ?
             GROUP BY minute_timestamp, interface_name
-        """, (cutoff,))
-        if cursor.rowcount > 0: self.logger.debug("Aggregated %d per-minute records.", cursor.rowcount)
-        
-        cursor.execute(f"DELETE FROM {constants.data.SPEED_TABLE_RAW} WHERE timestamp < ?", (cutoff,))
-        if cursor.rowcount > 0: self.logger.debug("Pruned %d raw records after aggregation.", cursor.rowcount)
+            ON CONFLICT (timestamp, interface_name) DO UPDATE SET
+                upload_avg = (upload_avg * sample_count + excluded.upload_avg * excluded.sample_count)
+                             / (sample_count + excluded.sample_count),
+                download_avg = (download_avg * sample_count + excluded.download_avg * excluded.sample_count)
+                               / (sample_count + excluded.sample_count),
+                upload_max = MAX(upload_max, excluded.upload_max),
+                download_max = MAX(download_max, excluded.download_max),
+                sample_count = sample_count + excluded.sample_count,
+                upload_bytes = upload_bytes + excluded.upload_bytes,
+                download_bytes = download_bytes + excluded.download_bytes,
+                covered_sec = covered_sec + excluded.covered_sec
+        """, cutoff)
 
 
     def _aggregate_minute_to_hour(self, cursor: sqlite3.Cursor, now: datetime) -> None:
@@ -756,7 +1181,7 @@ class DatabaseWorker(QThread):
         self.logger.debug("Aggregating minute data older than %s...", datetime.fromtimestamp(cutoff))
 
         cursor.execute(f"""
-            INSERT OR IGNORE INTO {constants.data.SPEED_TABLE_HOUR} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count)
+            INSERT OR IGNORE INTO {constants.data.SPEED_TABLE_HOUR} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count, upload_bytes, download_bytes, covered_sec)
             SELECT
                 (timestamp / 3600) * 3600 AS hour_timestamp,
                 interface_name,
@@ -764,7 +1189,10 @@ class DatabaseWorker(QThread):
                 SUM(download_avg * sample_count) / NULLIF(SUM(sample_count), 0),
                 MAX(upload_max),
                 MAX(download_max),
-                SUM(sample_count)
+                SUM(sample_count),
+                {self._EXACT_SUM.format(col="upload_bytes")},
+                {self._EXACT_SUM.format(col="download_bytes")},
+                {self._EXACT_SUM.format(col="covered_sec")}
             FROM {constants.data.SPEED_TABLE_MINUTE}
             WHERE timestamp < ?
             GROUP BY hour_timestamp, interface_name
@@ -824,6 +1252,20 @@ class DatabaseWorker(QThread):
         return cursor.rowcount > 0
 
 
+    def _import_archive(self, request: "ArchiveImport") -> None:
+        """Merge a history archive (utils.history_archive) on the writer's connection, then wake the
+        caller. Runs here, in queue order, so it never races a persist batch or maintenance."""
+        from netspeedtray.utils import history_archive
+        try:
+            request.result = history_archive.import_archive(self.conn, request.path)
+            self.database_updated.emit()
+        except (sqlite3.Error, ValueError, OSError, KeyError) as e:
+            self.logger.error("Archive import failed: %s", e)
+            request.error = str(e)
+        finally:
+            request.done.set()
+
+
     def _reconnect(self) -> None:
         """Closes and re-opens the database connection."""
         self._close_connection()
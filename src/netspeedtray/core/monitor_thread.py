@@ -46,11 +46,13 @@ except (ImportError, OSError):
     # (WMI hardware monitoring disabled) instead of crashing the app.
     win32com.client = None
 
-import subprocess
 import shutil
 from functools import lru_cache
 
 from netspeedtray import constants
+from netspeedtray.core.nvidia_smi_stream import NvidiaSmiSample, NvidiaSmiStream
+from netspeedtray.core.sensor_snapshot import SensorReading, SensorSnapshot, SensorSnapshotSource
+from netspeedtray.utils.instrumentation import registry as instrumentation
 from netspeedtray.utils.rdp_utils import is_rdp_session
 from netspeedtray.utils.network_utils import get_connected_network_identity
 
@@ -71,6 +73,59 @@ _NON_CPU_SENSOR_IDENTS: tuple = (
 )
 
 
+# --- LHM/OHM sensor selection rules, run against a per-tick SensorSnapshot ---------------------------
+# The snapshot source remembers what these pick (by identifier), so they only run on the first tick
+# and whenever a remembered sensor vanishes or stops reading in range.
+
+def _temp_in_range(r: SensorReading) -> bool:
+    return r.value is not None and 0.0 < r.value < 150.0
+
+
+def _power_in_range(r: SensorReading) -> bool:
+    return r.value is not None and 0.0 < r.value < 1000.0
+
+
+def _select_cpu_temp(snap: SensorSnapshot) -> List[SensorReading]:
+    """The exact "CPU Package" sensor if it reads; else every CPU-die candidate (the hottest wins).
+
+    Some boards label it differently (AMD Ryzen exposes "Core (Tctl/Tdie)", not "CPU Package"). Match
+    on the LHM Identifier (/amdcpu/ or /intelcpu/), which reliably scopes to the CPU regardless of the
+    display name, and broaden the name keywords to cover Ryzen's Tctl/Tdie/Tccd labels (#148)."""
+    temps = snap.sensors("Temperature")
+    for r in temps:
+        if r.name == "CPU Package" and _temp_in_range(r):
+            return [r]
+    out = []
+    for r in temps:
+        name, ident = r.name.upper(), r.identifier.lower()
+        # The identifier is authoritative: reject other devices before the name keywords get a
+        # vote, or "GPU Core" matches on "CORE" (#237).
+        if any(marker in ident for marker in _NON_CPU_SENSOR_IDENTS):
+            continue
+        if ("/amdcpu/" in ident or "/intelcpu/" in ident
+                or any(k in name for k in ("CPU", "CORE", "PACKAGE", "TCTL", "TDIE", "TCCD"))):
+            out.append(r)
+    return out
+
+
+def _select_cpu_power(snap: SensorSnapshot) -> List[SensorReading]:
+    """Prefer the package/total sensor over individual cores; else the first CPU power sensor."""
+    sensors = snap.sensors("Power", "cpu")
+    for r in sensors:
+        name = r.name.lower()
+        if ("package" in name or "pkg" in name or "total" in name) and _power_in_range(r):
+            return [r]
+    return [r for r in sensors if _power_in_range(r)][:1]
+
+
+def _select_gpu_temp(snap: SensorSnapshot) -> List[SensorReading]:
+    return [r for r in snap.sensors("Temperature", "gpu") if _temp_in_range(r)][:1]
+
+
+def _select_gpu_power(snap: SensorSnapshot) -> List[SensorReading]:
+    return [r for r in snap.sensors("Power", "gpu") if _power_in_range(r)][:1]
+
+
 class GpuPollResult(NamedTuple):
     """Structured result from GPU polling, replacing opaque 4-tuple."""
     util: float = 0.0
@@ -121,19 +176,20 @@ class StatsMonitorThread(QThread):
         # LibreHardwareMonitor / OpenHardwareMonitor WMI object.
         # None = not yet tried, False = tried and unavailable, object = connected.
         self._wmi_ohm: Any = None
+        # All LHM/OHM sensors come from ONE query per tick (core.sensor_snapshot), shared by the CPU
+        # temp/power and GPU temp/power reads; the snapshot is dropped at the start of each tick.
+        self._sensor_source = SensorSnapshotSource()
+        self._tick_snapshot: Optional[SensorSnapshot] = None
+        self._tick_snapshot_wmi: Any = None
         self._ohm_guidance_logged: bool = False  # One-time "no sensor source" guidance, logged only when NO namespace connects
         self._last_temp_source_sig: Optional[Tuple[str, str]] = None  # (source, sensor) of the last-logged CPU-temp read; re-logged only on change (#216)
         self._lhm_notice_emitted: bool = False  # One-time notification flag
         self._lhm_check_polls: int = 0  # Count polls before emitting notice
         self._last_identity_poll: float = 0.0  # monotonic ts of the last network-identity sub-poll (0 = poll immediately)
         self._nvidia_smi_path: Optional[str] = self._get_cached_path("nvidia-smi")
-        # nvidia-smi is a synchronous subprocess (up to NVIDIA_SMI_TIMEOUT_SEC). Temps/power
-        # change slowly, so poll it on a slow sub-cadence and cache between calls - keeps the
-        # per-second network readout off the subprocess critical path.
-        self._NVIDIA_POLL_INTERVAL_SEC = 5.0
-        self._nvidia_last_poll: float = 0.0
-        self._nvidia_cache_temp: Optional[float] = None
-        self._nvidia_cache_power: Optional[float] = None
+        # nvidia-smi runs as ONE looping process (core.nvidia_smi_stream), started on the first poll
+        # that needs it; the poll just reads its newest row, so it never waits on a subprocess.
+        self._nvidia_stream: Optional[NvidiaSmiStream] = None
         self._nvidia_cache_vram_total: Optional[float] = None
 
         # PDH Queries for GPU
@@ -325,103 +381,51 @@ class StatsMonitorThread(QThread):
         need_smi_power = include_power
 
         if include_temp or include_power:
-            self._init_ohm_wmi()
-            if self._wmi_ohm:
+            snap = self._lhm_snapshot()
+            if snap:
                 # 3a. LHM/OHM GPU temperature
                 if include_temp:
-                    try:
-                        sensors = self._wmi_ohm.ExecQuery(
-                            "SELECT Value, Identifier, Name FROM Sensor WHERE SensorType='Temperature'"
-                        )
-                        for s in sensors:
-                            identifier = str(getattr(s, 'Identifier', '')).lower()
-                            if 'gpu' not in identifier:
-                                continue
-                            val = float(s.Value)
-                            if 0.0 < val < 150.0:
-                                temp_c = val
-                                self.logger.debug("LHM/OHM GPU temp from sensor '%s': %.1f°C", getattr(s, 'Name', '?'), val)
-                                break
-                        if temp_c is None:
-                            self.logger.debug("LHM/OHM: no valid GPU temperature sensor found")
-                        else:
-                            need_smi_temp = False
-                    except Exception as e:
-                        self.logger.debug("LHM/OHM GPU temp error: %s", e)
-                        self._wmi_ohm = None
+                    picked = self._sensor_source.resolve(snap, "gpu_temp", _select_gpu_temp, _temp_in_range)
+                    if picked and _temp_in_range(picked[0]):
+                        temp_c = picked[0].value
+                        need_smi_temp = False
+                        self.logger.debug("LHM/OHM GPU temp from sensor '%s': %.1f°C", picked[0].name, temp_c)
+                    else:
+                        self.logger.debug("LHM/OHM: no valid GPU temperature sensor found")
 
                 # 3b. LHM/OHM GPU power (all vendors)
-                if include_power and self._wmi_ohm:
-                    try:
-                        sensors = self._wmi_ohm.ExecQuery(
-                            "SELECT Value, Identifier, Name FROM Sensor WHERE SensorType='Power'"
-                        )
-                        for s in sensors:
-                            identifier = str(getattr(s, 'Identifier', '')).lower()
-                            if 'gpu' not in identifier:
-                                continue
-                            val = float(s.Value)
-                            if 0.0 < val < 1000.0:
-                                power_w = val
-                                self.logger.debug("LHM/OHM GPU power from sensor '%s': %.1fW", getattr(s, 'Name', '?'), val)
-                                break
-                        if power_w is not None:
-                            need_smi_power = False
-                    except Exception as e:
-                        self.logger.debug("LHM/OHM GPU power error: %s", e)
-
-        # 4. nvidia-smi fallback for temp/power (vram_total comes as bonus). The subprocess
-        #    runs on a slow sub-cadence; values are cached and reused on intervening polls so
-        #    a synchronous (up to 1.5s) nvidia-smi call never stalls the network readout.
-        # Total VRAM is a property of the card, not a reading, so it is fetched once and cached for
-        # the life of the process - which is why asking for it here costs nothing on later polls.
-        # It has to be its own reason to call nvidia-smi: this used to run only when temp or power
-        # were needed FROM it, so with LibreHardwareMonitor supplying those, nvidia-smi never ran and
-        # the total silently never arrived. Users saw VRAM as used-only with LHM open and used/total
-        # with it closed, which is a bizarre thing to have to notice (#250).
+                if include_power:
+                    picked = self._sensor_source.resolve(snap, "gpu_power", _select_gpu_power, _power_in_range)
+                    if picked and _power_in_range(picked[0]):
+                        power_w = picked[0].value
+                        need_smi_power = False
+                        self.logger.debug("LHM/OHM GPU power from sensor '%s': %.1fW", picked[0].name, power_w)
+
+        # 4. nvidia-smi fallback for temp/power (vram_total comes as bonus). A single long-lived
+        #    `nvidia-smi --loop-ms` session streams a row every 5 s on its own thread; reading the newest
+        #    one is non-blocking, so a reading is up to 5 s old. A row older than 15 s (process died,
+        #    restarting, or hung) reads as None, so temp/power fall back to N/A instead of freezing the
+        #    last good value.
+        # Total VRAM is a property of the card, not a reading, so once seen it is kept for the life of
+        # the process. It has to be its own reason to start nvidia-smi: this used to run only when temp
+        # or power were needed FROM it, so with LibreHardwareMonitor supplying those, nvidia-smi never
+        # ran and the total silently never arrived. Users saw VRAM as used-only with LHM open and
+        # used/total with it closed, which is a bizarre thing to have to notice (#250).
         need_smi_vram_total = self._nvidia_cache_vram_total is None
         if self._nvidia_smi_path and (need_smi_temp or need_smi_power or need_smi_vram_total):
-            now_mono = time.monotonic()
-            if (now_mono - self._nvidia_last_poll) >= self._NVIDIA_POLL_INTERVAL_SEC:
-                # Stamp first: a hung/failed call then waits the full interval before retry,
-                # instead of re-running (and re-stalling) every poll.
-                self._nvidia_last_poll = now_mono
-                try:
-                    query_fields = "temperature.gpu,memory.total,power.draw"
-                    output = subprocess.check_output(
-                        [self._nvidia_smi_path, f"--query-gpu={query_fields}", "--format=csv,noheader,nounits"],
-                        encoding='utf-8', timeout=constants.timeouts.NVIDIA_SMI_TIMEOUT_SEC,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    parts = output.strip().split('\n')[0].split(',')
-                    if len(parts) > 0:
-                        try:
-                            _t = float(parts[0].strip())
-                            if 0.0 < _t < 150.0:  # sanity-range like every other temp path
-                                self._nvidia_cache_temp = _t
-                        except: pass
-                    if len(parts) > 1:
-                        try: self._nvidia_cache_vram_total = float(parts[1].strip())  # MiB
-                        except: pass
-                    if len(parts) > 2:
-                        try:
-                            pw = float(parts[2].strip())
-                            if 0.0 < pw < 1000.0:
-                                self._nvidia_cache_power = pw
-                        except: pass
-                except Exception as e:
-                    self.logger.debug("nvidia-smi temp/power query failed: %s", e)
-                    # Sensor likely dropped out - invalidate the cache so readings fall back to
-                    # N/A instead of freezing the last good value forever (the N/A design intent).
-                    self._nvidia_cache_temp = None
-                    self._nvidia_cache_power = None
-                    self._nvidia_cache_vram_total = None
-
-            # Apply the (possibly just-refreshed) cached values to whatever still needs a source.
-            if need_smi_temp and temp_c is None and self._nvidia_cache_temp is not None:
-                temp_c = self._nvidia_cache_temp
-            if need_smi_power and power_w is None and self._nvidia_cache_power is not None:
-                power_w = self._nvidia_cache_power
+            sample = self._nvidia_smi_sample()
+            if sample is not None:
+                if sample.vram_total is not None:
+                    self._nvidia_cache_vram_total = sample.vram_total  # MiB
+                if need_smi_temp and temp_c is None:
+                    temp_c = sample.temp
+                if need_smi_power and power_w is None:
+                    power_w = sample.power
+        elif self._nvidia_stream is not None and self._nvidia_stream.running:
+            # Nothing needs nvidia-smi any more (LHM supplies temp/power, the total is cached, or the
+            # readouts were turned off): end the looping child rather than keep the dGPU awake for it.
+            # request_stop() doesn't wait - the stream's supervisor does the kill.
+            self._nvidia_stream.request_stop()
 
         # Outside the gate on purpose: once the total is known it applies on every poll, whatever the
         # reason nvidia-smi did or did not run this time round.
@@ -447,6 +451,23 @@ class StatsMonitorThread(QThread):
         return GpuPollResult(util_pct, vram_used, vram_total, temp_c, power_w,
                              present=self._gpu_engine_seen)
 
+    def _nvidia_smi_sample(self) -> Optional[NvidiaSmiSample]:
+        """Newest fresh row from the streaming nvidia-smi session, starting it on first use."""
+        if self._nvidia_stream is None:
+            self._nvidia_stream = NvidiaSmiStream(self._nvidia_smi_path)
+        if not self._nvidia_stream.running:
+            self._nvidia_stream.start()
+        return self._nvidia_stream.latest()
+
+    def _cleanup_nvidia_stream(self) -> None:
+        """Stops the streaming nvidia-smi session (and its child process), if one was started."""
+        if self._nvidia_stream is not None:
+            try:
+                self._nvidia_stream.stop()
+            except Exception as e:
+                self.logger.debug("nvidia-smi stream stop failed: %s", e)
+            self._nvidia_stream = None
+
     @lru_cache(maxsize=4)
     def _get_cached_path(self, binary: str) -> Optional[str]:
         """Resolve a system binary from TRUSTED locations only - never the current directory.
@@ -653,35 +674,40 @@ class StatsMonitorThread(QThread):
                     self.logger.debug("RAPL PKG power polling error: %s", e)
 
         # 2. LHM/OHM WMI fallback
-        self._init_ohm_wmi()
-        if self._wmi_ohm:
-            try:
-                sensors = self._wmi_ohm.ExecQuery(
-                    "SELECT Value, Identifier, Name FROM Sensor WHERE SensorType='Power'"
-                )
-                for s in sensors:
-                    identifier = str(getattr(s, 'Identifier', '')).lower()
-                    if 'cpu' not in identifier:
-                        continue
-                    # Prefer 'package' or 'pkg' sensor over individual cores
-                    name = str(getattr(s, 'Name', '')).lower()
-                    if 'package' in name or 'pkg' in name or 'total' in name:
-                        val = float(s.Value)
-                        if 0.0 < val < 1000.0:
-                            return val
-                # If no package sensor, take first cpu power sensor
-                for s in sensors:
-                    identifier = str(getattr(s, 'Identifier', '')).lower()
-                    if 'cpu' not in identifier:
-                        continue
-                    val = float(s.Value)
-                    if 0.0 < val < 1000.0:
-                        return val
-            except Exception as e:
-                self.logger.debug("LHM/OHM CPU power error: %s", e)
+        snap = self._lhm_snapshot()
+        if snap:
+            picked = self._sensor_source.resolve(snap, "cpu_power", _select_cpu_power, _power_in_range)
+            if picked and _power_in_range(picked[0]):
+                return picked[0].value
 
         return None
 
+    def _begin_tick(self) -> None:
+        """Start a new stats tick: the next LHM/OHM read takes a fresh sensor snapshot."""
+        self._tick_snapshot = None
+        self._sensor_source.begin_tick()
+
+    def _lhm_snapshot(self) -> Optional[SensorSnapshot]:
+        """This tick's LHM/OHM sensor snapshot - one WMI round trip, shared by every consumer.
+
+        None when no sensor source is connected. A failed query drops the connection (re-probed next
+        tick, as before) and yields an empty snapshot, so the rest of the tick doesn't retry it."""
+        if self._tick_snapshot is not None and self._tick_snapshot_wmi is self._wmi_ohm:
+            return self._tick_snapshot
+        self._init_ohm_wmi()
+        if not self._wmi_ohm:
+            return None
+        wmi = self._wmi_ohm
+        try:
+            snap = self._sensor_source.take(wmi)
+        except Exception as e:
+            self.logger.debug("LHM/OHM sensor snapshot failed: %s", e)
+            self._wmi_ohm = None
+            self._sensor_source.forget()
+            snap = SensorSnapshot()
+        self._tick_snapshot, self._tick_snapshot_wmi = snap, self._wmi_ohm
+        return snap
+
     def _init_ohm_wmi(self) -> None:
         """
         Probes for a running LibreHardwareMonitor or OpenHardwareMonitor instance
@@ -714,6 +740,7 @@ class StatsMonitorThread(QThread):
                     self.logger.debug("Hardware monitor: %s exists but exposes 0 sensors.", ns)
                     continue
                 self._wmi_ohm = obj
+                self._sensor_source.forget()
                 self.logger.info("Hardware monitor: connected to %s (%d sensors).", ns, count)
                 return
             except Exception as e:
@@ -759,50 +786,13 @@ class StatsMonitorThread(QThread):
         (LibreHardwareMonitor, HWiNFO64, etc.) - see the settings note.
         """
         # 1. LibreHardwareMonitor / OpenHardwareMonitor - the accurate CPU-die source.
-        self._init_ohm_wmi()
-        if self._wmi_ohm:
-            try:
-                sensors = self._wmi_ohm.ExecQuery(
-                    "SELECT Value FROM Sensor WHERE SensorType='Temperature' AND Name='CPU Package'"
-                )
-                for s in sensors:
-                    val = float(s.Value)
-                    if 0.0 < val < 150.0:
-                        return self._log_temp(val, "LHM/OHM", "CPU Package")
-                # Some boards label it differently (AMD Ryzen exposes "Core (Tctl/Tdie)",
-                # not "CPU Package"). Match on the LHM Identifier (/amdcpu/ or /intelcpu/),
-                # which reliably scopes to the CPU regardless of the display name, and
-                # broaden the name keywords to cover Ryzen's Tctl/Tdie/Tccd labels. (#148)
-                sensors = self._wmi_ohm.ExecQuery(
-                    "SELECT Value, Name, Identifier FROM Sensor WHERE SensorType='Temperature'"
-                )
-                best_val: Optional[float] = None
-                best_name: str = ""
-                for s in sensors:
-                    name = str(getattr(s, 'Name', '')).upper()
-                    ident = str(getattr(s, 'Identifier', '')).lower()
-                    # The identifier is authoritative: reject other devices before the name
-                    # keywords get a vote, or "GPU Core" matches on "CORE" (#237).
-                    if any(marker in ident for marker in _NON_CPU_SENSOR_IDENTS):
-                        continue
-                    is_cpu = (
-                        "/amdcpu/" in ident or "/intelcpu/" in ident
-                        or any(k in name for k in ("CPU", "CORE", "PACKAGE", "TCTL", "TDIE", "TCCD"))
-                    )
-                    if not is_cpu:
-                        continue
-                    try:
-                        val = float(s.Value)
-                    except (TypeError, ValueError):
-                        continue
-                    if 0.0 < val < 150.0 and (best_val is None or val > best_val):
-                        best_val = val
-                        best_name = str(getattr(s, 'Name', '')) or "CPU"
-                if best_val is not None:
-                    return self._log_temp(best_val, "LHM/OHM", best_name)
-            except Exception as e:
-                self.logger.debug("OHM/LHM CPU temp error: %s", e)
-                self._wmi_ohm = None
+        snap = self._lhm_snapshot()
+        if snap:
+            picked = self._sensor_source.resolve(snap, "cpu_temp", _select_cpu_temp, _temp_in_range)
+            valid = [r for r in picked if _temp_in_range(r)]
+            if valid:
+                best = max(valid, key=lambda r: r.value)
+                return self._log_temp(best.value, "LHM/OHM", best.name or "CPU")
 
         # 2. PDH Thermal Zone Information (generic ACPI; may be motherboard/ambient - #216)
         if win32pdh:
@@ -902,7 +892,10 @@ class StatsMonitorThread(QThread):
         except Exception:
             pass
 
+        tick_span = instrumentation.histogram("monitor_thread.tick")
         while self._is_running:
+            self._begin_tick()
+            tick_started = instrumentation.begin()   # the collection cost; the sleep is not timed
             try:
                 # Apply any config-driven hardware-query reset HERE, on the owning thread (set by
                 # update_config from the GUI thread) - never close a PDH handle out from under this loop.
@@ -1005,6 +998,7 @@ class StatsMonitorThread(QThread):
 
             except Exception as e:
                 self.consecutive_errors += 1
+                instrumentation.count("monitor_thread.errors")
                 self.logger.error("Error fetching stats (consecutive=%d): %s", self.consecutive_errors, e)
 
                 # Notify ONCE when we cross the threshold - but keep running. The thread is
@@ -1015,6 +1009,8 @@ class StatsMonitorThread(QThread):
                                         self._ERROR_NOTIFY_THRESHOLD)
                     self.error_occurred.emit(f"Hardware monitor is having trouble: {e}")
 
+            tick_span.end(tick_started)
+
             # Responsive sleep, with exponential backoff while in an error streak so a failing
             # source isn't hammered every second (capped at _MAX_BACKOFF_SEC; recovers on success).
             if self.consecutive_errors == 0:
@@ -1034,6 +1030,7 @@ class StatsMonitorThread(QThread):
         self._cleanup_thermal_query()
         self._cleanup_power_query()
         self._cleanup_ohm_wmi()
+        self._cleanup_nvidia_stream()
         self._cleanup_com()
 
     def _cleanup_ohm_wmi(self) -> None:
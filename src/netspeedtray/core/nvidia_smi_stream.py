@@ -0,0 +1,253 @@
+"""
+NvidiaSmiStream - one long-lived ``nvidia-smi`` process instead of a spawn per GPU poll.
+
+``StatsMonitorThread._poll_gpu_hybrid`` used to run ``nvidia-smi --query-gpu=...`` through
+``subprocess.check_output`` every few seconds. Each call is a process creation plus a driver handshake
+(a cold one can take over a second, hence ``NVIDIA_SMI_TIMEOUT_SEC``), it blocked the stats poll while
+it ran, and any single failure wiped every cached value.
+
+nvidia-smi has a looping mode (``--loop-ms``) that prints a fresh CSV row per interval from the same
+process. This class starts it once, reads the stream on a daemon thread, and keeps only the newest
+parsed row in a lock-protected slot - so the poll thread's read is a non-blocking ``latest()``. The
+interval matches the old one-shot poll's cadence (``NVIDIA_SMI_STREAM_INTERVAL_MS``): a child that
+queries the driver every half second keeps a discrete GPU from idling down, which costs more power
+than the spawns it replaced. When the process exits (driver reset, GPU removed, binary gone) it is
+restarted with exponential backoff, reset once a session produces data again. A process that stays
+alive but stops printing is treated as hung: its readings go stale (``latest()`` returns None, so the
+UI shows N/A rather than freezing the last value) and the supervisor thread - never the caller of
+``latest()`` - kills it and starts a fresh one.
+
+The stream is only worth its child process while something needs it: the monitor thread calls
+``request_stop()`` once LibreHardwareMonitor supplies temp/power and the VRAM total is cached, and
+``start()`` again if that changes.
+
+Only GPU index 0 is read, matching the single-GPU readout of the old one-shot query. No Qt here: the
+monitor thread owns the instance, and the tests drive it against a fake ``nvidia-smi`` script.
+"""
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+from netspeedtray import constants
+
+logger = logging.getLogger("NetSpeedTray.NvidiaSmiStream")
+
+QUERY_FIELDS = "index,temperature.gpu,memory.total,power.draw"
+
+
+class NvidiaSmiSample(NamedTuple):
+    """One parsed row. Fields outside their sanity range (or ``[N/A]``) are None."""
+    temp: Optional[float]        # deg C
+    vram_total: Optional[float]  # MiB
+    power: Optional[float]       # W
+    at: float                    # time.monotonic() when the row was read
+
+
+def _field(raw: str, low: float, high: float) -> Optional[float]:
+    try:
+        value = float(raw.strip())
+    except ValueError:           # "[N/A]", "[Not Supported]", empty
+        return None
+    return value if low < value < high else None
+
+
+def parse_line(line: str, gpu_index: int = 0, now: Optional[float] = None) -> Optional[NvidiaSmiSample]:
+    """Parse one ``index, temperature.gpu, memory.total, power.draw`` row; None if it isn't ours."""
+    parts = line.strip().split(",")
+    if len(parts) < 4:
+        return None
+    try:
+        if int(parts[0].strip()) != gpu_index:
+            return None
+    except ValueError:
+        return None
+    return NvidiaSmiSample(
+        temp=_field(parts[1], 0.0, 150.0),          # same sanity ranges as every other temp/power path
+        vram_total=_field(parts[2], 0.0, float("inf")),
+        power=_field(parts[3], 0.0, 1000.0),
+        at=time.monotonic() if now is None else now,
+    )
+
+
+class NvidiaSmiStream:
+    """Supervises a looping ``nvidia-smi`` and exposes its newest row via :meth:`latest`."""
+
+    def __init__(self, path: str,
+                 interval_ms: int = constants.timeouts.NVIDIA_SMI_STREAM_INTERVAL_MS,
+                 stale_after_sec: float = constants.timeouts.NVIDIA_SMI_STREAM_STALE_SEC,
+                 backoff_initial_sec: float = constants.timeouts.NVIDIA_SMI_RESTART_BACKOFF_SEC,
+                 backoff_max_sec: float = constants.timeouts.NVIDIA_SMI_RESTART_BACKOFF_MAX_SEC,
+                 gpu_index: int = 0,
+                 popen: Callable[..., subprocess.Popen] = subprocess.Popen) -> None:
+        self.path = path
+        self.interval_ms = max(100, int(interval_ms))
+        self.stale_after_sec = stale_after_sec
+        self.backoff_initial_sec = backoff_initial_sec
+        self.backoff_max_sec = backoff_max_sec
+        self.gpu_index = gpu_index
+        self._popen = popen
+
+        self._lock = threading.Lock()
+        self._latest: Optional[NvidiaSmiSample] = None
+        self._last_output = 0.0                        # monotonic ts of the last line of any kind
+        self._proc: Optional[subprocess.Popen] = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.restarts = 0                              # sessions started after the first one
+        self.rows_parsed = 0
+
+    # --- public API --------------------------------------------------------------------------
+    def command(self) -> List[str]:
+        return [self.path, f"--query-gpu={QUERY_FIELDS}", "--format=csv,noheader,nounits",
+                f"--loop-ms={self.interval_ms}"]
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the supervisor thread (idempotent)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._supervise, name="nvidia-smi-stream", daemon=True)
+        self._thread.start()
+
+    def latest(self) -> Optional[NvidiaSmiSample]:
+        """The newest row if it is fresher than ``stale_after_sec``, else None. Never blocks."""
+        now = time.monotonic()
+        with self._lock:
+            sample = self._latest
+        if sample is None or now - sample.at > self.stale_after_sec:
+            return None
+        return sample
+
+    def request_stop(self) -> None:
+        """Ask the supervisor to end the session without waiting for it (safe from the poll thread).
+
+        The supervisor notices within one watch tick, terminates the child and exits; ``start()`` can
+        bring the stream back once that has happened."""
+        if self.running and not self._stopping.is_set():
+            logger.debug("nvidia-smi stream no longer needed; stopping it.")
+        self._stopping.set()
+        with self._lock:
+            self._latest = None
+
+    def stop(self, timeout: float = constants.timeouts.NVIDIA_SMI_TIMEOUT_SEC) -> None:
+        """Stop the supervisor and the child process and wait for both; safe to call more than once."""
+        self._stopping.set()
+        with self._lock:
+            proc = self._proc
+        if proc is not None:
+            self._terminate(proc, timeout)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        with self._lock:
+            self._latest = None
+
+    # --- supervisor --------------------------------------------------------------------------
+    def _supervise(self) -> None:
+        backoff = self.backoff_initial_sec
+        first = True
+        while not self._stopping.is_set():
+            if not first:
+                self.restarts += 1
+            first = False
+            produced = self._run_session()
+            if self._stopping.is_set():
+                break
+            # A session that delivered data was healthy; its exit (driver reset, sleep/resume) gets a
+            # prompt restart. One that died without a single row backs off, so a broken install
+            # isn't respawned every interval forever.
+            if produced:
+                backoff = self.backoff_initial_sec
+            delay = backoff
+            backoff = min(self.backoff_max_sec, backoff * 2)
+            logger.debug("nvidia-smi exited; restarting in %.1fs.", delay)
+            self._stopping.wait(delay)
+
+    def _watch_interval(self) -> float:
+        return max(0.05, min(1.0, self.stale_after_sec / 4))
+
+    def _run_session(self) -> bool:
+        """Run one nvidia-smi process until it exits, hangs or is stopped; True if it produced a row.
+
+        Lines are read on a short-lived reader thread; this (supervisor) thread watches it, so the kill
+        of a mute or unwanted process happens here and never on a caller's thread."""
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        try:
+            proc = self._popen(self.command(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               stdin=subprocess.DEVNULL, text=True, encoding="utf-8", errors="replace",
+                               bufsize=1, **kwargs)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not start nvidia-smi: %s", e)
+            return False
+        with self._lock:
+            self._proc = proc
+            self._last_output = time.monotonic()
+        rows_before = self.rows_parsed
+        reader = threading.Thread(target=self._read_rows, args=(proc,), name="nvidia-smi-reader",
+                                  daemon=True)
+        reader.start()
+        try:
+            watch = self._watch_interval()
+            while reader.is_alive() and not self._stopping.wait(watch):
+                with self._lock:
+                    silent_for = time.monotonic() - self._last_output
+                if silent_for > self.stale_after_sec and proc.poll() is None:
+                    # Alive but mute: a wedged driver call. Kill it; the loop in _supervise restarts it.
+                    logger.debug("nvidia-smi silent for %.1fs; restarting it.", silent_for)
+                    break
+        finally:
+            self._terminate(proc)
+            reader.join(constants.timeouts.NVIDIA_SMI_TIMEOUT_SEC)
+            try:
+                proc.stdout.close()
+            except Exception:
+                pass
+            with self._lock:
+                if self._proc is proc:
+                    self._proc = None
+        return self.rows_parsed > rows_before
+
+    def _read_rows(self, proc: subprocess.Popen) -> None:
+        """Reader thread: parse rows into the latest-value slot until the process's stdout closes."""
+        try:
+            for line in proc.stdout:
+                now = time.monotonic()
+                sample = parse_line(line, self.gpu_index, now)
+                with self._lock:
+                    self._last_output = now
+                    if sample is not None:
+                        self._latest = sample
+                if sample is not None:
+                    self.rows_parsed += 1
+                if self._stopping.is_set():
+                    break
+        except (OSError, ValueError) as e:
+            logger.debug("nvidia-smi stream read failed: %s", e)
+
+    @staticmethod
+    def _terminate(proc: subprocess.Popen, timeout: float = 1.0) -> None:
+        if proc.poll() is not None:
+            return
+        try:
+            proc.terminate()
+            proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                proc.kill()
+                proc.wait(timeout)
+            except Exception:
+                pass
+        except Exception:
+            pass
@@ -0,0 +1,197 @@
+"""
+A small bounded pool of SQLite read connections for WidgetState.
+
+``WidgetState._get_read_conn`` used to keep one connection per thread id and, on every call, walk
+``threading.enumerate()`` to close the connections of threads that had exited (the per-Monitor-open leak
+of M2). Every history, summary and export read paid that enumeration, each connection was tied to one
+thread for its lifetime, and the thread-id keying could hand a recycled id a stale connection.
+
+``ReadConnectionPool`` hands connections out instead. A read checks one out for the duration of the
+query and checks it back in; at most ``size`` are ever open, so concurrent Monitor tabs, the CSV export
+and the summaries read in parallel up to that bound and queue briefly beyond it. A connection outlives
+the thread that used it, so there is nothing to prune. A nested read on a thread that already holds a
+connection reuses it rather than taking a second one (and can't deadlock a full pool).
+
+Each connection keeps sqlite3's per-connection statement cache (``cached_statements``), keyed by SQL
+text - which only pays off if the text is stable, so WidgetState's queries bind their bin widths and
+the read-your-writes overlay as parameters instead of formatting them into the SQL.
+
+``query(name)`` times every checkout-to-checkin span and the wait for a free connection, keeps
+per-name counters (``stats()``) and calls any registered hooks with ``(name, elapsed_ms, wait_ms)``.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Type, Union
+
+from netspeedtray import constants
+
+logger = logging.getLogger("NetSpeedTray.ReadPool")
+
+QueryHook = Callable[[str, float, float], None]
+
+
+class ReadConnectionPool:
+    """Bounded checkout/checkin pool of read-only-use SQLite connections to one database file."""
+
+    def __init__(self, db_path: Union[str, Path],
+                 size: int = constants.timeouts.DB_READ_POOL_SIZE,
+                 checkout_timeout: float = constants.timeouts.DB_READ_POOL_CHECKOUT_TIMEOUT_SEC,
+                 statement_cache: int = constants.timeouts.DB_READ_STATEMENT_CACHE,
+                 factory: Type[sqlite3.Connection] = sqlite3.Connection) -> None:
+        self.db_path = db_path
+        self.size = max(1, int(size))
+        self.checkout_timeout = checkout_timeout
+        self.statement_cache = statement_cache
+        self._factory = factory
+
+        self._cond = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._opened = 0                   # connections alive, idle or checked out
+        self._closed = False
+        self._held = threading.local()     # (connection, depth) of this thread's current checkout
+        self._hooks: List[QueryHook] = []
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._waits = 0
+
+    # --- connections -----------------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=self.statement_cache, factory=self._factory)
+        conn.row_factory = sqlite3.Row
+        # Wait (up to 5s) for a lock instead of erroring out immediately - otherwise a
+        # read concurrent with the maintenance VACUUM can fail with "database is locked".
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        # The Monitor reloads ~a dozen multi-tier scans every few seconds on these read
+        # connections; give them the same cache + in-RAM temp B-trees + memory-mapped reads as
+        # the writer so the nested-GROUP-BY history queries don't run under-provisioned.
+        conn.execute("PRAGMA cache_size = -8000;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA mmap_size = 268435456;")
+        return conn
+
+    def checkout(self) -> sqlite3.Connection:
+        """Take a connection: this thread's current one if it holds one, else an idle one, else a new
+        one while under ``size``, else wait up to ``checkout_timeout`` for a checkin."""
+        held = getattr(self._held, "entry", None)
+        if held is not None:
+            self._held.entry = (held[0], held[1] + 1)
+            return held[0]
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._cond:
+            conn = None
+            while conn is None:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("read pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                elif self._opened < self.size:
+                    self._opened += 1
+                    try:
+                        conn = self._connect()
+                    except Exception:
+                        self._opened -= 1
+                        raise
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise sqlite3.OperationalError(
+                            f"no read connection free after {self.checkout_timeout:.1f}s")
+                    self._waits += 1
+                    self._cond.wait(remaining)
+        self._held.entry = (conn, 1)
+        return conn
+
+    def checkin(self, conn: sqlite3.Connection) -> None:
+        """Return a connection taken with checkout(). A nested checkout only drops its depth."""
+        held = getattr(self._held, "entry", None)
+        if held is not None and held[0] is conn and held[1] > 1:
+            self._held.entry = (conn, held[1] - 1)
+            return
+        self._held.entry = None
+        try:
+            if conn.in_transaction:   # a read left a statement open; don't pin a WAL snapshot
+                conn.rollback()
+        except sqlite3.Error:
+            pass
+        with self._cond:
+            if self._closed:
+                self._opened -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, name: str = "read") -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the body of the ``with``; time it under ``name``."""
+        t0 = time.perf_counter()
+        conn = self.checkout()
+        t1 = time.perf_counter()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+            self._record(name, (time.perf_counter() - t1) * 1000.0, (t1 - t0) * 1000.0)
+
+    @contextmanager
+    def query(self, name: str) -> Iterator[sqlite3.Cursor]:
+        """``with pool.query("speed_history") as cur:`` - a cursor on a checked-out connection."""
+        with self.connection(name) as conn:
+            cur = conn.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
+
+    def close(self) -> None:
+        """Close the idle connections now and the checked-out ones as they come back."""
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._opened -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+    # --- timing hooks ----------------------------------------------------------------------------
+    def add_hook(self, hook: QueryHook) -> None:
+        """Call ``hook(name, elapsed_ms, wait_ms)`` after every query."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: QueryHook) -> None:
+        try:
+            self._hooks.remove(hook)
+        except ValueError:
+            pass
+
+    def _record(self, name: str, elapsed_ms: float, wait_ms: float) -> None:
+        with self._cond:
+            s = self._stats.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                              "last_ms": 0.0, "wait_ms": 0.0})
+            s["count"] += 1
+            s["total_ms"] += elapsed_ms
+            s["max_ms"] = max(s["max_ms"], elapsed_ms)
+            s["last_ms"] = elapsed_ms
+            s["wait_ms"] += wait_ms
+        for hook in list(self._hooks):
+            try:
+                hook(name, elapsed_ms, wait_ms)
+            except Exception as e:   # a diagnostics hook must never fail a read
+                logger.debug("Read-query hook failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy plus per-query-name timings (count, avg/max/last ms, time spent waiting)."""
+        with self._cond:
+            queries = {name: dict(s, avg_ms=(s["total_ms"] / s["count"]) if s["count"] else 0.0)
+                       for name, s in self._stats.items()}
+            return {"size": self.size, "open": self._opened, "idle": len(self._idle),
+                    "in_use": self._opened - len(self._idle), "waits": self._waits, "queries": queries}
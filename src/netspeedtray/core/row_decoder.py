@@ -0,0 +1,84 @@
+"""
+Decode an SQLite result set straight into typed NumPy columns.
+
+WidgetState's history and summary readers used to ``fetchall()`` a window into a list of row objects
+(``sqlite3.Row`` - the read pool's row_factory), rebuild that into lists of tuples or values, and leave
+the NumPy conversion to whoever consumed them (the summaries, the analytics, the graph). For a 20k-row
+window that is three Python objects per value before the data is in an array at all.
+
+``fetch_columns`` reads the cursor ``DB_READ_FETCH_ROWS`` rows at a time, with the cursor's row
+factory switched off (plain tuples, no Row objects), and copies each chunk into preallocated typed
+columns - int64 timestamps, float64 values, NULL as NaN. The stdlib driver still hands each chunk over as
+tuples, but only one chunk is ever alive: memory is the columns plus one chunk, and nothing per row
+survives the call. ``size_hint`` (e.g. window / bin width for a binned query) sizes the columns up front;
+without one they grow geometrically and are trimmed at the end.
+
+numpy is a registered deferred import (utils.lazy_import) and WidgetState is on the startup path, so it
+is bound lazily here and only loads on the first decode.
+"""
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Optional, Sequence, Tuple
+
+from netspeedtray import constants
+from netspeedtray.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# Column kinds: "int" -> int64 (a row whose value is NULL is dropped, see fetch_columns), "real" -> float64
+# (NULL as NaN).
+INT = "int"
+REAL = "real"
+
+
+def empty_columns(kinds: Sequence[str]) -> Tuple["np.ndarray", ...]:
+    """Zero-length columns of the given kinds."""
+    return tuple(np.empty(0, dtype=np.int64 if k == INT else np.float64) for k in kinds)
+
+
+def fetch_columns(cursor: sqlite3.Cursor, kinds: Sequence[str], size_hint: Optional[int] = None,
+                  chunk_rows: int = constants.timeouts.DB_READ_FETCH_ROWS) -> Tuple["np.ndarray", ...]:
+    """
+    Drain an executed ``cursor`` into one array per selected column, typed by ``kinds`` (INT/REAL).
+    Rows with a NULL in an INT column are dropped (a binned query's NULL timestamp, say); REAL NULLs
+    come back as NaN. Returns the columns trimmed to the rows kept.
+    """
+    cursor.row_factory = None            # tuples, not the pool's sqlite3.Row objects
+    width = len(kinds)
+    int_cols = [i for i, k in enumerate(kinds) if k == INT]
+    capacity = max(1, int(size_hint)) if size_hint else chunk_rows
+    cols = [np.empty(capacity, dtype=np.int64 if k == INT else np.float64) for k in kinds]
+    n = 0
+    while True:
+        rows = cursor.fetchmany(chunk_rows)
+        if not rows:
+            break
+        block = np.array(rows, dtype=np.float64)         # None -> NaN
+        if block.ndim != 2 or block.shape[1] != width:
+            raise ValueError(f"expected {width} columns, got shape {block.shape}")
+        if int_cols:
+            keep = ~np.isnan(block[:, int_cols]).any(axis=1)
+            if not keep.all():
+                block = block[keep]
+        m = block.shape[0]
+        if n + m > capacity:
+            capacity = max(n + m, capacity * 2)
+            cols = [_grow(c, n, capacity) for c in cols]
+        for i, c in enumerate(cols):
+            c[n:n + m] = block[:, i]
+        n += m
+    return tuple(c[:n] for c in cols)
+
+
+def _grow(col: "np.ndarray", used: int, capacity: int) -> "np.ndarray":
+    out = np.empty(capacity, dtype=col.dtype)
+    out[:used] = col[:used]
+    return out
+
+
+def query_columns(cursor: sqlite3.Cursor, sql: str, params: Sequence[Any], kinds: Sequence[str],
+                  size_hint: Optional[int] = None) -> Tuple["np.ndarray", ...]:
+    """``cursor.execute(sql, params)`` and ``fetch_columns`` in one call."""
+    cursor.execute(sql, tuple(params))
+    return fetch_columns(cursor, kinds, size_hint)
@@ -0,0 +1,128 @@
+"""
+One LibreHardwareMonitor / OpenHardwareMonitor WMI query per stats tick.
+
+``_poll_cpu_temperature``, ``_poll_cpu_power`` and ``_poll_gpu_hybrid`` each used to send their own
+``SELECT ... FROM Sensor WHERE SensorType=...`` to the same LHM namespace on the same tick - two for the
+CPU temperature alone - and then scan every row for "cpu" or "gpu" in the identifier. Each ExecQuery is a
+cross-process COM round trip into LHM, so a tick with temps and power on cost four or five of them.
+
+``SensorSnapshotSource.take`` issues ONE query for every Temperature and Power sensor and materializes
+it as a ``SensorSnapshot``: readings indexed by (hardware kind, sensor type) and by identifier. The
+monitor thread takes at most one snapshot per tick and every consumer reads from it.
+
+Sensor *choice* is also remembered. The first tick runs the consumer's selection rules (CPU Package
+first, the identifier veto of #237, and so on) and records the identifiers it picked per role; later
+ticks look those identifiers up directly. If a remembered sensor disappears (LHM restarted, hardware
+re-enumerated) or none of them reads in range any more, the rules run again.
+
+Kept free of win32com / Qt so the tests can drive it with a fake WMI provider.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger("NetSpeedTray.SensorSnapshot")
+
+SNAPSHOT_QUERY = (
+    "SELECT Value, Identifier, Name, SensorType FROM Sensor "
+    "WHERE SensorType='Temperature' OR SensorType='Power'"
+)
+
+
+class SensorReading(NamedTuple):
+    identifier: str      # as LHM reports it, e.g. "/amdcpu/0/temperature/2"
+    name: str            # display name, e.g. "Core (Tctl/Tdie)"
+    sensor_type: str     # "Temperature" / "Power"
+    kind: str            # "cpu" / "gpu" / "other" - from the identifier's hardware segment
+    value: Optional[float]
+
+
+def hardware_kind(identifier: str) -> str:
+    """Classify a sensor by the hardware segment of its LHM identifier (/intelcpu/, /gpu-nvidia/, ...)."""
+    segment = identifier.strip("/").split("/", 1)[0].lower()
+    if "gpu" in segment:
+        return "gpu"
+    if "cpu" in segment:
+        return "cpu"
+    return "other"
+
+
+class SensorSnapshot:
+    """One tick's Temperature/Power readings, indexed for direct lookup."""
+
+    def __init__(self, readings: Sequence[SensorReading] = ()) -> None:
+        self.readings: List[SensorReading] = list(readings)
+        self._by_id: Dict[str, SensorReading] = {}
+        self._by_kind_type: Dict[Tuple[str, str], List[SensorReading]] = {}
+        for r in self.readings:
+            self._by_id.setdefault(r.identifier, r)
+            self._by_kind_type.setdefault((r.kind, r.sensor_type), []).append(r)
+
+    def __len__(self) -> int:
+        return len(self.readings)
+
+    def get(self, identifier: str) -> Optional[SensorReading]:
+        return self._by_id.get(identifier)
+
+    def sensors(self, sensor_type: str, kind: Optional[str] = None) -> List[SensorReading]:
+        """Readings of one type, for one hardware kind or (kind=None) all of them, in WMI order."""
+        if kind is not None:
+            return self._by_kind_type.get((kind, sensor_type), [])
+        return [r for r in self.readings if r.sensor_type == sensor_type]
+
+
+def _reading(sensor: Any) -> SensorReading:
+    identifier = str(getattr(sensor, "Identifier", "") or "")
+    try:
+        value: Optional[float] = float(sensor.Value)
+    except (TypeError, ValueError, AttributeError):
+        value = None
+    return SensorReading(identifier, str(getattr(sensor, "Name", "") or ""),
+                         str(getattr(sensor, "SensorType", "") or ""), hardware_kind(identifier), value)
+
+
+class SensorSnapshotSource:
+    """Takes snapshots from an LHM/OHM WMI connection, counts round trips, and remembers choices."""
+
+    def __init__(self) -> None:
+        self._chosen: Dict[str, Tuple[str, ...]] = {}
+        self.round_trips = 0           # ExecQuery calls, lifetime
+        self.tick_round_trips = 0      # ExecQuery calls since the last begin_tick()
+        self.lookups = 0               # roles served from remembered identifiers
+        self.selections = 0            # roles that had to run their selection rules
+
+    def begin_tick(self) -> None:
+        self.tick_round_trips = 0
+
+    def take(self, wmi: Any) -> SensorSnapshot:
+        """Run the single snapshot query. Raises whatever the WMI call raises."""
+        self.round_trips += 1
+        self.tick_round_trips += 1
+        rows = [_reading(s) for s in wmi.ExecQuery(SNAPSHOT_QUERY)]
+        return SensorSnapshot(rows)
+
+    def forget(self) -> None:
+        """Drop remembered choices (the sensor source was reconnected)."""
+        self._chosen.clear()
+
+    def resolve(self, snapshot: SensorSnapshot, role: str,
+                select: Callable[[SensorSnapshot], List[SensorReading]],
+                valid: Callable[[SensorReading], bool]) -> List[SensorReading]:
+        """The readings for ``role``: the remembered identifiers if they are all still present and at
+        least one reads valid, otherwise a fresh ``select(snapshot)`` whose identifiers are remembered."""
+        ids = self._chosen.get(role)
+        if ids:
+            hits = [snapshot.get(i) for i in ids]
+            if all(h is not None for h in hits) and any(valid(h) for h in hits):
+                self.lookups += 1
+                return hits
+        chosen = select(snapshot)
+        self.selections += 1
+        if chosen:
+            self._chosen[role] = tuple(r.identifier for r in chosen)
+            if ids and self._chosen[role] != ids:
+                logger.debug("Sensor for %s re-selected: %s", role, ", ".join(self._chosen[role]))
+        else:
+            self._chosen.pop(role, None)
+        return chosen
@@ -0,0 +1,217 @@
+"""
+Columnar in-memory session history: per-interface speeds as a (time × interface slot) ring buffer.
+
+WidgetState used to keep the session's per-interface speeds as a deque of ``SpeedDataSnapshot``
+objects - a frozen dataclass holding a fresh ``dict`` of (up, down) tuples plus a ``datetime`` per
+tick. At 4 interfaces that is roughly 1 KB of Python objects per second, so the deque was kept to the
+*current* mini-graph window, and nothing could be served from it per NIC: a Session graph filtered to
+one interface fell back to the database.
+
+``SessionSpeedHistory`` stores the same data as flat ``array('d')`` columns:
+
+* ``ts``          - one float (unix seconds) per row;
+* ``up`` / ``down`` - ``capacity × width`` floats, row-major: row ``r``'s value for interface slot
+  ``s`` lives at ``r * width + s``. NaN means "the interface reported nothing on this tick".
+
+An interface gets a slot the first time it reports (``slot_of``). When all slots are taken, a slot
+whose interface has no values left anywhere in the buffer is reused; only when none is free does the
+buffer widen (rebuilding ``up``/``down`` once with twice the slots). That keeps VPN/adapter churn from
+growing it without bound. A row costs ``8 × (1 + 2 × width)`` bytes - about 72 bytes at 4 slots.
+
+It is deliberately NumPy-free: ``add_speed_data`` runs on every tick from launch, and numpy is a
+registered deferred import (utils.lazy_import) that must stay off the live-numbers path. Readers that
+want arrays convert the plain lists these accessors return. All access is under one lock: appends come
+from the GUI thread, reads from the graph worker.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Collection, Dict, Iterator, List, Mapping, Optional, Tuple
+
+_NAN = float("nan")
+
+
+@dataclass(slots=True, frozen=True)
+class SpeedDataSnapshot:
+    """Represents a snapshot of per-interface network speeds at a specific timestamp."""
+    speeds: Dict[str, Tuple[float, float]]
+    timestamp: datetime
+
+
+class SessionSpeedHistory:
+    """A bounded, columnar ring buffer of per-interface (upload, download) speeds."""
+
+    def __init__(self, capacity: int, width: int = 4) -> None:
+        self._lock = threading.Lock()
+        self._capacity = max(1, int(capacity))
+        self._width = max(1, int(width))
+        self._ts = array("d", [0.0]) * self._capacity
+        self._up = array("d", [_NAN]) * (self._capacity * self._width)
+        self._down = array("d", [_NAN]) * (self._capacity * self._width)
+        self._head = 0                      # next row to write
+        self._count = 0
+        self._slots: Dict[str, int] = {}    # interface -> slot
+        self._names: List[Optional[str]] = [None] * self._width
+
+    # ------------------------------------------------------------------ size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the three columns (the whole footprint, bar a few small bookkeeping objects)."""
+        return (len(self._ts) + len(self._up) + len(self._down)) * self._ts.itemsize
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _rows(self) -> range:
+        """Physical row indexes, oldest first (only call under the lock)."""
+        start = (self._head - self._count) % self._capacity
+        return range(start, start + self._count)
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the newest rows."""
+        capacity = max(1, int(capacity))
+        with self._lock:
+            if capacity == self._capacity:
+                return
+            keep = list(self._rows())[-capacity:]
+            w, cap = self._width, self._capacity
+            ts = array("d", [0.0]) * capacity
+            up = array("d", [_NAN]) * (capacity * w)
+            down = array("d", [_NAN]) * (capacity * w)
+            for new, phys in enumerate(keep):
+                old = (phys % cap) * w
+                ts[new] = self._ts[phys % cap]
+                up[new * w:(new + 1) * w] = self._up[old:old + w]
+                down[new * w:(new + 1) * w] = self._down[old:old + w]
+            self._ts, self._up, self._down = ts, up, down
+            self._capacity, self._count = capacity, len(keep)
+            self._head = len(keep) % capacity
+
+    # ------------------------------------------------------------------ slots
+
+    def _column_empty(self, slot: int) -> bool:
+        w, cap = self._width, self._capacity
+        return all(math.isnan(self._up[(r % cap) * w + slot]) and math.isnan(self._down[(r % cap) * w + slot])
+                   for r in self._rows())
+
+    def _widen(self) -> None:
+        old_w, new_w = self._width, self._width * 2
+        up = array("d", [_NAN]) * (self._capacity * new_w)
+        down = array("d", [_NAN]) * (self._capacity * new_w)
+        for r in range(self._capacity):
+            up[r * new_w:r * new_w + old_w] = self._up[r * old_w:(r + 1) * old_w]
+            down[r * new_w:r * new_w + old_w] = self._down[r * old_w:(r + 1) * old_w]
+        self._up, self._down, self._width = up, down, new_w
+        self._names.extend([None] * (new_w - old_w))
+
+    def slot_of(self, name: str, reserved: Collection[int] = ()) -> int:
+        """The slot of ``name``, assigning one (reusing a vacated slot, or widening) on first sight.
+        ``reserved`` slots were just assigned for the row being written and are not vacated yet, however
+        empty their columns look. Only call under the lock."""
+        slot = self._slots.get(name)
+        if slot is not None:
+            return slot
+        slot = next((i for i, n in enumerate(self._names) if n is None), None)
+        if slot is None:
+            slot = next((i for i in range(self._width) if i not in reserved and self._column_empty(i)), None)
+            if slot is not None:
+                del self._slots[self._names[slot]]
+        if slot is None:
+            slot = self._width
+            self._widen()
+        self._names[slot] = name
+        self._slots[name] = slot
+        return slot
+
+    # ------------------------------------------------------------------ write
+
+    def append(self, timestamp: float, speeds: Mapping[str, Tuple[float, float]]) -> None:
+        """Record one tick: ``speeds`` maps interface -> (upload, download) bytes/sec."""
+        with self._lock:
+            row = self._head
+            slots: List[Tuple[int, float, float]] = []
+            for name, (up, down) in speeds.items():
+                slots.append((self.slot_of(name, {s for s, _, _ in slots}), up, down))
+            w = self._width                 # after slot_of: it may have widened
+            base = row * w
+            self._up[base:base + w] = array("d", [_NAN]) * w
+            self._down[base:base + w] = array("d", [_NAN]) * w
+            for slot, up, down in slots:
+                self._up[base + slot] = float(up)
+                self._down[base + slot] = float(down)
+            self._ts[row] = float(timestamp)
+            self._head = (row + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._head = self._count = 0
+            self._slots.clear()
+            self._names = [None] * self._width
+
+    # ------------------------------------------------------------------ read
+
+    def interfaces(self) -> List[str]:
+        """Interfaces with at least one value in the buffer, sorted."""
+        with self._lock:
+            return sorted(n for i, n in enumerate(self._names) if n is not None and not self._column_empty(i))
+
+    def series(self, interface: str, start_ts: Optional[float] = None,
+               end_ts: Optional[float] = None) -> List[Tuple[float, float, float]]:
+        """(ts, up, down) for every tick ``interface`` reported, oldest first, optionally limited to
+        [start_ts, end_ts]. Empty for an interface the buffer has never seen."""
+        with self._lock:
+            slot = self._slots.get(interface)
+            if slot is None:
+                return []
+            w, cap = self._width, self._capacity
+            lo = -math.inf if start_ts is None else start_ts
+            hi = math.inf if end_ts is None else end_ts
+            out = []
+            for r in self._rows():
+                p = r % cap
+                t = self._ts[p]
+                if t < lo or t > hi:
+                    continue
+                up, down = self._up[p * w + slot], self._down[p * w + slot]
+                if not (math.isnan(up) and math.isnan(down)):
+                    out.append((t, 0.0 if math.isnan(up) else up, 0.0 if math.isnan(down) else down))
+            return out
+
+    def _snapshot(self, phys: int) -> SpeedDataSnapshot:
+        w, p = self._width, phys % self._capacity
+        speeds = {}
+        for slot, name in enumerate(self._names):
+            if name is None:
+                continue
+            up, down = self._up[p * w + slot], self._down[p * w + slot]
+            if not (math.isnan(up) and math.isnan(down)):
+                speeds[name] = (up, down)
+        return SpeedDataSnapshot(speeds=speeds, timestamp=datetime.fromtimestamp(self._ts[p]))
+
+    def __getitem__(self, index: int) -> SpeedDataSnapshot:
+        """The ``index``-th tick (oldest first; negative from the newest) as a SpeedDataSnapshot."""
+        with self._lock:
+            rows = self._rows()
+            return self._snapshot(rows[index])
+
+    def snapshots(self) -> List[SpeedDataSnapshot]:
+        """Every tick as a SpeedDataSnapshot, oldest first (the pre-columnar representation)."""
+        with self._lock:
+            return [self._snapshot(r) for r in self._rows()]
+
+    def __iter__(self) -> Iterator[SpeedDataSnapshot]:
+        return iter(self.snapshots())
@@ -0,0 +1,455 @@
+"""
+Record and replay of the sampling pipeline's input (``--record-trace``).
+
+Everything downstream of ``StatsMonitorThread`` - the controller's rate maths and spike filter,
+``WidgetState``'s buffers and write batches, the database rollups, the graphs - is driven by one
+thing: the ``stats_ready`` dict the thread emits each tick (psutil's per-NIC counters, CPU, RAM,
+GPU...). Those come from live Windows APIs, so a user's load could not be reproduced, and no
+benchmark or soak test could run the real pipeline on Linux.
+
+This module captures that input and plays it back:
+
+* ``TraceRecorder`` - connected (direct) to ``stats_ready``, writes every payload with its monotonic
+  timestamp, plus the controller's primary-interface changes (``auto`` mode resolves the primary with
+  a routing lookup that is not part of the payload). Enabled by ``--record-trace`` (to
+  ``stats_trace.nst`` in the app-data folder) or ``--record-trace=<path>``.
+* ``TraceReader`` - iterates a trace back as ``TraceEvent`` records.
+* ``TraceReplaySource`` - a drop-in for the monitor thread: emits the recorded payloads on its own
+  ``stats_ready`` at real speed, ``speed`` times faster, or as fast as possible. ``attach()`` points the
+  controller's clock, wall clock and primary resolver at the trace, so rates, intervals and DB
+  timestamps are exactly those of the recording however fast it is replayed - a day compresses into
+  minutes without the controller seeing a single "gap".
+
+The format is a gzip stream (a 4-NIC tick is ~60 bytes on disk, ~5 MB a day at 1 Hz) of:
+
+* a header: ``MAGIC``, then a u32-length-prefixed JSON object (format version, recording wall time,
+  update rate, interface mode);
+* records, each starting with a kind byte and an f64 offset in seconds from the first record:
+  ``_STATS`` - new interned strings (u16 count, then u16-length UTF-8 each), the NICs (u16 count, then
+  u16 name id + 8 × u64 psutil counters each) and the other keys (u16 count, then u16 key id, a tag
+  byte and the value); ``_PRIMARY`` - a u16 name id (``_NO_NAME`` for None).
+
+Names (interfaces and keys) are interned: each is written once, with the record that first uses it,
+and referred to by id after that. Stdlib-only; values of a type it cannot encode are dropped (logged
+once per key) rather than failing the recording.
+"""
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import json
+import logging
+import struct
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from netspeedtray.utils.network_utils import NetworkIdentity
+
+logger = logging.getLogger("NetSpeedTray.StatsTrace")
+
+TRACE_FLAG = "--record-trace"
+TRACE_FILENAME = "stats_trace.nst"
+MAGIC = b"NSTTRACE"
+FORMAT_VERSION = 1
+
+_STATS = 1
+_PRIMARY = 2
+_NO_NAME = 0xFFFF
+
+# Value tags for the non-network keys.
+_T_NONE, _T_FLOAT, _T_BOOL, _T_INT, _T_STR, _T_OBJECT = range(6)
+# Dataclass payloads (tag _T_OBJECT) are stored as JSON of their fields and rebuilt by type name.
+_OBJECT_TYPES: Dict[str, type] = {"NetworkIdentity": NetworkIdentity}
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_HEAD = struct.Struct("<Bd")            # kind, offset (s)
+_NIC = struct.Struct("<H8Q")            # name id, psutil snetio fields
+_F64 = struct.Struct("<d")
+_I64 = struct.Struct("<q")
+
+
+class NetIOCounters(NamedTuple):
+    """A replayed per-NIC counter set - the fields (and order) of psutil's ``snetio``."""
+    bytes_sent: int = 0
+    bytes_recv: int = 0
+    packets_sent: int = 0
+    packets_recv: int = 0
+    errin: int = 0
+    errout: int = 0
+    dropin: int = 0
+    dropout: int = 0
+
+
+class TraceEvent(NamedTuple):
+    """One trace record: ``kind`` is "stats" (``value`` = the payload dict) or "primary" (``value`` =
+    the interface name the controller resolved, or None); ``t`` is seconds since the first record."""
+    t: float
+    kind: str
+    value: Any
+
+
+# ---------------------------------------------------------------------------------------------- write
+
+class TraceRecorder:
+    """Writes ``stats_ready`` payloads to a trace file. Thread-safe: ``record`` runs on the monitor
+    thread (direct connection), ``note_primary`` on the GUI thread."""
+
+    def __init__(self, path: Union[str, Path], meta: Optional[Dict[str, Any]] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fh: Optional[IO[bytes]] = gzip.open(self.path, "wb", compresslevel=6)
+        self._names: Dict[str, int] = {}
+        self._t0: Optional[float] = None
+        self._last_t = 0.0                  # offset of the latest stats record
+        self._skipped: set = set()
+        self.records = 0
+        header = dict(meta or {}, version=FORMAT_VERSION, recorded_at=datetime.now().timestamp())
+        blob = json.dumps(header).encode("utf-8")
+        self._fh.write(MAGIC + _U32.pack(len(blob)) + blob)
+        logger.info("Recording stats trace to %s", self.path)
+
+    def _offset(self) -> float:
+        now = self._clock()
+        if self._t0 is None:
+            self._t0 = now
+        return now - self._t0
+
+    def _intern(self, name: str, new: List[bytes]) -> int:
+        idx = self._names.get(name)
+        if idx is None:
+            idx = self._names[name] = len(self._names)
+            raw = name.encode("utf-8")
+            new.append(_U16.pack(len(raw)) + raw)
+        return idx
+
+    def _encode_value(self, key: str, value: Any, new: List[bytes]) -> Optional[bytes]:
+        if value is None:
+            return bytes((_T_NONE,))
+        if isinstance(value, bool):
+            return bytes((_T_BOOL, int(value)))
+        if isinstance(value, int):
+            return bytes((_T_INT,)) + _I64.pack(value)
+        if isinstance(value, float):
+            return bytes((_T_FLOAT,)) + _F64.pack(value)
+        if isinstance(value, str):
+            return bytes((_T_STR,)) + _U16.pack(self._intern(value, new))
+        if dataclasses.is_dataclass(value) and type(value).__name__ in _OBJECT_TYPES:
+            blob = json.dumps({"type": type(value).__name__, "fields": dataclasses.asdict(value)}).encode("utf-8")
+            return bytes((_T_OBJECT,)) + _U32.pack(len(blob)) + blob
+        if key not in self._skipped:
+            self._skipped.add(key)
+            logger.debug("Trace: not recording %r (unsupported %s)", key, type(value).__name__)
+        return None
+
+    def record(self, stats: Dict[str, Any]) -> None:
+        """Append one ``stats_ready`` payload (slot for the monitor thread's signal)."""
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                new: List[bytes] = []
+                nics = [_NIC.pack(self._intern(name, new), *(int(v) for v in (tuple(c) + (0,) * 8)[:8]))
+                        for name, c in (stats.get("network") or {}).items()]
+                scalars = []
+                for key, value in stats.items():
+                    if key == "network":
+                        continue
+                    encoded = self._encode_value(key, value, new)
+                    if encoded is not None:
+                        scalars.append(_U16.pack(self._intern(key, new)) + encoded)
+                self._last_t = self._offset()
+                self._fh.write(b"".join([_HEAD.pack(_STATS, self._last_t), _U16.pack(len(new)), *new,
+                                         _U16.pack(len(nics)), *nics, _U16.pack(len(scalars)), *scalars]))
+                self.records += 1
+            except Exception as e:
+                logger.error("Stats trace write failed, recording stopped: %s", e)
+                self._close_locked()
+
+    def note_primary(self, name: Optional[str]) -> None:
+        """The controller resolved a new primary interface (``auto`` mode). It does so while handling
+        a tick, so the change is stamped with that tick's offset, and replay applies it just before it."""
+        with self._lock:
+            if self._fh is None:
+                return
+            new: List[bytes] = []
+            idx = _NO_NAME if name is None else self._intern(name, new)
+            # Strings ride in a stats record only, so a primary name seen first here gets an empty one.
+            if new:
+                self._fh.write(b"".join([_HEAD.pack(_STATS, self._last_t), _U16.pack(len(new)), *new,
+                                         _U16.pack(0), _U16.pack(0)]))
+            self._fh.write(_HEAD.pack(_PRIMARY, self._last_t) + _U16.pack(idx))
+
+    def _close_locked(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                logger.info("Stats trace closed: %d records in %s", self.records, self.path)
+            self._close_locked()
+
+
+def parse_trace_flag(argv: Sequence[str]) -> "tuple[bool, Optional[Path]]":
+    """``--record-trace`` -> (True, None); ``--record-trace=<path>`` -> (True, path)."""
+    for arg in argv:
+        if arg == TRACE_FLAG:
+            return True, None
+        if arg.startswith(TRACE_FLAG + "="):
+            value = arg.split("=", 1)[1].strip()
+            return True, Path(value) if value else None
+    return False, None
+
+
+def recorder_from_argv(argv: Sequence[str], config: Dict[str, Any]) -> Optional[TraceRecorder]:
+    """A recorder if ``--record-trace`` is on the command line, else None (never raises)."""
+    wanted, path = parse_trace_flag(argv)
+    if not wanted:
+        return None
+    try:
+        if path is None:
+            from netspeedtray.utils.helpers import get_app_data_path
+            path = Path(get_app_data_path()) / TRACE_FILENAME
+        return TraceRecorder(path, {"update_rate": config.get("update_rate", 1.0),
+                                    "interface_mode": config.get("interface_mode", "auto")})
+    except Exception as e:
+        logger.error("Could not start the stats trace: %s", e, exc_info=True)
+        return None
+
+
+# ----------------------------------------------------------------------------------------------- read
+
+class TraceFormatError(ValueError):
+    """The file is not a stats trace, or is truncated mid-header."""
+
+
+class TraceReader:
+    """Iterates a trace file as ``TraceEvent``s. ``meta`` is the header JSON. A trace cut short by a
+    crash ends at its last complete record."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with gzip.open(self.path, "rb") as fh:
+            self.meta = self._read_header(fh)
+
+    @staticmethod
+    def _read_header(fh: IO[bytes]) -> Dict[str, Any]:
+        head = fh.read(len(MAGIC) + _U32.size)
+        if len(head) < len(MAGIC) + _U32.size or not head.startswith(MAGIC):
+            raise TraceFormatError("not a NetSpeedTray stats trace")
+        (n,) = _U32.unpack_from(head, len(MAGIC))
+        try:
+            return json.loads(fh.read(n).decode("utf-8"))
+        except ValueError as e:
+            raise TraceFormatError(f"bad trace header: {e}") from None
+
+    def __iter__(self) -> Iterator[TraceEvent]:
+        names: List[str] = []
+        with gzip.open(self.path, "rb") as fh:
+            self._read_header(fh)
+            try:
+                while True:
+                    head = fh.read(_HEAD.size)
+                    if len(head) < _HEAD.size:
+                        return
+                    kind, t = _HEAD.unpack(head)
+                    if kind == _PRIMARY:
+                        (idx,) = _U16.unpack(_exact(fh, _U16.size))
+                        yield TraceEvent(t, "primary", None if idx == _NO_NAME else names[idx])
+                        continue
+                    if kind != _STATS:
+                        raise TraceFormatError(f"unknown record kind {kind}")
+                    for _ in range(_U16.unpack(_exact(fh, _U16.size))[0]):
+                        (n,) = _U16.unpack(_exact(fh, _U16.size))
+                        names.append(_exact(fh, n).decode("utf-8"))
+                    stats: Dict[str, Any] = {}
+                    nic_count = _U16.unpack(_exact(fh, _U16.size))[0]
+                    if nic_count:
+                        network = {}
+                        for _ in range(nic_count):
+                            idx, *counters = _NIC.unpack(_exact(fh, _NIC.size))
+                            network[names[idx]] = NetIOCounters(*counters)
+                        stats["network"] = network
+                    for _ in range(_U16.unpack(_exact(fh, _U16.size))[0]):
+                        (idx,) = _U16.unpack(_exact(fh, _U16.size))
+                        stats[names[idx]] = _read_value(fh, names)
+                    if stats:
+                        yield TraceEvent(t, "stats", stats)
+            except (EOFError, _Truncated):
+                logger.warning("Stats trace %s is truncated; replaying up to its last complete record.",
+                               self.path)
+
+
+class _Truncated(Exception):
+    pass
+
+
+def _exact(fh: IO[bytes], n: int) -> bytes:
+    data = fh.read(n)
+    if len(data) < n:
+        raise _Truncated
+    return data
+
+
+def _read_value(fh: IO[bytes], names: List[str]) -> Any:
+    tag = _exact(fh, 1)[0]
+    if tag == _T_NONE:
+        return None
+    if tag == _T_BOOL:
+        return bool(_exact(fh, 1)[0])
+    if tag == _T_INT:
+        return _I64.unpack(_exact(fh, _I64.size))[0]
+    if tag == _T_FLOAT:
+        return _F64.unpack(_exact(fh, _F64.size))[0]
+    if tag == _T_STR:
+        return names[_U16.unpack(_exact(fh, _U16.size))[0]]
+    if tag == _T_OBJECT:
+        (n,) = _U32.unpack(_exact(fh, _U32.size))
+        obj = json.loads(_exact(fh, n).decode("utf-8"))
+        cls = _OBJECT_TYPES.get(obj.get("type"))
+        return cls(**obj["fields"]) if cls is not None else obj["fields"]
+    raise TraceFormatError(f"unknown value tag {tag}")
+
+
+# --------------------------------------------------------------------------------------------- replay
+
+class TraceClock:
+    """The replay's notion of time: trace seconds as ``monotonic()``, and the matching wall clock
+    (``now()``) starting at ``wall_start``."""
+
+    def __init__(self, wall_start: datetime, base: float = 1000.0) -> None:
+        self.wall_start = wall_start
+        self.base = base            # a positive origin: the controller treats 0.0 as "no previous tick"
+        self.t = 0.0
+
+    def monotonic(self) -> float:
+        return self.base + self.t
+
+    def now(self) -> datetime:
+        return self.wall_start + timedelta(seconds=self.t)
+
+
+class TraceReplaySource(QObject):
+    """
+    Plays a trace into the pipeline the way StatsMonitorThread would. ``speed`` is the time
+    compression (1.0 = real time, 1000.0 = a day in ~90 s, None = no waiting at all).
+
+    ``attach(controller)`` connects ``stats_ready`` to ``handle_stats`` and hands the controller the
+    trace clock. ``start()`` replays from the event loop (QTimer-paced, for running the app or a GUI
+    on a trace); ``run()`` replays synchronously (benchmarks, soak tests), calling ``on_event`` after
+    every record.
+    """
+
+    stats_ready = pyqtSignal(dict)
+    finished = pyqtSignal()
+
+    def __init__(self, path: Union[str, Path], speed: Optional[float] = 1.0,
+                 wall_start: Optional[datetime] = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for as fast as possible)")
+        self.reader = TraceReader(path)
+        self.speed = speed
+        self.clock = TraceClock(wall_start or datetime.fromtimestamp(self.reader.meta.get("recorded_at", time.time())))
+        self.primary_interface: Optional[str] = None
+        self.emitted = 0
+        self._cursor: Optional[Iterator[TraceEvent]] = None     # run()'s position
+        self._events: Optional[Iterator[TraceEvent]] = None     # start()'s position
+        self._pending: Optional[TraceEvent] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+
+    def attach(self, controller: Any) -> None:
+        """Drive ``controller`` from this trace (clock, wall clock, primary interface, stats)."""
+        controller.clock = self.clock.monotonic
+        controller.wall_clock = self.clock.now
+        controller.primary_resolver = lambda: self.primary_interface
+        self.stats_ready.connect(controller.handle_stats)
+
+    def events(self) -> Iterator[TraceEvent]:
+        """The trace in replay order: a primary change is recorded after the tick whose handling
+        resolved it (same offset), but must be in place *before* that tick is handled again."""
+        held: Optional[TraceEvent] = None
+        for event in self.reader:
+            if held is not None and not (event.kind == "primary" and event.t == held.t):
+                yield held
+                held = None
+            if event.kind == "stats":
+                held = event
+            else:
+                yield event
+        if held is not None:
+            yield held
+
+    def _apply(self, event: TraceEvent) -> None:
+        self.clock.t = event.t
+        if event.kind == "primary":
+            self.primary_interface = event.value
+        else:
+            self.emitted += 1
+            self.stats_ready.emit(event.value)
+
+    def run(self, on_event: Optional[Callable[[TraceEvent], None]] = None,
+            limit: Optional[int] = None) -> int:
+        """Replay synchronously; returns the number of payloads emitted by this call. ``limit`` stops
+        after that many, and the next call carries on from there (a soak feeds the trace in chunks)."""
+        if self._cursor is None:
+            self._cursor = self.events()
+        started, first, emitted = time.monotonic(), None, 0
+        for event in self._cursor:
+            if first is None:
+                first = event.t
+            if self.speed is not None:
+                delay = (event.t - first) / self.speed - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            self._apply(event)
+            if on_event is not None:
+                on_event(event)
+            if event.kind == "stats":
+                emitted += 1
+                if limit is not None and emitted >= limit:
+                    break
+        return emitted
+
+    def start(self) -> None:
+        """Replay from the event loop; ``finished`` is emitted after the last record."""
+        self._events = self.events()
+        self._pending = next(self._events, None)
+        self._schedule(None)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._events = self._pending = None
+
+    def _schedule(self, previous_t: Optional[float]) -> None:
+        if self._pending is None:
+            self._events = None
+            self.finished.emit()
+            return
+        if previous_t is None or self.speed is None:
+            delay_ms = 0
+        else:
+            delay_ms = max(0, int((self._pending.t - previous_t) * 1000 / self.speed))
+        self._timer.start(delay_ms)
+
+    def _on_timer(self) -> None:
+        if self._pending is None or self._events is None:
+            return
+        event = self._pending
+        self._apply(event)
+        self._pending = next(self._events, None)
+        self._schedule(event.t)
@@ -13,11 +13,12 @@ Key Features:
   - Per-minute aggregates are kept for 30 days.
   - Per-hour aggregates are kept for up to 1 year.
 - Handles user-configurable data retention with a 48-hour grace period for reductions.
-- Performs all database writes and maintenance (pruning, aggregation, VACUUM) in a
-  dedicated background thread to prevent UI blocking.
+- Performs all database writes and maintenance (pruning, aggregation, incremental space
+  reclaim) in a dedicated background thread to prevent UI blocking.
 - Guarantees data integrity through the use of atomic transactions.
 """
 
+import json
 import logging
 import sqlite3
 import threading
@@ -27,16 +28,26 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, date
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional, Tuple, Literal, Union
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Literal, Union
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer
 
 from netspeedtray import constants
 from netspeedtray.constants import network, timeouts
+from netspeedtray.core import row_decoder
+# SpeedDataSnapshot (the per-tick, per-interface DTO) now lives with the columnar buffer that yields it.
+from netspeedtray.core.session_history import SessionSpeedHistory, SpeedDataSnapshot
 from netspeedtray.utils.helpers import get_app_data_path
+from netspeedtray.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")   # registered deferred import; only the array readers/summaries touch it
 
 logger = logging.getLogger("NetSpeedTray.WidgetState")
 
+# Column kinds for the summary queries' row_decoder reads (all-REAL: NULL stays NaN, no row is dropped).
+_REAL2 = (row_decoder.REAL,) * 2
+_REAL4 = (row_decoder.REAL,) * 4
+
 
 # --- Data Transfer Objects (DTOs) ---
 @dataclass(slots=True, frozen=True)
@@ -47,13 +58,6 @@ class AggregatedSpeedData:
     timestamp: datetime
 
 
-@dataclass(slots=True, frozen=True)
-class SpeedDataSnapshot:
-    """Represents a snapshot of per-interface network speeds at a specific timestamp."""
-    speeds: Dict[str, Tuple[float, float]]
-    timestamp: datetime
-
-
 @dataclass(slots=True, frozen=True)
 class HardwareStatSnapshot:
     """Represents a single hardware utilization data point."""
@@ -63,6 +67,8 @@ class HardwareStatSnapshot:
 
 # --- Database Worker Thread ---
 from netspeedtray.core.database import DatabaseWorker
+from netspeedtray.core.read_pool import ReadConnectionPool
+from netspeedtray.core.write_scheduler import WriteBatch, WriteScheduler
 
 
 class WidgetState(QObject):
@@ -74,19 +80,19 @@ class WidgetState(QObject):
         self.config = config.copy()
         # read_only: a headless reader (the --export-csv CLI) that must NOT start a second write thread
         # against the live app's DB, nor run maintenance/VACUUM. Reads go straight through
-        # _get_read_conn(); the worker is constructed but never started, so flush_and_wait short-circuits.
+        # the read pool; the worker is constructed but never started, so flush_and_wait short-circuits.
         self._read_only = read_only
 
         # In-Memory Cache for real-time mini-graph.
-        #   * in_memory_history holds per-tick raw snapshots (a dict per entry - heavy), so it stays
-        #     sized to the *current* window.
-        #   * the mini-graph series (aggregated speed + per-stat hardware %) are light (a few floats per
-        #     entry), so they buffer the *maximum* selectable window. That way GROWING the graph timespan
-        #     reveals already-recorded samples immediately instead of waiting minutes for them to
-        #     accumulate; the renderer slices each series down to the configured window.
-        self.max_history_points: int = self._get_max_history_points()
+        #   * in_memory_history holds the per-interface speeds of every tick as a columnar (time ×
+        #     interface slot) ring buffer - a few floats per tick, see core.session_history - so per-NIC
+        #     Session graphs are served from memory.
+        #   * it and the mini-graph series (aggregated speed + per-stat hardware %) buffer the *maximum*
+        #     selectable window. That way GROWING the graph timespan reveals already-recorded samples
+        #     immediately instead of waiting minutes for them to accumulate; the renderer slices each
+        #     series down to the configured window.
         self._graph_buffer_points: int = self._get_graph_buffer_points()
-        self.in_memory_history: Deque[SpeedDataSnapshot] = deque(maxlen=self.max_history_points)
+        self.in_memory_history = SessionSpeedHistory(self._graph_buffer_points)
         self.aggregated_history: Deque[AggregatedSpeedData] = deque(maxlen=self._graph_buffer_points)
 
         # New: Hardware history for mini-graph tabs
@@ -95,33 +101,46 @@ class WidgetState(QObject):
         self.ram_history: Deque[HardwareStatSnapshot] = deque(maxlen=self._graph_buffer_points)
         
         # Batching lists for database writes
-        self._db_batch: List[Tuple[int, str, float, float]] = []
-        self._hw_batch: List[Tuple[int, str, float]] = []
+        self._db_batch: List[Tuple[int, str, float, float, Optional[float]]] = []
+        self._hw_batch: List[Tuple[int, str, float, Optional[float]]] = []
         # Guards the two batch lists: they're APPENDED on the GUI thread but flushed (snapshot+reset)
         # from the graph-worker thread (get_speed_history(wait_for_flush=True)). Without it an append
         # landing between the snapshot and the reset would silently drop that persisted row (#6).
         self._batch_lock = threading.Lock()
+        # When the batches go to disk: an adaptive deadline (short under read pressure, long when idle)
+        # checked every DB_FLUSH_TICK_MS, replacing the fixed 10 s flush. See core.write_scheduler.
+        self._write_scheduler = WriteScheduler()
 
         # Database Worker Thread
         self._db_path = Path(get_app_data_path()) / "speed_history.db"
         self.db_worker = DatabaseWorker(self._db_path)
         self.db_worker.error.connect(lambda msg: self.logger.error("DB Worker Error: %s", msg))
+        # Staged boot: opening/migrating/indexing the DB happens on the worker thread while the widget
+        # paints and the monitor thread starts polling. Until `ready` fires, samples stay in the batch
+        # lists (see flush_batch) and the odometer buffers its bytes, so nothing touches SQLite on the
+        # GUI thread mid-migration. Queued connection: the slot runs on the GUI thread.
+        self.db_worker.ready.connect(self._on_db_ready)
         if not read_only:
             self.db_worker.start()
 
         # Timers for periodic operations (constructed either way so cleanup() stays simple, but only
-        # started for a live instance - a read_only export never writes or runs maintenance).
+        # started for a live instance - a read_only export never writes or runs maintenance). The first
+        # maintenance pass is no longer run at construction: _on_db_ready schedules it on
+        # startup_maintenance_timer, well after the first number is on screen.
         self.batch_persist_timer = QTimer(self)
-        self.batch_persist_timer.timeout.connect(self.flush_batch)
+        self.batch_persist_timer.timeout.connect(self._on_flush_tick)
         self.maintenance_timer = QTimer(self)
         self.maintenance_timer.timeout.connect(self.trigger_maintenance)
+        self.startup_maintenance_timer = QTimer(self)
+        self.startup_maintenance_timer.setSingleShot(True)
+        self.startup_maintenance_timer.timeout.connect(self.trigger_maintenance)
         if not read_only:
-            self.batch_persist_timer.start(10 * 1000) # Persist every 10 seconds
+            self.batch_persist_timer.start(timeouts.DB_FLUSH_TICK_MS)  # cheap due-check; see WriteScheduler
             self.maintenance_timer.start(60 * 60 * 1000) # Run maintenance every hour
-            self.trigger_maintenance()
 
-        self._read_conns: Dict[int, sqlite3.Connection] = {}
-        self._read_conns_lock = threading.Lock()
+        # Every read (history, summaries, totals, the CSV export) checks a connection out of this bounded
+        # pool for the duration of its query; see core.read_pool.
+        self._read_pool = ReadConnectionPool(self._db_path)
 
         # Data-usage odometer (data-cap feature). Lazily loaded from the DB on first
         # use (the worker thread may not have created the table yet at construction).
@@ -130,47 +149,37 @@ class WidgetState(QObject):
             "anchor_up": 0.0, "anchor_down": 0.0, "period_key": "",
         }
         self._usage_loaded: bool = False
-        self._usage_last_persist: float = 0.0
+        # Set when the counter changed since the last flush: the odometer row then rides the next write
+        # batch, in the same transaction as the samples, instead of a separate throttled write.
+        self._usage_dirty: bool = False
+        # Bytes counted before the odometer row could be loaded (DB still initializing). Folded in once
+        # it loads, instead of being dropped as they were when the poll simply deferred.
+        self._usage_pending_up: float = 0.0
+        self._usage_pending_down: float = 0.0
 
         self.logger.debug("WidgetState initialized with threaded database worker.")
 
 
-    def _get_read_conn(self) -> sqlite3.Connection:
-        """Returns a thread-local read connection, pruning ones left behind by dead threads.
+    def _db_initializing(self) -> bool:
+        """True while the worker thread is running but has not finished opening/migrating the DB."""
+        return self.db_worker.isRunning() and not self.db_worker.is_ready()
 
-        Each worker thread (notably the Monitor's GraphDataWorker, recreated on every Monitor open) opens
-        its own read connection here, removed otherwise only in cleanup() at exit. Without pruning, every
-        Monitor open/close leaked a connection (a file handle + a WAL reader slot) for the whole session,
-        and a recycled thread id could even hand a new worker a dead thread's stale connection. So evict
-        entries whose owning thread has exited (safe to close cross-thread: check_same_thread=False)."""
-        thread_id = threading.get_ident()
-        with self._read_conns_lock:
-            if self._read_conns:
-                live = {t.ident for t in threading.enumerate()}
-                for dead in [tid for tid in self._read_conns if tid not in live and tid != thread_id]:
-                    try:
-                        self._read_conns.pop(dead).close()
-                    except Exception:
-                        pass
-            if thread_id not in self._read_conns:
-                conn = sqlite3.connect(self._db_path, check_same_thread=False)
-                conn.row_factory = sqlite3.Row
-                # Wait (up to 5s) for a lock instead of erroring out immediately - otherwise a
-                # read concurrent with the maintenance VACUUM can fail with "database is locked".
-                conn.execute("PRAGMA busy_timeout = 5000;")
-                # The Monitor reloads ~a dozen multi-tier scans every few seconds on these read
-                # connections; give them the same cache + in-RAM temp B-trees + memory-mapped reads as
-                # the writer so the nested-GROUP-BY history queries don't run under-provisioned.
-                conn.execute("PRAGMA cache_size = -8000;")
-                conn.execute("PRAGMA temp_store = MEMORY;")
-                conn.execute("PRAGMA mmap_size = 268435456;")
-                self._read_conns[thread_id] = conn
-            return self._read_conns[thread_id]
-
-    def add_speed_data(self, speed_data: Dict[str, Tuple[float, float]], now: Optional[datetime] = None, aggregated_up: Optional[float] = None, aggregated_down: Optional[float] = None) -> None:
-        """Adds new per-interface speed data."""
+    def _on_db_ready(self) -> None:
+        """The worker finished initializing: hand it everything buffered during startup, load the
+        odometer, and schedule the deferred startup maintenance pass."""
+        self.logger.debug("Database ready; flushing %d buffered speed rows.", len(self._db_batch))
+        self.flush_batch()
+        if not self._usage_loaded:
+            self._try_load_usage()
+        if not self._read_only:
+            self.startup_maintenance_timer.start(timeouts.STARTUP_MAINTENANCE_DELAY_MS)
+
+    def add_speed_data(self, speed_data: Dict[str, Tuple[float, float]], now: Optional[datetime] = None, aggregated_up: Optional[float] = None, aggregated_down: Optional[float] = None, interval: Optional[float] = None) -> None:
+        """Adds new per-interface speed data. ``interval`` is the monotonic seconds the rates were
+        measured over (the controller's time_diff); it is stored with each raw row so byte totals are
+        rate × the interval actually captured rather than × whatever update_rate is configured now."""
         _now = now or datetime.now()
-        self.in_memory_history.append(SpeedDataSnapshot(speeds=speed_data.copy(), timestamp=_now))
+        self.in_memory_history.append(_now.timestamp(), speed_data)
 
         if aggregated_up is not None and aggregated_down is not None:
             total_up, total_down = aggregated_up, aggregated_down
@@ -183,19 +192,25 @@ class WidgetState(QObject):
         timestamp = int(_now.timestamp())
         max_speed = network.interface.MAX_REASONABLE_SPEED_BPS
         
+        added = 0
         with self._batch_lock:
             for interface, (up_speed, down_speed) in speed_data.items():
                 if up_speed >= network.speed.MIN_RECORDABLE_SPEED_BPS or down_speed >= network.speed.MIN_RECORDABLE_SPEED_BPS:
-                    self._db_batch.append((timestamp, interface, min(up_speed, max_speed), min(down_speed, max_speed)))
+                    self._db_batch.append((timestamp, interface, min(up_speed, max_speed), min(down_speed, max_speed), interval))
+                    added += 1
+        if added:
+            self._write_scheduler.note_rows(added)
 
 
     # Utilization stats are 0-100% and clamped; physical stats (power W, temperature °C, latency ms)
     # are NOT percentages and must be stored unclamped - a 200 ms ping or 180 W draw must not become 100.
     _PCT_STATS = frozenset({'cpu', 'gpu', 'ram', 'vram'})
 
-    def add_hardware_stat(self, stat_type: str, value: float, now: Optional[datetime] = None) -> None:
+    def add_hardware_stat(self, stat_type: str, value: float, now: Optional[datetime] = None,
+                          interval: Optional[float] = None) -> None:
         """Record a hardware sample (utilization %, power W, temperature °C, or latency ms) to the
-        in-memory deque (for graphed util stats) + the DB batch (for all, via the 3-tier rollups)."""
+        in-memory deque (for graphed util stats) + the DB batch (for all, via the 3-tier rollups).
+        ``interval`` is the seconds since the previous stats tick, if known (drives coverage %)."""
         _now = now or datetime.now()
         snapshot = HardwareStatSnapshot(value=value, timestamp=_now)
 
@@ -209,7 +224,8 @@ class WidgetState(QObject):
         # Clamp only the percentage stats; store physical stats unclamped (just floor at 0).
         v = max(0.0, min(100.0, value)) if stat_type in self._PCT_STATS else max(0.0, float(value))
         with self._batch_lock:
-            self._hw_batch.append((int(_now.timestamp()), stat_type, v))
+            self._hw_batch.append((int(_now.timestamp()), stat_type, v, interval))
+        self._write_scheduler.note_rows(1)
 
 
     # --- Data-usage odometer (data-cap feature) ------------------------------
@@ -232,16 +248,15 @@ class WidgetState(QObject):
         Returns False (so the caller defers) if the table isn't ready yet - never
         overwrites a real persisted counter with a fresh zero one."""
         try:
-            conn = self._get_read_conn()
-            cur = conn.cursor()
-            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                        (constants.data.USAGE_COUNTER_TABLE,))
-            if cur.fetchone() is None:
-                return False
-            cur.execute(
-                f"SELECT cumulative_up, cumulative_down, anchor_up, anchor_down, period_key "
-                f"FROM {constants.data.USAGE_COUNTER_TABLE} WHERE id = 1")
-            row = cur.fetchone()
+            with self._read_pool.query("usage_counter") as cur:
+                cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                            (constants.data.USAGE_COUNTER_TABLE,))
+                if cur.fetchone() is None:
+                    return False
+                cur.execute(
+                    f"SELECT cumulative_up, cumulative_down, anchor_up, anchor_down, period_key "
+                    f"FROM {constants.data.USAGE_COUNTER_TABLE} WHERE id = 1")
+                row = cur.fetchone()
             if row:
                 # Validate the persisted row - a corrupt/negative/NaN value flowing into the cap
                 # math could trigger a false 100% alert. Coerce to a finite, non-negative float
@@ -259,6 +274,9 @@ class WidgetState(QObject):
                 self._usage = {"cumulative_up": cu, "cumulative_down": cd,
                                "anchor_up": au, "anchor_down": ad, "period_key": str(row[4] or "")}
             self._usage_loaded = True
+            self._usage["cumulative_up"] += self._usage_pending_up
+            self._usage["cumulative_down"] += self._usage_pending_down
+            self._usage_pending_up = self._usage_pending_down = 0.0
             return True
         except Exception as e:
             self.logger.debug("Usage counter not ready yet: %s", e)
@@ -281,42 +299,43 @@ class WidgetState(QObject):
             u["anchor_down"] = u["cumulative_down"]
             u["period_key"] = pk
             self._persist_usage_now()
-            self._usage_last_persist = time.time()
             return True
         return False
 
     def add_usage_bytes(self, up_bytes: float, down_bytes: float) -> None:
         """Accumulate exact transferred bytes into the odometer, re-anchoring on a new
-        billing period, and persist on a throttle. Called every poll; cheap."""
-        if not self._usage_loaded and not self._try_load_usage():
-            return  # defer until the table exists, so we don't clobber the saved total
+        billing period. Called every poll; cheap - the row is persisted with the next write batch."""
+        if not self._usage_loaded and (self._db_initializing() or not self._try_load_usage()):
+            # Defer until the table exists, so we don't clobber the saved total - but keep the bytes,
+            # they are folded into the counter when it loads.
+            self._usage_pending_up += max(0.0, up_bytes)
+            self._usage_pending_down += max(0.0, down_bytes)
+            return
         u = self._usage
         # Roll the period over BEFORE adding this poll, so a boundary-crossing poll's bytes
-        # count toward the NEW period rather than being stranded at the anchor (audit #15).
-        rolled = self._maybe_reanchor()
+        # count toward the NEW period rather than being stranded at the anchor (audit #15). A rollover
+        # also requests a prompt flush, so the new period (with this poll's bytes) is on disk next tick.
+        self._maybe_reanchor()
         u["cumulative_up"] += max(0.0, up_bytes)
         u["cumulative_down"] += max(0.0, down_bytes)
-        if rolled:
-            self._persist_usage_now()  # capture this poll's bytes into the fresh period now
-            self._usage_last_persist = time.time()
-            return
-
-        now = time.time()
-        if now - self._usage_last_persist >= 30:
-            self._persist_usage_now()
-            self._usage_last_persist = now
+        self._usage_dirty = True
 
     def _persist_usage_now(self) -> None:
+        """Have the odometer row written with the next flush, and make that flush happen on the next
+        scheduler tick rather than at the deadline."""
         if not self._usage_loaded:
             return
+        self._usage_dirty = True
+        self._write_scheduler.request_prompt_flush()
+
+    def _usage_row(self) -> Tuple[float, float, float, float, str, int]:
         u = self._usage
-        self.db_worker.enqueue_task("persist_usage", (
-            u["cumulative_up"], u["cumulative_down"], u["anchor_up"], u["anchor_down"],
-            u["period_key"], int(time.time())))
+        return (u["cumulative_up"], u["cumulative_down"], u["anchor_up"], u["anchor_down"],
+                u["period_key"], int(time.time()))
 
     def get_usage_this_period(self) -> Tuple[float, float]:
         """(upload_bytes, download_bytes) used since the current period's reset day."""
-        if not self._usage_loaded and not self._try_load_usage():
+        if not self._usage_loaded and (self._db_initializing() or not self._try_load_usage()):
             return (0.0, 0.0)
         # Roll over on read too: if the reset day passed with no traffic, the anchor would
         # otherwise stay stale and report last period's usage as this period's (audit #5).
@@ -332,24 +351,39 @@ class WidgetState(QObject):
         clock/DST shift can't change it and spuriously re-fire a threshold alert - and so the
         alert period and the odometer period are one source of truth.
         """
-        if self._usage_loaded or self._try_load_usage():
+        if self._usage_loaded or (not self._db_initializing() and self._try_load_usage()):
             self._maybe_reanchor()
             return self._usage["period_key"] or self._compute_period_key(
                 self.config.get("data_cap_reset_day", 1))
         return self._compute_period_key(self.config.get("data_cap_reset_day", 1))
 
-    def flush_batch(self) -> None:
-        """Sends all batches to the database worker. Each list is swapped out for a fresh one under the
-        lock (atomic snapshot+reset), so a concurrent GUI-thread append can't land between copy and
-        clear and be lost (#6). Enqueue happens after the lock is released (the worker queue is its own
-        thread-safe handoff)."""
+    def _on_flush_tick(self) -> None:
+        """batch_persist_timer slot: flush only when the scheduler says the pending batch is due."""
+        if self._write_scheduler.due():
+            self.flush_batch()
+
+    def flush_batch(self, force: bool = False) -> None:
+        """Sends everything pending to the database worker as ONE WriteBatch (speed rows, hardware rows
+        and the odometer row, if it changed), which the worker commits in a single transaction. Each list
+        is swapped out for a fresh one under the lock (atomic snapshot+reset), so a concurrent GUI-thread
+        append can't land between copy and clear and be lost (#6). The enqueue happens under the same
+        lock: the worker registers the batch as in-flight as it is queued, so a concurrent overlay read
+        (_pending_rows) always finds every row either still pending here or in flight there.
+
+        While the worker is still initializing the DB the batches are left in place: they are the
+        startup buffer, handed over by _on_db_ready. ``force`` enqueues anyway (shutdown, or a reader
+        that is about to wait on the FIFO barrier) - the worker drains its queue once initialized."""
+        if not force and self._db_initializing():
+            return
+        usage = None
+        if self._usage_dirty and self._usage_loaded:
+            usage, self._usage_dirty = self._usage_row(), False
         with self._batch_lock:
             db_batch, self._db_batch = self._db_batch, []
             hw_batch, self._hw_batch = self._hw_batch, []
-        if db_batch:
-            self.db_worker.enqueue_task("persist_speed", db_batch)
-        if hw_batch:
-            self.db_worker.enqueue_task("persist_hardware", hw_batch)
+            if db_batch or hw_batch or usage is not None:
+                self.db_worker.enqueue_task("persist_batch", WriteBatch(db_batch, hw_batch, usage))
+        self._write_scheduler.flushed()
 
     def flush_and_wait(self, timeout: float = 2.0) -> None:
         """
@@ -360,11 +394,15 @@ class WidgetState(QObject):
         Bounded by ``timeout`` so a stalled worker can never hang the reader.
         """
         try:
-            self.flush_batch()
+            self.flush_batch(force=True)
             # If the worker thread isn't running (tests, or mid-shutdown) the signal would
             # never fire - don't burn the timeout; the flush has nothing to persist anyway.
             if not self.db_worker.isRunning():
                 return
+            # Nothing queued or mid-commit (the scheduler already flushed, and nothing was pending
+            # here): the DB is current, so skip the barrier round-trip through the worker's FIFO.
+            if not self.db_worker.outstanding_writes():
+                return
             done = threading.Event()
             self.db_worker.enqueue_task("__signal__", done)
             # Poll in short steps rather than one long wait: if the worker thread exits AFTER the
@@ -382,6 +420,74 @@ class WidgetState(QObject):
             self.logger.error("flush_and_wait failed: %s", e, exc_info=True)
 
 
+    # --- read-your-writes overlay ------------------------------------------------------------
+    # Samples not yet committed - still in the batch lists, or handed to the worker but queued /
+    # mid-transaction - are merged into the raw tier of the history queries, so reads are complete up
+    # to the current tick without waiting on the writer. They travel as ONE JSON parameter expanded by
+    # json_each, which keeps the SQL text stable whatever the row count. Each overlay row is dropped if
+    # its (timestamp, key) is already in the table: SQLite reads a single snapshot per statement, so a
+    # batch that commits while the read is in flight is counted exactly once, from the table. The
+    # committed rows come from the *_ALL views (hot raw table + sealed day partitions); the dedupe only
+    # probes the hot table, the only one a pending row can have landed in.
+    _RAW_SPEED_LIVE = f"""(
+        SELECT timestamp, interface_name, upload_bytes_sec, download_bytes_sec
+            FROM {constants.data.SPEED_TABLE_RAW_ALL}
+        UNION ALL
+        SELECT p.ts, p.iface, p.up, p.down FROM (
+            SELECT json_extract(value, '$[0]') AS ts, json_extract(value, '$[1]') AS iface,
+                   json_extract(value, '$[2]') AS up, json_extract(value, '$[3]') AS down
+            FROM json_each(?)) p
+        WHERE NOT EXISTS (SELECT 1 FROM {constants.data.SPEED_TABLE_RAW} r
+                          WHERE r.timestamp = p.ts AND r.interface_name = p.iface)
+    ) AS raw_live"""
+
+    _RAW_HW_LIVE = f"""(
+        SELECT timestamp, stat_type, value FROM {constants.data.HARDWARE_STATS_TABLE_RAW_ALL}
+        UNION ALL
+        SELECT p.ts, p.stat, p.v FROM (
+            SELECT json_extract(value, '$[0]') AS ts, json_extract(value, '$[1]') AS stat,
+                   json_extract(value, '$[2]') AS v
+            FROM json_each(?)) p
+        WHERE NOT EXISTS (SELECT 1 FROM {constants.data.HARDWARE_STATS_TABLE_RAW} r
+                          WHERE r.timestamp = p.ts AND r.stat_type = p.stat)
+    ) AS hw_raw_live"""
+
+    def _pending_rows(self, hardware: bool = False) -> List[Tuple]:
+        """Every uncommitted speed (or hardware) row: the batch list plus the worker's in-flight
+        batches. Taken under the batch lock, which flush_batch also holds while enqueueing, so no row
+        is ever between the two."""
+        with self._batch_lock:
+            rows = list(self._hw_batch if hardware else self._db_batch)
+            for batch in self.db_worker.inflight_batches():
+                rows.extend(batch.hardware if hardware else batch.speed)
+        return rows
+
+    def _pending_json(self, hardware: bool = False) -> str:
+        """The overlay parameter for _RAW_SPEED_LIVE / _RAW_HW_LIVE."""
+        width = 3 if hardware else 4
+        return json.dumps([list(r[:width]) for r in self._pending_rows(hardware)])
+
+
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """Write-path diagnostics: the scheduler's mode, deadline and pending rows, plus the worker's
+        batch sizes, commit latency, queue depth and incremental-vacuum progress."""
+        metrics = dict(self.db_worker.write_metrics.snapshot())
+        metrics.update(self.db_worker.reclaim_stats())
+        metrics.update(self._write_scheduler.snapshot())
+        metrics["deadline_sec"] = self._write_scheduler.deadline()
+        metrics["queue_depth"] = self.db_worker.queue_depth()
+        metrics["outstanding_writes"] = self.db_worker.outstanding_writes()
+        return metrics
+
+    def get_read_metrics(self) -> Dict[str, Any]:
+        """Read-path diagnostics: pool occupancy and per-query timings (see ReadConnectionPool.stats)."""
+        return self._read_pool.stats()
+
+    def add_read_hook(self, hook: Callable[[str, float, float], None]) -> None:
+        """Call ``hook(query_name, elapsed_ms, wait_ms)`` after every history/summary/total read."""
+        self._read_pool.add_hook(hook)
+
+
     def get_cpu_history(self) -> List[HardwareStatSnapshot]:
         """Returns in-memory CPU utilization history."""
         return list(self.cpu_history)
@@ -397,6 +503,44 @@ class WidgetState(QObject):
         return list(self.ram_history)
 
 
+    @staticmethod
+    def _hardware_bin_interval(duration: int) -> int:
+        """Target resolution by window length: raw (≤6h), minute (≤30d), hour (>30d)."""
+        return 1 if duration <= 6 * 3600 else (60 if duration <= 30 * 86400 else 3600)
+
+    def _hardware_history_query(self, stat_type: str, start_ts: int, end_ts: int) -> Tuple[str, Tuple]:
+        """
+        The SQL (and its parameters) behind get_hardware_history/iter_hardware_history: one
+        (bin_ts, avg) row per bin in time order.
+        """
+        interval = self._hardware_bin_interval(end_ts - start_ts)
+
+        # Union ALL tiers (non-overlapping - data is moved, not copied) and bin to the target
+        # interval, mirroring get_speed_history. A recent-but-long window (e.g. 48h or a week) has
+        # its most-recent <24h only in the RAW tier and the older portion in minute/hour; reading a
+        # single tier silently dropped the recent half (and the old fallback only fired when the tier
+        # was TOTALLY empty). Binning keeps the point count bounded by window/interval regardless.
+        # The bin width is a bound parameter so the SQL text - and its cached statement - is the same
+        # for every window.
+        HMIN = constants.data.HARDWARE_STATS_TABLE_MINUTE
+        HHOUR = constants.data.HARDWARE_STATS_TABLE_HOUR
+        bin_ts = "CAST(timestamp / ? AS INTEGER) * ?"
+        tier = (interval, interval, stat_type, start_ts, end_ts)
+        # The raw tier includes the not-yet-committed samples (read-your-writes overlay).
+        sql = f"""
+            SELECT b, AVG(v) FROM (
+                SELECT {bin_ts} AS b, value AS v FROM {self._RAW_HW_LIVE}
+                    WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
+                UNION ALL
+                SELECT {bin_ts} AS b, avg_value AS v FROM {HMIN}
+                    WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
+                UNION ALL
+                SELECT {bin_ts} AS b, avg_value AS v FROM {HHOUR}
+                    WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
+            ) GROUP BY b ORDER BY b ASC
+        """
+        return sql, (interval, interval, self._pending_json(hardware=True)) + tier[2:] + tier * 2
+
     def get_hardware_history(self, stat_type: str, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> List[Tuple[datetime, float]]:
         """
         Retrieves historical hardware utilization data from the database.
@@ -406,86 +550,111 @@ class WidgetState(QObject):
             return []
 
         try:
-            conn = self._get_read_conn()
-            cursor = conn.cursor()
-            
             _end = end_time or datetime.now()
             _start = start_time or (_end - timedelta(hours=24))
-            
-            start_ts = int(_start.timestamp())
-            end_ts = int(_end.timestamp())
-            
-            # Target resolution by window length: raw (≤6h), minute (≤30d), hour (>30d).
-            duration = end_ts - start_ts
-            interval = 1 if duration <= 6 * 3600 else (60 if duration <= 30 * 86400 else 3600)
-
-            # Union ALL tiers (non-overlapping - data is moved, not copied) and bin to the target
-            # interval, mirroring get_speed_history. A recent-but-long window (e.g. 48h or a week) has
-            # its most-recent <24h only in the RAW tier and the older portion in minute/hour; reading a
-            # single tier silently dropped the recent half (and the old fallback only fired when the tier
-            # was TOTALLY empty). Binning keeps the point count bounded by window/interval regardless.
-            HRAW = constants.data.HARDWARE_STATS_TABLE_RAW
-            HMIN = constants.data.HARDWARE_STATS_TABLE_MINUTE
-            HHOUR = constants.data.HARDWARE_STATS_TABLE_HOUR
-            bin_ts = f"CAST(timestamp / {interval} AS INTEGER) * {interval}"
-            cursor.execute(f"""
-                SELECT b, AVG(v) FROM (
-                    SELECT {bin_ts} AS b, value AS v FROM {HRAW}
-                        WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
-                    UNION ALL
-                    SELECT {bin_ts} AS b, avg_value AS v FROM {HMIN}
-                        WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
-                    UNION ALL
-                    SELECT {bin_ts} AS b, avg_value AS v FROM {HHOUR}
-                        WHERE stat_type = ? AND timestamp BETWEEN ? AND ?
-                ) GROUP BY b ORDER BY b ASC
-            """, (stat_type, start_ts, end_ts) * 3)
-            rows = cursor.fetchall()
+            sql, params = self._hardware_history_query(stat_type, int(_start.timestamp()), int(_end.timestamp()))
+            with self._read_pool.query("hardware_history") as cursor:
+                cursor.row_factory = None      # positional tuples; no sqlite3.Row per bin
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
 
             return [(datetime.fromtimestamp(row[0]), row[1]) for row in rows]
         except Exception as e:
             self.logger.error("Error fetching hardware history: %s", e, exc_info=True)
             return []
 
+    def get_hardware_history_arrays(self, stat_type: str, start_time: Optional[datetime] = None,
+                                    end_time: Optional[datetime] = None) -> Tuple[Any, Any]:
+        """
+        The get_hardware_history bins as two NumPy columns - (unix_ts int64, value float64, NaN for a
+        bin without a value) - decoded straight from the cursor by core.row_decoder, for consumers that
+        work on arrays anyway (the analytics, the outage log). No datetime or tuple per bin; the columns
+        are sized up front from the window and its bin width. Empty columns on error.
+        """
+        kinds = (row_decoder.INT, row_decoder.REAL)
+        if not getattr(self, 'db_worker', None):
+            return row_decoder.empty_columns(kinds)
+        try:
+            _end = end_time or datetime.now()
+            _start = start_time or (_end - timedelta(hours=24))
+            st, et = int(_start.timestamp()), int(_end.timestamp())
+            sql, params = self._hardware_history_query(stat_type, st, et)
+            hint = (et - st) // self._hardware_bin_interval(et - st) + 2
+            with self._read_pool.query("hardware_history") as cursor:
+                return row_decoder.query_columns(cursor, sql, params, kinds, size_hint=hint)
+        except Exception as e:
+            self.logger.error("Error fetching hardware history arrays: %s", e, exc_info=True)
+            return row_decoder.empty_columns(kinds)
+
+    def iter_hardware_history(self, stat_type: str, start_time: datetime,
+                              end_time: datetime) -> Iterator[Tuple[int, float]]:
+        """
+        Stream the same (unix_ts, value) bins as get_hardware_history, fetched EXPORT_FETCH_ROWS at a
+        time from a pooled connection held until the generator is exhausted or closed - for exports,
+        which must not hold a whole year of points in memory.
+        """
+        sql, params = self._hardware_history_query(stat_type, int(start_time.timestamp()),
+                                                   int(end_time.timestamp()))
+        with self._read_pool.query("hardware_history_stream") as cursor:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(constants.export.EXPORT_FETCH_ROWS)
+                if not rows:
+                    return
+                for ts, value in rows:
+                    if ts is not None and value is not None:
+                        yield int(ts), float(value)
+
     # --- pro-stats: tier-aware honest window summaries (exact ≤24h raw, avg+max beyond) ----------
     _RAW_SUMMARY_SECONDS = 24 * 3600   # the raw tier retains ~24h; windows within it summarize exactly
 
     def summarize_hardware(self, stat_type: str, start_time: datetime, end_time: datetime,
                            poll_interval: float = 1.0):
-        """Honest WindowSummary for a hardware stat over [start,end] (see utils.summaries)."""
+        """Honest WindowSummary for a hardware stat over [start,end] (see utils.summaries). Coverage
+        counts the capture interval recorded with each sample; ``poll_interval`` only stands in for
+        rows written before intervals were recorded."""
         from netspeedtray.utils import summaries as S
         if not getattr(self, 'db_worker', None):
             return S.summarize_raw([])
         win = max(0.0, (end_time - start_time).total_seconds())
         st, et = int(start_time.timestamp()), int(end_time.timestamp())
+        poll = poll_interval if poll_interval > 0 else 1.0
         try:
-            cur = self._get_read_conn().cursor()
-            if win <= self._RAW_SUMMARY_SECONDS:
-                cur.execute(f"SELECT value FROM {constants.data.HARDWARE_STATS_TABLE_RAW} "
-                            f"WHERE stat_type=? AND timestamp BETWEEN ? AND ?", (stat_type, st, et))
-                vals = [r[0] for r in cur.fetchall()]
-                return S.summarize_raw(vals, S.coverage_pct(len(vals), win, poll_interval))
-            # Beyond the raw horizon the window spans tiers: the recent <24h is still in RAW, older data
-            # in minute/hour. Union all three (non-overlapping - data is moved, not copied - exactly like
-            # get_speed_history) so the summary covers the WHOLE window instead of only the rolled-up
-            # older half, which silently dropped the most recent ~24h and disagreed with the graph.
-            avgs, maxes, counts = [], [], []
-            for table in (constants.data.HARDWARE_STATS_TABLE_MINUTE, constants.data.HARDWARE_STATS_TABLE_HOUR):
-                cur.execute(f"SELECT avg_value, max_value, sample_count FROM {table} "
-                            f"WHERE stat_type=? AND timestamp BETWEEN ? AND ?", (stat_type, st, et))
-                for r in cur.fetchall():
-                    if r[0] is None:
-                        continue
-                    avgs.append(r[0]); maxes.append(r[1]); counts.append(r[2] or 1)
-            cur.execute(f"SELECT value FROM {constants.data.HARDWARE_STATS_TABLE_RAW} "
-                        f"WHERE stat_type=? AND timestamp BETWEEN ? AND ?", (stat_type, st, et))
-            raw_vals = [r[0] for r in cur.fetchall() if r[0] is not None]
-            if not avgs:   # the whole window still fits the raw tier (e.g. a <24h-old install) -> exact
-                return S.summarize_raw(raw_vals, S.coverage_pct(len(raw_vals), win, poll_interval))
-            avgs += raw_vals; maxes += raw_vals; counts += [1] * len(raw_vals)   # raw samples = count-1 buckets
-            tier = "minute" if win <= 30 * 86400 else "hour"
-            return S.summarize_rollup(avgs, maxes, counts, tier,
-                                      S.coverage_pct(sum(counts), win, poll_interval))
+            with self._read_pool.query("summarize_hardware") as cur:
+                def _raw_rows():
+                    vals, intervals = row_decoder.query_columns(
+                        cur, f"SELECT value, COALESCE(interval_sec, ?) FROM {constants.data.HARDWARE_STATS_TABLE_RAW_ALL} "
+                             f"WHERE stat_type=? AND timestamp BETWEEN ? AND ?", (poll, stat_type, st, et), _REAL2)
+                    ok = ~np.isnan(vals)
+                    return vals[ok], float(intervals[ok].sum())
+
+                if win <= self._RAW_SUMMARY_SECONDS:
+                    vals, covered = _raw_rows()
+                    return S.summarize_raw(vals, S.covered_pct(covered, win))
+                # Beyond the raw horizon the window spans tiers: the recent <24h is still in RAW, older data
+                # in minute/hour. Union all three (non-overlapping - data is moved, not copied - exactly like
+                # get_speed_history) so the summary covers the WHOLE window instead of only the rolled-up
+                # older half, which silently dropped the most recent ~24h and disagreed with the graph.
+                avgs, maxes, counts = [], [], []
+                covered_seconds = 0.0
+                for table in (constants.data.HARDWARE_STATS_TABLE_MINUTE, constants.data.HARDWARE_STATS_TABLE_HOUR):
+                    a, m, c, cov = row_decoder.query_columns(
+                        cur, f"SELECT avg_value, max_value, sample_count, covered_sec FROM {table} "
+                             f"WHERE stat_type=? AND timestamp BETWEEN ? AND ?", (stat_type, st, et), _REAL4)
+                    ok = ~np.isnan(a)                                  # a bucket without an average is skipped
+                    a, m, c, cov = a[ok], m[ok], c[ok], cov[ok]
+                    c = np.where(np.isnan(c) | (c == 0), 1.0, c)       # a missing/zero count stands for one sample
+                    covered_seconds += float(np.where(np.isnan(cov), c * poll, cov).sum())
+                    avgs.append(a); maxes.append(m); counts.append(c)
+                raw_vals, raw_covered = _raw_rows()
+                if not sum(a.size for a in avgs):   # the whole window still fits the raw tier (e.g. a <24h-old install) -> exact
+                    return S.summarize_raw(raw_vals, S.covered_pct(raw_covered, win))
+                # raw samples = count-1 buckets
+                avgs = np.concatenate(avgs + [raw_vals]); maxes = np.concatenate(maxes + [raw_vals])
+                counts = np.concatenate(counts + [np.ones(raw_vals.size)])
+                tier = "minute" if win <= 30 * 86400 else "hour"
+                return S.summarize_rollup(avgs, maxes, counts, tier,
+                                          S.covered_pct(covered_seconds + raw_covered, win))
         except Exception as e:
             self.logger.error("summarize_hardware failed: %s", e, exc_info=True)
             return S.summarize_raw([])
@@ -493,7 +662,8 @@ class WidgetState(QObject):
     def summarize_network(self, direction: str, start_time: datetime, end_time: datetime,
                           interface_name: Optional[str] = None, poll_interval: float = 1.0):
         """Honest WindowSummary for 'download' or 'upload' bytes/sec over [start,end] (per interface,
-        or aggregated when interface_name is None/'all')."""
+        or aggregated when interface_name is None/'all'). Coverage uses the recorded capture intervals;
+        ``poll_interval`` only stands in for rows written before intervals were recorded."""
         from netspeedtray.utils import summaries as S
         if not getattr(self, 'db_worker', None):
             return S.summarize_raw([])
@@ -503,49 +673,51 @@ class WidgetState(QObject):
         iface = None if interface_name in (None, "all") else interface_name
         wh = "" if iface is None else " AND interface_name=?"
         params_tail = () if iface is None else (iface,)
+        poll = poll_interval if poll_interval > 0 else 1.0
         try:
-            cur = self._get_read_conn().cursor()
-
-            def _raw_vals():
-                # Sum per-timestamp across interfaces when aggregating, so an "all" summary matches the
-                # widget's aggregate rather than mixing per-NIC samples.
-                cur.execute(
-                    f"SELECT SUM({col}_bytes_sec) FROM {constants.data.SPEED_TABLE_RAW} "
-                    f"WHERE timestamp BETWEEN ? AND ?{wh} GROUP BY timestamp", (st, et) + params_tail)
-                return [r[0] for r in cur.fetchall() if r[0] is not None]
-
-            if win <= self._RAW_SUMMARY_SECONDS:
-                vals = _raw_vals()
-                return S.summarize_raw(vals, S.coverage_pct(len(vals), win, poll_interval))
-
-            # Beyond the raw horizon the window spans tiers: the recent <24h is still in RAW, older data
-            # in minute/hour. Union all three (non-overlapping, like get_speed_history) so the summary
-            # covers the WHOLE window instead of only the rolled-up older half (which dropped the most
-            # recent ~24h and disagreed with the graph for the same window).
-            avgs, maxes, counts = [], [], []
-            covered_seconds = 0.0   # for coverage: count distinct TIME buckets × their duration, NOT
-            #                         SUM(sample_count) - which, for an "all" aggregate, double-counts by
-            #                         NIC and inflates the evidence-admissibility figure past 100%.
-            for table, bucket_secs in ((constants.data.SPEED_TABLE_MINUTE, 60.0),
-                                       (constants.data.SPEED_TABLE_HOUR, 3600.0)):
-                cur.execute(
-                    f"SELECT SUM({col}_avg), MAX(t.mx), SUM(sample_count) FROM "
-                    f"(SELECT timestamp, {col}_avg, {col}_max AS mx, sample_count FROM {table} "
-                    f" WHERE timestamp BETWEEN ? AND ?{wh}) t GROUP BY t.timestamp",
-                    (st, et) + params_tail)
-                for r in cur.fetchall():
-                    if r[0] is None:
-                        continue
-                    avgs.append(r[0]); maxes.append(r[1]); counts.append(r[2] or 1)
-                    covered_seconds += bucket_secs   # one distinct timestamp bucket of this tier
-            raw_vals = _raw_vals()
-            if not avgs:   # the whole window still fits the raw tier -> exact percentiles
-                return S.summarize_raw(raw_vals, S.coverage_pct(len(raw_vals), win, poll_interval))
-            avgs += raw_vals; maxes += raw_vals; counts += [1] * len(raw_vals)   # raw samples = count-1 buckets
-            covered_seconds += len(raw_vals) * poll_interval
-            coverage = min(100.0, (covered_seconds / win * 100.0)) if win > 0 else 0.0
-            tier = "minute" if win <= 30 * 86400 else "hour"
-            return S.summarize_rollup(avgs, maxes, counts, tier, coverage)
+            with self._read_pool.query("summarize_network") as cur:
+                def _raw_rows():
+                    # Sum per-timestamp across interfaces when aggregating, so an "all" summary matches the
+                    # widget's aggregate rather than mixing per-NIC samples. The NICs of one tick share its
+                    # interval, so MAX (not SUM) is that timestamp's covered time.
+                    vals, intervals = row_decoder.query_columns(
+                        cur, f"SELECT SUM({col}_bytes_sec), MAX(COALESCE(interval_sec, ?)) FROM {constants.data.SPEED_TABLE_RAW_ALL} "
+                             f"WHERE timestamp BETWEEN ? AND ?{wh} GROUP BY timestamp", (poll, st, et) + params_tail, _REAL2)
+                    ok = ~np.isnan(vals)
+                    return vals[ok], float(intervals[ok].sum())
+
+                if win <= self._RAW_SUMMARY_SECONDS:
+                    vals, covered = _raw_rows()
+                    return S.summarize_raw(vals, S.covered_pct(covered, win))
+
+                # Beyond the raw horizon the window spans tiers: the recent <24h is still in RAW, older data
+                # in minute/hour. Union all three (non-overlapping, like get_speed_history) so the summary
+                # covers the WHOLE window instead of only the rolled-up older half (which dropped the most
+                # recent ~24h and disagreed with the graph for the same window).
+                avgs, maxes, counts = [], [], []
+                covered_seconds = 0.0   # for coverage: per distinct TIME bucket, NOT SUM(sample_count) -
+                #                         which, for an "all" aggregate, double-counts by NIC and inflates
+                #                         the evidence-admissibility figure past 100%. A bucket's recorded
+                #                         covered_sec when it has one, else its full duration (pre-v8 rows).
+                for table, bucket_secs in ((constants.data.SPEED_TABLE_MINUTE, 60.0),
+                                           (constants.data.SPEED_TABLE_HOUR, 3600.0)):
+                    a, m, c, cov = row_decoder.query_columns(
+                        cur, f"SELECT SUM({col}_avg), MAX(t.mx), SUM(sample_count), MAX(COALESCE(t.cov, ?)) FROM "
+                             f"(SELECT timestamp, {col}_avg, {col}_max AS mx, sample_count, covered_sec AS cov FROM {table} "
+                             f" WHERE timestamp BETWEEN ? AND ?{wh}) t GROUP BY t.timestamp",
+                        (bucket_secs, st, et) + params_tail, _REAL4)
+                    ok = ~np.isnan(a)
+                    a, m, c, cov = a[ok], m[ok], c[ok], cov[ok]
+                    covered_seconds += float(np.minimum(bucket_secs, cov).sum())
+                    avgs.append(a); maxes.append(m); counts.append(np.where(np.isnan(c) | (c == 0), 1.0, c))
+                raw_vals, raw_covered = _raw_rows()
+                if not sum(a.size for a in avgs):   # the whole window still fits the raw tier -> exact percentiles
+                    return S.summarize_raw(raw_vals, S.covered_pct(raw_covered, win))
+                # raw samples = count-1 buckets
+                avgs = np.concatenate(avgs + [raw_vals]); maxes = np.concatenate(maxes + [raw_vals])
+                counts = np.concatenate(counts + [np.ones(raw_vals.size)])
+                tier = "minute" if win <= 30 * 86400 else "hour"
+                return S.summarize_rollup(avgs, maxes, counts, tier, S.covered_pct(covered_seconds + raw_covered, win))
         except Exception as e:
             self.logger.error("summarize_network failed: %s", e, exc_info=True)
             return S.summarize_raw([])
@@ -560,9 +732,6 @@ class WidgetState(QObject):
             return 0.0, 0.0
 
         try:
-            conn = self._get_read_conn()
-            cursor = conn.cursor()
-            
             start_ts = int(start_time.timestamp()) if start_time else 0
             end_ts = int(end_time.timestamp())
 
@@ -572,36 +741,43 @@ class WidgetState(QObject):
             # Raw: last 2 days. Minute: last 32 days. Hour: all.
             now_ts = int(datetime.now().timestamp())
             
-            # Bytes per tier = (sum of per-sample RATES) × (the seconds that sum represents). For the
-            # MINUTE and HOUR rollups that span is the FIXED bucket duration (60 / 3600 s) - NOT
-            # sample_count × the LIVE poll interval, which silently rescales ALL historical data when the
-            # user changes the poll rate (1s→5s would 5×-over-report months of minute/hour history). When
-            # the poll rate is unchanged the two agree (sample_count × poll ≈ bucket duration); the fix
-            # only changes the rate-changed case. The raw tier has no stored capture interval, so it uses
-            # the current poll interval (it's ≤24h, where the rate rarely changes). Per the db_utils model.
+            # Bytes per tier are integrals. Since v8 each raw row carries the monotonic interval it was
+            # measured over, so the raw tier is SUM(rate × interval_sec) and the minute/hour rollups
+            # carry that integral forward as upload_bytes / download_bytes - exact under SMART mode and
+            # across poll-rate changes. Rows written before v8 have no interval (NULL) and keep the old
+            # estimate: raw × the current poll interval, rollups × their FIXED bucket duration (60 /
+            # 3600 s, never sample_count × the live poll interval, which would rescale all history
+            # when the user changes the poll rate).
             poll_interval = float(self.config.get("update_rate", 1.0) or 1.0)
             if poll_interval <= 0:  # SMART (-1.0) / invalid → ~1s nominal
                 poll_interval = 1.0
 
             tiers = []
-            if start_ts <= now_ts:                  # raw: SUM(bytes_sec) × poll_interval
-                tiers.append(("speed_history_raw", "upload_bytes_sec", "download_bytes_sec", poll_interval))
-            if start_ts < (now_ts - 24 * 3600):     # minute: SUM(avg) × 60
-                tiers.append(("speed_history_minute", "upload_avg", "download_avg", 60.0))
-            if start_ts < (now_ts - 30 * 86400):    # hour: SUM(avg) × 3600
-                tiers.append(("speed_history_hour", "upload_avg", "download_avg", 3600.0))
-
-            for table, up_expr, down_expr, secs in tiers:
-                query = f"SELECT SUM({up_expr}), SUM({down_expr}) FROM {table} WHERE timestamp BETWEEN ? AND ?"
-                params = [start_ts, end_ts]
-                if interface_name and str(interface_name).lower() != "all":
-                    query += " AND interface_name = ?"
-                    params.append(interface_name)
-                cursor.execute(query, params)
-                row = cursor.fetchone()
-                if row:
-                    total_up += (row[0] or 0.0) * secs
-                    total_down += (row[1] or 0.0) * secs
+            if start_ts <= now_ts:
+                tiers.append((constants.data.SPEED_TABLE_RAW_ALL,
+                              "upload_bytes_sec * COALESCE(interval_sec, ?)",
+                              "download_bytes_sec * COALESCE(interval_sec, ?)", poll_interval))
+            if start_ts < (now_ts - 24 * 3600):
+                tiers.append(("speed_history_minute",
+                              "COALESCE(upload_bytes, upload_avg * ?)",
+                              "COALESCE(download_bytes, download_avg * ?)", 60.0))
+            if start_ts < (now_ts - 30 * 86400):
+                tiers.append(("speed_history_hour",
+                              "COALESCE(upload_bytes, upload_avg * ?)",
+                              "COALESCE(download_bytes, download_avg * ?)", 3600.0))
+
+            with self._read_pool.query("total_bandwidth") as cursor:
+                for table, up_expr, down_expr, fallback_secs in tiers:
+                    query = f"SELECT SUM({up_expr}), SUM({down_expr}) FROM {table} WHERE timestamp BETWEEN ? AND ?"
+                    params = [fallback_secs, fallback_secs, start_ts, end_ts]
+                    if interface_name and str(interface_name).lower() != "all":
+                        query += " AND interface_name = ?"
+                        params.append(interface_name)
+                    cursor.execute(query, params)
+                    row = cursor.fetchone()
+                    if row:
+                        total_up += row[0] or 0.0
+                        total_down += row[1] or 0.0
 
             return total_up, total_down
 
@@ -618,7 +794,25 @@ class WidgetState(QObject):
             A list of SpeedDataSnapshot objects, each containing a dictionary of
             per-interface speeds for a specific timestamp.
         """
-        return list(self.in_memory_history)
+        return self.in_memory_history.snapshots()
+
+
+    def get_session_speed_history(self, interface_name: str, start_time: Optional[datetime] = None,
+                                  end_time: Optional[datetime] = None) -> List[Tuple[float, float, float]]:
+        """
+        One interface's in-memory session speeds as (unix ts, upload, download) tuples, oldest first -
+        the ticks it reported within [start_time, end_time]. Empty if the interface hasn't reported
+        this session (callers fall back to the database).
+        """
+        return self.in_memory_history.series(
+            interface_name,
+            start_time.timestamp() if start_time is not None else None,
+            end_time.timestamp() if end_time is not None else None)
+
+
+    def get_session_interfaces(self) -> List[str]:
+        """Interfaces with speeds in the in-memory session history, sorted."""
+        return self.in_memory_history.interfaces()
 
 
     def get_aggregated_speed_history(self) -> List[AggregatedSpeedData]:
@@ -656,135 +850,151 @@ class WidgetState(QObject):
         self.trigger_maintenance()
 
 
-    def get_speed_history(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, interface_name: Optional[str] = None, return_raw: bool = False, resolution: Literal['auto', 'raw', 'minute', 'hour', 'day'] = 'auto', _visited_resolutions: set = None, wait_for_flush: bool = True) -> List[Tuple[Union[datetime, float], float, float]]:
+    def _speed_history_query(self, _start_ts: int, _end_ts: int, target_res: str,
+                             interface_name: Optional[str], rollups_only: bool = False) -> Tuple[str, List[Any]]:
         """
-        Retrieves speed history by querying ALL relevant database tiers (raw, minute, hour)
-        and unifying them into a single timeline.
+        The SQL (and its parameters) behind get_speed_history/iter_speed_history: every tier that can
+        hold the window, binned to ``target_res``, one (bin_ts, up, down) row per bin in time order.
+        ``rollups_only`` (aggregated resolutions only) leaves out the raw tier and its overlay - the
+        expensive part of a long window - for the progressive graph's first, preview paint.
         """
-        # Flush AND wait for persistence so the read includes the just-buffered samples (H3):
-        # the previous fire-and-forget flush could miss them, leaving a gap at the graph edge.
-        # Only on the top-level call - the resolution recursion (which sets _visited_resolutions)
-        # must not re-barrier on every tier. Callers that run on the GUI thread on a timer (the Overview
-        # reload, every few seconds) pass wait_for_flush=False so they never block the UI up to the 2s
-        # flush timeout for a missing last second that doesn't matter at multi-hour resolution.
-        if _visited_resolutions is None and wait_for_flush:
-            self.flush_and_wait()
-
-        # 1. Timeline Setup
-        _now_ts = int(datetime.now().timestamp())
-        _start_ts = int(start_time.timestamp()) if start_time else 0
-        _end_ts = int(end_time.timestamp()) if end_time else _now_ts
-        
-        # 2. Determine Resolution
-        target_res = resolution
-        if target_res == 'auto':
-            target_res = constants.data.history_period.get_target_resolution(start_time, end_time)
-
         # Resolution -> Interval (seconds) mapping
         # 'day' maps to 86400, others to their standard seconds
-        res_map = {'raw': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
-        target_interval = res_map.get(target_res, 60)
-        
-        # 3. Build TARGETED Query (Single Table based on Resolution)
+        target_interval = constants.data.history_period.RESOLUTION_SECONDS.get(target_res, 60)
+
+        # Build TARGETED Query (Single Table based on Resolution)
         # For multi-tier queries (minute/hour), we query both the aggregated table AND raw table
         # to ensure we capture recent data that hasn't been moved to aggregates yet.
         is_all_ifaces = not interface_name or str(interface_name).lower() == "all"
-        
+
         # Map resolution to primary table and columns
         table_map = {
-            'raw': ("speed_history_raw", "upload_bytes_sec", "download_bytes_sec"),
+            'raw': (constants.data.SPEED_TABLE_RAW_ALL, "upload_bytes_sec", "download_bytes_sec"),
             'minute': ("speed_history_minute", "upload_avg", "download_avg"),
             'hour': ("speed_history_hour", "upload_avg", "download_avg"),
             'day': ("speed_history_hour", "upload_avg", "download_avg"),
         }
-        
+
         table, up_col, down_col = table_map.get(target_res, table_map['minute'])
-        
-        try:
-            conn = self._get_read_conn()
-            cursor = conn.cursor()
-            
-            # Time binning calculation
-            time_calc = f"CAST(timestamp / {target_interval} AS INTEGER) * {target_interval}"
-            
-            # Build inner query. For aggregated resolutions, construct a UNION
-            # and keep peak speed semantics (MAX) across tiers so timeline
-            # changes do not dilute/reshape the same event differently.
-            if target_res in ('minute', 'hour', 'day'):
-                # Multi-tier merge with explicit peak-preserving logic.
-                tier_queries = []
-                params = []
-
-                def add_tier_query(table_name: str, up_expr: str, down_expr: str) -> None:
-                    q = f"""
-                        SELECT
-                            {time_calc} as bin_ts,
-                            interface_name,
-                            {up_expr} as up,
-                            {down_expr} as down
-                        FROM {table_name}
-                        WHERE timestamp BETWEEN ? AND ?
-                    """
-                    tier_params = [_start_ts, _end_ts]
-                    if not is_all_ifaces:
-                        q += " AND interface_name = ?"
-                        tier_params.append(interface_name)
-                    tier_queries.append(q)
-                    params.extend(tier_params)
-
-                # Raw keeps exact per-second peaks.
-                add_tier_query(constants.data.SPEED_TABLE_RAW, "upload_bytes_sec", "download_bytes_sec")
-                # Aggregated tiers use preserved per-bucket maxima.
-                add_tier_query(constants.data.SPEED_TABLE_MINUTE, "upload_max", "download_max")
-
-                if target_res in ('hour', 'day'):
-                    add_tier_query(constants.data.SPEED_TABLE_HOUR, "upload_max", "download_max")
-
-                union_query = " UNION ALL ".join(tier_queries)
-                inner_query = f"""
+
+        # Time binning calculation. The bin width is bound, not formatted in, so each query shape
+        # (resolution tiers × interface filter) has ONE SQL text and reuses its cached statement.
+        time_calc = "CAST(timestamp / ? AS INTEGER) * ?"
+
+        # Build inner query. For aggregated resolutions, construct a UNION
+        # and keep peak speed semantics (MAX) across tiers so timeline
+        # changes do not dilute/reshape the same event differently.
+        if target_res in ('minute', 'hour', 'day'):
+            # Multi-tier merge with explicit peak-preserving logic.
+            tier_queries = []
+            params = []
+
+            def add_tier_query(table_name: str, up_expr: str, down_expr: str,
+                               source_params: Tuple = ()) -> None:
+                q = f"""
                     SELECT
-                        bin_ts,
+                        {time_calc} as bin_ts,
                         interface_name,
-                        MAX(up) as up,
-                        MAX(down) as down
-                    FROM ({union_query})
-                    GROUP BY bin_ts, interface_name
-                """
-            else:
-                # Raw resolution: single table query
-                inner_query = f"""
-                    SELECT 
-                        {time_calc} as bin_ts, 
-                        interface_name, 
-                        AVG({up_col}) as up, 
-                        AVG({down_col}) as down
-                    FROM {table}
+                        {up_expr} as up,
+                        {down_expr} as down
+                    FROM {table_name}
                     WHERE timestamp BETWEEN ? AND ?
                 """
-                params = [_start_ts, _end_ts]
+                tier_params = [target_interval, target_interval, *source_params, _start_ts, _end_ts]
                 if not is_all_ifaces:
-                    inner_query += " AND interface_name = ?"
-                    params.append(interface_name)
-                inner_query += " GROUP BY bin_ts, interface_name"
-                
-            # Outer query: aggregate bins
-            if is_all_ifaces:
-                outer_query = f"""
-                    SELECT bin_ts, COALESCE(SUM(up), 0), COALESCE(SUM(down), 0)
-                    FROM ({inner_query})
-                    GROUP BY bin_ts
-                    ORDER BY bin_ts
-                """
-            else:
-                outer_query = f"""
-                    SELECT bin_ts, COALESCE(AVG(up), 0), COALESCE(AVG(down), 0)
-                    FROM ({inner_query})
-                    GROUP BY bin_ts
-                    ORDER BY bin_ts
-                """
-            
-            cursor.execute(outer_query, tuple(params))
-            rows = cursor.fetchall()
+                    q += " AND interface_name = ?"
+                    tier_params.append(interface_name)
+                tier_queries.append(q)
+                params.extend(tier_params)
+
+            # Raw keeps exact per-second peaks.
+            if not rollups_only:
+                add_tier_query(self._RAW_SPEED_LIVE, "upload_bytes_sec", "download_bytes_sec",
+                               (self._pending_json(),))
+            # Aggregated tiers use preserved per-bucket maxima.
+            add_tier_query(constants.data.SPEED_TABLE_MINUTE, "upload_max", "download_max")
+
+            if target_res in ('hour', 'day'):
+                add_tier_query(constants.data.SPEED_TABLE_HOUR, "upload_max", "download_max")
+
+            union_query = " UNION ALL ".join(tier_queries)
+            inner_query = f"""
+                SELECT
+                    bin_ts,
+                    interface_name,
+                    MAX(up) as up,
+                    MAX(down) as down
+                FROM ({union_query})
+                GROUP BY bin_ts, interface_name
+            """
+        else:
+            # Raw resolution: single table query
+            inner_query = f"""
+                SELECT 
+                    {time_calc} as bin_ts, 
+                    interface_name, 
+                    AVG({up_col}) as up, 
+                    AVG({down_col}) as down
+                FROM {self._RAW_SPEED_LIVE}
+                WHERE timestamp BETWEEN ? AND ?
+            """
+            params = [target_interval, target_interval, self._pending_json(), _start_ts, _end_ts]
+            if not is_all_ifaces:
+                inner_query += " AND interface_name = ?"
+                params.append(interface_name)
+            inner_query += " GROUP BY bin_ts, interface_name"
+
+        # Outer query: aggregate bins
+        if is_all_ifaces:
+            outer_query = f"""
+                SELECT bin_ts, COALESCE(SUM(up), 0), COALESCE(SUM(down), 0)
+                FROM ({inner_query})
+                GROUP BY bin_ts
+                ORDER BY bin_ts
+            """
+        else:
+            outer_query = f"""
+                SELECT bin_ts, COALESCE(AVG(up), 0), COALESCE(AVG(down), 0)
+                FROM ({inner_query})
+                GROUP BY bin_ts
+                ORDER BY bin_ts
+            """
+
+        return outer_query, params
+
+    def get_speed_history(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, interface_name: Optional[str] = None, return_raw: bool = False, resolution: Literal['auto', 'raw', 'minute', 'hour', 'day'] = 'auto', _visited_resolutions: set = None) -> List[Tuple[Union[datetime, float], float, float]]:
+        """
+        Retrieves speed history by querying ALL relevant database tiers (raw, minute, hour)
+        and unifying them into a single timeline.
+
+        Never blocks on the writer: samples not yet committed are merged into the raw tier by the
+        read-your-writes overlay (_RAW_SPEED_LIVE), so the graph's right edge is complete up to the
+        current tick. (This used to flush and wait on a FIFO barrier for up to 2 s per read - H3 - and
+        the GUI-thread Overview opted out of it and accepted a gap.)
+        """
+        if _visited_resolutions is None:
+            # Read pressure: keep the scheduler's deadline short while history is being viewed, so the
+            # overlay stays a handful of rows.
+            self._write_scheduler.note_read()
+
+        # 1. Timeline Setup
+        _now_ts = int(datetime.now().timestamp())
+        _start_ts = int(start_time.timestamp()) if start_time else 0
+        _end_ts = int(end_time.timestamp()) if end_time else _now_ts
+        
+        # 2. Determine Resolution
+        target_res = resolution
+        if target_res == 'auto':
+            target_res = constants.data.history_period.get_target_resolution(start_time, end_time)
+
+        # 3. Build TARGETED Query (see _speed_history_query)
+        try:
+            outer_query, params = self._speed_history_query(_start_ts, _end_ts, target_res, interface_name)
+
+            with self._read_pool.query("speed_history") as cursor:
+                cursor.row_factory = None      # positional tuples; no sqlite3.Row per bin
+                cursor.execute(outer_query, tuple(params))
+                rows = cursor.fetchall()
             self.logger.debug("History query: target_res=%s fetched_rows=%d", target_res, len(rows))
             
             # Convert rows to standard format (Timestamp, Up, Down)
@@ -856,22 +1066,75 @@ class WidgetState(QObject):
             return []
 
 
+    def iter_speed_history(self, start_time: datetime, end_time: datetime, interface_name: Optional[str] = None,
+                           resolution: Literal['auto', 'raw', 'minute', 'hour', 'day'] = 'auto'
+                           ) -> Iterator[Tuple[int, float, float]]:
+        """
+        Stream (unix_ts, up, down) bins for the window, in time order - the query get_speed_history
+        runs, fetched EXPORT_FETCH_ROWS at a time instead of as one list. Only recorded bins: no
+        zero-fill edge padding (a graph concern) and no legacy fallback query.
+        """
+        target_res = resolution
+        if target_res == 'auto':
+            target_res = constants.data.history_period.get_target_resolution(start_time, end_time)
+        sql, params = self._speed_history_query(int(start_time.timestamp()), int(end_time.timestamp()),
+                                                target_res, interface_name)
+        with self._read_pool.query("speed_history_stream") as cursor:
+            cursor.execute(sql, tuple(params))
+            while True:
+                rows = cursor.fetchmany(constants.export.EXPORT_FETCH_ROWS)
+                if not rows:
+                    return
+                for ts, up, down in rows:
+                    if ts is not None:
+                        yield int(ts), float(up or 0.0), float(down or 0.0)
+
+    def get_speed_history_arrays(self, start_time: datetime, end_time: datetime,
+                                 interface_name: Optional[str] = None,
+                                 resolution: Literal['auto', 'raw', 'minute', 'hour', 'day'] = 'auto',
+                                 rollups_only: bool = False) -> Tuple[Any, Any, Any]:
+        """
+        The iter_speed_history bins as three NumPy columns - (unix_ts int64, up float64, down float64) -
+        decoded straight from the cursor by core.row_decoder and sized up front from the window and its
+        bin width. Same contract as iter_speed_history: only recorded bins, no zero-fill edge padding and
+        no legacy fallback query. ``rollups_only`` reads just the minute/hour tiers (see
+        _speed_history_query). Empty columns on error.
+        """
+        kinds = (row_decoder.INT, row_decoder.REAL, row_decoder.REAL)
+        if not getattr(self, 'db_worker', None):
+            return row_decoder.empty_columns(kinds)
+        target_res = resolution
+        if target_res == 'auto':
+            target_res = constants.data.history_period.get_target_resolution(start_time, end_time)
+        st, et = int(start_time.timestamp()), int(end_time.timestamp())
+        try:
+            sql, params = self._speed_history_query(st, et, target_res, interface_name,
+                                                    rollups_only=rollups_only and target_res != 'raw')
+            hint = (et - st) // constants.data.history_period.RESOLUTION_SECONDS.get(target_res, 60) + 2
+            with self._read_pool.query("speed_history") as cursor:
+                ts, up, down = row_decoder.query_columns(cursor, sql, params, kinds, size_hint=hint)
+        except sqlite3.Error as e:
+            self.logger.error("Speed history array query failed: %s", e, exc_info=True)
+            return row_decoder.empty_columns(kinds)
+        np.nan_to_num(up, copy=False)                  # the query COALESCEs already; belt and braces
+        np.nan_to_num(down, copy=False)
+        return ts, up, down
+
+
     def get_distinct_interfaces(self) -> List[str]:
         """Returns a sorted list of all unique interface names from the database."""
         try:
-            conn = self._get_read_conn()
-            cursor = conn.cursor()
-
             # Query all three tables to be comprehensive
-            cursor.execute("""
-                SELECT DISTINCT interface_name FROM speed_history_raw
-                UNION
-                SELECT DISTINCT interface_name FROM speed_history_minute
-                UNION
-                SELECT DISTINCT interface_name FROM speed_history_hour
-                ORDER BY interface_name
-            """)
-            interfaces = [row[0] for row in cursor.fetchall()]
+            with self._read_pool.query("distinct_interfaces") as cursor:
+                cursor.execute("""
+                    SELECT DISTINCT interface_name FROM speed_history_raw_all
+                    UNION
+                    SELECT DISTINCT interface_name FROM speed_history_minute
+                    UNION
+                    SELECT DISTINCT interface_name FROM speed_history_hour
+                    ORDER BY interface_name
+                """)
+                interfaces = [row[0] for row in cursor.fetchall()]
             return interfaces
         except sqlite3.Error as e:
             self.logger.error("Error fetching distinct interfaces: %s", e, exc_info=True)
@@ -886,20 +1149,18 @@ class WidgetState(QObject):
         # time.sleep(0.1)  # REMOVED: This was causing a 100ms freeze on the UI thread.
         
         try:
-            conn = self._get_read_conn()
-            cursor = conn.cursor()
-
             query = """
                 SELECT MIN(earliest_ts) FROM (
-                    SELECT MIN(timestamp) as earliest_ts FROM speed_history_raw
+                    SELECT MIN(timestamp) as earliest_ts FROM speed_history_raw_all
                     UNION ALL
                     SELECT MIN(timestamp) as earliest_ts FROM speed_history_minute
                     UNION ALL
                     SELECT MIN(timestamp) as earliest_ts FROM speed_history_hour
                 ) WHERE earliest_ts IS NOT NULL;
             """
-            cursor.execute(query)
-            result = cursor.fetchone()
+            with self._read_pool.query("earliest_timestamp") as cursor:
+                cursor.execute(query)
+                result = cursor.fetchone()
             
             if result and result[0] is not None:
                 earliest_ts = int(result[0])
@@ -911,24 +1172,52 @@ class WidgetState(QObject):
         return None
 
 
+    def export_archive(self, path: str, start_time: Optional[datetime] = None,
+                       end_time: Optional[datetime] = None, app_version: str = "") -> Dict[str, int]:
+        """
+        Write the history tiers in [start_time, end_time] (everything when omitted) to a columnar
+        archive (utils.history_archive) at ``path``. Streams from one pooled read connection, chunk by
+        chunk. Returns the rows written per tier; raises on failure so the caller can report it.
+        """
+        from netspeedtray.utils import history_archive   # numpy: off the startup path
+        self.flush_and_wait()
+        with self._read_pool.connection("archive_export") as conn:
+            return history_archive.export_archive(conn, path, start_time, end_time, app_version=app_version)
+
+
+    def import_archive(self, path: str, timeout: float = 300.0) -> Dict[str, int]:
+        """
+        Merge a history archive into the database. The merge runs on the write thread, in queue order
+        behind any pending batches; this blocks until it finishes (bounded by ``timeout``). Returns the
+        rows inserted per tier. Raises ValueError for an unreadable archive or a failed merge.
+        """
+        from netspeedtray.utils import history_archive
+        if self._read_only:
+            raise ValueError("A read-only history store cannot import an archive.")
+        history_archive.read_manifest(path)   # fail fast, before queueing anything
+        self.flush_batch(force=True)
+        request = history_archive.ArchiveImport(path)
+        self.db_worker.enqueue_task("import_archive", request)
+        if not request.done.wait(timeout):
+            raise TimeoutError(f"Archive import did not finish within {timeout:.0f}s.")
+        if request.error:
+            raise ValueError(request.error)
+        return request.result or {}
+
+
     def cleanup(self) -> None:
         """Flushes final data and cleanly stops the database worker thread."""
         self.logger.info("Cleaning up WidgetState...")
         self.batch_persist_timer.stop()
         self.maintenance_timer.stop()
-        self.flush_batch()
-        # Persist the final odometer tail so the ~30s throttle window isn't lost on exit
-        # (no-op if the counter was never loaded). The worker drains this before stopping.
+        self.startup_maintenance_timer.stop()
+        # The final flush carries the odometer tail along with the last samples (no-op for the counter
+        # if it was never loaded). The worker drains this before stopping.
         self._persist_usage_now()
+        self.flush_batch(force=True)
 
-        # Close persistent read connections
-        with self._read_conns_lock:
-            for tid, conn in self._read_conns.items():
-                try:
-                    conn.close()
-                except:
-                    pass
-            self._read_conns.clear()
+        # Close the pooled read connections (any still checked out close on checkin)
+        self._read_pool.close()
 
         self.db_worker.stop()
         # Only wait for the thread if it was actually running
@@ -936,20 +1225,6 @@ class WidgetState(QObject):
             self.db_worker.wait(2000) # Wait up to 2 seconds for the thread to finish
 
 
-    def _get_max_history_points(self) -> int:
-        """Calculates max points for the in-memory deque based on config."""
-        try:
-            history_minutes = self.config.get("history_minutes", 30)
-            update_rate_sec = self.config.get("update_rate", 1.0)
-            if update_rate_sec <= 0: update_rate_sec = 1.0
-
-            points = int(round((history_minutes * 60) / update_rate_sec))
-            return max(10, min(points, 5000))
-
-        except Exception as e:
-            self.logger.error("Error calculating max history points: %s. Using default.", e)
-            return 1800
-
     def _get_graph_buffer_points(self) -> int:
         """Capacity for the lightweight mini-graph series (aggregated speed + per-stat hardware %).
         Sized to the MAXIMUM selectable graph window - not the current one - so that growing the graph
@@ -971,17 +1246,13 @@ class WidgetState(QObject):
         """Apply updated configuration and adjust state."""
         self.logger.debug("Applying new configuration to WidgetState...")
         self.config = config.copy()
-        new_max_points = self._get_max_history_points()
-        if new_max_points != self.max_history_points:
-            self.max_history_points = new_max_points
-            self.in_memory_history = deque(self.in_memory_history, maxlen=self.max_history_points)
-            self.logger.debug("In-memory raw history capacity updated to %d points.", self.max_history_points)
 
         # The graph series buffer the *max* window, so they only resize when update_rate changes (not on
         # a timespan change - the renderer just slices a different amount from the same buffer).
         new_graph_points = self._get_graph_buffer_points()
         if new_graph_points != self._graph_buffer_points:
             self._graph_buffer_points = new_graph_points
+            self.in_memory_history.resize(new_graph_points)
             self.aggregated_history = deque(self.aggregated_history, maxlen=new_graph_points)
             self.cpu_history = deque(self.cpu_history, maxlen=new_graph_points)
             self.gpu_history = deque(self.gpu_history, maxlen=new_graph_points)
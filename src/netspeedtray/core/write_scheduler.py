@@ -0,0 +1,184 @@
+"""
+Adaptive write scheduling for WidgetState's sample batches.
+
+The batches used to go to the DB worker on a fixed 10 s ``QTimer``, and every history read with
+``wait_for_flush=True`` forced its own flush plus a ``__signal__`` barrier - so a Monitor refreshing its
+graphs turned the write path into a stream of tiny transactions, one per refresh, each with its own
+fsync-bound commit, while an idle session still woke the disk every 10 s.
+
+``WriteScheduler`` decides *when* to flush instead. The flush check runs on a cheap 1 s tick; the
+batch goes to disk once its oldest row has waited out a deadline that adapts to who is looking:
+
+* **read pressure** (a history read in the last ``DB_READ_PRESSURE_WINDOW_SEC``): the deadline drops to
+  ``DB_FLUSH_DEADLINE_MIN_SEC`` so readers find the DB nearly current and rarely have a tail to flush
+  themselves;
+* **steady** (the default): ``DB_FLUSH_DEADLINE_SEC``, the old fixed cadence;
+* **idle** (no read for ``DB_IDLE_AFTER_SEC``): ``DB_FLUSH_DEADLINE_MAX_SEC`` - fewer, bigger batches.
+
+``DB_FLUSH_MAX_ROWS`` flushes regardless, bounding memory. Each flush is one ``WriteBatch`` - speed rows,
+hardware rows and the usage odometer row - which the worker writes in a single transaction.
+``WriteMetrics`` records what that costs (batch size, commit latency, queue depth) for diagnostics.
+
+No Qt here; WidgetState owns the tick timer and the tests drive the clock directly.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from netspeedtray import constants
+
+
+class WriteBatch(NamedTuple):
+    """One flush: everything pending, persisted by the worker in a single transaction."""
+    speed: List[Tuple]                 # (timestamp, interface, up B/s, down B/s, interval_sec)
+    hardware: List[Tuple]              # (timestamp, stat_type, value, interval_sec)
+    usage: Optional[Tuple]             # odometer row for DatabaseWorker._persist_usage, or None
+
+    @property
+    def rows(self) -> int:
+        return len(self.speed) + len(self.hardware) + (1 if self.usage is not None else 0)
+
+
+class WriteScheduler:
+    """Tracks pending rows and read pressure; says when the pending batch is due."""
+
+    MODE_PRESSURE = "read-pressure"
+    MODE_STEADY = "steady"
+    MODE_IDLE = "idle"
+
+    def __init__(self,
+                 deadline_sec: float = constants.timeouts.DB_FLUSH_DEADLINE_SEC,
+                 min_deadline_sec: float = constants.timeouts.DB_FLUSH_DEADLINE_MIN_SEC,
+                 max_deadline_sec: float = constants.timeouts.DB_FLUSH_DEADLINE_MAX_SEC,
+                 pressure_window_sec: float = constants.timeouts.DB_READ_PRESSURE_WINDOW_SEC,
+                 idle_after_sec: float = constants.timeouts.DB_IDLE_AFTER_SEC,
+                 max_rows: int = constants.timeouts.DB_FLUSH_MAX_ROWS) -> None:
+        self.deadline_sec = deadline_sec
+        self.min_deadline_sec = min_deadline_sec
+        self.max_deadline_sec = max_deadline_sec
+        self.pressure_window_sec = pressure_window_sec
+        self.idle_after_sec = idle_after_sec
+        self.max_rows = max(1, int(max_rows))
+
+        self._lock = threading.Lock()      # rows arrive on the GUI thread, reads on graph workers
+        now = time.monotonic()
+        self._pending_rows = 0
+        self._oldest_pending: Optional[float] = None
+        self._last_read = -float("inf")
+        self._last_activity = now          # start "steady", not idle
+        self._prompt = False
+
+    def note_rows(self, count: int = 1, now: Optional[float] = None) -> None:
+        """``count`` rows joined the pending batch."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._pending_rows == 0:
+                self._oldest_pending = now
+            self._pending_rows += count
+
+    def note_read(self, now: Optional[float] = None) -> None:
+        """A history read happened: shorten the deadline for the next little while."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._last_read = now
+            self._last_activity = now
+
+    def request_prompt_flush(self) -> None:
+        """Flush on the next tick whatever the deadline (e.g. a billing-period rollover)."""
+        with self._lock:
+            self._prompt = True
+
+    def mode(self, now: Optional[float] = None) -> str:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self._mode(now)
+
+    def _mode(self, now: float) -> str:
+        if now - self._last_read <= self.pressure_window_sec:
+            return self.MODE_PRESSURE
+        if now - self._last_activity >= self.idle_after_sec:
+            return self.MODE_IDLE
+        return self.MODE_STEADY
+
+    def deadline(self, now: Optional[float] = None) -> float:
+        """Seconds the oldest pending row may wait in the current mode."""
+        mode = self.mode(now)
+        if mode == self.MODE_PRESSURE:
+            return self.min_deadline_sec
+        if mode == self.MODE_IDLE:
+            return self.max_deadline_sec
+        return self.deadline_sec
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """True when the pending batch should be flushed now."""
+        now = time.monotonic() if now is None else now
+        deadline = self.deadline(now)
+        with self._lock:
+            if self._prompt:
+                return True
+            if self._pending_rows == 0 or self._oldest_pending is None:
+                return False
+            return self._pending_rows >= self.max_rows or now - self._oldest_pending >= deadline
+
+    def flushed(self) -> None:
+        """The pending batch was handed to the worker."""
+        with self._lock:
+            self._pending_rows = 0
+            self._oldest_pending = None
+            self._prompt = False
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending_rows
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            age = 0.0 if self._oldest_pending is None else now - self._oldest_pending
+            return {"mode": self._mode(now), "pending_rows": self._pending_rows, "oldest_pending_sec": age}
+
+
+class WriteMetrics:
+    """Counters for the worker's batched writes. Updated on the worker thread, read from any."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.rows = 0
+        self.last_batch_rows = 0
+        self.max_batch_rows = 0
+        self.last_commit_ms = 0.0
+        self.max_commit_ms = 0.0
+        self.total_commit_ms = 0.0
+        self.last_queue_depth = 0
+        self.max_queue_depth = 0
+
+    def record(self, rows: int, commit_ms: float, queue_depth: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.rows += rows
+            self.last_batch_rows = rows
+            self.max_batch_rows = max(self.max_batch_rows, rows)
+            self.last_commit_ms = commit_ms
+            self.max_commit_ms = max(self.max_commit_ms, commit_ms)
+            self.total_commit_ms += commit_ms
+            self.last_queue_depth = queue_depth
+            self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            n = self.batches
+            return {
+                "batches": n,
+                "rows": self.rows,
+                "avg_batch_rows": (self.rows / n) if n else 0.0,
+                "last_batch_rows": self.last_batch_rows,
+                "max_batch_rows": self.max_batch_rows,
+                "avg_commit_ms": (self.total_commit_ms / n) if n else 0.0,
+                "last_commit_ms": self.last_commit_ms,
+                "max_commit_ms": self.max_commit_ms,
+                "last_queue_depth": self.last_queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+            }
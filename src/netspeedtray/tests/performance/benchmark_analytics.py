@@ -0,0 +1,103 @@
+"""
+Benchmark for the window analytics: per-sample Python loops vs utils.analytics on month-long inputs.
+
+Two month-long inputs: minute bins (43,200 pairs - what get_hardware_history returns for a month) and
+per-second samples (2.59M pairs - a raw-resolution month, the worst case). For each it times:
+  * hourly_profile  - busiest/quietest hour (legacy: dict accumulation with a try/except per sample)
+  * outage_summary  - drop runs from the gateway-timeout series (legacy: event_runs' state machine)
+  * summarize_raw   - list-comprehension rebuild + three np.percentile calls vs one np.quantile
+both through the pair-based summaries API (which converts once at the edge) and, for the first two,
+on the (timestamps, values) arrays directly - the cost once callers hold arrays.
+
+Run: python -m netspeedtray.tests.performance.benchmark_analytics   (from src/)
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from netspeedtray.utils import analytics as A
+from netspeedtray.utils import summaries as S
+
+
+def legacy_hourly_profile(pairs):
+    sums, counts = {}, {}
+    for ts, v in pairs:
+        try:
+            fv = float(v)
+            if not np.isfinite(fv):
+                continue
+            hour = ts.hour if hasattr(ts, "hour") else int((float(ts) // 3600) % 24)
+        except (TypeError, ValueError):
+            continue
+        sums[hour] = sums.get(hour, 0.0) + fv
+        counts[hour] = counts.get(hour, 0) + 1
+    return {h: sums[h] / counts[h] for h in sums if counts[h]}
+
+
+def legacy_outage_summary(pairs):
+    runs, start, prev_ts = [], None, None
+    for ts, v in pairs:
+        bad = v is not None and float(v) >= 0.5
+        if bad and start is None:
+            start = ts
+        elif not bad and start is not None:
+            runs.append((start, prev_ts if prev_ts is not None else ts))
+            start = None
+        prev_ts = ts
+    if start is not None:
+        runs.append((start, prev_ts if prev_ts is not None else start))
+    total = 0.0
+    for s, e in runs:
+        if hasattr(s, "timestamp") and hasattr(e, "timestamp"):
+            total += max(0.0, e.timestamp() - s.timestamp())
+    return {"count": len(runs), "total_down_seconds": total, "runs": runs}
+
+
+def legacy_summarize_raw(values):
+    arr = np.asarray([float(v) for v in values], dtype=float)
+    arr = arr[np.isfinite(arr)]
+    return (arr.mean(), np.percentile(arr, 50), np.percentile(arr, 95), np.percentile(arr, 99))
+
+
+def arrays_hourly(ts, vals):
+    return A.hourly_means(A.hour_of_day(ts), vals)
+
+
+def arrays_outages(ts, vals):
+    with np.errstate(invalid="ignore"):
+        starts, ends = A.run_bounds(vals >= 0.5)
+    return starts.size, float(np.maximum(ts[ends] - ts[starts], 0).sum())
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def run_benchmark() -> None:
+    rng = np.random.default_rng(0)
+    end = datetime.now().replace(microsecond=0)
+    print(f"{'input':<16} {'analysis':<16} {'legacy ms':>10} {'pairs ms':>10} {'arrays ms':>10}")
+    for label, step in (("month @ 1 min", 60), ("month @ 1 s", 1)):
+        n = 30 * 86400 // step
+        stamps = [end - timedelta(seconds=step * (n - i)) for i in range(n)]
+        load = rng.uniform(0, 100, n)
+        drops = (rng.random(n) < 0.01).astype(float)
+        load_pairs = list(zip(stamps, load.tolist()))
+        drop_pairs = list(zip(stamps, drops.tolist()))
+        ts = A.timestamps_array(stamps)
+        for name, legacy, new, arrays in (
+                ("hourly_profile", lambda: legacy_hourly_profile(load_pairs),
+                 lambda: S.hourly_profile(load_pairs), lambda: arrays_hourly(ts, load)),
+                ("outage_summary", lambda: legacy_outage_summary(drop_pairs),
+                 lambda: S.outage_summary(drop_pairs), lambda: arrays_outages(ts, drops)),
+                ("summarize_raw", lambda: legacy_summarize_raw(load.tolist()),
+                 lambda: S.summarize_raw(load.tolist()), None)):
+            arr_ms = f"{timed(arrays):>10.1f}" if arrays else f"{'-':>10}"
+            print(f"{label:<16} {name:<16} {timed(legacy):>10.1f} {timed(new):>10.1f} {arr_ms}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
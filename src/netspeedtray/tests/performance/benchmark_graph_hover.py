@@ -0,0 +1,76 @@
+"""
+Benchmark for the Monitor graph's hover lookup: per-move linear scan vs the per-render sorted index.
+
+Builds a dense 6-hour raw network graph (one sample per second, download + upload - 21,600 points per
+line) and times a sweep of cursor positions both ways:
+  * scan    - what every motion event used to do: copy each line's x/y into new float arrays and take
+              np.argmin(np.abs(x - cursor)) (O(n) per line per move)
+  * indexed - GraphHoverTooltip.lookup over HoverSeries built once per render (np.searchsorted,
+              O(log n) per line per move)
+and reports the mean cost of one hover in microseconds. Motion coalescing (at most one lookup per display
+frame) comes on top of this and isn't measured here.
+
+Run: python -m netspeedtray.tests.performance.benchmark_graph_hover   (from src/)
+"""
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import matplotlib.dates as mdates
+import numpy as np
+
+from netspeedtray.views.monitor.graph_hover import GraphHoverTooltip, HoverSeries
+
+POINTS = 6 * 3600
+MOVES = 2000
+
+
+class _Axes:
+    def __init__(self, lo, hi):
+        self._lim = (lo, hi)
+
+    def get_xlim(self):
+        return self._lim
+
+
+def scan(lines, x):
+    rows = []
+    for xs, ys in lines:
+        xd = np.asarray(xs, dtype=float)
+        yd = np.asarray(ys, dtype=float)
+        idx = int(np.argmin(np.abs(xd - x)))
+        rows.append(float(yd[idx]))
+    return rows
+
+
+def run_benchmark() -> None:
+    end = datetime.now()
+    xs = mdates.date2num([end - timedelta(seconds=POINTS - i) for i in range(POINTS)])
+    rng = np.random.default_rng(1)
+    down, up = rng.uniform(0, 1e7, POINTS), rng.uniform(0, 1e6, POINTS)
+    lines = [(list(xs), list(down)), (list(xs), list(up))]    # Line2D hands back what it was given
+
+    tip = GraphHoverTooltip(SimpleNamespace(_current_stat="network", i18n=None))
+    t0 = time.perf_counter()
+    tip._series = [HoverSeries.build("Download", "#42B883", xs, down),
+                   HoverSeries.build("Upload", "#4287F5", xs, up)]
+    build_us = (time.perf_counter() - t0) * 1e6
+    ax = _Axes(float(xs[0]), float(xs[-1]))
+    cursors = rng.uniform(xs[0], xs[-1], MOVES)
+
+    t0 = time.perf_counter()
+    for x in cursors:
+        scan(lines, x)
+    scan_us = (time.perf_counter() - t0) / MOVES * 1e6
+    t0 = time.perf_counter()
+    for x in cursors:
+        tip.lookup(ax, float(x))
+    indexed_us = (time.perf_counter() - t0) / MOVES * 1e6
+
+    print(f"{POINTS} points x 2 lines, {MOVES} hovers")
+    print(f"scan     {scan_us:>10.1f} us/hover")
+    print(f"indexed  {indexed_us:>10.1f} us/hover   (index built once per render in {build_us:.0f} us)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
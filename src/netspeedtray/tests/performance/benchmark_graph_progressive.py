@@ -0,0 +1,78 @@
+"""
+Benchmark for long network timelines: one all-tier query vs progressive, cache-backed loading.
+
+Builds the synthetic year of benchmark_stats_export (24h of per-second raw samples, 30 days of minute
+rollups, the rest hourly) and, for Week / Month / a year, reports:
+  * single     - the pre-progressive worker path: get_speed_history over the whole window
+  * first      - GraphDataWorker's first paint (the rollup-tier preview) on a cold cache
+  * complete   - the cold progressive load until its final, exact emission
+  * refresh    - the next live refresh of the same window (only the open bin re-read)
+all in milliseconds (median of a few runs; the totals query, unchanged, is excluded).
+
+Run: python -m netspeedtray.tests.performance.benchmark_graph_progressive   (from src/)
+"""
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from PyQt6.QtCore import QCoreApplication, QThread
+
+from netspeedtray import constants
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.tests.performance.benchmark_stats_export import build_year_db
+from netspeedtray.views.graph.request import DataRequest
+from netspeedtray.views.graph.worker import GraphDataWorker
+
+REPEATS = 5
+
+
+def progressive_load(ws: WidgetState, start: datetime, end: datetime, worker=None):
+    """(ms to first emission, ms to the final one) for one network request."""
+    worker = worker or GraphDataWorker(ws)
+    stamps = []
+    t0 = time.perf_counter()
+    worker.data_ready.connect(lambda *a: stamps.append(time.perf_counter()))
+    worker.process_data(DataRequest(start_time=start, end_time=end, interface_name=None,
+                                    is_session_view=False, sequence_id=1, stat_type="network"))
+    worker.data_ready.disconnect()
+    return (stamps[0] - t0) * 1000, (stamps[-1] - t0) * 1000
+
+
+def run_benchmark() -> None:
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(QThread, "start", lambda self: None), \
+             patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp):
+            ws = WidgetState(dict(constants.config.defaults.DEFAULT_CONFIG))
+        ws.db_worker._initialize_connection()
+        ws.db_worker._check_and_create_schema()
+        ws.batch_persist_timer.stop()
+        now = datetime.now().replace(microsecond=0)
+        print("Building a synthetic year of history...")
+        build_year_db(ws, now)
+
+        # Totals are the same query either way; leave them out so the series cost is what's compared.
+        with patch.object(ws, "get_total_bandwidth_for_period", return_value=(0.0, 0.0)):
+            print(f"{'window':<7} {'single':>8} {'first':>8} {'complete':>9} {'refresh':>8}")
+            for label, days in (("week", 7), ("month", 30), ("year", 365)):
+                start = now - timedelta(days=days)
+                single, first, complete, refresh = [], [], [], []
+                for _ in range(REPEATS):
+                    t0 = time.perf_counter()
+                    ws.get_speed_history(start, now, None, return_raw=True)
+                    single.append((time.perf_counter() - t0) * 1000)
+                    worker = GraphDataWorker(ws)
+                    f, c = progressive_load(ws, start, now, worker)
+                    first.append(f)
+                    complete.append(c)
+                    refresh.append(progressive_load(ws, start, now + timedelta(seconds=1), worker)[1])
+                print(f"{label:<7} {statistics.median(single):>8.1f} {statistics.median(first):>8.1f} "
+                      f"{statistics.median(complete):>9.1f} {statistics.median(refresh):>8.1f}")
+        ws.db_worker._close_connection()
+        ws.cleanup()
+
+
+if __name__ == "__main__":
+    run_benchmark()
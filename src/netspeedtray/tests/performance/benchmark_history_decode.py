@@ -0,0 +1,83 @@
+"""
+Benchmark for the history readers: row objects vs columns decoded by core.row_decoder.
+
+Seeds a day of per-second CPU samples and reads a 6h raw window (21,600 bins) and the whole day binned
+to minutes, three ways:
+  * rows    - the pre-decoder path: fetchall() of sqlite3.Row objects, then (datetime, value) pairs and
+              the float array the analytics build from them
+  * list    - get_hardware_history (positional tuples, pairs), then the same array
+  * arrays  - get_hardware_history_arrays: (int64 ts, float64 value) straight from the cursor
+and reports the median wall time and peak Python heap (tracemalloc) of each.
+
+Run: python -m netspeedtray.tests.performance.benchmark_history_decode   (from src/)
+"""
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+from PyQt6.QtCore import QCoreApplication, QThread
+
+from netspeedtray import constants
+from netspeedtray.core.widget_state import WidgetState
+
+REPEATS = 7
+
+
+def rows_path(ws: WidgetState, start: datetime, end: datetime):
+    sql, params = ws._hardware_history_query("cpu", int(start.timestamp()), int(end.timestamp()))
+    with ws._read_pool.connection("bench") as conn:
+        rows = conn.execute(sql, params).fetchall()
+    pairs = [(datetime.fromtimestamp(r[0]), r[1]) for r in rows]
+    return np.asarray([v for _, v in pairs], dtype=float)
+
+
+def list_path(ws: WidgetState, start: datetime, end: datetime):
+    return np.asarray([v for _, v in ws.get_hardware_history("cpu", start, end)], dtype=float)
+
+
+def arrays_path(ws: WidgetState, start: datetime, end: datetime):
+    return ws.get_hardware_history_arrays("cpu", start, end)[1]
+
+
+def measure(fn, *args):
+    times = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out.size, statistics.median(times) * 1000, peak / (1024 * 1024)
+
+
+def run_benchmark() -> None:
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(QThread, "start", lambda self: None), \
+             patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp):
+            ws = WidgetState(dict(constants.config.defaults.DEFAULT_CONFIG))
+        ws.db_worker._initialize_connection()
+        ws.db_worker._check_and_create_schema()
+        ws.batch_persist_timer.stop()
+        now = datetime.now().replace(microsecond=0)
+        end = int(now.timestamp())
+        ws.db_worker._persist_hardware_batch([(t, "cpu", float(t % 100), 1.0) for t in range(end - 86400, end)])
+
+        print(f"{'window':<8} {'variant':<8} {'bins':>7} {'median ms':>10} {'peak MiB':>9}")
+        for label, hours in (("6h", 6), ("24h", 24)):
+            start = now - timedelta(hours=hours)
+            for name, fn in (("rows", rows_path), ("list", list_path), ("arrays", arrays_path)):
+                n, ms, peak = measure(fn, ws, start, now)
+                print(f"{label:<8} {name:<8} {n:>7} {ms:>10.2f} {peak:>9.2f}")
+        ws.db_worker._close_connection()
+        ws.cleanup()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,77 @@
+"""
+Benchmark for the in-memory session history: a deque of SpeedDataSnapshot vs the columnar
+SessionSpeedHistory ring buffer.
+
+Feeds both a full graph buffer (5000 ticks) of 2, 4 and 8 interfaces and reports:
+  * KiB      - memory held by the history once full (tracemalloc, after the feed)
+  * append   - median µs per tick appended
+  * nic ms   - milliseconds to pull one interface's (ts, up, down) series out of it
+The deque is the pre-columnar representation (a dict copy + datetime per tick, one NIC pulled by
+iterating the snapshots); the ring buffer's per-NIC read is SessionSpeedHistory.series.
+
+Run: python -m netspeedtray.tests.performance.benchmark_session_history   (from src/)
+"""
+import statistics
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+
+from netspeedtray.core.session_history import SessionSpeedHistory, SpeedDataSnapshot
+
+TICKS = 5000
+
+
+def _ticks(nics: int):
+    t0 = time.time() - TICKS
+    return [(t0 + i, {f"nic{n}": (float(i * n), float(i + n)) for n in range(nics)}) for i in range(TICKS)]
+
+
+def feed_deque(ticks):
+    d = deque(maxlen=TICKS)
+    for t, speeds in ticks:
+        d.append(SpeedDataSnapshot(speeds=speeds.copy(), timestamp=datetime.fromtimestamp(t)))
+    return d
+
+
+def feed_ring(ticks):
+    h = SessionSpeedHistory(TICKS)
+    for t, speeds in ticks:
+        h.append(t, speeds)
+    return h
+
+
+def nic_from_deque(d, name):
+    return [(s.timestamp.timestamp(), *s.speeds[name]) for s in d if name in s.speeds]
+
+
+def measure(feed, read, ticks):
+    tracemalloc.start()
+    held = feed(ticks)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_tick = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        feed(ticks)
+        per_tick.append((time.perf_counter() - t0) / TICKS * 1e6)
+    reads = []
+    for _ in range(5):
+        t0 = time.perf_counter()
+        read(held, "nic1")
+        reads.append((time.perf_counter() - t0) * 1000)
+    return size / 1024, statistics.median(per_tick), statistics.median(reads)
+
+
+def run_benchmark() -> None:
+    print(f"{'nics':>4} {'variant':<8} {'KiB':>9} {'append':>8} {'nic ms':>8}")
+    for nics in (2, 4, 8):
+        ticks = _ticks(nics)
+        for name, feed, read in (("deque", feed_deque, nic_from_deque),
+                                 ("ring", feed_ring, lambda h, n: h.series(n))):
+            kib, us, ms = measure(feed, read, ticks)
+            print(f"{nics:>4} {name:<8} {kib:>9.1f} {us:>8.2f} {ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,118 @@
+"""
+Benchmark for the Stats export raw series: accumulate-and-sort vs the streaming merge.
+
+Builds a synthetic year of history (24h of per-second raw samples, 30 days of minute rollups, the rest
+of the year hourly - network plus three hardware stats), then writes the long-format raw CSV for a day,
+a month and the whole year both ways:
+  * legacy    - every metric's history fetched as a list (network once per direction), all rows
+                collected into one Python list, sorted, then written (the pre-streaming exporter)
+  * streaming - stats_exporter._raw_rows: one cursor per metric, heapq.merge by timestamp, rows
+                written as they arrive
+and reports wall time and peak Python heap (tracemalloc) for each.
+
+Run: python -m netspeedtray.tests.performance.benchmark_stats_export   (from src/)
+"""
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from PyQt6.QtCore import QCoreApplication, QThread
+
+from netspeedtray import constants
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.utils import stats_exporter as SE
+
+HW_STATS = ("cpu", "gpu", "ram")
+
+
+def build_year_db(ws: WidgetState, now: datetime) -> None:
+    """Fill the worker's DB with a year of synthetic history, tier by tier."""
+    w = ws.db_worker
+    end = int(now.timestamp())
+    raw_start = end - 86400
+    minute_start = (end - 30 * 86400) // 60 * 60
+    hour_start = (end - 365 * 86400) // 3600 * 3600
+    w._persist_speed_batch([(t, "eth0", 1e5 + t % 997, 5e5 + t % 991, 1.0) for t in range(raw_start, end)])
+    w._persist_hardware_batch([(t, s, float(t % 100), 1.0) for t in range(raw_start, end) for s in HW_STATS])
+    cur = w.conn.cursor()
+    cur.executemany(f"INSERT INTO {constants.data.SPEED_TABLE_MINUTE} VALUES (?, 'eth0', ?, ?, ?, ?, 60, NULL, NULL, NULL)",
+                    ((t, 1e5, 5e5, 2e5, 9e5) for t in range(minute_start, raw_start, 60)))
+    cur.executemany(f"INSERT INTO {constants.data.HARDWARE_STATS_TABLE_MINUTE} VALUES (?, ?, 50.0, 90.0, 60, 60.0)",
+                    ((t, s) for t in range(minute_start, raw_start, 60) for s in HW_STATS))
+    cur.executemany(f"INSERT INTO {constants.data.SPEED_TABLE_HOUR} VALUES (?, 'eth0', ?, ?, ?, ?, 3600, NULL, NULL, NULL)",
+                    ((t, 1e5, 5e5, 2e5, 9e5) for t in range(hour_start, minute_start, 3600)))
+    cur.executemany(f"INSERT INTO {constants.data.HARDWARE_STATS_TABLE_HOUR} VALUES (?, ?, 50.0, 90.0, 3600, 3600.0)",
+                    ((t, s) for t in range(hour_start, minute_start, 3600) for s in HW_STATS))
+    w.conn.commit()
+
+
+def legacy_raw_csv(ws: WidgetState, start: datetime, end: datetime, path: str) -> int:
+    raw_rows = []
+    for key in ("download", "upload"):
+        idx = 2 if key == "download" else 1
+        for row in ws.get_speed_history(start, end, None, resolution='auto'):
+            tsec = int(row[0].timestamp())
+            raw_rows.append((tsec, datetime.fromtimestamp(tsec).isoformat(), key, SE._bps_to_mbps(row[idx])))
+    for key in HW_STATS:
+        for ts, val in ws.get_hardware_history(key, start, end):
+            tsec = int(ts.timestamp())
+            raw_rows.append((tsec, datetime.fromtimestamp(tsec).isoformat(), key, SE._r(val)))
+    raw_rows.sort(key=lambda r: (r[0], r[2]))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["timestamp_unix", "timestamp_iso", "metric", "value"])
+        w.writerows(raw_rows)
+    return len(raw_rows)
+
+
+def streaming_raw_csv(ws: WidgetState, start: datetime, end: datetime, path: str) -> int:
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["timestamp_unix", "timestamp_iso", "metric", "value"])
+        for row in SE._raw_rows(ws, start, end, None, {"download", "upload", *HW_STATS}):
+            w.writerow(row)
+            n += 1
+    return n
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    rows = fn(*args)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak / (1024 * 1024)
+
+
+def run_benchmark() -> None:
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(QThread, "start", lambda self: None), \
+             patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp):
+            ws = WidgetState(dict(constants.config.defaults.DEFAULT_CONFIG))
+        ws.db_worker._initialize_connection()
+        ws.db_worker._check_and_create_schema()
+        ws.batch_persist_timer.stop()
+        now = datetime.now().replace(microsecond=0)
+        print("Building a synthetic year of history...")
+        build_year_db(ws, now)
+
+        print(f"{'window':<8} {'variant':<10} {'rows':>9} {'time (s)':>9} {'peak MiB':>9}")
+        for label, days in (("day", 1), ("month", 30), ("year", 365)):
+            start = now - timedelta(days=days)
+            for name, fn in (("legacy", legacy_raw_csv), ("streaming", streaming_raw_csv)):
+                out = os.path.join(tmp, f"{label}_{name}.csv")
+                rows, elapsed, peak = measure(fn, ws, start, now, out)
+                print(f"{label:<8} {name:<10} {rows:>9} {elapsed:>9.2f} {peak:>9.1f}")
+        ws.db_worker._close_connection()
+        ws.cleanup()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,104 @@
+"""
+Benchmark for core.stats_trace: recording cost, trace size and how far a replay compresses time.
+
+Records a synthetic day (86,400 ticks at 1 Hz, 4 NICs plus CPU/RAM/GPU) and replays it as fast as
+possible into a StatsController + WidgetState, persisting each minute's write batch to a temp database
+(the DB worker's persist calls, run inline). Reports:
+  * record   - median µs to record one payload, and the trace's bytes per tick
+  * replay   - wall seconds for the whole day, per stage: reading the trace alone, the controller +
+               WidgetState, and the same with the database writes
+  * x        - time compression (simulated seconds per wall second) of each stage
+
+Run: python -m netspeedtray.tests.performance.benchmark_trace_replay   (from src/)
+"""
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from PyQt6.QtCore import QCoreApplication, QThread
+
+from netspeedtray import constants
+from netspeedtray.core.controller import StatsController
+from netspeedtray.core.stats_trace import NetIOCounters, TraceReader, TraceRecorder, TraceReplaySource
+from netspeedtray.core.widget_state import WidgetState
+
+TICKS = 86_400
+NICS = ("Ethernet", "Wi-Fi", "vEthernet (WSL)", "Tailscale")
+
+
+def record_day(path: Path) -> float:
+    """Writes the synthetic day; returns the median µs per record() call."""
+    clock = [1000.0]
+    rec = TraceRecorder(path, {"update_rate": 1.0}, clock=lambda: clock[0])
+    sent = [0] * len(NICS)
+    recv = [0] * len(NICS)
+    per_call = []
+    for i in range(TICKS):
+        for n in range(len(NICS)):
+            sent[n] += (i * 7919 + n * 104729) % 50_000 >> n
+            recv[n] += (i * 6151 + n * 15485863) % 400_000 >> n
+        stats = {"network": {name: NetIOCounters(sent[n], recv[n], i, i) for n, name in enumerate(NICS)},
+                 "cpu": float(i % 100), "ram_used": 9.5, "ram_total": 32.0, "gpu": float(i % 37),
+                 "gpu_present": True}
+        t0 = time.perf_counter()
+        rec.record(stats)
+        per_call.append(time.perf_counter() - t0)
+        clock[0] += 1.0
+    rec.note_primary("Ethernet")
+    rec.close()
+    return statistics.median(per_call) * 1e6
+
+
+def replay(path: Path, tmp: str, persist: bool) -> float:
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp):
+        ws = WidgetState(dict(constants.config.defaults.DEFAULT_CONFIG))
+    ws.batch_persist_timer.stop()
+    if persist:
+        ws.db_worker._initialize_connection()
+        ws.db_worker._check_and_create_schema()
+    controller = StatsController(dict(constants.config.defaults.DEFAULT_CONFIG), ws)
+    source = TraceReplaySource(path, speed=None)
+    source.attach(controller)
+
+    def drain(_event=None) -> None:
+        if source.emitted % 60:
+            return
+        with ws._batch_lock:
+            speed, ws._db_batch = ws._db_batch, []
+            hw, ws._hw_batch = ws._hw_batch, []
+        if persist:
+            ws.db_worker._persist_speed_batch(speed)
+            ws.db_worker._persist_hardware_batch(hw)
+
+    t0 = time.perf_counter()
+    source.run(on_event=drain)
+    elapsed = time.perf_counter() - t0
+    if persist:
+        ws.db_worker._close_connection()
+    ws.cleanup()
+    return elapsed
+
+
+def run_benchmark() -> None:
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "day.nst"
+        us = record_day(path)
+        print(f"record: {us:.2f} µs/tick, {path.stat().st_size / TICKS:.1f} bytes/tick "
+              f"({path.stat().st_size / 1024 / 1024:.2f} MiB/day)")
+
+        t0 = time.perf_counter()
+        sum(1 for _ in TraceReader(path))
+        stages = [("read", time.perf_counter() - t0),
+                  ("pipeline", replay(path, tmp, persist=False)),
+                  ("+ db", replay(path, tmp, persist=True))]
+        print(f"{'stage':<10} {'wall s':>8} {'x':>9}")
+        for name, seconds in stages:
+            print(f"{name:<10} {seconds:>8.2f} {TICKS / seconds:>9.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,357 @@
+"""
+Soak test and leak detector for the Monitor's open/close lifecycle.
+
+Several past leaks only showed after many Monitor opens: a read connection per graph thread
+(WidgetState's old per-thread map, now core.read_pool), the App Activity worker and its psutil name
+cache outliving AppActivityFeed.teardown, GraphHost's worker QThreads. Each was fixed after a user
+noticed the RSS creeping. This harness looks for that class of bug directly:
+
+* a real WidgetState (temp database, DB worker thread running) and StatsController are fed a stats
+  trace (core.stats_trace - a recorded one via ``--trace``, else a synthetic one) between cycles;
+* each cycle opens a MonitorWindow on that pipeline, visits every tab, moves every tab's timeline,
+  applies a display setting and closes it (WA_DeleteOnClose, deferred deletes flushed);
+* every ``--every`` cycles ``LeakProbe`` samples RSS, the traced Python heap, live QObject wrappers and
+  widgets, OS threads, running QThreads, open SQLite connections and OS handles;
+* ``assess`` then fails any metric still growing after the warm-up: a count whose last third tops its
+  first third by more than its tolerance, or a byte metric that does so *and* keeps a positive slope
+  (bytes per cycle) above its budget. The top tracemalloc growth sites since the warm-up are printed to
+  point at the culprit.
+
+Results layout: one row per sample (cycle, then each metric), the verdict per metric, the top growth
+sites, and exit status 1 if anything leaked.
+
+Run: python -m netspeedtray.tests.performance.soak_monitor --cycles 2000   (from src/)
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import psutil
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QThread
+from PyQt6.QtWidgets import QApplication
+
+from netspeedtray import constants
+from netspeedtray.constants.i18n import I18nStrings
+from netspeedtray.core.controller import StatsController
+from netspeedtray.core.stats_trace import NetIOCounters, TraceRecorder, TraceReplaySource
+from netspeedtray.core.widget_state import WidgetState
+
+NICS = ("Ethernet", "Wi-Fi")
+
+
+# ------------------------------------------------------------------------------------------ the probe
+
+@dataclass
+class ProbeSample:
+    cycle: int
+    rss: int              # bytes
+    heap: int             # bytes traced by tracemalloc (0 when it is off)
+    qobjects: int         # live QObject wrappers
+    widgets: int          # QApplication.allWidgets()
+    threads: int          # OS threads of this process
+    qthreads: int         # running QThreads
+    sqlite: int           # open sqlite3 connections
+    handles: int          # open fds (POSIX) / handles (Windows)
+
+
+# metric -> (absolute tolerance, slope budget per cycle or None for counts)
+DEFAULT_BUDGETS: Dict[str, Tuple[float, Optional[float]]] = {
+    "rss": (16 * 1024 * 1024, 4096.0),
+    "heap": (2 * 1024 * 1024, 1024.0),
+    "qobjects": (8, None),
+    "widgets": (4, None),
+    "threads": (1, None),
+    "qthreads": (0, None),
+    "sqlite": (0, None),
+    "handles": (2, None),
+}
+
+
+def _open_sqlite(objs: Sequence[Any]) -> int:
+    n = 0
+    for o in objs:
+        if isinstance(o, sqlite3.Connection):
+            try:
+                o.in_transaction
+                n += 1
+            except sqlite3.ProgrammingError:
+                pass            # closed
+    return n
+
+
+class LeakProbe:
+    """Samples the process's leak-prone resources; call ``sample`` between cycles."""
+
+    def __init__(self, trace_heap: bool = True) -> None:
+        self._proc = psutil.Process()
+        self.trace_heap = trace_heap
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        if trace_heap and not tracemalloc.is_tracing():
+            tracemalloc.start(1)     # growth sites by line; deeper stacks slow the soak several-fold
+
+    def sample(self, cycle: int) -> ProbeSample:
+        gc.collect()
+        objs = gc.get_objects()
+        qobjects = qthreads = 0
+        for o in objs:
+            if isinstance(o, QObject):
+                try:
+                    qobjects += 1
+                    if isinstance(o, QThread) and o.isRunning():
+                        qthreads += 1
+                except RuntimeError:
+                    pass        # wrapper whose C++ object is already gone
+        handles = self._proc.num_handles() if hasattr(self._proc, "num_handles") else self._proc.num_fds()
+        return ProbeSample(
+            cycle=cycle,
+            rss=self._proc.memory_info().rss,
+            heap=tracemalloc.get_traced_memory()[0] if self.trace_heap else 0,
+            qobjects=qobjects,
+            widgets=len(QApplication.allWidgets()),
+            threads=self._proc.num_threads(),
+            qthreads=qthreads,
+            sqlite=_open_sqlite(objs),
+            handles=handles,
+        )
+
+    def mark_baseline(self) -> None:
+        """Take the heap snapshot later growth is reported against (end of the warm-up)."""
+        if self.trace_heap:
+            self._baseline = tracemalloc.take_snapshot()
+
+    def top_growth(self, limit: int = 10) -> List[str]:
+        if not self.trace_heap or self._baseline is None:
+            return []
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen *>")]
+        now = tracemalloc.take_snapshot().filter_traces(filters)
+        stats = now.compare_to(self._baseline.filter_traces(filters), "lineno")
+        return [str(s) for s in stats if s.size_diff > 0][:limit]
+
+
+def _slope(xs: Sequence[float], ys: Sequence[float]) -> float:
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    var = sum((x - mx) ** 2 for x in xs)
+    return 0.0 if var == 0 else sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+def assess(samples: Sequence[ProbeSample], warmup: int = 1,
+           budgets: Optional[Dict[str, Tuple[float, Optional[float]]]] = None) -> Dict[str, str]:
+    """Metric -> reason, for every metric that is still growing after the first ``warmup`` samples.
+    Needs at least three samples past the warm-up; with fewer, nothing can be judged (empty result)."""
+    budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+    tail = list(samples[warmup:])
+    if len(tail) < 3:
+        return {}
+    third = max(1, len(tail) // 3)
+    first, last = tail[:third], tail[-third:]
+    failures: Dict[str, str] = {}
+    for name, (tolerance, slope_budget) in budgets.items():
+        values = [getattr(s, name) for s in tail]
+        grew = max(getattr(s, name) for s in last) - max(getattr(s, name) for s in first)
+        if grew <= tolerance:
+            continue
+        if slope_budget is None:
+            failures[name] = f"+{grew} after the warm-up (tolerance {tolerance})"
+            continue
+        slope = _slope([s.cycle for s in tail], values)
+        if slope > slope_budget:
+            failures[name] = f"+{grew / 1024:.0f} KiB, {slope:.0f} B/cycle (budget {slope_budget:.0f})"
+    return failures
+
+
+# --------------------------------------------------------------------------------------- the pipeline
+
+def synthetic_trace(path: Path, ticks: int, nics: Sequence[str] = NICS) -> Path:
+    """A 1 Hz trace of ``ticks`` payloads: varying traffic on ``nics`` plus CPU/RAM/GPU."""
+    clock = [1000.0]
+    rec = TraceRecorder(path, {"update_rate": 1.0}, clock=lambda: clock[0])
+    sent, recv = [0] * len(nics), [0] * len(nics)
+    for i in range(ticks):
+        for n in range(len(nics)):
+            sent[n] += (i * 7919 + n * 104729) % 80_000
+            recv[n] += (i * 6151 + n * 15485863) % 900_000
+        rec.record({"network": {name: NetIOCounters(sent[n], recv[n]) for n, name in enumerate(nics)},
+                    "cpu": float(i % 100), "ram_used": 9.5, "ram_total": 32.0, "gpu": float(i % 37),
+                    "gpu_present": True})
+        if i == 0:
+            rec.note_primary(nics[0])
+        clock[0] += 1.0
+    rec.close()
+    return path
+
+
+class _ConfigManager:
+    def save(self, config: Dict[str, Any]) -> None:
+        pass
+
+
+class _ConfigController:
+    def __init__(self, host: "SoakHost") -> None:
+        self._host = host
+
+    def update_config(self, updates: Dict[str, Any], save_to_disk: bool = True) -> None:
+        self._host.config.update(updates)
+
+
+class SoakHost:
+    """
+    The parts of NetworkSpeedWidget the Monitor reads, backed by a real WidgetState + StatsController
+    fed from a trace. ``feed(n)`` replays the next ``n`` ticks; the trace's wall clock is anchored so its
+    end lands at "now", which keeps every Monitor period populated.
+    """
+
+    def __init__(self, data_dir: Path, trace: Optional[Path] = None, ticks: int = 7200) -> None:
+        self.config = dict(constants.config.defaults.DEFAULT_CONFIG)
+        self.config.update(monitor_cpu_enabled=True, monitor_gpu_enabled=True, latency_enabled=False)
+        self.i18n = I18nStrings("en_US")
+        self.config_manager = _ConfigManager()
+        self.config_controller = _ConfigController(self)
+        self.monitor_thread = type("MonitorThreadStub", (), {"_force_hardware_collection": False})()
+        self.session_start_time = datetime.now()
+        self.upload_speed = self.download_speed = 0.0
+        self.cpu_usage = self.gpu_usage = 0.0
+        self.cpu_temp = self.gpu_temp = self.cpu_power = self.gpu_power = None
+        self.ram_used = self.ram_total = self.vram_used = self.vram_total = None
+        self.gpu_present = True
+
+        with patch("netspeedtray.core.widget_state.get_app_data_path", return_value=data_dir):
+            self.widget_state = WidgetState(self.config)
+        self.controller = StatsController(self.config, self.widget_state)
+        self.controller.display_speed_updated.connect(self._on_speed)
+        self.controller.cpu_usage_updated.connect(lambda v: setattr(self, "cpu_usage", v))
+        self.controller.gpu_usage_updated.connect(lambda v: setattr(self, "gpu_usage", v))
+        self.controller.ram_info_updated.connect(self._on_ram)
+
+        path = trace or synthetic_trace(data_dir / "soak.nst", ticks)
+        self.source = TraceReplaySource(path, speed=None, wall_start=datetime.now() - timedelta(seconds=ticks))
+        self.source.attach(self.controller)
+
+    def _on_speed(self, up: float, down: float) -> None:
+        self.upload_speed, self.download_speed = up, down
+
+    def _on_ram(self, used: float, total: float) -> None:
+        self.ram_used, self.ram_total = used, total
+
+    def feed(self, ticks: int) -> int:
+        return self.source.run(limit=ticks)
+
+    # --- NetworkSpeedWidget API the Monitor calls
+    def get_unified_interface_list(self) -> List[str]:
+        return self.widget_state.get_session_interfaces() or list(NICS)
+
+    def open_data_usage_settings(self) -> None:
+        pass
+
+    def _hover_usage_totals(self):
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return (self.widget_state.get_total_bandwidth_for_period(midnight, now),
+                self.widget_state.get_total_bandwidth_for_period(midnight.replace(day=1), now))
+
+    def _hover_cap_info(self):
+        return None
+
+    def cleanup(self) -> None:
+        self.widget_state.cleanup()
+
+
+def pump(app: QCoreApplication, ms: int = 30) -> None:
+    """Run the event loop for ``ms`` (worker results, timers), then flush deferred deletes."""
+    deadline = time.monotonic() + ms / 1000.0
+    while time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.002)
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    app.processEvents()
+
+
+def monitor_cycle(app: QCoreApplication, host: SoakHost, cycle: int) -> None:
+    """One open -> every tab -> every tab's timeline moved -> a settings apply -> close."""
+    from netspeedtray.views.monitor.timeline_selector import TimelineSelector
+    from netspeedtray.views.monitor.window import MonitorWindow
+
+    win = MonitorWindow(host, host.config, host.i18n)
+    win.show()
+    pump(app)
+    order = TimelineSelector._ORDER
+    for i, d in enumerate(win._descriptors):
+        win._tab_bar.setCurrentIndex(i)
+        pump(app)
+        if d.page is not None:
+            for sel in d.page.findChildren(TimelineSelector):
+                sel.set_period_index(order[(cycle + i) % len(order)], emit=True)
+            pump(app)
+    host.config["monitor_graph_legend"] = not host.config.get("monitor_graph_legend", True)
+    win._on_settings_changed()
+    pump(app)
+    win.close()
+    pump(app)
+
+
+def run_soak(cycles: int, every: int = 25, warmup: int = 2, ticks_per_cycle: int = 20,
+             trace: Optional[Path] = None, trace_heap: bool = True,
+             report=print) -> Tuple[List[ProbeSample], Dict[str, str], List[str]]:
+    """Runs the soak; returns (samples, failures, top heap growth sites). ``warmup`` is in samples."""
+    app = QApplication.instance() or QApplication([])
+    probe = LeakProbe(trace_heap)
+    samples: List[ProbeSample] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        host = SoakHost(Path(tmp), trace, ticks=max(3600, cycles * ticks_per_cycle + 60))
+        try:
+            host.feed(60)
+            names = [f.name for f in fields(ProbeSample)]
+            report(" ".join(f"{n:>10}" for n in names))
+            for cycle in range(1, cycles + 1):
+                host.feed(ticks_per_cycle)
+                monitor_cycle(app, host, cycle)
+                if cycle % every == 0 or cycle == cycles:
+                    samples.append(probe.sample(cycle))
+                    if len(samples) == warmup:
+                        probe.mark_baseline()
+                    s = samples[-1]
+                    report(" ".join(f"{getattr(s, n) // (1024 if n in ('rss', 'heap') else 1):>10}"
+                                    for n in names))
+        finally:
+            host.cleanup()
+            pump(app)
+    return samples, assess(samples, warmup), probe.top_growth()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument("--every", type=int, default=25, help="sample every N cycles")
+    parser.add_argument("--warmup", type=int, default=2, help="samples ignored before judging growth")
+    parser.add_argument("--trace", type=Path, default=None, help="a recorded --record-trace file to replay")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip heap tracing (faster)")
+    args = parser.parse_args(argv)
+
+    samples, failures, growth = run_soak(args.cycles, args.every, args.warmup, trace=args.trace,
+                                         trace_heap=not args.no_tracemalloc)
+    print()
+    for name in DEFAULT_BUDGETS:
+        print(f"{name:<10} {'LEAK: ' + failures[name] if name in failures else 'ok'}")
+    if growth:
+        print("\nTop heap growth since the warm-up:")
+        for line in growth:
+            print("  " + line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
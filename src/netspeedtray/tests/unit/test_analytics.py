@@ -0,0 +1,108 @@
+"""
+Vectorized window analytics (utils.analytics, behind utils.summaries): the array versions of the
+run-length, clock-hour and percentile work must agree with the per-sample Python loops they replaced -
+kept below as references - on messy input (None/NaN readings, datetimes and unix seconds, leading and
+trailing runs).
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from netspeedtray.utils import analytics as A
+from netspeedtray.utils import summaries as S
+
+
+# --- the pre-vectorization implementations, verbatim in behaviour ------------------------------------
+def _ref_hourly_profile(pairs):
+    sums, counts = {}, {}
+    for ts, v in pairs:
+        try:
+            fv = float(v)
+            if not np.isfinite(fv):
+                continue
+            hour = ts.hour if hasattr(ts, "hour") else int((float(ts) // 3600) % 24)
+        except (TypeError, ValueError):
+            continue
+        sums[hour] = sums.get(hour, 0.0) + fv
+        counts[hour] = counts.get(hour, 0) + 1
+    return {h: sums[h] / counts[h] for h in sums if counts[h]}
+
+
+def _ref_event_runs(pairs, is_bad):
+    runs, start, prev_ts = [], None, None
+    for ts, v in pairs:
+        bad = bool(is_bad(v))
+        if bad and start is None:
+            start = ts
+        elif not bad and start is not None:
+            runs.append((start, prev_ts if prev_ts is not None else ts))
+            start = None
+        prev_ts = ts
+    if start is not None:
+        runs.append((start, prev_ts if prev_ts is not None else start))
+    return runs
+
+
+def _ref_outage_total(runs):
+    return sum(max(0.0, e.timestamp() - s.timestamp()) for s, e in runs)
+
+
+def _series(n, seed, bad_frac=0.1):
+    rng = np.random.default_rng(seed)
+    t0 = datetime(2026, 3, 1, 0, 0, 0)
+    out = []
+    for i in range(n):
+        r = rng.random()
+        v = None if r < 0.02 else (float("nan") if r < 0.03 else (1.0 if r < 0.03 + bad_frac else 0.0))
+        out.append((t0 + timedelta(seconds=37 * i), v))
+    return out
+
+
+def test_run_bounds_edges():
+    s, e = A.run_bounds(np.array([True, True, False, True, False, False, True]))
+    assert s.tolist() == [0, 3, 6] and e.tolist() == [1, 3, 6]
+    assert [a.tolist() for a in A.run_bounds(np.array([], dtype=bool))] == [[], []]
+    assert [a.tolist() for a in A.run_bounds(np.zeros(5, dtype=bool))] == [[], []]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_outage_summary_matches_the_loop(seed):
+    pairs = _series(5000, seed)
+    pairs[0] = (pairs[0][0], 1.0)                      # a run open at the start ...
+    pairs[-1] = (pairs[-1][0], 1.0)                    # ... and one still open at the end
+    ref = _ref_event_runs(pairs, lambda v: v is not None and float(v) >= 0.5)
+    o = S.outage_summary(pairs)
+    assert o["runs"] == ref and o["count"] == len(ref) and o["last_start"] == ref[-1][0]
+    assert o["total_down_seconds"] == pytest.approx(_ref_outage_total(ref))
+    assert S.event_runs(pairs, lambda v: v == 1.0) == _ref_event_runs(pairs, lambda v: v == 1.0)
+
+
+def test_hourly_profile_matches_the_loop():
+    rng = np.random.default_rng(5)
+    t0 = datetime(2026, 6, 1)
+    pairs = [(t0 + timedelta(seconds=int(s)), None if i % 97 == 0 else float(v))
+             for i, (s, v) in enumerate(zip(rng.integers(0, 30 * 86400, 20000), rng.uniform(0, 1e6, 20000)))]
+    got, ref = S.hourly_profile(pairs), _ref_hourly_profile(pairs)
+    assert got.keys() == ref.keys()
+    assert all(got[h] == pytest.approx(ref[h], rel=1e-12) for h in ref)
+    unix = [(float(int(t.timestamp())), v) for t, v in pairs]              # unix seconds: UTC hours
+    assert S.hourly_profile(unix) == pytest.approx(_ref_hourly_profile(unix), rel=1e-12)
+    assert S.hourly_profile([]) == {}
+
+
+def test_hour_of_day_is_the_local_clock_hour_across_a_dst_change():
+    # A window spanning the March and October changes in most DST zones; in a zone without DST this
+    # still checks the constant-offset path.
+    ts = np.arange(datetime(2026, 1, 1).timestamp(), datetime(2026, 12, 1).timestamp(), 1234.5)
+    expect = np.array([datetime.fromtimestamp(t).hour for t in ts.tolist()])
+    assert (A.hour_of_day(ts) == expect).all()
+    assert A.hour_of_day(np.array([np.nan, 72000.0]), utc=True).tolist() == [-1, 20]
+
+
+def test_summarize_raw_quantiles_match_percentile():
+    vals = np.random.default_rng(9).lognormal(10, 2, 10001)
+    s = S.summarize_raw(list(vals) + [None, float("nan")])
+    assert s.count == vals.size
+    assert (s.p50, s.p95, s.p99) == tuple(float(np.percentile(vals, q)) for q in (50, 95, 99))
+    assert s.stddev == pytest.approx(float(vals.std()))
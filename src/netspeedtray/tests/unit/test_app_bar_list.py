@@ -1,12 +1,13 @@
 """
-AppBarList + AppActivityFeed - the Monitor Network tab's per-app connection list. Verifies the bar
-list builds/reuses/removes rows in place, summarises honestly, handles empty + RDP-unavailable
+AppBarList + AppActivityFeed - the Monitor Network tab's per-app connection list. Verifies the keyed
+model builds/updates/removes rows in place, summarises honestly, handles empty + RDP-unavailable
 states, and that the feed degrades to an 'unavailable' signal under RDP without spawning a thread.
 """
 import pytest
 
 from netspeedtray.constants.i18n import I18nStrings
-from netspeedtray.views.monitor.network.app_list import AppBarList, AppRow, _ActivityBar
+from netspeedtray.views.monitor.keyed_list import ROW_ROLE
+from netspeedtray.views.monitor.network.app_list import AppBarList, _ActivityBar
 from netspeedtray.views.monitor.network.app_feed import AppActivityFeed
 
 
@@ -33,18 +34,17 @@ def _payload(rows, **kw):
 def test_rows_built_and_summarised(q_app):
     lst = AppBarList(I18nStrings("en_US"))
     lst.set_payload(_payload([_row("chrome.exe", 18, est=5, hosts=7), _row("svchost", 2, est=0)]))
-    assert set(lst._rows.keys()) == {"chrome.exe", "svchost"}
+    assert set(lst._model.keys()) == {"chrome.exe", "svchost"}
     assert "2" in lst._summary.text()  # 2 apps
 
 
 def test_rows_updated_in_place_and_pruned(q_app):
     lst = AppBarList(I18nStrings("en_US"))
     lst.set_payload(_payload([_row("a", 4, est=1), _row("b", 2)]))
-    row_a = lst._rows["a"]
     lst.set_payload(_payload([_row("a", 9, est=2)]))   # b gone, a updated
-    assert lst._rows["a"] is row_a                      # reused, not recreated
-    assert "b" not in lst._rows
-    assert row_a._count.text() == "9"
+    assert lst._model.last_stats == {"removed": 1, "moved": 0, "inserted": 0, "changed": 1}
+    assert lst._model.keys() == ["a"]
+    assert lst._model.index(0, 0).data(ROW_ROLE)["conn_count"] == 9
 
 
 def test_empty_and_rdp_states(q_app):
@@ -63,10 +63,7 @@ def test_stable_active_first_then_name_sort(q_app):
         _row("alpha.exe", 2, est=1),             # active (TCP established)
         _row("mid.exe", 30, est=0, hosts=2),     # active via UDP/host, despite 0 established
     ]))
-    L = lst._list_layout
-    assert L.itemAt(0).widget() is lst._rows["alpha.exe"]
-    assert L.itemAt(1).widget() is lst._rows["mid.exe"]
-    assert L.itemAt(2).widget() is lst._rows["zeta.exe"]
+    assert lst._model.keys() == ["alpha.exe", "mid.exe", "zeta.exe"]
     assert "2 active" in lst._summary.text()     # UDP/host app counts as active
 
 
@@ -74,18 +71,20 @@ def test_bar_uses_log_scale_not_linear(q_app):
     """A dominant process must not squash small apps to nothing - log scale keeps them visible."""
     lst = AppBarList(I18nStrings("en_US"))
     lst.set_payload(_payload([_row("big", 100, est=1), _row("small", 1, est=1)]))
-    big = lst._rows["big"]._bar._frac
-    small = lst._rows["small"]._bar._frac
+    ctx = lst._model.context
+    big = lst._delegate.cells(lst.get_row("big"), ctx).frac
+    small = lst._delegate.cells(lst.get_row("small"), ctx).frac
     assert big == 1.0 and small < big
     assert small > 0.1               # linear would be 0.01 (a stub); log keeps it legible
 
 
-def test_no_spacer_or_widget_leak_across_ticks(q_app):
-    """Repeated refreshes keep exactly len(rows)+1 layout items (rows + the single stretch)."""
+def test_identical_ticks_repaint_nothing(q_app):
+    """Repeated identical refreshes keep exactly len(rows) model rows and emit no change signals."""
     lst = AppBarList(I18nStrings("en_US"))
     for _ in range(5):
         lst.set_payload(_payload([_row("a", 3, est=1), _row("b", 2, est=1)]))
-    assert lst._list_layout.count() == 3   # 2 rows + 1 trailing stretch, not growing
+    assert lst._model.rowCount() == 2
+    assert lst._model.last_stats == {"removed": 0, "moved": 0, "inserted": 0, "changed": 0}
 
 
 def test_activity_bar_paints(q_app):
@@ -25,20 +25,15 @@ def _sensor(name, identifier, value):
     s = MagicMock()
     s.Name = name
     s.Identifier = identifier
+    s.SensorType = "Temperature"
     s.Value = value
     return s
 
 
 def _wmi_returning(sensors):
-    """An LHM WMI stub. _poll_cpu_temperature queries twice: exact 'CPU Package', then broad."""
+    """An LHM WMI stub. The monitor takes one Temperature+Power snapshot per tick."""
     wmi = MagicMock()
-
-    def exec_query(query):
-        if "Name='CPU Package'" in query:
-            return [s for s in sensors if s.Name == "CPU Package"]
-        return sensors
-
-    wmi.ExecQuery.side_effect = exec_query
+    wmi.ExecQuery.return_value = sensors
     return wmi
 
 
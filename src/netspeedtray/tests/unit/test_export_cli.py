@@ -36,6 +36,12 @@ def test_unknown_period_is_rejected(capsys):
     assert "Unknown" in capsys.readouterr().err
 
 
+def test_interface_is_rejected_with_the_archive_format(capsys):
+    code = CLI.run_export_cli(["--export-csv", "--format", "archive", "--interface", "Ethernet"])
+    assert code == 2
+    assert "--interface" in capsys.readouterr().err
+
+
 def test_emit_survives_none_stream(caplog):
     """The shipped exe is built console=False, so sys.stdout/sys.stderr are None. _emit must never raise
     on a None stream (a bare .write would AttributeError) - it logs instead."""
@@ -1,16 +1,25 @@
 """
 GraphHoverTooltip - the Monitor graph's lightweight hover readout (ported feature: the one thing the
-old Graph window had that the Monitor lacked). The mouse-snap path needs a live matplotlib canvas, so
-that's covered by a standalone smoke script; here we cover the canvas-free formatting: the network graph
-formats values as speed, the hardware graphs as percent, and the timestamp + series name are shown.
+old Graph window had that the Monitor lacked). Drawing on a live canvas is covered by a standalone smoke
+script; here we cover the canvas-free parts: the network graph formats values as speed, the hardware
+graphs as percent, the timestamp + series name are shown, the per-render index snaps to the same sample
+a linear scan would, and a burst of motion events is handled once per frame.
 """
 from datetime import datetime
 from types import SimpleNamespace
 
 import matplotlib.dates as mdates
+import numpy as np
+import pytest
 
 from netspeedtray.constants.i18n import I18nStrings
-from netspeedtray.views.monitor.graph_hover import GraphHoverTooltip
+from netspeedtray.views.monitor.graph_hover import GraphHoverTooltip, HoverSeries
+
+
+@pytest.fixture(scope="session")
+def q_app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
 
 
 def _host(stat):
@@ -35,3 +44,57 @@ def test_hardware_hover_formats_percent():
     assert "09:05:00" in html
     assert "CPU" in html and "42%" in html
     assert "RAM" in html and "67%" in html             # multiple series at the cursor time
+
+
+class _Axes:
+    def __init__(self, lo, hi):
+        self._lim = (lo, hi)
+
+    def get_xlim(self):
+        return self._lim
+
+
+def test_index_lookup_matches_a_linear_scan():
+    """searchsorted over the per-render index picks the same nearest sample as the old argmin scan -
+    including for unsorted input, ties, the ends, and a cursor too far from any sample."""
+    rng = np.random.default_rng(3)
+    xs = rng.uniform(0.0, 100.0, 2000)
+    ys = rng.uniform(0.0, 1.0, 2000)
+    t = GraphHoverTooltip(_host("network"))
+    t._series = [HoverSeries.build("Download", "#42B883", xs, ys)]
+    ax = _Axes(0.0, 100.0)
+    for x in list(rng.uniform(-1.0, 101.0, 500)) + [0.0, 100.0, float(xs[7])]:
+        i = int(np.argmin(np.abs(xs - x)))
+        nearest_x, rows = t.lookup(ax, x)
+        assert nearest_x == pytest.approx(xs[i]) and rows[0][1] == pytest.approx(ys[i])
+    t._series = [HoverSeries.build("CPU", "#00BCD4", [10.0, 12.0], [1.0, 2.0])]
+    assert t.lookup(ax, 11.0)[0] == 10.0 and t.lookup(ax, 11.0 + 1e-9)[0] == 12.0
+    assert t.lookup(ax, 80.0) == (None, [])                 # > _MAX_SNAP_FRAC of the range away
+
+
+def test_index_is_scoped_to_its_axes():
+    top, bottom = _Axes(0.0, 10.0), _Axes(0.0, 10.0)
+    t = GraphHoverTooltip(_host("hwseparate"))
+    t._series = [HoverSeries.build("CPU", "#00BCD4", [1.0, 2.0], [5.0, 6.0], top),
+                 HoverSeries.build("GPU", "#FF9800", [1.0, 2.0], [7.0, 8.0], bottom)]
+    assert [r[0] for r in t.lookup(top, 1.1)[1]] == ["CPU"]
+    assert [r[0] for r in t.lookup(bottom, 1.1)[1]] == ["GPU"]
+
+
+def test_motion_events_coalesce_to_one_lookup_per_frame(q_app, monkeypatch):
+    """A burst of moves inside one frame records only the cursor; the frame timer then does a single
+    lookup, at the latest position."""
+    from PyQt6.QtWidgets import QLabel
+    t = GraphHoverTooltip(_host("network"))
+    t._label = QLabel()
+    ax = _Axes(0.0, 100.0)
+    seen = []
+    monkeypatch.setattr(t, "lookup", lambda a, x: (seen.append(x), (None, []))[1])
+    for x in range(50):
+        t._on_move(SimpleNamespace(inaxes=ax, xdata=float(x), x=0.0, y=0.0))
+    assert seen == [] and t._frame_timer.isActive()
+    t._frame_timer.stop()
+    t._process_pending()
+    assert seen == [49.0]
+    t._on_move(SimpleNamespace(inaxes=None, xdata=None, x=0.0, y=0.0))   # leaving cancels the frame
+    assert not t._frame_timer.isActive() and t._pending is None
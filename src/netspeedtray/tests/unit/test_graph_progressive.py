@@ -0,0 +1,160 @@
+"""
+Progressive loading for long network timelines (views/graph/progressive.py + GraphDataWorker).
+
+A Week/Month window is painted from the rollup tiers first, then refined chunk by chunk; the refined
+series must be bin-for-bin what the single all-tier query returns, and a later request inside the
+loaded span (a live refresh, a zoom) must only fetch what is missing.
+"""
+import math
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.views.graph import progressive as P
+from netspeedtray.views.graph.request import DataRequest
+from netspeedtray.views.graph.worker import GraphDataWorker
+
+HOUR = 3600
+
+
+def test_split_newest_first_is_contiguous_and_complete():
+    ranges = [(0, 10 * HOUR), (20 * HOUR, 26 * HOUR)]
+    chunks = P.split_newest_first(ranges, HOUR, 3)
+    assert chunks[0][1] == 26 * HOUR                              # newest piece first
+    assert all(lo % HOUR == 0 and hi % HOUR == 0 for lo, hi in chunks)
+    covered = sorted(h for lo, hi in chunks for h in range(lo, hi, HOUR))
+    assert covered == list(range(0, 10 * HOUR, HOUR)) + list(range(20 * HOUR, 26 * HOUR, HOUR))
+
+
+def test_loaded_series_plans_only_the_missing_head_and_open_tail():
+    s = P.LoadedSeries(None, "hour", HOUR)
+    assert s.plan((0, 10 * HOUR)) is None                         # nothing loaded -> start over
+    ts = np.arange(5 * HOUR, 10 * HOUR, HOUR)
+    s.merge((5 * HOUR, 10 * HOUR), (ts, ts * 1.0, ts * 2.0), now_ts=9 * HOUR + 10)
+    assert (s.lo, s.hi, s.closed) == (5 * HOUR, 10 * HOUR, 9 * HOUR)   # the bin holding "now" stays open
+    assert s.plan((6 * HOUR, 9 * HOUR)) == []                     # inside the closed bins: a pure hit
+    assert s.plan((2 * HOUR, 11 * HOUR)) == [(2 * HOUR, 5 * HOUR), (9 * HOUR, 11 * HOUR)]
+    assert s.plan((20 * HOUR, 30 * HOUR)) is None                 # disjoint
+
+
+def test_loaded_series_window_fills_unrefined_bins_from_the_preview():
+    s = P.LoadedSeries(None, "hour", HOUR)
+    ts = np.arange(6 * HOUR, 10 * HOUR, HOUR)
+    s.merge((6 * HOUR, 10 * HOUR), (ts, np.full(4, 9.0), np.full(4, 9.0)), now_ts=20 * HOUR)
+    p_ts = np.arange(0, 10 * HOUR, HOUR)
+    w_ts, w_up, _ = s.window((0, 10 * HOUR), (p_ts, np.ones(10), np.ones(10)))
+    assert w_ts.tolist() == p_ts.tolist()
+    assert w_up.tolist() == [1.0] * 6 + [9.0] * 4                 # exact bins win where loaded
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> Iterator[WidgetState]:
+    cfg = constants.config.defaults.DEFAULT_CONFIG.copy()
+    with patch.object(QThread, "start", lambda self: None):
+        with patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+            ws = WidgetState(cfg)
+    w = ws.db_worker
+    w.db_path = tmp_path / "speed_history.db"
+    w._initialize_connection()
+    w._check_and_create_schema()
+    ws.batch_persist_timer.stop()
+    yield ws
+    w._close_connection()
+    ws.cleanup()
+
+
+def _seed(ws: WidgetState, now: datetime) -> None:
+    """Ten days on two NICs: the last 24h in raw (every 10 s), the rest in the minute tier."""
+    end = int(now.timestamp())
+    raw_start = end - 86400
+    cur = ws.db_worker.conn.cursor()
+    cur.executemany(
+        f"INSERT INTO {constants.data.SPEED_TABLE_RAW} (timestamp, interface_name, upload_bytes_sec, "
+        f"download_bytes_sec) VALUES (?, ?, ?, ?)",
+        [(t, nic, float(t % 977), float(t % 991) * 3) for t in range(raw_start, end, 10) for nic in ("eth0", "wlan0")])
+    cur.executemany(
+        f"INSERT INTO {constants.data.SPEED_TABLE_MINUTE} (timestamp, interface_name, upload_avg, download_avg, "
+        f"upload_max, download_max, sample_count) VALUES (?, ?, 1, 2, ?, ?, 60)",
+        [(t, nic, float(t % 613), float(t % 617)) for t in range((end - 10 * 86400) // 60 * 60, raw_start, 60)
+         for nic in ("eth0", "wlan0")])
+    ws.db_worker.conn.commit()
+
+
+def _request(start: datetime, end: datetime, seq: int) -> DataRequest:
+    return DataRequest(start_time=start, end_time=end, interface_name=None, is_session_view=False,
+                       sequence_id=seq, stat_type="network")
+
+
+def _run(worker: GraphDataWorker, request: DataRequest):
+    got = []
+    worker.data_ready.connect(lambda *a: got.append(a))
+    worker.process_data(request)
+    worker.data_ready.disconnect()
+    return got
+
+
+def _week(now: datetime):
+    return datetime.fromtimestamp(P.align((now - timedelta(days=7)).timestamp(), HOUR)), now
+
+
+def test_week_view_paints_a_preview_then_the_exact_series(q_app, state):
+    now = datetime.now().replace(microsecond=0)
+    _seed(state, now)
+    start, end = _week(now)
+    got = _run(GraphDataWorker(state), _request(start, end, 1))
+
+    assert len(got) >= 2
+    assert all(math.isnan(g[1]) for g in got[:-1])                 # previews/partials: totals unknown
+    assert not math.isnan(got[-1][1]) and got[-1][2] > 0
+    raw_start = int(end.timestamp()) - 86400
+    assert not [p for p in got[0][0] if p[0] >= raw_start and p[2] > 0]   # the preview skipped the raw tier
+    expected = state.get_speed_history(start, end, None, return_raw=True)
+    assert [p[0] for p in got[-1][0]] == [p[0] for p in expected]
+    assert [p[1:] for p in got[-1][0]] == pytest.approx([p[1:] for p in expected])
+
+
+def test_refresh_and_zoom_reuse_the_loaded_bins(q_app, state):
+    now = datetime.now().replace(microsecond=0)
+    _seed(state, now)
+    start, end = _week(now)
+    worker = GraphDataWorker(state)
+    _run(worker, _request(start, end, 1))
+
+    calls = []
+    real = state.get_speed_history_arrays
+
+    def spy(s, e, *a, **k):
+        calls.append((int(s.timestamp()), int(e.timestamp()) + 1))
+        return real(s, e, *a, **k)
+
+    with patch.object(state, "get_speed_history_arrays", side_effect=spy):
+        refresh = _run(worker, _request(start, end + timedelta(seconds=5), 2))
+        assert len(refresh) == 1 and not math.isnan(refresh[0][1])
+        assert len(calls) == 1 and calls[0][1] - calls[0][0] <= 2 * HOUR    # only the open bin onward
+
+        calls.clear()
+        zoom = _run(worker, _request(start + timedelta(days=1), start + timedelta(days=5), 3))
+        assert calls == [] and len(zoom) == 1                                 # served from the loaded span
+
+
+def test_a_newer_request_stops_the_refinement(q_app, state):
+    now = datetime.now().replace(microsecond=0)
+    _seed(state, now)
+    start, end = _week(now)
+    worker = GraphDataWorker(state)
+    real = state.get_speed_history_arrays
+
+    def newer_arrives(*a, **k):
+        worker.note_requested(2)
+        return real(*a, **k)
+
+    with patch.object(state, "get_speed_history_arrays", side_effect=newer_arrives):
+        got = _run(worker, _request(start, end, 1))
+    assert got and all(math.isnan(g[1]) for g in got)               # never finished with totals
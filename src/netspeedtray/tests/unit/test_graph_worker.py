@@ -25,10 +25,26 @@ def test_session_all_interfaces_uses_in_memory_aggregate(q_app):
     ws.get_speed_history.assert_not_called()
 
 
+def test_session_specific_nic_is_served_from_the_per_interface_buffer(q_app):
+    """Session view scoped to ONE NIC reads that interface's column of the in-memory session buffer -
+    never the all-interfaces aggregate, and no DB query."""
+    ws = MagicMock()
+    ws.get_session_speed_history.return_value = [(1.0, 10.0, 20.0), (2.0, 30.0, 40.0)]
+    got = []
+    worker = GraphDataWorker(ws)
+    worker.data_ready.connect(lambda *a: got.append(a))
+    worker.process_data(_session_net_request("Ethernet", 1))
+    assert ws.get_session_speed_history.call_args.args[0] == "Ethernet"
+    assert got == [([(1.0, 10.0, 20.0), (2.0, 30.0, 40.0)], 40.0, 60.0, 1)]
+    ws.get_speed_history.assert_not_called()
+    ws.get_aggregated_speed_history.assert_not_called()
+
+
 def test_session_specific_nic_reads_per_interface_from_db(q_app):
-    """Session view scoped to ONE NIC must read that interface from the DB (the in-memory aggregate is
-    all-interfaces only), not silently show the aggregate - the 2.0 NIC-filter fix."""
+    """Session view scoped to ONE NIC that hasn't reported this session must read that interface from
+    the DB, not silently show the aggregate - the 2.0 NIC-filter fix."""
     ws = MagicMock()
+    ws.get_session_speed_history.return_value = []
     ws.get_speed_history.return_value = []
     ws.get_total_bandwidth_for_period.return_value = (0.0, 0.0)
     GraphDataWorker(ws).process_data(_session_net_request("Ethernet", 1))
@@ -8,7 +8,7 @@ import types
 import pytest
 
 from netspeedtray.constants.i18n import I18nStrings
-from netspeedtray.views.monitor.hardware.list import HardwareBarList, HardwareRow
+from netspeedtray.views.monitor.hardware.list import HardwareBarList
 from netspeedtray.views.monitor.hardware.feed import HardwareFeed
 import netspeedtray.views.monitor.hardware.worker as W
 
@@ -167,24 +167,24 @@ def test_worker_excludes_system_and_pseudo_processes(monkeypatch, q_app):
 def test_list_builds_and_summarises(q_app):
     lst = HardwareBarList(I18nStrings("en_US"))
     lst.set_payload(_hpayload([_hrow("a.exe", 40, 100, 5), _hrow("b.exe", 2, 50)]))
-    assert set(lst._rows.keys()) == {"a.exe", "b.exe"}
+    assert set(lst._model.keys()) == {"a.exe", "b.exe"}
     assert "2 processes" in lst._summary.text()
 
 
 def test_list_bar_relative_to_busiest(q_app):
     lst = HardwareBarList(I18nStrings("en_US"))
     lst.set_payload(_hpayload([_hrow("busy", 40), _hrow("light", 10)]))
-    assert lst._rows["busy"]._bar._frac == 1.0            # 40/40
-    assert abs(lst._rows["light"]._bar._frac - 0.25) < 0.01  # 10/40
+    frac = lambda key: lst._delegate.cells(lst._model.row(key), lst._model.context).frac
+    assert frac("busy") == 1.0            # 40/40
+    assert abs(frac("light") - 0.25) < 0.01  # 10/40
 
 
 def test_list_inplace_update_and_prune(q_app):
     lst = HardwareBarList(I18nStrings("en_US"))
     lst.set_payload(_hpayload([_hrow("a", 5), _hrow("b", 3)]))
-    row_a = lst._rows["a"]
     lst.set_payload(_hpayload([_hrow("a", 9)]))
-    assert lst._rows["a"] is row_a and "b" not in lst._rows
-    assert lst._list_layout.count() == 2   # 1 row + 1 stretch
+    assert lst._model.keys() == ["a"]
+    assert lst._model.last_stats == {"removed": 1, "moved": 0, "inserted": 0, "changed": 1}
 
 
 def test_list_empty_and_rdp(q_app):
@@ -198,7 +198,7 @@ def test_list_empty_and_rdp(q_app):
 def test_gpu_column_shows_dash_when_unavailable(q_app):
     lst = HardwareBarList(I18nStrings("en_US"))
     lst.set_payload(_hpayload([_hrow("a.exe", 5, 100, 0)], gpu=False))
-    assert lst._rows["a.exe"]._gpu.text() == "-"
+    assert lst._delegate.cells(lst._model.row("a.exe"), lst._model.context).numbers[-1] == "-"
 
 
 def test_feed_rdp_degrades_without_thread(q_app, monkeypatch):
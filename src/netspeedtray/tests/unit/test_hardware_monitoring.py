@@ -5,6 +5,29 @@ Unit tests for the hardware monitoring logic in StatsMonitorThread.
 import pytest
 from unittest.mock import MagicMock, patch
 from netspeedtray.core.monitor_thread import StatsMonitorThread, GpuPollResult
+from netspeedtray.core.nvidia_smi_stream import parse_line
+
+
+class _FakeStream:
+    """Stands in for the streaming nvidia-smi session: `latest()` returns a canned row (or None)."""
+
+    def __init__(self, line=None):
+        self.sample = parse_line(line) if line else None
+        self.running = False
+        self.starts = 0
+
+    def start(self):
+        self.starts += 1
+        self.running = True
+
+    def latest(self):
+        return self.sample
+
+    def request_stop(self):
+        self.running = False
+
+    def stop(self):
+        self.running = False
 
 class TestHardwareMonitoring:
 
@@ -37,24 +60,24 @@ class TestHardwareMonitoring:
             {"luid_0x0_0x1_phys_0": 1073741824.0},
         ]
 
-        # nvidia-smi returns: temperature, memory.total (MiB), power.draw (W)
-        mock_smi_output = "52, 8192, 75.3\n"
+        # The nvidia-smi stream's newest row: index, temperature, memory.total (MiB), power.draw (W)
+        stream = _FakeStream("0, 52, 8192, 75.3")
+        monitor_thread._nvidia_stream = stream
 
-        with patch('subprocess.check_output') as mock_sub:
-            mock_sub.return_value = mock_smi_output
+        result = monitor_thread._poll_gpu_hybrid()
 
-            result = monitor_thread._poll_gpu_hybrid()
+        assert isinstance(result, GpuPollResult)
+        assert result.util == 45.0
+        assert result.vram_used == 1024.0   # 1073741824 bytes / (1024*1024)
+        assert result.vram_total == 8192.0   # MiB, from nvidia-smi memory.total
+        assert result.temp == 52.0
+        assert stream.starts == 1            # the session is started once, then only read
+        monitor_thread._poll_gpu_hybrid()
+        assert stream.starts == 1
 
-            assert isinstance(result, GpuPollResult)
-            assert result.util == 45.0
-            assert result.vram_used == 1024.0   # 1073741824 bytes / (1024*1024)
-            assert result.vram_total == 8192.0   # MiB, from nvidia-smi memory.total
-            assert result.temp == 52.0
-
-            # Ensure the nvidia-smi call fetches temp, memory.total, and power.draw
-            args, _ = mock_sub.call_args
-            cmd = args[0]
-            assert any("temperature.gpu,memory.total,power.draw" in arg for arg in cmd)
+        # The total is now cached; with temp and power off, nothing needs the looping child any more.
+        monitor_thread._poll_gpu_hybrid(include_temp=False, include_power=False)
+        assert not stream.running
 
     @patch('win32pdh.GetFormattedCounterValue')
     @patch('win32pdh.CollectQueryData')
@@ -74,14 +97,14 @@ class TestHardwareMonitoring:
         mock_sensor.Value = 68.0
         mock_sensor.Identifier = "/nvidiagpu/0/temperature/0"
         mock_sensor.Name = "GPU Core"
+        mock_sensor.SensorType = "Temperature"
         mock_ohm.ExecQuery.return_value = [mock_sensor]
         monitor_thread._wmi_ohm = mock_ohm
 
-        with patch('subprocess.check_output') as mock_sub:
-            result = monitor_thread._poll_gpu_hybrid()
+        result = monitor_thread._poll_gpu_hybrid()
 
-            assert result.temp == 68.0            # From LHM, not nvidia-smi
-            mock_sub.assert_not_called()   # LHM supplies temp, and the total is already known
+        assert result.temp == 68.0            # From LHM, not nvidia-smi
+        assert monitor_thread._nvidia_stream is None   # LHM supplies temp, and the total is already known
 
     @patch('win32pdh.GetFormattedCounterValue')
     @patch('win32pdh.CollectQueryData')
@@ -95,12 +118,11 @@ class TestHardwareMonitoring:
 
         mock_get_val.return_value = (None, 30.0)
 
-        with patch('subprocess.check_output') as mock_sub:
-            result = monitor_thread._poll_gpu_hybrid(include_temp=False)
+        result = monitor_thread._poll_gpu_hybrid(include_temp=False)
 
-            assert result.temp is None
-            assert result.power is None
-            mock_sub.assert_not_called()  # nothing needed, and the total is already known
+        assert result.temp is None
+        assert result.power is None
+        assert monitor_thread._nvidia_stream is None  # nothing needed, and the total is already known
 
     def test_poll_gpu_hybrid_no_smi(self, monitor_thread):
         """AMD/Intel with no nvidia-smi and no LHM: total, temp, and power are None."""
@@ -119,7 +141,7 @@ class TestHardwareMonitoring:
                 assert result.power is None
 
     def test_poll_gpu_hybrid_smi_error(self, monitor_thread):
-        """nvidia-smi subprocess failure should not crash polling; temp, total, and power stay None."""
+        """No fresh nvidia-smi row (session down, restarting, or hung) reads as N/A, not a crash."""
         monitor_thread._gpu_query = 123
         monitor_thread._gpu_util_counter = 1
         monitor_thread._gpu_vram_counter = None
@@ -128,12 +150,12 @@ class TestHardwareMonitoring:
 
         with patch('win32pdh.CollectQueryData'):
             with patch('win32pdh.GetFormattedCounterArray', return_value={"eng_0": 20.0}):
-                with patch('subprocess.check_output', side_effect=Exception("SMI Error")):
-                    result = monitor_thread._poll_gpu_hybrid()
-                    assert result.util == 20.0
-                    assert result.vram_total is None
-                    assert result.temp is None
-                    assert result.power is None
+                monitor_thread._nvidia_stream = _FakeStream(None)
+                result = monitor_thread._poll_gpu_hybrid()
+                assert result.util == 20.0
+                assert result.vram_total is None
+                assert result.temp is None
+                assert result.power is None
 
     # ------------------------------------------------------------------
     # GPU power polling
@@ -150,14 +172,12 @@ class TestHardwareMonitoring:
         monitor_thread._wmi_ohm = False
 
         mock_get_val.return_value = (None, 50.0)
-        mock_smi_output = "65, 8192, 120.5\n"
+        monitor_thread._nvidia_stream = _FakeStream("0, 65, 8192, 120.5")
 
-        with patch('subprocess.check_output') as mock_sub:
-            mock_sub.return_value = mock_smi_output
-            result = monitor_thread._poll_gpu_hybrid(include_power=True)
+        result = monitor_thread._poll_gpu_hybrid(include_power=True)
 
-            assert result.power == 120.5
-            assert result.temp == 65.0
+        assert result.power == 120.5
+        assert result.temp == 65.0
 
     @patch('win32pdh.GetFormattedCounterValue')
     @patch('win32pdh.CollectQueryData')
@@ -176,29 +196,24 @@ class TestHardwareMonitoring:
         mock_temp_sensor.Value = 72.0
         mock_temp_sensor.Identifier = "/nvidiagpu/0/temperature/0"
         mock_temp_sensor.Name = "GPU Core"
+        mock_temp_sensor.SensorType = "Temperature"
         # Power sensor
         mock_power_sensor = MagicMock()
         mock_power_sensor.Value = 95.2
         mock_power_sensor.Identifier = "/nvidiagpu/0/power/0"
         mock_power_sensor.Name = "GPU Power"
+        mock_power_sensor.SensorType = "Power"
 
-        def mock_exec_query(query):
-            if "Temperature" in query:
-                return [mock_temp_sensor]
-            elif "Power" in query:
-                return [mock_power_sensor]
-            return []
-
-        mock_ohm.ExecQuery.side_effect = mock_exec_query
+        # One snapshot query returns every Temperature and Power sensor.
+        mock_ohm.ExecQuery.return_value = [mock_temp_sensor, mock_power_sensor]
         monitor_thread._wmi_ohm = mock_ohm
         monitor_thread._nvidia_cache_vram_total = 8192.0   # already known: not a reason to call smi
 
-        with patch('subprocess.check_output') as mock_sub:
-            result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=True)
+        result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=True)
 
-            assert result.temp == 72.0
-            assert result.power == 95.2
-            mock_sub.assert_not_called()  # LHM supplies both, and the total is already known
+        assert result.temp == 72.0
+        assert result.power == 95.2
+        assert monitor_thread._nvidia_stream is None  # LHM supplies both, and the total is already known
 
     @patch('win32pdh.GetFormattedCounterValue')
     @patch('win32pdh.CollectQueryData')
@@ -216,7 +231,6 @@ class TestHardwareMonitoring:
         monitor_thread._gpu_vram_counter = None
         monitor_thread._nvidia_smi_path = "nvidia-smi"
         monitor_thread._nvidia_cache_vram_total = None       # the total is NOT yet known
-        monitor_thread._nvidia_last_poll = -9999.0           # bypass the sub-cadence throttle
         mock_get_val.return_value = (None, 55.0)
 
         # LHM supplies temperature, so the old gate would have skipped nvidia-smi entirely.
@@ -225,12 +239,14 @@ class TestHardwareMonitoring:
         sensor.Value = 68.0
         sensor.Identifier = "/nvidiagpu/0/temperature/0"
         sensor.Name = "GPU Core"
+        sensor.SensorType = "Temperature"
         mock_ohm.ExecQuery.return_value = [sensor]
         monitor_thread._wmi_ohm = mock_ohm
 
-        with patch('subprocess.check_output', return_value="68, 8192, 95.2\n") as mock_sub:
-            result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=False)
-            mock_sub.assert_called_once()                    # called for the total, not the temp
+        stream = _FakeStream("0, 60, 8192, 95.2")
+        monitor_thread._nvidia_stream = stream
+        result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=False)
+        assert stream.starts == 1                            # started for the total, not the temp
 
         assert result.temp == 68.0, "temperature must still come from LHM"
         assert result.vram_total == 8192.0, "total VRAM never arrived - this is the #250 bug"
@@ -256,12 +272,12 @@ class TestHardwareMonitoring:
         sensor.Value = 68.0
         sensor.Identifier = "/nvidiagpu/0/temperature/0"
         sensor.Name = "GPU Core"
+        sensor.SensorType = "Temperature"
         mock_ohm.ExecQuery.return_value = [sensor]
         monitor_thread._wmi_ohm = mock_ohm
 
-        with patch('subprocess.check_output') as mock_sub:
-            result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=False)
-            mock_sub.assert_not_called()
+        result = monitor_thread._poll_gpu_hybrid(include_temp=True, include_power=False)
+        assert monitor_thread._nvidia_stream is None
 
         assert result.vram_total == 8192.0, "a cached total must survive a poll that skips smi"
 
@@ -0,0 +1,138 @@
+"""
+History archive (utils.history_archive): a chunked, dictionary-encoded .npz of every history tier that
+round-trips exactly (NULLs included), loads with plain NumPy, and merges back into a database without
+double counting - idempotently, never re-adding raw rows for a minute the target already aggregated, and
+never adding an aggregated minute the target still holds raw rows for.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from netspeedtray import constants
+from netspeedtray.core.database import DatabaseWorker
+from netspeedtray.utils import history_archive as A
+
+D = constants.data
+_TABLES = (D.SPEED_TABLE_RAW, D.SPEED_TABLE_MINUTE, D.SPEED_TABLE_HOUR,
+           D.HARDWARE_STATS_TABLE_RAW, D.HARDWARE_STATS_TABLE_MINUTE, D.HARDWARE_STATS_TABLE_HOUR)
+
+
+def _worker(path):
+    w = DatabaseWorker(path)
+    w._initialize_connection()
+    w._check_and_create_schema()
+    return w
+
+
+def _fill(w):
+    now = int(datetime.now().timestamp())
+    w._persist_speed_batch([(now - i, f"nic{i % 3}", 100.0 + i, 200.0 + i, None if i % 7 == 0 else 1.0)
+                            for i in range(250)])
+    w._persist_hardware_batch([(now - i, "cpu" if i % 2 else "gpu", float(i), 1.0) for i in range(40)])
+    old = (now // 3600) * 3600 - 40 * 86400
+    w.conn.executemany(f"INSERT INTO {D.SPEED_TABLE_MINUTE} VALUES (?, 'eth0', 1.5, 2.5, 3.0, 4.0, 60, ?, ?, ?)",
+                       [(old + 60 * i, 90.0, 150.0, None if i == 3 else 60.0) for i in range(10)])
+    w.conn.execute(f"INSERT INTO {D.SPEED_TABLE_HOUR} VALUES (?, 'eth0', 1.0, 2.0, 3.0, 4.0, 3600, NULL, NULL, NULL)",
+                   (old - 86400 * 200,))
+    w.conn.execute(f"INSERT INTO {D.HARDWARE_STATS_TABLE_MINUTE} VALUES (?, 'ram', 40.0, 55.0, 60, 60.0)", (old,))
+    w.conn.commit()
+
+
+def _dump(w):
+    return {t: sorted(w.conn.execute(f"SELECT * FROM {t}").fetchall()) for t in _TABLES}
+
+
+def test_round_trip_is_exact_across_chunks(tmp_path):
+    src = _worker(tmp_path / "src.db")
+    _fill(src)
+    path = str(tmp_path / "h.npz")
+    written = A.export_archive(src.conn, path, chunk_rows=64)
+    assert written["speed_raw"] == 250 and written["speed_minute"] == 10 and written["hardware_hour"] == 0
+
+    dst = _worker(tmp_path / "dst.db")
+    inserted = A.import_archive(dst.conn, path)
+    assert inserted == written
+    assert _dump(dst) == _dump(src)
+    assert A.import_archive(dst.conn, path) == {tier: 0 for tier in written}   # idempotent
+    src._close_connection()
+    dst._close_connection()
+
+
+def test_archive_is_typed_columns_readable_with_numpy(tmp_path):
+    w = _worker(tmp_path / "n.db")
+    _fill(w)
+    path = str(tmp_path / "n.npz")
+    A.export_archive(w.conn, path, chunk_rows=100)
+    with np.load(path) as z:
+        manifest = A.read_manifest(path)
+        assert manifest["tiers"]["speed_raw"]["chunks"] == 3
+        assert z["speed_raw/00000/timestamp"].dtype == np.int64
+        assert z["speed_raw/00000/upload_bytes_sec"].dtype == np.float64
+        codes = z["speed_raw/00000/interface_name"]
+        assert codes.dtype == np.int32
+        assert set(manifest["tiers"]["speed_raw"]["keys"]["interface_name"]) == {"nic0", "nic1", "nic2"}
+        assert np.isnan(z["speed_raw/00000/interval_sec"]).any()          # NULL -> NaN
+    w._close_connection()
+
+
+def test_window_limits_every_tier(tmp_path):
+    w = _worker(tmp_path / "win.db")
+    _fill(w)
+    end = datetime.now()
+    written = A.export_archive(w.conn, str(tmp_path / "w.npz"), end - timedelta(seconds=99), end)
+    assert 0 < written["speed_raw"] <= 100 and written["speed_minute"] == 0 and written["speed_hour"] == 0
+    w._close_connection()
+
+
+def test_raw_rows_of_an_aggregated_minute_are_not_merged_again(tmp_path):
+    src = _worker(tmp_path / "a.db")
+    minute = (int((datetime.now() - timedelta(days=2)).timestamp()) // 60) * 60
+    src._persist_speed_batch([(minute + i, "eth0", 10.0, 20.0, 1.0) for i in range(60)])
+    path = str(tmp_path / "a.npz")
+    A.export_archive(src.conn, path)
+
+    dst = _worker(tmp_path / "b.db")             # the same minute, already rolled up here
+    dst.conn.execute(f"INSERT INTO {D.SPEED_TABLE_MINUTE} VALUES (?, 'eth0', 10.0, 20.0, 10.0, 20.0, 60, 600.0, 1200.0, 60.0)",
+                     (minute,))
+    dst.conn.commit()
+    assert A.import_archive(dst.conn, path)["speed_raw"] == 0
+    dst._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=datetime.now())
+    assert dst.conn.execute(f"SELECT sample_count FROM {D.SPEED_TABLE_MINUTE}").fetchall() == [(60,)]
+    src._close_connection()
+    dst._close_connection()
+
+
+def test_minute_rows_for_a_minute_the_target_still_holds_raw_are_not_merged_again(tmp_path):
+    minute = (int((datetime.now() - timedelta(days=2)).timestamp()) // 60) * 60
+    src = _worker(tmp_path / "m_src.db")         # the minute, already rolled up in the archive
+    src.conn.execute(f"INSERT INTO {D.SPEED_TABLE_MINUTE} VALUES (?, 'eth0', 10.0, 20.0, 10.0, 20.0, 60, 600.0, 1200.0, 60.0)",
+                     (minute,))
+    src.conn.execute(f"INSERT INTO {D.HARDWARE_STATS_TABLE_MINUTE} VALUES (?, 'cpu', 40.0, 55.0, 60, 60.0)", (minute,))
+    src.conn.commit()
+    path = str(tmp_path / "m.npz")
+    A.export_archive(src.conn, path)
+
+    dst = _worker(tmp_path / "m_dst.db")         # the same minute, still raw here (not yet rolled up)
+    dst._persist_speed_batch([(minute + i, "eth0", 10.0, 20.0, 1.0) for i in range(60)])
+    dst._persist_hardware_batch([(minute + i, "cpu", 40.0, 1.0) for i in range(60)])
+    inserted = A.import_archive(dst.conn, path)
+    assert inserted["speed_minute"] == 0 and inserted["hardware_minute"] == 0
+    dst._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=datetime.now())
+    assert dst.conn.execute(f"SELECT sample_count FROM {D.SPEED_TABLE_MINUTE}").fetchall() == [(60,)]
+    assert dst.conn.execute(f"SELECT sample_count FROM {D.HARDWARE_STATS_TABLE_MINUTE}").fetchall() == [(60,)]
+    assert not dst.conn.execute("SELECT name FROM sqlite_temp_master WHERE type = 'table'").fetchall()
+    src._close_connection()
+    dst._close_connection()
+
+
+def test_import_task_reports_bad_archives(tmp_path):
+    w = _worker(tmp_path / "t.db")
+    bogus = tmp_path / "bogus.npz"
+    bogus.write_bytes(b"not a zip")
+    with pytest.raises(ValueError):
+        A.read_manifest(str(bogus))
+    request = A.ArchiveImport(str(bogus))
+    w._execute_task("import_archive", request)
+    assert request.done.is_set() and request.error and request.result is None
+    w._close_connection()
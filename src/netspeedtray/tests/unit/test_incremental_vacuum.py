@@ -0,0 +1,138 @@
+"""
+Incremental auto-vacuum (schema v9): new and migrated databases use auto_vacuum=INCREMENTAL, maintenance
+no longer runs a full VACUUM on the write thread, and the idle reclaimer returns pruned pages a bounded
+step at a time, reporting what it reclaimed.
+"""
+import queue
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from netspeedtray import constants
+from netspeedtray.core.database import DatabaseWorker
+
+RAW = constants.data.SPEED_TABLE_RAW
+
+
+def _worker(path):
+    w = DatabaseWorker(path)
+    w._initialize_connection()
+    w._check_and_create_schema()
+    return w
+
+
+def _auto_vacuum(conn):
+    return conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+
+def _fill_and_prune(w, rows=80_000):
+    old = int((datetime.now() - timedelta(days=400)).timestamp())
+    w._persist_speed_batch([(old + i, f"nic{i % 4}", 1000.0 + i, 2000.0 + i, 1.0) for i in range(rows)])
+    w.conn.execute(f"DELETE FROM {RAW}")
+    w.conn.commit()
+
+
+def test_new_database_is_incremental(tmp_path):
+    w = _worker(tmp_path / "new.db")
+    assert _auto_vacuum(w.conn) == 2
+    w._close_connection()
+
+
+def test_v8_database_is_converted_by_the_migration(tmp_path):
+    path = tmp_path / "v8.db"
+    legacy = sqlite3.connect(path)                               # a pre-v9 file: auto_vacuum NONE
+    legacy.execute("PRAGMA journal_mode = WAL;")
+    legacy.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    legacy.execute("INSERT INTO metadata VALUES ('db_version', '8')")
+    legacy.execute("CREATE TABLE kept (x)")
+    legacy.execute("INSERT INTO kept VALUES (42)")
+    legacy.commit()
+    legacy.close()
+
+    w = DatabaseWorker(path)
+    w._initialize_connection()
+    assert _auto_vacuum(w.conn) == 0, "the pragma alone can't convert an existing file"
+    w._check_and_create_schema()
+    assert _auto_vacuum(w.conn) == 2
+    assert w._get_current_db_version() == DatabaseWorker._DB_VERSION
+    assert w.conn.execute("SELECT x FROM kept").fetchone()[0] == 42
+    w._close_connection()
+
+
+def test_maintenance_never_runs_a_full_vacuum(tmp_path):
+    w = _worker(tmp_path / "m.db")
+    _fill_and_prune(w)
+    real = w.conn
+    w.conn = MagicMock(wraps=real)
+    w.conn.execute.side_effect = lambda sql, *a: real.execute(sql, *a)
+    w._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=datetime.now())
+    # A full VACUUM is a statement of its own; the pragmas (auto_vacuum, incremental_vacuum) are fine.
+    assert not any(str(c.args[0]).strip().upper().startswith("VACUUM")
+                   for c in w.conn.execute.call_args_list)
+    w.conn = real
+    w._close_connection()
+
+
+def test_reclaimer_returns_free_pages_in_bounded_steps(tmp_path):
+    w = _worker(tmp_path / "r.db")
+    _fill_and_prune(w)
+    free = w._refresh_free_pages()
+    assert free >= constants.timeouts.DB_VACUUM_MIN_FREE_PAGES and w._reclaim_due
+    pages_before = w.conn.execute("PRAGMA page_count").fetchone()[0]
+
+    first = w._reclaim_step(pages=100)
+    assert first == 100
+    steps = 1
+    while w._reclaim_step(pages=100):
+        steps += 1
+    stats = w.reclaim_stats()
+    assert stats["reclaimed_pages"] == free and stats["free_pages"] == 0
+    assert stats["reclaim_steps"] == steps >= free // 100
+    assert w.conn.execute("PRAGMA page_count").fetchone()[0] <= pages_before - free   # the file shrank
+    assert w._reclaim_step() == 0                               # nothing left: a no-op
+    w._close_connection()
+
+
+def test_small_freelists_are_left_for_reuse(tmp_path):
+    w = _worker(tmp_path / "s.db")
+    _fill_and_prune(w, rows=200)
+    assert w._refresh_free_pages() < constants.timeouts.DB_VACUUM_MIN_FREE_PAGES
+    assert not w._reclaim_due and w._reclaim_step() == 0
+    w._close_connection()
+
+
+def test_roll_up_without_a_retention_prune_still_queues_reclaim(tmp_path):
+    # Raw rows past the 24 h raw window but well inside retention: the pass aggregates and DELETEs them
+    # without pruning anything, and the freed pages must still reach the idle reclaimer.
+    w = _worker(tmp_path / "rollup.db")
+    old = int((datetime.now() - timedelta(hours=48)).timestamp())                 # 48 h..26 h ago
+    w._persist_speed_batch([(old + i, f"nic{i % 4}", 1000.0 + i, 2000.0 + i, 1.0) for i in range(80_000)])
+    w._refresh_free_pages()
+    assert not w._reclaim_due
+    w._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=datetime.now())
+    assert w.conn.execute(f"SELECT COUNT(*) FROM {RAW}").fetchone()[0] == 0
+    assert w.reclaim_stats()["free_pages"] >= constants.timeouts.DB_VACUUM_MIN_FREE_PAGES
+    assert w._reclaim_due
+    w._close_connection()
+
+
+def test_idle_worker_blocks_until_work_arrives_unless_reclaim_is_pending(tmp_path):
+    # No reclaim pending: the loop sleeps in a plain get() (no 0.5 s wake-ups), and stop() still ends it.
+    timeouts = []
+
+    class _Recording(queue.Queue):
+        def get(self, block=True, timeout=None):
+            timeouts.append(timeout)
+            return super().get(block, timeout)
+
+    w = DatabaseWorker(tmp_path / "idle.db")
+    w._queue = _Recording()
+    t = threading.Thread(target=w.run, daemon=True)
+    t.start()
+    assert w._ready_event.wait(10)
+    w.enqueue_task("noop")          # an unknown task is logged and skipped; it just drives one turn
+    w.stop()
+    t.join(10)
+    assert not t.is_alive()
+    assert timeouts and all(tm is None for tm in timeouts)
@@ -0,0 +1,113 @@
+"""
+utils.instrumentation - the hot-path timing registry behind the Monitor's Diagnostics tab and the
+support bundle's diagnostics.json.
+
+Off, a hook must record nothing; on, a span lands in the right power-of-two bucket, percentiles are the
+bucket bounds capped at the observed max, and reset keeps the registered names (so a span still lists
+with no samples). The DB worker's per-task timing and the read-pool hook are checked end to end.
+"""
+import threading
+import time
+
+import pytest
+
+from netspeedtray.utils import instrumentation as I
+
+
+@pytest.fixture
+def reg():
+    r = I.Instrumentation()
+    r.set_enabled(True)
+    return r
+
+
+def test_buckets_are_powers_of_two_from_about_a_microsecond():
+    assert I.bucket_index(0) == 0 and I.bucket_index(1023) == 0
+    assert I.bucket_index(1024) == 1 and I.bucket_index(2047) == 1 and I.bucket_index(2048) == 2
+    assert I.bucket_index(10 ** 12) == I.BUCKETS - 1                     # 1000 s: the open-ended bucket
+    assert I.bucket_upper_ms(1) == pytest.approx(0.002048) and I.bucket_upper_ms(I.BUCKETS - 1) is None
+
+
+def test_histogram_percentiles_and_snapshot(reg):
+    h = reg.histogram("x")
+    for _ in range(90):
+        h.add(50_000)                                                     # 50 µs
+    for _ in range(10):
+        h.add(30_000_000)                                                 # 30 ms
+    snap = reg.snapshot()["spans"]["x"]
+    assert snap["count"] == 100 and snap["max_ms"] == 30.0
+    assert snap["p50_ms"] == pytest.approx(0.065536, abs=1e-4)            # 50 µs's bucket bound
+    assert snap["p95_ms"] == snap["p99_ms"] == 30.0                       # capped at the real max
+    assert snap["mean_ms"] == pytest.approx((90 * 0.05 + 10 * 30) / 100, rel=1e-3)
+    assert sum(snap["buckets"].values()) == 100 and len(h.counts) == I.BUCKETS
+
+
+def test_disabled_records_nothing_and_reset_keeps_names():
+    r = I.Instrumentation()
+    assert r.begin() == 0
+    r.end("a", r.begin())
+    r.count("errors")
+    r.level("depth", 5)
+    r.read_hook("history", 3.0, 0.0)
+    assert r.snapshot()["spans"] == {} and r.snapshot()["counters"] == {} and r.snapshot()["gauges"] == {}
+
+    r.set_enabled(True)
+    r.end("a", r.begin())
+    r.count("errors", 2)
+    r.level("depth", 7)
+    r.level("depth", 3)
+    snap = r.snapshot()
+    assert snap["spans"]["a"]["count"] == 1 and snap["counters"] == {"errors": 2}
+    assert snap["gauges"] == {"depth": {"value": 3, "peak": 7}}
+    r.reset()
+    snap = r.snapshot()
+    assert snap["spans"]["a"]["count"] == 0 and snap["counters"] == {"errors": 0}
+    assert snap["gauges"]["depth"] == {"value": 0, "peak": 0}
+
+
+def test_timed_decorator_follows_the_shared_switch(monkeypatch):
+    r = I.Instrumentation()
+    monkeypatch.setattr(I, "registry", r)
+
+    @I.timed("work")
+    def work(x):
+        """doc"""
+        time.sleep(0.002)
+        return x * 2
+
+    assert work.__doc__ == "doc" and "work" in r.snapshot()["spans"]    # listed before any call
+    assert work(2) == 4 and r.histogram("work").count == 0
+    r.set_enabled(True)
+    work(1)
+    assert r.histogram("work").count == 1 and r.histogram("work").max_ns >= 2_000_000
+    with pytest.raises(ZeroDivisionError):
+        I.timed("boom")(lambda: 1 / 0)()
+    assert r.histogram("boom").count == 1                                # a raising call still counts
+
+
+def test_busiest_orders_by_total_time(reg):
+    reg.histogram("cheap").add(1_000)
+    reg.histogram("hot").add(5_000_000)
+    reg.histogram("idle")
+    assert reg.busiest()[:2] == ["hot", "cheap"] and reg.busiest(1) == ["hot"]
+
+
+def test_database_worker_times_each_task_type(tmp_path, monkeypatch):
+    from netspeedtray.core import database
+    r = I.Instrumentation()
+    r.set_enabled(True)
+    monkeypatch.setattr(database, "instrumentation", r)
+    worker = database.DatabaseWorker(tmp_path / "speed.db")
+    done = threading.Event()
+    worker.enqueue_task("__signal__", done)
+    worker.stop()
+    worker.run()                                                           # inline: init, drain, exit
+    assert done.is_set()
+    snap = r.snapshot()
+    assert snap["spans"]["database.__signal__"]["count"] == 1
+    assert snap["gauges"]["database.queue_depth"]["peak"] >= 0
+
+
+def test_read_hook_records_history_reads(reg):
+    reg.read_hook("history", 12.5, 0.0)
+    assert reg.snapshot()["spans"]["database.read.history"]["max_ms"] == pytest.approx(12.5)
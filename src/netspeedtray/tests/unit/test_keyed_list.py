@@ -0,0 +1,177 @@
+"""
+Keyed model/view for the Monitor's bar lists (views.monitor.keyed_list) and the workers' row deltas
+(utils.row_delta): a tick only emits the model signals it needs - removes, moves, inserts and
+dataChanged for rows whose values changed - and a continuing delta lets unchanged rows go uncompared.
+"""
+import socket
+import types
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+
+from netspeedtray.utils.row_delta import RowDeltaTracker
+from netspeedtray.views.monitor.keyed_list import KEY_ROLE, KeyedListView, KeyedRowModel, ROW_ROLE
+
+
+def _r(key, n=0):
+    return {"identity_key": key, "display_name": key.upper(), "n": n}
+
+
+class _Spy:
+    """Records the model's structural and value signals."""
+
+    def __init__(self, model):
+        self.events = []
+        model.rowsRemoved.connect(lambda _p, a, b: self.events.append(("removed", a, b)))
+        model.rowsInserted.connect(lambda _p, a, b: self.events.append(("inserted", a, b)))
+        model.rowsMoved.connect(lambda _p, a, b, _d, dest: self.events.append(("moved", a, dest)))
+        model.dataChanged.connect(lambda tl, br, _roles=None: self.events.append(("changed", tl.row(), br.row())))
+        model.modelReset.connect(lambda: self.events.append(("reset",)))
+
+    def kinds(self):
+        return [e[0] for e in self.events]
+
+
+def test_first_apply_inserts_in_order(q_app):
+    m = KeyedRowModel()
+    m.apply([_r("a"), _r("b"), _r("c")])
+    assert m.keys() == ["a", "b", "c"]
+    assert m.index(1, 0).data(KEY_ROLE) == "b" and m.index(1, 0).data() == "B"
+
+
+def test_only_changed_rows_emit_data_changed(q_app):
+    m = KeyedRowModel()
+    m.apply([_r(k) for k in "abcdef"])
+    spy = _Spy(m)
+    m.apply([_r("a"), _r("b", 1), _r("c", 1), _r("d"), _r("e"), _r("f", 2)])
+    assert spy.events == [("changed", 1, 2), ("changed", 5, 5)]     # contiguous runs, nothing else
+    assert m.index(5, 0).data(ROW_ROLE)["n"] == 2
+
+
+def test_reorder_is_expressed_as_moves_not_a_reset(q_app):
+    m = KeyedRowModel()
+    m.apply([_r(k) for k in "abcd"])
+    spy = _Spy(m)
+    m.apply([_r(k) for k in "dabc"])
+    assert spy.kinds() == ["moved"]
+    assert m.keys() == list("dabc")
+    assert m.last_stats["moved"] == 1
+
+
+def test_removes_inserts_and_moves_together(q_app):
+    m = KeyedRowModel()
+    m.apply([_r(k) for k in "abcde"])
+    spy = _Spy(m)
+    m.apply([_r("e"), _r("x"), _r("a"), _r("c")])
+    assert m.keys() == ["e", "x", "a", "c"]
+    assert "reset" not in spy.kinds()
+    assert m.last_stats == {"removed": 2, "moved": 1, "inserted": 1, "changed": 0}
+    assert spy.events[0] == ("removed", 3, 3) and spy.events[1] == ("removed", 1, 1)   # b, d back-to-front
+
+
+def test_continuing_delta_skips_comparisons(q_app):
+    tracker = RowDeltaTracker()
+    m = KeyedRowModel()
+    rows, delta = tracker.commit([_r("a"), _r("b")])
+    m.apply(rows, delta)
+    rows, delta = tracker.commit([_r("a", 1), _r("b")])
+    assert delta["changed"] == ["a"] and rows[1] is m.row("b")      # unchanged row interned
+    spy = _Spy(m)
+    m.apply(rows, delta)
+    assert spy.events == [("changed", 0, 0)]
+
+
+def test_broken_delta_sequence_falls_back_to_diffing(q_app):
+    m = KeyedRowModel()
+    m.apply([_r("a"), _r("b")], {"base": 0, "seq": 1, "changed": ["a", "b"], "removed": []})
+    stale = {"base": 7, "seq": 8, "changed": [], "removed": []}      # a worker this model never saw
+    spy = _Spy(m)
+    m.apply([_r("a", 5), _r("b")], stale)
+    assert spy.events == [("changed", 0, 0)], "an unknown base must not be trusted to mean 'nothing changed'"
+
+
+def test_update_values_never_reorders(q_app):
+    m = KeyedRowModel()
+    m.apply([_r("a"), _r("b")])
+    spy = _Spy(m)
+    assert m.update_values([_r("b", 3), _r("new"), _r("a")]) == 1
+    assert m.keys() == ["a", "b"] and spy.events == [("changed", 1, 1)]
+
+
+def test_selection_repaints_only_the_two_rows(q_app):
+    m = KeyedRowModel()
+    m.apply([_r(k) for k in "abc"])
+    m.set_selected_key("a")
+    spy = _Spy(m)
+    m.set_selected_key("c")
+    assert spy.events == [("changed", 0, 0), ("changed", 2, 2)]
+
+
+def test_context_change_repaints_all_rows_once(q_app):
+    m = KeyedRowModel()
+    m.apply([_r(k) for k in "abc"])
+    spy = _Spy(m)
+    m.set_context(max_conn=10)
+    m.set_context(max_conn=10)
+    assert spy.events == [("changed", 0, 2)]
+
+
+def test_context_change_repaints_only_rows_whose_render_key_changed(q_app):
+    # Bar = n / max, reduced to a 100px fill: a leader moving 41 -> 49.5 redraws the rows with a bar,
+    # not the idle ones, and a move too small to shift any fill by a pixel redraws nothing.
+    m = KeyedRowModel()
+    m.set_render_key(lambda row, ctx: int(100 * row["n"] / ctx["max"]) if ctx.get("max") else 0)
+    m.apply([_r("a", 41), _r("b", 21), _r("c"), _r("d")])
+    m.set_context(max=41)
+    spy = _Spy(m)
+    m.set_context(max=49.5)
+    m.set_context(max=49.9)
+    assert spy.events == [("changed", 0, 1)]
+
+
+def test_tracker_reports_removed_keys():
+    t = RowDeltaTracker()
+    t.commit([_r("a"), _r("b")])
+    _, delta = t.commit([_r("b")])
+    assert delta == {"base": 1, "seq": 2, "changed": [], "removed": ["a"]}
+
+
+def test_view_activates_rows_by_keyboard(q_app):
+    m = KeyedRowModel()
+    m.apply([_r("a"), _r("b")])
+    view = KeyedListView()
+    view.setModel(m)
+    view.setCurrentIndex(m.index(1, 0))
+    got = []
+    view.row_activated.connect(got.append)
+    QTest.keyClick(view, Qt.Key.Key_Return)
+    QTest.keyClick(view, Qt.Key.Key_Space)
+    assert got == ["b", "b"]
+
+
+def test_app_worker_reuses_rows_for_unchanged_apps(q_app, monkeypatch):
+    from netspeedtray.views.app_activity import worker as W
+    addr = types.SimpleNamespace
+    c1 = (1, socket.AF_INET, socket.SOCK_STREAM, addr(ip="10.0.0.2", port=5000),
+          addr(ip="1.2.3.4", port=443), "ESTABLISHED", 10)
+    c2 = (2, socket.AF_INET, socket.SOCK_DGRAM, addr(ip="10.0.0.2", port=53), None, "NONE", 20)
+    conns = {10: [types.SimpleNamespace(**dict(zip(("fd", "family", "type", "laddr", "raddr", "status", "pid"), c1)))],
+             20: [types.SimpleNamespace(**dict(zip(("fd", "family", "type", "laddr", "raddr", "status", "pid"), c2)))]}
+    w = W.AppActivityWorker()
+    monkeypatch.setattr(w, "_collect_connections_by_pid", lambda: (dict(conns), False))
+    monkeypatch.setattr(w, "_process_name", lambda pid: {10: "chrome.exe", 20: "dns.exe"}[pid])
+    built = []
+    real_build = w._build_row
+    monkeypatch.setattr(w, "_build_row", lambda *a: built.append(a[0]) or real_build(*a))
+    got = []
+    w.data_ready.connect(got.append)
+    w.sample()
+    w.sample()
+    assert sorted(built) == ["chrome.exe", "dns.exe"], "unchanged apps must not be rebuilt"
+    assert got[1]["delta"]["changed"] == [] and got[1]["rows"][0] is got[0]["rows"][0]
+    conns[20] = conns[20] + [types.SimpleNamespace(fd=3, family=socket.AF_INET, type=socket.SOCK_DGRAM,
+                                                   laddr=addr(ip="10.0.0.2", port=54), raddr=None,
+                                                   status="NONE", pid=20)]
+    w.sample()
+    assert got[2]["delta"]["changed"] == ["dns.exe"]
+    assert {r["identity_key"]: r["conn_count"] for r in got[2]["rows"]} == {"chrome.exe": 1, "dns.exe": 2}
@@ -0,0 +1,92 @@
+"""
+Deferred-import registry (utils.lazy_import): the declarative list of modules kept off the startup path,
+the LazyModule proxy that loads them on first attribute access, and the enforcement test - importing the
+widget's startup modules in a clean interpreter must not load any registered module.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from netspeedtray.utils import lazy_import as L
+
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))  # .../src
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=_SRC, QT_QPA_PLATFORM="offscreen")
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+
+
+def test_registry_lists_the_heavy_modules():
+    names = L.deferred_module_names()
+    for required in ("matplotlib", "numpy", "netspeedtray.views.graph", "netspeedtray.views.monitor"):
+        assert required in names
+    assert all(entry.reason for entry in L.DEFERRED_IMPORTS), "every entry must say why it is deferred"
+
+
+def test_is_deferred_covers_submodules_only_by_prefix():
+    assert L.is_deferred("matplotlib.dates")
+    assert L.is_deferred("netspeedtray.views.graph.window")
+    assert not L.is_deferred("matplotlibx")          # a prefix match must stop at a dot
+    assert not L.is_deferred("netspeedtray.views.widget")
+
+
+def test_leaked_deferred_modules_reports_registry_entries():
+    assert L.leaked_deferred_modules(["json", "numpy", "numpy.linalg"]) == ["numpy"]
+    assert L.leaked_deferred_modules(["json"]) == []
+
+
+def test_lazy_import_rejects_unregistered_modules():
+    with pytest.raises(ValueError):
+        L.lazy_import("json")
+
+
+def test_lazy_import_returns_a_shared_proxy():
+    assert L.lazy_import("numpy") is L.lazy_import("numpy")
+
+
+def test_proxy_loads_on_first_attribute_access():
+    r = _run(
+        "import sys\n"
+        "from netspeedtray.utils.lazy_import import lazy_import\n"
+        "np = lazy_import('numpy')\n"
+        "assert 'numpy' not in sys.modules, 'binding the proxy must not import numpy'\n"
+        "assert not np.is_loaded\n"
+        "assert np.asarray([1, 2]).sum() == 3\n"
+        "assert np.is_loaded and 'numpy' in sys.modules\n"
+        "print('LAZY_OK')\n"
+    )
+    assert r.returncode == 0, r.stdout + "\n" + r.stderr
+    assert "LAZY_OK" in r.stdout
+
+
+def test_startup_modules_do_not_load_deferred_modules():
+    """The registry is the contract: importing what the widget needs to start must leave every
+    registered module unloaded. Modules whose Windows-only dependencies are missing on this platform
+    are skipped (they run on the Windows CI)."""
+    r = _run(
+        "import sys\n"
+        "startup = [\n"
+        "    'netspeedtray.constants',\n"
+        "    'netspeedtray.utils.startup_profiler',\n"
+        "    'netspeedtray.utils.summaries',\n"
+        "    'netspeedtray.core.widget_state',\n"
+        "    'netspeedtray.core.controller',\n"
+        "    'netspeedtray.views.widget.main',\n"
+        "]\n"
+        "for name in startup:\n"
+        "    try:\n"
+        "        __import__(name)\n"
+        "    except ModuleNotFoundError as e:\n"
+        "        if e.name.split('.')[0] not in ('winreg', 'win32api', 'win32con', 'win32gui', 'win32com',\n"
+        "                                           'win32pdh', 'pythoncom', 'pywintypes', 'win32event'):\n"
+        "            raise\n"
+        "from netspeedtray.utils.lazy_import import leaked_deferred_modules\n"
+        "leaked = leaked_deferred_modules()\n"
+        "assert not leaked, 'deferred modules loaded during startup imports: %r' % leaked\n"
+        "print('REGISTRY_OK')\n"
+    )
+    assert r.returncode == 0, r.stdout + "\n" + r.stderr
+    assert "REGISTRY_OK" in r.stdout
@@ -0,0 +1,103 @@
+"""
+Compiled locale catalog (constants.locale_catalog): the binary build of locales/*.json must serve
+exactly the JSON strings, lazily, and I18nStrings must fall back to the JSON files whenever the
+catalog is missing, stale, disabled or corrupt.
+"""
+import json
+import os
+import shutil
+
+import pytest
+
+from netspeedtray.constants import i18n as i18n_mod
+from netspeedtray.constants import locale_catalog as lc
+from netspeedtray.constants.i18n import I18nStrings, get_locales_path
+
+
+@pytest.fixture
+def locales(tmp_path, monkeypatch):
+    """A private copy of the shipped locales, wired in as I18nStrings' locales path."""
+    d = tmp_path / "locales"
+    shutil.copytree(get_locales_path(), d, ignore=shutil.ignore_patterns(lc.CATALOG_FILENAME))
+    monkeypatch.setattr(i18n_mod, "get_locales_path", lambda: d)
+    monkeypatch.setattr(lc, "_catalogs", {})
+    monkeypatch.delenv(lc.FORCE_JSON_ENV, raising=False)
+    return d
+
+
+def _json(d, code):
+    with (d / f"{code}.json").open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_catalog_round_trips_every_locale(locales):
+    path = lc.compile_catalog(locales)
+    catalog = lc.LocaleCatalog(path)
+    try:
+        assert sorted(catalog.languages) == sorted(p.stem for p in locales.glob("*.json"))
+        for code in catalog.languages:
+            source = _json(locales, code)
+            view = catalog.language(code)
+            assert dict(view.items()) == source, code
+    finally:
+        catalog.close()
+
+
+def test_catalog_is_smaller_than_the_json_it_replaces(locales):
+    path = lc.compile_catalog(locales)
+    json_bytes = sum(p.stat().st_size for p in locales.glob("*.json"))
+    assert path.stat().st_size < json_bytes
+
+
+def test_lookups_decode_lazily_and_cache(locales):
+    catalog = lc.LocaleCatalog(lc.compile_catalog(locales))
+    try:
+        view = catalog.language("de_DE")
+        assert view._cache == {}, "nothing is decoded until a string is asked for"
+        key = next(iter(_json(locales, "en_US")))
+        assert view.get(key) == _json(locales, "de_DE")[key]
+        assert list(view._cache) == [key]
+        assert view.get("NO_SUCH_KEY") is None and "NO_SUCH_KEY" not in view
+        assert catalog.language("xx_XX") is None
+    finally:
+        catalog.close()
+
+
+def test_missing_translation_falls_back_to_english(locales):
+    de = _json(locales, "de_DE")
+    key = sorted(de)[0]
+    del de[key]
+    (locales / "de_DE.json").write_text(json.dumps(de, ensure_ascii=False), encoding="utf-8")
+    lc.compile_catalog(locales)
+    strings = I18nStrings("de_DE")
+    assert strings._catalog is not None
+    assert getattr(strings, key) == _json(locales, "en_US")[key]
+
+
+def test_i18n_uses_the_catalog_and_matches_json(locales, monkeypatch):
+    lc.compile_catalog(locales)
+    via_catalog = I18nStrings("ja_JP")
+    assert isinstance(via_catalog._strings, lc.CatalogLanguage)
+
+    monkeypatch.setattr(lc, "_catalogs", {})
+    monkeypatch.setenv(lc.FORCE_JSON_ENV, "1")
+    via_json = I18nStrings("ja_JP")
+    assert isinstance(via_json._strings, dict)
+    for key in _json(locales, "en_US"):
+        assert getattr(via_catalog, key) == getattr(via_json, key), key
+
+
+def test_stale_catalog_is_ignored_from_source(locales):
+    path = lc.compile_catalog(locales)
+    later = path.stat().st_mtime + 60
+    os.utime(locales / "de_DE.json", (later, later))   # a JSON edited after the last build
+    assert not lc.is_catalog_current(path, locales)
+    assert lc.open_catalog(locales) is None
+    assert isinstance(I18nStrings("fr_FR")._strings, dict)
+
+
+def test_corrupt_catalog_falls_back_to_json(locales):
+    (locales / lc.CATALOG_FILENAME).write_bytes(b"not a catalog")
+    strings = I18nStrings("es_ES")
+    assert strings._catalog is None
+    assert isinstance(strings._strings, dict) and strings.language == "es_ES"
@@ -90,11 +90,14 @@ def test_app_row_is_keyboard_activatable_and_named(q_app):
 
 
 def test_hardware_row_has_accessible_name(q_app):
-    from netspeedtray.views.monitor.hardware.list import HardwareRow
-    row = HardwareRow(I18nStrings("en_US"))
-    row.update_row({"display_name": "python.exe", "cpu_percent": 12.0, "rss": 1.5e8, "gpu_percent": 0.0},
-                   max_cpu=50.0, gpu_available=True)
-    assert "python.exe" in row.accessibleName()
+    from netspeedtray.views.monitor.hardware.list import HardwareBarList
+    lst = HardwareBarList(I18nStrings("en_US"))
+    lst.set_payload({"rows": [{"identity_key": "python.exe", "display_name": "python.exe",
+                               "cpu_pct": 12.0, "rss_bytes": 150_000_000, "gpu_pct": 0.0}],
+                     "gpu_available": True})
+    idx = lst._model.index(0, 0)
+    assert "python.exe" in idx.data(Qt.ItemDataRole.AccessibleTextRole)   # not just a tooltip
+    assert idx.data(Qt.ItemDataRole.ToolTipRole) == idx.data(Qt.ItemDataRole.AccessibleTextRole)
 
 
 def test_top_talkers_card_is_keyboard_activatable(q_app):
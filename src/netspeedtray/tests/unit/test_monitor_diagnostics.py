@@ -0,0 +1,72 @@
+"""
+The Monitor's Diagnostics tab (views/monitor/diagnostics.py): hidden unless ``diagnostics_enabled`` is
+on, and a live view of the instrumentation registry - one row per code path that has samples, busiest
+first, with Reset emptying the table.
+"""
+from unittest.mock import MagicMock
+
+from netspeedtray import constants
+from netspeedtray.constants.i18n import I18nStrings
+from netspeedtray.utils.instrumentation import Instrumentation
+from netspeedtray.views.monitor.diagnostics import DiagnosticsTab, format_ms
+from netspeedtray.views.monitor.window import MonitorWindow
+
+
+def _main_widget():
+    m = MagicMock()
+    m.config = {}
+    m.config_manager = MagicMock()
+    return m
+
+
+def _cfg(**over):
+    c = dict(constants.config.defaults.DEFAULT_CONFIG)
+    c.update(over)
+    return c
+
+
+def test_tab_follows_the_diagnostics_switch(q_app):
+    off = MonitorWindow(_main_widget(), _cfg(), I18nStrings("en_US"))
+    assert off._tab_bar._buttons["diagnostics"].isHidden()
+    on = MonitorWindow(_main_widget(), _cfg(diagnostics_enabled=True), I18nStrings("en_US"))
+    assert not on._tab_bar._buttons["diagnostics"].isHidden()
+    for w in (off, on):
+        w.close()
+
+
+def test_toggling_diagnostics_with_the_monitor_open_regates_the_tab(q_app):
+    cfg = _cfg()
+    w = MonitorWindow(_main_widget(), cfg, I18nStrings("en_US"))
+    cfg["diagnostics_enabled"] = True                    # Settings applied while the Monitor is open
+    w.refresh_tab_visibility()
+    assert not w._tab_bar._buttons["diagnostics"].isHidden()
+    w.select_tab("diagnostics")
+    cfg["diagnostics_enabled"] = False
+    w.refresh_tab_visibility()
+    assert w._tab_bar._buttons["diagnostics"].isHidden()
+    assert w._descriptors[w._stack.currentIndex()].tab_id != "diagnostics"
+    w.close()
+
+
+def test_table_lists_measured_paths_busiest_first_and_reset_clears(q_app):
+    reg = Instrumentation()
+    reg.set_enabled(True)
+    reg.histogram("widget.paint").add(200_000)
+    reg.histogram("graph.render").add(40_000_000)
+    reg.histogram("controller.handle_stats")                               # registered, never hit
+    reg.level("database.queue_depth", 3)
+    tab = DiagnosticsTab({}, I18nStrings("en_US"), registry=reg)
+
+    rows = [tab._table.item(r, 0).text() for r in range(tab._table.rowCount())]
+    assert rows == ["graph.render", "widget.paint"]
+    assert tab._table.item(0, 1).text() == "1" and tab._table.item(0, 6).text() == "40.0"
+    assert "database.queue_depth: 3 (peak 3)" in tab._levels.text()
+    assert tab._empty.isHidden()
+
+    tab._on_reset()
+    assert tab._table.rowCount() == 0 and not tab._empty.isHidden()
+    tab.teardown()
+
+
+def test_format_ms_precision():
+    assert [format_ms(v) for v in (0.0421, 3.184, 27.44, 1250.2)] == ["0.042", "3.18", "27.4", "1250"]
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from netspeedtray.constants.i18n import I18nStrings
+from netspeedtray.views.monitor.keyed_list import SELECTED_ROLE
 from netspeedtray.views.monitor.network.app_list import AppBarList
 from netspeedtray.views.monitor.network.detail import ConnectionDetailPanel
 
@@ -44,11 +45,11 @@ def test_app_row_click_selects_and_emits(q_app):
     lst.set_payload(_payload())
     seen = []
     lst.row_selected.connect(seen.append)
-    lst._rows["chrome.exe"].clicked.emit("chrome.exe")
+    lst._view.row_activated.emit("chrome.exe")
     assert seen == ["chrome.exe"]
     assert lst.selected_key() == "chrome.exe"
-    assert lst._rows["chrome.exe"]._selected is True
-    assert lst._rows["svchost.exe"]._selected is False
+    selected = {k: lst._model.index_of(k).data(SELECTED_ROLE) for k in lst._model.keys()}
+    assert selected == {"chrome.exe": True, "svchost.exe": False}
     # get_row exposes the live payload data the detail panel reads.
     assert lst.get_row("chrome.exe")["distinct_hosts"] == ["1.2.3.4", "5.6.7.8"]
 
@@ -107,7 +108,7 @@ def test_network_tab_detail_flow_select_refresh_close(q_app):
     assert tab._detail.isHidden()                         # nothing selected yet
 
     # Click Chrome -> panel opens with its detail.
-    tab._app_list._rows["chrome.exe"].clicked.emit("chrome.exe")
+    tab._app_list._view.row_activated.emit("chrome.exe")
     assert not tab._detail.isHidden()
     assert "1.2.3.4" in tab._detail._body.toPlainText()
 
@@ -130,20 +131,18 @@ def test_selected_row_pinned_to_top(q_app):
     # it must lead the list.
     lst = AppBarList(_i18n())
     lst.set_payload(_payload())
-    lst._rows["svchost.exe"].clicked.emit("svchost.exe")
+    lst._view.row_activated.emit("svchost.exe")
     lst.set_payload(_payload())
-    assert lst._list_layout.itemAt(0).widget() is lst._rows["svchost.exe"]
+    assert lst._model.keys()[0] == "svchost.exe"
 
 
 def test_empty_payload_prunes_rows(q_app):
     # Review fix: an empty payload must clear the stale rows, not just change the summary text.
     lst = AppBarList(_i18n())
     lst.set_payload(_payload())
-    assert lst._rows
+    assert lst._model.rowCount()
     lst.set_payload({"rows": [], "app_count": 0, "total_conn_count": 0, "updated_at": "x"})
-    assert lst._rows == {}
-    widgets = [lst._list_layout.itemAt(i).widget() for i in range(lst._list_layout.count())]
-    assert all(w is None for w in widgets)   # only the trailing stretch remains
+    assert lst._model.rowCount() == 0 and lst.get_row("chrome.exe") is None
 
 
 def test_empty_payload_shows_access_limited_message(q_app):
@@ -157,7 +156,7 @@ def test_empty_payload_shows_access_limited_message(q_app):
 def test_network_tab_detail_marks_inactive_when_app_drops(q_app):
     tab = _network_tab(q_app)
     tab._on_payload(_payload())
-    tab._app_list._rows["chrome.exe"].clicked.emit("chrome.exe")
+    tab._app_list._view.row_activated.emit("chrome.exe")
     assert "1.2.3.4" in tab._detail._body.toPlainText()
     # Chrome closes all connections -> drops off the payload -> panel goes "no details", stays open.
     tab._on_payload(_payload(include_chrome=False))
@@ -0,0 +1,245 @@
+"""
+Idle prefetch for the Monitor (views/monitor/prefetch.py) and the loads that consult its cache.
+
+The predictor must learn the user's habitual switches (and fall back to the neighbouring views with no
+history), the prefetcher must fill the cache off the GUI thread and stand aside the moment a real load
+starts, and a cached Overview window / progressive graph load must be used without re-reading.
+"""
+import math
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from netspeedtray.constants.i18n import I18nStrings
+from netspeedtray.views.monitor import prefetch as PF
+from netspeedtray.views.monitor.overview.tab import OverviewTab, load_window_snapshot, prefetch_job
+
+
+def test_predictor_learns_the_habitual_next_view():
+    p = PF.ViewPredictor()
+    for _ in range(3):
+        p.record(("network", "TIMELINE_24_HOURS"))
+        p.record(("network", "TIMELINE_MONTH"))
+        p.record(("overview", "TIMELINE_24_HOURS"))
+    ranked = p.predict(("network", "TIMELINE_24_HOURS"), 3)
+    assert ranked[0] == ("network", "TIMELINE_MONTH")       # what followed this view every time
+    assert ("network", "TIMELINE_24_HOURS") not in ranked   # never the current view
+
+
+def test_predictor_without_history_offers_the_neighbours():
+    ranked = PF.ViewPredictor().predict(("network", "TIMELINE_24_HOURS"), 4)
+    assert set(ranked[:2]) == {("network", "TIMELINE_12_HOURS"), ("network", "TIMELINE_48_HOURS")}
+    assert set(ranked[2:]) == {("overview", "TIMELINE_24_HOURS"), ("hardware", "TIMELINE_24_HOURS")}
+    assert all(key != "TIMELINE_SESSION" for _, key in PF.ViewPredictor().predict(("overview", "TIMELINE_30_MIN"), 9))
+
+
+def test_predictor_history_is_sanitized_and_bounded():
+    p = PF.ViewPredictor(["network:TIMELINE_WEEK", "bogus", "graph:TIMELINE_WEEK", 7, "overview:TIMELINE_NOPE"],
+                         max_len=3)
+    assert p.history == ["network:TIMELINE_WEEK"]
+    assert not p.record(("network", "TIMELINE_WEEK"))       # re-showing the same view isn't a choice
+    for key in ("TIMELINE_MONTH", "TIMELINE_ALL", "TIMELINE_1_HOUR"):
+        p.record(("hardware", key))
+    assert p.history == ["hardware:TIMELINE_MONTH", "hardware:TIMELINE_ALL", "hardware:TIMELINE_1_HOUR"]
+
+
+def test_result_cache_expires_and_stays_bounded():
+    cache = PF.ResultCache(ttl=10.0, max_entries=2)
+    with patch.object(PF.time, "monotonic", return_value=100.0):
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)                                    # "a" is dropped (oldest)
+        assert cache.get("a") is None and cache.get("b") == 2
+    with patch.object(PF.time, "monotonic", return_value=111.0):
+        assert cache.get("c") is None
+
+
+def _wait(q_app, cond, timeout=5.0):
+    import time
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        q_app.processEvents()
+        time.sleep(0.005)
+    return cond()
+
+
+def test_prefetcher_fills_the_cache_off_the_gui_thread(q_app):
+    config = {"history_period_slider_value": 2}
+    pf = PF.IdlePrefetcher(config)
+    ran = []
+
+    def provider(key):
+        return ("overview", key), (lambda cancelled: ran.append(threading.current_thread()) or key)
+
+    pf.set_provider("overview", provider)
+    with patch.object(PF.constants.graph, "PREFETCH_START_DELAY_MS", 0):
+        pf.start("network")
+    try:
+        assert _wait(q_app, lambda: pf.cache.get(("overview", "TIMELINE_24_HOURS")) is not None)
+        assert ran and all(t is not threading.main_thread() for t in ran)
+        assert config[PF.RECENT_VIEWS_KEY] == ["network:TIMELINE_24_HOURS"] and pf.learned
+    finally:
+        pf.stop()
+
+
+def test_a_real_request_cancels_the_running_job(q_app):
+    pf = PF.IdlePrefetcher({"history_period_slider_value": 2})
+    started, release, seen = threading.Event(), threading.Event(), []
+
+    def run(cancelled):
+        started.set()
+        release.wait(5)
+        seen.append(cancelled())
+        return None if cancelled() else "done"
+
+    pf.set_provider("overview", lambda key: (("overview", key), run))
+    with patch.object(PF.constants.graph, "PREFETCH_START_DELAY_MS", 0):
+        pf.start("network")
+    try:
+        assert _wait(q_app, started.is_set)
+        pf.note_request()                                    # e.g. the user switched period
+        release.set()
+        assert _wait(q_app, lambda: bool(seen))
+        assert seen == [True]
+        assert pf.cache.get(("overview", "TIMELINE_24_HOURS")) is None
+    finally:
+        release.set()
+        pf.stop()
+
+
+def test_stop_waits_out_a_job_stuck_in_a_long_read(q_app):
+    pf = PF.IdlePrefetcher({"history_period_slider_value": 2})
+    started, finished = threading.Event(), threading.Event()
+
+    def run(cancelled):
+        started.set()
+        threading.Event().wait(0.3)                         # one read that ignores cancellation
+        finished.set()
+        return None
+
+    pf.set_provider("overview", lambda key: (("overview", key), run))
+    with patch.object(PF.constants.graph, "PREFETCH_START_DELAY_MS", 0):
+        pf.start("network")
+    assert _wait(q_app, started.is_set)
+    thread = pf._thread
+    with patch.object(PF, "STOP_WAIT_MS", 20):              # the bounded wait times out first
+        pf.stop()
+    assert finished.is_set() and thread.isFinished() and pf._thread is None
+
+
+class _WS:
+    """Counts DB reads; hands back a tiny, fixed window."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def get_speed_history(self, start, end, iface, resolution='auto'):
+        self.reads += 1
+        return [(datetime.now(), 1.0e6, 2.0e6), (datetime.now(), 1.5e6, 3.0e6)]
+
+    def get_hardware_history_arrays(self, stat, start, end):
+        import numpy as np
+        self.reads += 1
+        return np.array([int(datetime.now().timestamp())]), np.array([42.0])
+
+    def summarize_network(self, direction, start, end, iface, poll):
+        from netspeedtray.utils.summaries import summarize_raw
+        self.reads += 1
+        return summarize_raw([2.0e6, 3.0e6])
+
+    def summarize_hardware(self, stat, start, end, poll):
+        from netspeedtray.utils.summaries import summarize_raw
+        self.reads += 1
+        return summarize_raw([10.0, 42.0])
+
+    def get_earliest_data_timestamp(self):
+        return datetime.now() - timedelta(days=3)
+
+
+class _MW:
+    cpu_usage = gpu_usage = 0.0
+    download_speed = upload_speed = 0.0
+    ram_used = ram_total = vram_used = vram_total = None
+    session_start_time = None
+
+    def __init__(self):
+        self.widget_state = _WS()
+
+    def _hover_usage_totals(self):
+        return None
+
+    def _hover_cap_info(self):
+        return None
+
+
+def test_snapshot_load_stops_between_reads():
+    ws = _WS()
+    calls = iter([False, True])
+    assert load_window_snapshot(ws, datetime.now() - timedelta(hours=1), datetime.now(), 1.0, False,
+                                cancelled=lambda: next(calls, True)) is None
+    assert ws.reads == 2                                     # network + cpu, then it stopped
+    assert prefetch_job(_MW(), {}, "TIMELINE_SESSION") is None
+
+
+def test_overview_period_switch_paints_the_prefetched_window(q_app):
+    mw = _MW()
+    pf = PF.IdlePrefetcher({"history_period_slider_value": 2})
+    key, run = prefetch_job(mw, {"latency_enabled": False}, "TIMELINE_WEEK")
+    pf.cache.put(key, run(lambda: False))
+    ov = OverviewTab(mw, {"latency_enabled": False, "history_period_slider_value": 2}, I18nStrings("en_US"),
+                     prefetcher=pf)
+    ov.show()
+    q_app.processEvents()
+    try:
+        before = mw.widget_state.reads
+        ov._on_period_changed(3)                             # -> Week, prefetched
+        assert mw.widget_state.reads == before
+        assert ov._series["cpu"] == [42.0]
+        assert pf.view == ("overview", "TIMELINE_WEEK")
+        ov._on_period_changed(4)                             # -> Month, not prefetched: a real read
+        assert mw.widget_state.reads > before
+    finally:
+        ov.hide()
+        ov.teardown()
+        pf.stop()
+
+
+def test_graph_load_without_preview_paints_only_the_final_series(q_app, tmp_path):
+    from PyQt6.QtCore import QThread
+    from netspeedtray import constants
+    from netspeedtray.core.widget_state import WidgetState
+    from netspeedtray.views.graph.request import DataRequest
+    from netspeedtray.views.graph.worker import GraphDataWorker
+
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+        ws = WidgetState(constants.config.defaults.DEFAULT_CONFIG.copy())
+    ws.db_worker._initialize_connection()
+    ws.db_worker._check_and_create_schema()
+    ws.batch_persist_timer.stop()
+    try:
+        end = int(datetime.now().timestamp())
+        ws.db_worker.conn.executemany(
+            f"INSERT INTO {constants.data.SPEED_TABLE_MINUTE} (timestamp, interface_name, upload_avg, "
+            f"download_avg, upload_max, download_max, sample_count) VALUES (?, 'eth0', 1, 2, 3, 4, 60)",
+            [(t,) for t in range((end - 8 * 86400) // 60 * 60, end - 86400, 60)])
+        ws.db_worker.conn.commit()
+        start, stop = datetime.fromtimestamp(end - 7 * 86400), datetime.fromtimestamp(end)
+
+        def run(worker, request):
+            got = []
+            worker.data_ready.connect(lambda *a: got.append(a))
+            worker.process_data(request)
+            worker.data_ready.disconnect()
+            return got
+
+        got = run(GraphDataWorker(ws), DataRequest(start, stop, None, False, 1, "network", preview=False))
+        assert len(got) == 1 and not math.isnan(got[0][1])
+
+        worker = GraphDataWorker(ws)
+        worker.should_stop = lambda: True                    # the prefetcher's cancellation
+        got = run(worker, DataRequest(start, stop, None, False, 1, "network", preview=False))
+        assert got == []
+    finally:
+        ws.db_worker._close_connection()
+        ws.cleanup()
@@ -0,0 +1,53 @@
+"""
+The Monitor soak harness (tests/performance/soak_monitor.py): its leak verdict, and the one-cycle
+version of what it checks - a closed Monitor that opened a chart tab leaves nothing behind.
+
+The long soak itself is a performance script (thousands of cycles); these pin the pieces that decide
+whether it fails, and the GraphHost worker leak it found (a deleteLater() posted after the worker's
+thread stopped was never processed, and the worker's error connection kept the whole window alive).
+"""
+import gc
+
+from netspeedtray.tests.performance import soak_monitor as SM
+
+
+def _series(**grow):
+    """Eight samples, 25 cycles apart; each metric in ``grow`` adds that much per sample."""
+    base = dict(rss=200 << 20, heap=40 << 20, qobjects=10, widgets=0, threads=3, qthreads=1, sqlite=2,
+                handles=15)
+    return [SM.ProbeSample(cycle=25 * (i + 1), **{k: v + grow.get(k, 0) * i for k, v in base.items()})
+            for i in range(8)]
+
+
+def test_assess_flags_steady_growth_only():
+    assert SM.assess(_series()) == {}
+    leaking = SM.assess(_series(qobjects=181, heap=160 * 1024 * 25, sqlite=1))
+    assert set(leaking) == {"qobjects", "heap", "sqlite"}
+
+    # A warm-up step (caches filling on the first opens) is not a leak, and neither is RSS that jumps
+    # once and plateaus: its slope over the run stays under budget.
+    samples = _series()
+    samples[0].qobjects += 300
+    for s in samples[4:]:
+        s.rss += 20 << 20
+    assert SM.assess(samples, warmup=1, budgets={"rss": (16 << 20, 1 << 20)}) == {}
+    assert SM.assess(samples[:3]) == {}                                   # too short to judge
+
+
+def test_closed_monitor_with_a_chart_tab_is_reclaimed(q_app, tmp_path):
+    from netspeedtray.views.monitor.graph_host import GraphHost
+    from netspeedtray.views.monitor.window import MonitorWindow
+
+    host = SM.SoakHost(tmp_path, ticks=3700)
+    try:
+        host.feed(60)
+        probe = SM.LeakProbe(trace_heap=False)
+        before = probe.sample(0)
+        SM.monitor_cycle(q_app, host, 1)
+        after = probe.sample(1)
+        gc.collect()
+        assert not [o for o in gc.get_objects() if isinstance(o, (MonitorWindow, GraphHost))]
+        assert after.qthreads == before.qthreads and after.sqlite <= before.sqlite
+    finally:
+        host.cleanup()
+        SM.pump(q_app)
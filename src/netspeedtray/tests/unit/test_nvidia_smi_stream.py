@@ -0,0 +1,134 @@
+"""
+Streaming nvidia-smi session (core.nvidia_smi_stream), driven by a fake ``nvidia-smi`` script: rows are
+parsed into a latest-value slot, stale rows read as None, and the process is restarted with backoff.
+"""
+import stat
+import sys
+import time
+
+import pytest
+
+from netspeedtray.core.nvidia_smi_stream import NvidiaSmiStream, parse_line
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fake nvidia-smi is a POSIX script")
+
+_FAKE = """#!{python}
+import os, sys, time
+with open({log!r}, "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+rows = {rows!r}
+for row in rows:
+    print(row, flush=True)
+    time.sleep({gap})
+time.sleep({linger})
+"""
+
+
+def _fake_smi(tmp_path, rows, gap=0.02, linger=0.0):
+    script = tmp_path / "nvidia-smi"
+    log = tmp_path / "launches.log"
+    script.write_text(_FAKE.format(python=sys.executable, log=str(log), rows=rows, gap=gap, linger=linger))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return str(script), log
+
+
+def _wait_for(pred, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_parse_line_reads_gpu_zero_and_drops_bad_fields():
+    s = parse_line("0, 52, 8192, 75.3\n", now=1.0)
+    assert (s.temp, s.vram_total, s.power, s.at) == (52.0, 8192.0, 75.3, 1.0)
+    assert parse_line("1, 40, 4096, 30.0") is None                     # another GPU
+    s = parse_line("0, [N/A], 8192, [Not Supported]")
+    assert s.temp is None and s.power is None and s.vram_total == 8192.0
+    assert parse_line("0, 900, 8192, 5000").temp is None                # outside the sanity ranges
+    assert parse_line("garbage") is None
+
+
+def test_one_process_streams_rows_into_the_latest_slot(tmp_path):
+    path, log = _fake_smi(tmp_path, ["0, 50, 8192, 70.0", "1, 99, 4096, 10.0", "0, 51, 8192, 71.5"],
+                          linger=5.0)
+    stream = NvidiaSmiStream(path, interval_ms=100, stale_after_sec=3.0)
+    stream.start()
+    try:
+        assert _wait_for(lambda: stream.rows_parsed == 2)
+        sample = stream.latest()
+        assert (sample.temp, sample.vram_total, sample.power) == (51.0, 8192.0, 71.5)
+        launches = log.read_text().splitlines()
+        assert len(launches) == 1 and "--loop-ms=100" in launches[0]
+        assert "--query-gpu=index,temperature.gpu,memory.total,power.draw" in launches[0]
+    finally:
+        stream.stop()
+
+
+def test_stale_rows_read_as_none_and_a_silent_process_is_restarted(tmp_path):
+    path, log = _fake_smi(tmp_path, ["0, 50, 8192, 70.0"], linger=30.0)   # one row, then hangs
+    stream = NvidiaSmiStream(path, interval_ms=100, stale_after_sec=0.3, backoff_initial_sec=1.0)
+    stream.start()
+    try:
+        assert _wait_for(lambda: stream.latest() is not None)
+        time.sleep(0.45)
+        assert stream.latest() is None, "a row older than the stale limit must read as N/A"
+        # The supervisor kills the mute process on its own - latest() never waits on a kill.
+        assert _wait_for(lambda: stream.restarts >= 1), "the mute process must be killed and restarted"
+        assert _wait_for(lambda: len(log.read_text().splitlines()) >= 2)
+    finally:
+        stream.stop()
+
+
+def test_exit_is_restarted_with_growing_backoff(tmp_path):
+    path, _ = _fake_smi(tmp_path, [])                     # exits immediately without a row, every time
+    stream = NvidiaSmiStream(path, backoff_initial_sec=0.05, backoff_max_sec=0.2)
+    stream.start()
+    try:
+        assert _wait_for(lambda: stream.restarts >= 4)
+        assert stream.latest() is None
+    finally:
+        stream.stop()
+    assert not stream.running
+
+
+def test_missing_binary_does_not_raise(tmp_path):
+    stream = NvidiaSmiStream(str(tmp_path / "absent"), backoff_initial_sec=0.05)
+    stream.start()
+    try:
+        assert _wait_for(lambda: stream.restarts >= 1)
+        assert stream.latest() is None
+    finally:
+        stream.stop()
+
+
+def test_stop_terminates_the_child_promptly(tmp_path):
+    path, _ = _fake_smi(tmp_path, ["0, 50, 8192, 70.0"], linger=60.0)
+    stream = NvidiaSmiStream(path, stale_after_sec=30.0)
+    stream.start()
+    assert _wait_for(lambda: stream.latest() is not None)
+    proc = stream._proc
+    started = time.monotonic()
+    stream.stop()
+    assert time.monotonic() - started < 3.0
+    assert proc.poll() is not None and not stream.running and stream.latest() is None
+
+
+def test_request_stop_ends_the_child_without_waiting(tmp_path):
+    path, _ = _fake_smi(tmp_path, ["0, 50, 8192, 70.0"], linger=60.0)
+    stream = NvidiaSmiStream(path, stale_after_sec=30.0)
+    stream.start()
+    try:
+        assert _wait_for(lambda: stream.latest() is not None)
+        proc = stream._proc
+        started = time.monotonic()
+        stream.request_stop()
+        assert time.monotonic() - started < 0.1                         # the caller doesn't wait
+        assert stream.latest() is None
+        assert _wait_for(lambda: proc.poll() is not None and not stream.running)
+        stream.start()                                                   # and it can come back
+        assert _wait_for(lambda: stream.latest() is not None)
+    finally:
+        stream.stop()
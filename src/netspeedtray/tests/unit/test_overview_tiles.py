@@ -50,6 +50,10 @@ class _WS:
     def get_hardware_history(self, stat, start, end):
         return [(datetime.now(), 42.0)]
 
+    def get_hardware_history_arrays(self, stat, start, end):
+        import numpy as np
+        return np.array([int(datetime.now().timestamp())]), np.array([42.0])
+
     def summarize_network(self, direction, start, end, iface, poll):
         from netspeedtray.utils.summaries import summarize_raw
         return summarize_raw([2.0e6, 3.0e6] if direction == "download" else [1.0e6, 1.5e6])
@@ -376,3 +380,60 @@ def test_sparkline_paints_baseline_when_sparse(q_app):
     s.set_series([])     # zero points -> baseline path, must not raise
     s.set_series([42.0], vmax=100.0)  # one point -> flat line at height, must not raise
     s.repaint()
+
+
+def test_column_envelope_keeps_extremes_in_order(q_app):
+    """Decimating to pixel columns keeps each column's min AND max (in the order they occurred), so a
+    one-sample spike in a long window still reaches its height; a short series passes through."""
+    from netspeedtray.views.monitor.overview.tiles import column_envelope
+    series = [1.0] * 5000
+    series[2345] = 90.0
+    series[4000] = -3.0
+    env = column_envelope(series, 200)
+    assert len(env) == 200
+    assert max(max(p) for p in env) == 90.0 and min(min(p) for p in env) == -3.0
+    assert column_envelope([3.0, 1.0, 2.0], 10) == [(3.0, 3.0), (1.0, 1.0), (2.0, 2.0)]
+    assert column_envelope([5.0, 1.0, 1.0, 0.0], 2) == [(5.0, 1.0), (1.0, 0.0)]   # falling: max first
+
+
+def test_sparkline_caches_paths_until_data_or_size_changes(q_app):
+    """A long series is drawn from a per-column envelope whose paths are built once and reused by every
+    repaint; re-setting the same series is a no-op, while new data or a resize rebuilds them."""
+    s = Sparkline("#00BCD4")
+    s.resize(120, 40)
+    series = [float(i % 37) for i in range(5000)]
+    s.set_series(series, vmax=40.0)
+    assert s._series == series                       # the whole window, not just its tail
+    s.grab()
+    built = s._paths
+    assert built is not None
+    assert built[1].elementCount() <= 2 * 116        # bounded by the width (~2 points per column)
+    s.grab()
+    assert s._paths is built
+    s.set_series(series, vmax=40.0)                  # same object, same scale: nothing to redo
+    assert s._paths is built
+    s.resize(160, 40)
+    s.grab()
+    assert s._paths is not built
+    rebuilt = s._paths
+    s.set_series(list(series), vmax=40.0)            # new data
+    assert s._paths is None
+    s.grab()
+    assert s._paths is not rebuilt
+
+
+def test_sliding_range_tracks_the_window(q_app):
+    """SlidingRange's incremental min/max equals a rescan of the last maxlen values at every step, and
+    fit_range over it matches dynamic_range over the buffer."""
+    import random
+    from collections import deque
+    from netspeedtray.views.monitor.overview.tiles import SlidingRange, dynamic_range, fit_range
+    rng = random.Random(7)
+    r, buf = SlidingRange(50), deque(maxlen=50)
+    assert r.bounds() == (None, None)
+    for _ in range(500):
+        v = rng.uniform(0, 100)
+        r.push(v)
+        buf.append(v)
+        assert r.bounds() == (min(buf), max(buf))
+    assert fit_range(*r.bounds()) == dynamic_range(list(buf))
@@ -0,0 +1,143 @@
+"""
+Partitioned raw tiers (schema v10): maintenance seals the hot raw tables into day partitions, readers see
+hot + sealed rows through the *_ALL views, and a partition past the 24h cutoff is rolled up into the minute
+tier and DROPped whole - merging, not losing, a minute that straddles a seal.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+from netspeedtray import constants
+from netspeedtray.core.database import DatabaseWorker
+
+RAW = constants.data.SPEED_TABLE_RAW
+RAW_ALL = constants.data.SPEED_TABLE_RAW_ALL
+HW_ALL = constants.data.HARDWARE_STATS_TABLE_RAW_ALL
+PARTITIONS = constants.data.RAW_PARTITIONS_TABLE
+
+
+def _worker(path):
+    w = DatabaseWorker(path)
+    w._initialize_connection()
+    w._check_and_create_schema()
+    return w
+
+
+def _backdate_seal(w, ts):
+    w.conn.execute("UPDATE metadata SET value = ? WHERE key = 'raw_sealed_at'", (str(ts),))
+    w.conn.commit()
+
+
+def _partitions(w, tier="speed"):
+    return [r[0] for r in w.conn.execute(f"SELECT name FROM {PARTITIONS} WHERE tier = ?", (tier,))]
+
+
+def _count(w, table):
+    return w.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_seal_waits_for_the_span(tmp_path):
+    w = _worker(tmp_path / "span.db")
+    now = datetime.now()
+    w._persist_speed_batch([(int(now.timestamp()) - 5, "eth0", 1.0, 2.0, 1.0)])
+    assert w._seal_raw_partitions(w.conn.cursor(), now) is False
+    assert _partitions(w) == [] and _count(w, RAW) == 1
+    w._close_connection()
+
+
+def test_seal_moves_the_hot_table_into_a_partition_behind_the_view(tmp_path):
+    w = _worker(tmp_path / "seal.db")
+    now = datetime.now().replace(microsecond=0)
+    t0 = int((now - timedelta(hours=2)).timestamp())
+    w._persist_speed_batch([(t0 + i, "eth0", 100.0, 200.0, 1.0) for i in range(120)])
+    w._persist_hardware_batch([(t0 + i, "cpu", 10.0, 1.0) for i in range(120)])
+    _backdate_seal(w, t0 - constants.data.RAW_PARTITION_SPAN_SEC)
+
+    assert w._seal_raw_partitions(w.conn.cursor(), now) is True
+    w.conn.commit()
+    [name] = _partitions(w)
+    assert name == f"{RAW}_p{t0}"
+    assert w.conn.execute(f"SELECT min_ts, max_ts FROM {PARTITIONS} WHERE name = ?", (name,)).fetchone() == (t0, t0 + 119)
+    assert _count(w, RAW) == 0 and _count(w, name) == 120
+    assert _count(w, RAW_ALL) == 120 and _count(w, HW_ALL) == 120
+
+    # The fresh hot table got its indexes back, and window reads still seek each source.
+    w._persist_speed_batch([(int(now.timestamp()), "eth0", 1.0, 1.0, 1.0)])
+    assert _count(w, RAW_ALL) == 121
+    plan = " ".join(r[3] for r in w.conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT * FROM {RAW_ALL} WHERE timestamp BETWEEN ? AND ? AND interface_name = ?",
+        (t0, t0 + 10, "eth0")))
+    assert f"SEARCH {RAW} USING INDEX idx_{RAW}_iface_ts" in plan and f"SEARCH {name}" in plan
+    w._close_connection()
+
+
+def test_closed_partition_is_rolled_up_and_dropped_without_deletes(tmp_path):
+    w = _worker(tmp_path / "drop.db")
+    now = datetime.now().replace(microsecond=0)
+    t0 = (int((now - timedelta(hours=30)).timestamp()) // 60) * 60
+    w._persist_speed_batch([(t0 + i, "eth0", 100.0, 200.0, 1.0) for i in range(600)])
+    _backdate_seal(w, t0 - constants.data.RAW_PARTITION_SPAN_SEC)
+    w._seal_raw_partitions(w.conn.cursor(), now - timedelta(hours=29))
+    w.conn.commit()
+    [name] = _partitions(w)
+
+    statements = []
+    w.conn.set_trace_callback(statements.append)
+    w._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=now)
+    w.conn.set_trace_callback(None)
+
+    assert _partitions(w) == []
+    assert not w.conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+    assert any(s.strip().upper() == f"DROP TABLE {name}".upper() for s in statements)
+    assert not any(s.lstrip().upper().startswith(f"DELETE FROM {name}".upper()) for s in statements)
+    assert w.conn.execute(f"SELECT COUNT(*), SUM(sample_count), SUM(covered_sec) FROM "
+                          f"{constants.data.SPEED_TABLE_MINUTE}").fetchone() == (10, 600, 600.0)
+    # The dropped table's pages go to the idle reclaimer, however few they are.
+    assert 0 < w.reclaim_stats()["free_pages"] < constants.timeouts.DB_VACUUM_MIN_FREE_PAGES
+    assert w._reclaim_due and not w._partitions_dropped
+    w._close_connection()
+
+
+def test_minute_split_by_a_seal_is_merged(tmp_path):
+    w = _worker(tmp_path / "merge.db")
+    now = datetime.now().replace(microsecond=0)
+    minute = (int((now - timedelta(hours=30)).timestamp()) // 60) * 60
+    w._persist_speed_batch([(minute + i, "eth0", 100.0, 10.0, 1.0) for i in range(30)])
+    w._persist_hardware_batch([(minute + i, "cpu", 20.0, 1.0) for i in range(30)])
+    _backdate_seal(w, minute - constants.data.RAW_PARTITION_SPAN_SEC)
+    w._seal_raw_partitions(w.conn.cursor(), now - timedelta(hours=29, minutes=59))
+    w.conn.commit()
+    # The rest of the minute lands in the new hot table, which the next pass seals too.
+    w._persist_speed_batch([(minute + 30 + i, "eth0", 300.0, 10.0, 1.0) for i in range(10)])
+    w._persist_hardware_batch([(minute + 30 + i, "cpu", 60.0, 1.0) for i in range(10)])
+    _backdate_seal(w, minute - constants.data.RAW_PARTITION_SPAN_SEC)
+
+    w._run_maintenance(dict(constants.config.defaults.DEFAULT_CONFIG), now=now)
+
+    row = w.conn.execute(f"SELECT upload_avg, upload_max, sample_count, upload_bytes, covered_sec "
+                         f"FROM {constants.data.SPEED_TABLE_MINUTE} WHERE timestamp = ?", (minute,)).fetchone()
+    assert row == (150.0, 300.0, 40, 6000.0, 40.0)
+    hw = w.conn.execute(f"SELECT avg_value, max_value, sample_count, covered_sec "
+                        f"FROM {constants.data.HARDWARE_STATS_TABLE_MINUTE} WHERE timestamp = ?", (minute,)).fetchone()
+    assert hw == (30.0, 60.0, 40, 40.0)
+    assert _partitions(w) == [] and _partitions(w, "hardware") == []
+    w._close_connection()
+
+
+def test_v9_database_gains_the_catalogue_and_views(tmp_path):
+    path = tmp_path / "v9.db"
+    w = _worker(path)
+    ts = int(datetime.now().timestamp())
+    w._persist_speed_batch([(ts, "eth0", 1.0, 2.0, 1.0)])
+    w._drop_raw_views(w.conn.cursor())
+    w.conn.execute(f"DROP TABLE {PARTITIONS}")
+    w.conn.execute("DELETE FROM metadata WHERE key = 'raw_sealed_at'")
+    w.conn.execute("UPDATE metadata SET value = '9' WHERE key = 'db_version'")
+    w.conn.commit()
+    w._close_connection()
+
+    w = _worker(path)
+    assert w._get_current_db_version() == DatabaseWorker._DB_VERSION
+    assert _count(w, RAW_ALL) == 1 and _partitions(w) == []
+    assert w.conn.execute("SELECT value FROM metadata WHERE key = 'raw_sealed_at'").fetchone() is not None
+    w._close_connection()
+    assert sqlite3.connect(path).execute(f"SELECT COUNT(*) FROM {RAW}").fetchone()[0] == 1
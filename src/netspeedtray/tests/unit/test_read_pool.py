@@ -0,0 +1,133 @@
+"""
+Read-connection pool (core.read_pool): a bounded set of connections checked out per query instead of one
+per thread, stable parameterized SQL so each query shape reuses its cached statement, and per-query
+timing hooks.
+"""
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.read_pool import ReadConnectionPool
+from netspeedtray.core.widget_state import WidgetState
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> Iterator[WidgetState]:
+    cfg = dict(constants.config.defaults.DEFAULT_CONFIG)
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+        ws = WidgetState(cfg)
+    w = ws.db_worker
+    w._initialize_connection()
+    w._check_and_create_schema()
+    ws.batch_persist_timer.stop()
+    yield ws
+    w._close_connection()
+    ws.cleanup()
+
+
+class RecordingCursor(sqlite3.Cursor):
+    def execute(self, sql, *args):
+        self.connection.statements.append(sql)
+        return super().execute(sql, *args)
+
+
+class RecordingConnection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statements = []
+
+    def cursor(self, factory=RecordingCursor):
+        return super().cursor(factory)
+
+
+def test_pool_is_bounded_and_waits_for_a_checkin(tmp_path):
+    pool = ReadConnectionPool(tmp_path / "p.db", size=2, checkout_timeout=0.2)
+    got = []
+
+    def hold(release):
+        with pool.connection("hold") as conn:
+            got.append(conn)
+            release.wait(2.0)
+
+    releases = [threading.Event(), threading.Event()]
+    threads = [threading.Thread(target=hold, args=(r,)) for r in releases]
+    for t in threads:
+        t.start()
+    while len(got) < 2:
+        time.sleep(0.005)
+    with pytest.raises(sqlite3.OperationalError):
+        pool.checkout()                                     # both connections are out
+    releases[0].set()
+    threads[0].join()
+    conn = pool.checkout()                                  # the returned one is handed on
+    assert conn is got[0]
+    pool.checkin(conn)
+    releases[1].set()
+    threads[1].join()
+    assert pool.stats()["open"] == 2 and pool.stats()["waits"] >= 1
+    pool.close()
+    assert pool.stats()["open"] == 0
+
+
+def test_nested_checkout_on_one_thread_reuses_its_connection(tmp_path):
+    pool = ReadConnectionPool(tmp_path / "p.db", size=1, checkout_timeout=0.1)
+    with pool.connection("outer") as outer:
+        with pool.connection("inner") as inner:           # would deadlock a size-1 pool otherwise
+            assert inner is outer
+        assert pool.stats()["in_use"] == 1
+    assert pool.stats()["in_use"] == 0
+    pool.close()
+
+
+def test_query_shapes_have_one_sql_text_each(state):
+    pool = state._read_pool
+    pool.close()
+    state._read_pool = pool = ReadConnectionPool(pool.db_path, factory=RecordingConnection)
+    now = datetime.now().replace(microsecond=0)
+    for hours in (2, 48, 24 * 40):                          # raw / minute / hour bins for hardware
+        state.get_hardware_history("cpu", now - timedelta(hours=hours), now)
+    for days in (3, 20):                                    # two windows at minute resolution
+        state.get_speed_history(now - timedelta(days=days), now, resolution="minute")
+    with pool.connection() as conn:
+        statements = list(conn.statements)
+    hw = {s for s in statements if constants.data.HARDWARE_STATS_TABLE_HOUR in s}
+    speed = {s for s in statements if "bin_ts" in s}
+    assert len(hw) == 1, "bin width must be bound, not formatted into the SQL"
+    assert len(speed) == 1
+
+
+def test_timing_hooks_see_every_query(state):
+    seen = []
+    state.add_read_hook(lambda name, elapsed_ms, wait_ms: seen.append((name, elapsed_ms >= 0, wait_ms >= 0)))
+    now = datetime.now()
+    state.get_speed_history(now - timedelta(minutes=5), now, resolution="raw")
+    state.get_total_bandwidth_for_period(now - timedelta(minutes=5), now)
+    assert ("speed_history", True, True) in seen and ("total_bandwidth", True, True) in seen
+    queries = state.get_read_metrics()["queries"]
+    assert queries["speed_history"]["count"] == 1 and queries["speed_history"]["avg_ms"] >= 0.0
+
+
+def test_streaming_reads_match_list_reads_and_return_their_connection(state):
+    now = datetime.now().replace(microsecond=0)
+    base = int(now.timestamp()) - 120
+    state.db_worker._persist_speed_batch([(base + i, "eth0", 100.0 + i, 200.0, 1.0) for i in range(100)])
+    state.db_worker._persist_hardware_batch([(base + i, "cpu", float(i), 1.0) for i in range(100)])
+    start, end = now - timedelta(minutes=5), now
+    listed = [p for p in state.get_speed_history(start, end, resolution="raw", return_raw=True) if p[1] or p[2]]
+    stream = state.iter_speed_history(start, end, resolution="raw")
+    assert next(stream) == listed[0]
+    assert state._read_pool.stats()["in_use"] == 1          # held while the stream is open...
+    assert [next(stream) for _ in range(99)] == listed[1:]
+    stream.close()
+    assert state._read_pool.stats()["in_use"] == 0          # ...and given back when it is closed
+    hw = [(int(ts.timestamp()), v) for ts, v in state.get_hardware_history("cpu", start, end)]
+    assert list(state.iter_hardware_history("cpu", start, end)) == hw
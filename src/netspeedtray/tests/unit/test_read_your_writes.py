@@ -0,0 +1,83 @@
+"""
+Read-your-writes overlay: history reads merge samples that are still in WidgetState's batch lists or in
+the DB worker's queue, instead of flushing and waiting on a FIFO barrier - and never count a row twice
+once its batch commits.
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.widget_state import WidgetState
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> Iterator[WidgetState]:
+    cfg = dict(constants.config.defaults.DEFAULT_CONFIG)
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+        ws = WidgetState(cfg)
+    w = ws.db_worker
+    w.db_path = tmp_path / "speed_history.db"
+    w._initialize_connection()
+    w._check_and_create_schema()
+    ws.batch_persist_timer.stop()
+    yield ws
+    w._close_connection()
+    ws.cleanup()
+
+
+def _window():
+    now = datetime.now().replace(microsecond=0)
+    return now - timedelta(minutes=2), now + timedelta(seconds=1), now
+
+
+def _non_padding(points):
+    return [p for p in points if p[1] or p[2]]
+
+
+def test_pending_samples_are_read_without_a_flush(state):
+    start, end, now = _window()
+    state.add_speed_data({"eth0": (1000.0, 2000.0)}, now=now - timedelta(seconds=3), interval=1.0)
+    state.add_speed_data({"eth0": (3000.0, 4000.0)}, now=now - timedelta(seconds=2), interval=1.0)
+    with patch.object(state, "flush_and_wait", side_effect=AssertionError("reads must not block")):
+        points = _non_padding(state.get_speed_history(start, end, resolution="raw", return_raw=True))
+    assert [(p[1], p[2]) for p in points] == [(1000.0, 2000.0), (3000.0, 4000.0)]
+    assert len(state._db_batch) == 2, "the overlay reads the batch, it doesn't drain it"
+
+
+def test_in_flight_batch_is_merged_then_counted_once_after_commit(state):
+    start, end, now = _window()
+    state.add_speed_data({"eth0": (1000.0, 2000.0)}, now=now - timedelta(seconds=5), interval=1.0)
+    state.flush_batch()                                   # queued on the (not running) worker
+    assert state._db_batch == [] and len(state.db_worker.inflight_batches()) == 1
+    state.add_speed_data({"eth0": (500.0, 500.0)}, now=now - timedelta(seconds=4), interval=1.0)
+    before = _non_padding(state.get_speed_history(start, end, resolution="raw", return_raw=True))
+    assert [(p[1], p[2]) for p in before] == [(1000.0, 2000.0), (500.0, 500.0)]   # in flight + pending
+
+    task, batch = state.db_worker._queue.get_nowait()
+    state.db_worker._execute_task(task, batch)            # the worker commits it
+    assert state.db_worker.inflight_batches() == []
+    after = _non_padding(state.get_speed_history(start, end, resolution="raw", return_raw=True))
+    assert [(p[1], p[2]) for p in after] == [(1000.0, 2000.0), (500.0, 500.0)]
+
+
+def test_a_row_both_committed_and_pending_is_not_doubled(state):
+    start, end, now = _window()
+    ts = int((now - timedelta(seconds=3)).timestamp())
+    state.db_worker._persist_speed_batch([(ts, "eth0", 1000.0, 2000.0, 1.0)])
+    state._db_batch.append((ts, "eth0", 1000.0, 2000.0, 1.0))     # e.g. a batch that just committed
+    points = _non_padding(state.get_speed_history(start, end, resolution="raw", return_raw=True))
+    assert [(p[1], p[2]) for p in points] == [(1000.0, 2000.0)]
+
+
+def test_hardware_history_includes_pending_samples(state):
+    start, end, now = _window()
+    state.add_hardware_stat("cpu", 40.0, now=now - timedelta(seconds=2), interval=1.0)
+    state.db_worker._persist_hardware_batch([(int((now - timedelta(seconds=10)).timestamp()), "cpu", 20.0, 1.0)])
+    values = [v for _, v in state.get_hardware_history("cpu", start, end)]
+    assert values == [20.0, 40.0]
@@ -2,11 +2,10 @@
 Reliability/security fixes from the 2.0 audit:
 - M1: update_config (GUI thread) must NOT close the monitor thread's PDH handles directly - it flags
       them for the worker thread to re-init.
-- M2: _get_read_conn prunes connections left behind by dead threads (the per-Monitor-open leak).
+- M2: reads from short-lived threads don't leave connections behind (the per-Monitor-open leak).
 - M12: nvidia-smi is resolved from trusted locations only - never a planted binary in the CWD.
 """
 import os
-import sqlite3
 import threading
 from pathlib import Path
 from unittest.mock import patch
@@ -39,27 +38,27 @@ def test_update_config_flags_instead_of_closing_pdh_handles(q_app):
 
 # --- M2: read-connection leak ------------------------------------------------
 
-def test_get_read_conn_prunes_dead_thread_connections(q_app, tmp_path: Path):
+def test_reads_from_exited_threads_leave_no_connections_behind(q_app, tmp_path: Path):
     cfg = dict(constants.config.defaults.DEFAULT_CONFIG)
     with patch.object(QThread, "start", lambda self: None), \
          patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
         ws = WidgetState(cfg)
-    ws._db_path = tmp_path / "speed_history.db"
-    ws.db_worker.db_path = ws._db_path
     ws.db_worker._initialize_connection()
     ws.db_worker._check_and_create_schema()
 
-    # Inject a connection as if a now-dead worker thread had opened it (a fake, non-live thread id).
-    dead_id = max(t.ident for t in threading.enumerate()) + 999_999
-    real = sqlite3.connect(":memory:")
-    ws._read_conns[dead_id] = real
-
-    ws._get_read_conn()                            # any call prunes dead-thread entries
-
-    assert dead_id not in ws._read_conns, "stale dead-thread connection was not evicted"
-    with pytest.raises(sqlite3.ProgrammingError):  # the leaked connection was closed
-        real.execute("SELECT 1")
+    # Each Monitor open used to run its graph reads on a fresh thread that kept its own connection.
+    # Connections are pooled now: a read borrows one and returns it, whichever thread it ran on.
+    for _ in range(10):
+        t = threading.Thread(target=ws.get_distinct_interfaces)
+        t.start()
+        t.join()
+
+    stats = ws.get_read_metrics()
+    assert stats["open"] == 1 and stats["in_use"] == 0
+    assert stats["queries"]["distinct_interfaces"]["count"] == 10
+    ws.db_worker._close_connection()
     ws.cleanup()
+    assert ws.get_read_metrics()["open"] == 0
 
 
 # --- M12: nvidia-smi binary planting -----------------------------------------
@@ -0,0 +1,121 @@
+"""
+core.row_decoder and the WidgetState array readers built on it.
+
+fetch_columns must give the same values a fetchall() would - chunk boundaries, columns growing past a
+too-small size hint, NULLs (dropped in an INT column, NaN in a REAL one) and connections whose
+row_factory is sqlite3.Row (the read pool's) included - and the *_arrays readers must return exactly
+the bins their list/iterator counterparts do.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core import row_decoder as RD
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.utils import summaries as S
+
+
+@pytest.fixture
+def conn() -> Iterator[sqlite3.Connection]:
+    c = sqlite3.connect(":memory:")
+    c.row_factory = sqlite3.Row
+    c.execute("CREATE TABLE t (ts INTEGER, v REAL)")
+    c.executemany("INSERT INTO t VALUES (?, ?)", [(i, i * 0.5) for i in range(1000)])
+    c.executemany("INSERT INTO t VALUES (?, ?)", [(None, 1.0), (2000, None)])
+    yield c
+    c.close()
+
+
+@pytest.mark.parametrize("chunk_rows, size_hint", [(7, None), (4096, None), (7, 3), (64, 5000)])
+def test_fetch_columns_matches_fetchall(conn, chunk_rows, size_hint):
+    cur = conn.execute("SELECT ts, v FROM t ORDER BY rowid")
+    ts, v = RD.fetch_columns(cur, (RD.INT, RD.REAL), size_hint=size_hint, chunk_rows=chunk_rows)
+    expected = [tuple(r) for r in conn.execute("SELECT ts, v FROM t ORDER BY rowid") if r[0] is not None]
+    assert ts.dtype == np.int64 and v.dtype == np.float64
+    assert ts.tolist() == [r[0] for r in expected]          # the NULL-timestamp row is dropped
+    assert v[:-1].tolist() == [r[1] for r in expected[:-1]]
+    assert np.isnan(v[-1])                                  # a NULL value is NaN
+
+
+def test_fetch_columns_empty_result(conn):
+    cur = conn.execute("SELECT ts, v FROM t WHERE ts < 0")
+    ts, v = RD.fetch_columns(cur, (RD.INT, RD.REAL))
+    assert ts.size == 0 and v.size == 0 and ts.dtype == np.int64
+
+
+def test_fetch_columns_rejects_a_kind_per_column_mismatch(conn):
+    cur = conn.execute("SELECT ts, v FROM t")
+    with pytest.raises(ValueError):
+        RD.fetch_columns(cur, (RD.INT,))
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> Iterator[WidgetState]:
+    cfg = constants.config.defaults.DEFAULT_CONFIG.copy()
+    with patch.object(QThread, "start", lambda self: None):
+        with patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+            ws = WidgetState(cfg)
+    w = ws.db_worker
+    w.db_path = tmp_path / "speed_history.db"
+    w._initialize_connection()
+    w._check_and_create_schema()
+    ws.batch_persist_timer.stop()
+    yield ws
+    w._close_connection()
+    ws.cleanup()
+
+
+def _seed(ws: WidgetState, now: datetime) -> None:
+    et = int(now.timestamp())
+    st = et - 48 * 3600
+    cur = ws.db_worker.conn.cursor()
+    cur.executemany(
+        f"INSERT INTO {constants.data.HARDWARE_STATS_TABLE_MINUTE} (timestamp, stat_type, avg_value, max_value, "
+        f"sample_count) VALUES (?, 'cpu', ?, ?, 60)", [(st + 60 * i, 20.0 + i % 7, 50.0) for i in range(600)])
+    cur.executemany(
+        f"INSERT INTO {constants.data.HARDWARE_STATS_TABLE_RAW} (timestamp, stat_type, value) VALUES (?, 'cpu', ?)",
+        [(et - 3600 + i, float(i % 100)) for i in range(3000)])
+    cur.executemany(
+        f"INSERT INTO {constants.data.SPEED_TABLE_RAW} (timestamp, interface_name, upload_bytes_sec, "
+        f"download_bytes_sec) VALUES (?, ?, ?, ?)",
+        [(et - 3600 + i, nic, 100.0 + i, 1000.0 + i) for i in range(3000) for nic in ("eth0", "wlan0")])
+    ws.db_worker.conn.commit()
+
+
+@pytest.mark.parametrize("hours", [2, 48])
+def test_hardware_history_arrays_match_list_reader(state, hours):
+    now = datetime.now().replace(microsecond=0)
+    _seed(state, now)
+    start = now - timedelta(hours=hours)
+    ts, vals = state.get_hardware_history_arrays("cpu", start, now)
+    pairs = state.get_hardware_history("cpu", start, now)
+    assert ts.tolist() == [int(t.timestamp()) for t, _ in pairs]
+    assert vals.tolist() == pytest.approx([v for _, v in pairs])
+
+
+@pytest.mark.parametrize("iface", [None, "eth0"])
+def test_speed_history_arrays_match_iter_reader(state, iface):
+    now = datetime.now().replace(microsecond=0)
+    _seed(state, now)
+    start = now - timedelta(hours=2)
+    ts, up, down = state.get_speed_history_arrays(start, now, iface)
+    rows = list(state.iter_speed_history(start, now, iface))
+    assert len(rows) > 0
+    assert ts.tolist() == [r[0] for r in rows]
+    assert up.tolist() == pytest.approx([r[1] for r in rows])
+    assert down.tolist() == pytest.approx([r[2] for r in rows])
+
+
+def test_outage_summary_arrays_matches_pair_form():
+    t0 = datetime(2026, 6, 1, 12)
+    pairs = [(t0 + timedelta(seconds=i), v) for i, v in enumerate([0, 1, 1, 0, None, 1, 0, 1])]
+    ts = np.array([int(t.timestamp()) for t, _ in pairs], dtype=np.int64)
+    vals = np.array([np.nan if v is None else v for _, v in pairs], dtype=float)
+    assert S.outage_summary_arrays(ts, vals) == S.outage_summary(pairs)
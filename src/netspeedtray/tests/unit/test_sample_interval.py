@@ -0,0 +1,174 @@
+"""
+Per-sample capture interval (schema v8): raw rows record the monotonic seconds they were measured over,
+rollups carry the integrated bytes / covered seconds forward, and totals and coverage use them instead
+of assuming the *current* update_rate - which was wrong under SMART mode and after a poll-rate change.
+"""
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.controller import StatsController
+from netspeedtray.core.database import DatabaseWorker
+from netspeedtray.core.widget_state import WidgetState
+
+RAW = constants.data.SPEED_TABLE_RAW
+MINUTE = constants.data.SPEED_TABLE_MINUTE
+HOUR = constants.data.SPEED_TABLE_HOUR
+HW_RAW = constants.data.HARDWARE_STATS_TABLE_RAW
+HW_MINUTE = constants.data.HARDWARE_STATS_TABLE_MINUTE
+
+
+@pytest.fixture
+def state_with_db(tmp_path: Path) -> Iterator[WidgetState]:
+    cfg = dict(constants.config.defaults.DEFAULT_CONFIG)
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+        state = WidgetState(cfg)
+    w = state.db_worker
+    w.db_path = tmp_path / "speed_history.db"
+    w._initialize_connection()
+    w._check_and_create_schema()
+    yield state
+    w._close_connection()
+    state.cleanup()
+
+
+def _columns(cur, table):
+    return {r[1] for r in cur.execute(f"PRAGMA table_info({table})")}
+
+
+def test_v7_database_gains_the_interval_columns(tmp_path):
+    w = DatabaseWorker(tmp_path / "v7.db")
+    w._initialize_connection()
+    cur = w.conn.cursor()
+    cur.executescript(f"""
+        CREATE TABLE {RAW} (timestamp INTEGER, interface_name TEXT, upload_bytes_sec REAL, download_bytes_sec REAL,
+                            PRIMARY KEY (timestamp, interface_name));
+        CREATE TABLE {MINUTE} (timestamp INTEGER, interface_name TEXT, upload_avg REAL, download_avg REAL,
+                               upload_max REAL, download_max REAL, sample_count INTEGER);
+        CREATE TABLE {HOUR} (timestamp INTEGER, interface_name TEXT, upload_avg REAL, download_avg REAL,
+                             upload_max REAL, download_max REAL, sample_count INTEGER);
+        CREATE TABLE {HW_RAW} (timestamp INTEGER, stat_type TEXT, value REAL);
+        CREATE TABLE {HW_MINUTE} (timestamp INTEGER, stat_type TEXT, avg_value REAL, max_value REAL, sample_count INTEGER);
+        CREATE TABLE {constants.data.HARDWARE_STATS_TABLE_HOUR} (timestamp INTEGER, stat_type TEXT, avg_value REAL,
+                                                                max_value REAL, sample_count INTEGER);
+        INSERT INTO {RAW} VALUES (1, 'eth0', 10, 20);
+    """)
+    w._migrate_v7_to_v8(cur)
+    w._migrate_v7_to_v8(cur)                       # a re-run (interrupted migration) is harmless
+    assert "interval_sec" in _columns(cur, RAW) and "interval_sec" in _columns(cur, HW_RAW)
+    assert {"upload_bytes", "download_bytes", "covered_sec"} <= _columns(cur, MINUTE) & _columns(cur, HOUR)
+    assert "covered_sec" in _columns(cur, HW_MINUTE)
+    assert cur.execute(f"SELECT interval_sec FROM {RAW}").fetchone() == (None,)   # legacy rows: unknown
+    w.conn.close()
+
+
+def test_totals_integrate_the_recorded_intervals(state_with_db):
+    """Samples at 1s, 2s and 5s intervals (SMART mode / a mid-window rate change) sum to their true bytes
+    whatever update_rate says now."""
+    now = int(datetime.now().timestamp())
+    state_with_db.db_worker._persist_speed_batch([
+        (now - 8, "eth0", 100.0, 1000.0, 1.0),
+        (now - 6, "eth0", 100.0, 1000.0, 2.0),
+        (now - 1, "eth0", 100.0, 1000.0, 5.0),
+    ])
+    start = datetime.now() - timedelta(minutes=5)
+    for rate in (1.0, 10.0, -1.0):
+        state_with_db.config["update_rate"] = rate
+        up, down = state_with_db.get_total_bandwidth_for_period(start, datetime.now())
+        assert (up, down) == (pytest.approx(800.0), pytest.approx(8000.0))
+
+
+def test_same_second_samples_merge_instead_of_dropping(state_with_db):
+    w = state_with_db.db_worker
+    ts = int(datetime.now().timestamp())
+    w._persist_speed_batch([(ts, "eth0", 100.0, 0.0, 0.4), (ts, "eth0", 400.0, 0.0, 0.6)])
+    row = w.conn.execute(f"SELECT upload_bytes_sec, interval_sec FROM {RAW}").fetchone()
+    assert row == (pytest.approx(280.0), pytest.approx(1.0))      # 40 + 240 bytes over 1.0s
+    # Without a recorded interval there is nothing to weight by: the first row wins, as before.
+    w._persist_speed_batch([(ts + 1, "eth0", 100.0, 0.0), (ts + 1, "eth0", 400.0, 0.0)])
+    assert w.conn.execute(f"SELECT upload_bytes_sec FROM {RAW} WHERE timestamp=?", (ts + 1,)).fetchone()[0] == 100.0
+
+
+def test_rollups_carry_exact_bytes_and_coverage(tmp_path):
+    w = DatabaseWorker(tmp_path / "agg.db")
+    w._initialize_connection()
+    w._check_and_create_schema()
+    t0 = 1_700_000_040                                           # a minute boundary
+    # Minute A: 20 samples 3s apart with recorded intervals. Minute B: one legacy (NULL) row among them.
+    w._persist_speed_batch([(t0 + 3 * i, "eth0", 50.0, 500.0, 3.0) for i in range(20)])
+    w._persist_speed_batch([(t0 + 60, "eth0", 50.0, 500.0, 3.0), (t0 + 63, "eth0", 50.0, 500.0)])
+    w._persist_hardware_batch([(t0 + 5 * i, "cpu", 10.0, 5.0) for i in range(12)])
+    cur = w.conn.cursor()
+    now = datetime.fromtimestamp(t0 + 86400 + 600)
+    w._aggregate_raw_to_minute(cur, now)
+    w._aggregate_hardware_raw_to_minute(cur, now)
+    w.conn.commit()
+
+    a = cur.execute(f"SELECT upload_bytes, download_bytes, covered_sec FROM {MINUTE} WHERE timestamp=?", (t0,)).fetchone()
+    assert a == (pytest.approx(3000.0), pytest.approx(30000.0), pytest.approx(60.0))
+    b = cur.execute(f"SELECT upload_bytes, covered_sec FROM {MINUTE} WHERE timestamp=?", (t0 + 60,)).fetchone()
+    assert b == (None, None), "a bucket with any unknown interval must not claim an exact integral"
+    assert cur.execute(f"SELECT covered_sec FROM {HW_MINUTE}").fetchone()[0] == pytest.approx(60.0)
+
+    w._aggregate_minute_to_hour(cur, datetime.fromtimestamp(t0 + 31 * 86400 + 7200))
+    w.conn.commit()
+    hour = cur.execute(f"SELECT upload_bytes, covered_sec FROM {HOUR}").fetchone()
+    assert hour == (None, None)                                   # inherits minute B's unknown
+    w.conn.close()
+
+
+def test_rollup_totals_prefer_integrated_bytes(state_with_db):
+    w = state_with_db.db_worker
+    base = (int((datetime.now() - timedelta(hours=36)).timestamp()) // 60) * 60
+    w.conn.execute(
+        f"INSERT INTO {MINUTE} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, "
+        "sample_count, upload_bytes, download_bytes, covered_sec) VALUES (?,?,?,?,?,?,?,?,?,?)",
+        (base, "eth0", 100.0, 200.0, 150.0, 250.0, 12, 4500.0, 9000.0, 45.0))
+    w.conn.execute(
+        f"INSERT INTO {MINUTE} (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, "
+        "sample_count) VALUES (?,?,?,?,?,?,?)", (base - 60, "eth0", 100.0, 200.0, 150.0, 250.0, 60))
+    w.conn.commit()
+    start = datetime.fromtimestamp(base - 120)
+    up, down = state_with_db.get_total_bandwidth_for_period(start, datetime.fromtimestamp(base + 30))
+    assert up == pytest.approx(4500.0 + 100.0 * 60)               # exact bucket + legacy estimate
+    assert down == pytest.approx(9000.0 + 200.0 * 60)
+
+
+def test_coverage_counts_recorded_intervals(state_with_db):
+    """Ten 2s-interval samples in a 60s window cover a third of it, even if the poll is now set to 10s."""
+    now = int(datetime.now().timestamp())
+    state_with_db.db_worker._persist_speed_batch([(now - 40 + 2 * i, "eth0", 10.0, 10.0, 2.0) for i in range(10)])
+    state_with_db.db_worker._persist_hardware_batch([(now - 40 + 2 * i, "cpu", 10.0, 2.0) for i in range(10)])
+    end = datetime.fromtimestamp(now)
+    start = end - timedelta(seconds=60)
+    net = state_with_db.summarize_network("download", start, end, poll_interval=10.0)
+    hw = state_with_db.summarize_hardware("cpu", start, end, poll_interval=10.0)
+    assert net.coverage_pct == pytest.approx(100.0 / 3, abs=0.1)
+    assert hw.coverage_pct == pytest.approx(100.0 / 3, abs=0.1)
+
+
+def test_controller_stores_the_measured_interval():
+    state = MagicMock(spec=WidgetState)
+    controller = StatsController(config=dict(constants.config.defaults.DEFAULT_CONFIG), widget_state=state)
+    controller.last_check_time = time.monotonic()
+    controller.last_interface_counters = {"eth0": MagicMock(bytes_sent=0, bytes_recv=0)}
+    with patch("time.monotonic", return_value=controller.last_check_time + 2.5):
+        controller._handle_network_counters({"eth0": MagicMock(bytes_sent=25_000, bytes_recv=50_000)})
+    assert state.add_speed_data.call_args.kwargs["interval"] == pytest.approx(2.5)
+
+    with patch("time.monotonic", return_value=100.0):
+        controller.handle_stats({"cpu": 10.0})
+    assert state.add_hardware_stat.call_args.kwargs["interval"] is None       # no previous tick
+    with patch("time.monotonic", return_value=101.5):
+        controller.handle_stats({"cpu": 10.0})
+    assert state.add_hardware_stat.call_args.kwargs["interval"] == pytest.approx(1.5)
+    with patch("time.monotonic", return_value=4000.0):                         # resumed from sleep
+        controller.handle_stats({"cpu": 10.0})
+    assert state.add_hardware_stat.call_args.kwargs["interval"] is None
@@ -0,0 +1,143 @@
+"""
+Per-tick LHM/OHM sensor snapshot (core.sensor_snapshot): CPU temp/power and GPU temp/power all read one
+WMI query per tick, indexed by (hardware kind, sensor type), and the chosen sensors are remembered by
+identifier so later ticks look them up instead of re-running the selection rules.
+"""
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from netspeedtray.core.sensor_snapshot import SensorSnapshotSource, hardware_kind
+
+
+class FakeWmiProvider:
+    """An LHM namespace stand-in: honours the SensorType/Name filters of a WQL query and counts calls."""
+
+    def __init__(self, sensors):
+        self.sensors = sensors
+        self.queries = []
+
+    def ExecQuery(self, query):
+        self.queries.append(query)
+        types = re.findall(r"SensorType='(\w+)'", query)
+        names = re.findall(r"Name='([^']+)'", query)
+        return [s for s in self.sensors
+                if (not types or s.SensorType in types) and (not names or s.Name in names)]
+
+
+def _s(name, identifier, sensor_type, value):
+    return SimpleNamespace(Name=name, Identifier=identifier, SensorType=sensor_type, Value=value)
+
+
+def _rig():
+    return [
+        _s("CPU Core #1", "/intelcpu/0/temperature/1", "Temperature", 55.0),
+        _s("CPU Package", "/intelcpu/0/temperature/0", "Temperature", 62.0),
+        _s("CPU Package", "/intelcpu/0/power/0", "Power", 35.5),
+        _s("CPU Cores", "/intelcpu/0/power/1", "Power", 20.0),
+        _s("GPU Core", "/gpu-nvidia/0/temperature/0", "Temperature", 48.0),
+        _s("GPU Package", "/gpu-nvidia/0/power/0", "Power", 110.0),
+        _s("Temperature", "/nvme/0/temperature/0", "Temperature", 40.0),
+        _s("GPU Core", "/gpu-nvidia/0/load/0", "Load", 12.0),            # not in the snapshot
+    ]
+
+
+@pytest.fixture
+def thread(q_app):
+    from netspeedtray.core.monitor_thread import StatsMonitorThread
+    t = StatsMonitorThread(interval=0.1)
+    t._gpu_query = 123              # PDH present but without util/VRAM counters
+    t._gpu_util_counter = None
+    t._gpu_vram_counter = None
+    t._nvidia_smi_path = None
+    t._power_query = -1             # no RAPL: CPU power comes from LHM
+    t._power_pkg_counter = None
+    t._power_pp1_counter = None
+    return t
+
+
+def _tick(thread):
+    thread._begin_tick()
+    with patch("netspeedtray.core.monitor_thread.win32pdh", None):
+        return (thread._poll_cpu_temperature(), thread._poll_cpu_power(),
+                thread._poll_gpu_hybrid(include_temp=True, include_power=True))
+
+
+def test_hardware_kind_comes_from_the_identifier_segment():
+    assert hardware_kind("/amdcpu/0/temperature/2") == "cpu"
+    assert hardware_kind("/gpu-amd/0/power/0") == "gpu"
+    assert hardware_kind("/nvidiagpu/0/temperature/0") == "gpu"
+    assert hardware_kind("/lpc/nct6797d/temperature/0") == "other"
+
+
+def test_snapshot_indexes_by_kind_and_type():
+    src = SensorSnapshotSource()
+    snap = src.take(FakeWmiProvider(_rig()))
+    assert len(snap) == 7                                            # Load sensors aren't fetched
+    assert [r.name for r in snap.sensors("Power", "cpu")] == ["CPU Package", "CPU Cores"]
+    assert [r.identifier for r in snap.sensors("Temperature", "gpu")] == ["/gpu-nvidia/0/temperature/0"]
+    assert snap.get("/nvme/0/temperature/0").kind == "other"
+
+
+def test_a_tick_costs_one_wmi_round_trip(thread):
+    wmi = FakeWmiProvider(_rig())
+    thread._wmi_ohm = wmi
+    cpu_temp, cpu_power, gpu = _tick(thread)
+    assert (cpu_temp, cpu_power, gpu.temp, gpu.power) == (62.0, 35.5, 48.0, 110.0)
+    assert thread._sensor_source.tick_round_trips == 1 and len(wmi.queries) == 1
+    _tick(thread)
+    assert len(wmi.queries) == 2, "each new tick takes exactly one fresh snapshot"
+
+
+def test_chosen_sensors_are_looked_up_on_later_ticks(thread):
+    rig = _rig()
+    thread._wmi_ohm = FakeWmiProvider(rig)
+    _tick(thread)
+    src = thread._sensor_source
+    selections = src.selections
+    rig[1].Value = 64.0                                              # CPU Package warms up
+    cpu_temp, _, _ = _tick(thread)
+    assert cpu_temp == 64.0
+    assert src.selections == selections and src.lookups >= 4
+
+
+def test_a_vanished_sensor_is_reselected(thread):
+    rig = _rig()
+    thread._wmi_ohm = FakeWmiProvider(rig)
+    _tick(thread)
+    del rig[1]                                                       # LHM stops exposing CPU Package
+    cpu_temp, _, _ = _tick(thread)
+    assert cpu_temp == 55.0, "falls back to the remaining CPU sensors"
+
+
+def test_resolve_reselects_when_remembered_sensors_read_out_of_range():
+    src = SensorSnapshotSource()
+    ok = lambda r: r.value is not None and 0 < r.value < 150
+    first = [_s("A", "/intelcpu/0/temperature/0", "Temperature", 50.0),
+             _s("B", "/intelcpu/0/temperature/1", "Temperature", 40.0)]
+    pick_valid = lambda snap: [r for r in snap.sensors("Temperature") if ok(r)][:1]
+    assert src.resolve(src.take(FakeWmiProvider(first)), "t", pick_valid, ok)[0].name == "A"
+    first[0].Value = 0.0
+    assert src.resolve(src.take(FakeWmiProvider(first)), "t", pick_valid, ok)[0].name == "B"
+
+
+def test_a_failed_snapshot_drops_the_connection_once_per_tick(thread):
+    class Broken:
+        calls = 0
+
+        def ExecQuery(self, query):
+            Broken.calls += 1
+            raise Exception("RPC server is unavailable")
+
+    thread._wmi_ohm = Broken()
+    thread._begin_tick()
+    with patch.object(thread, "_init_ohm_wmi"), \
+         patch("netspeedtray.core.monitor_thread.win32pdh", None), \
+         patch("netspeedtray.core.monitor_thread.win32com.client", None):
+        assert thread._poll_cpu_temperature() is None
+        assert thread._poll_cpu_power() is None
+    assert Broken.calls == 1, "the rest of the tick must not retry a failed snapshot"
+    assert thread._wmi_ohm is None                                   # re-probed next tick
+    assert not thread._tick_snapshot                                 # an empty snapshot
@@ -0,0 +1,89 @@
+"""
+core.session_history.SessionSpeedHistory - the columnar per-interface session buffer behind
+WidgetState.in_memory_history.
+
+It must give back exactly the per-tick speeds it was fed (as SpeedDataSnapshot and per-NIC series),
+wrap and resize keeping the newest ticks, and keep interface churn from widening it forever.
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.session_history import SessionSpeedHistory, SpeedDataSnapshot
+from netspeedtray.core.widget_state import WidgetState
+
+
+def _feed(h: SessionSpeedHistory, ticks):
+    for t, speeds in ticks:
+        h.append(t, speeds)
+
+
+def test_round_trips_ticks_as_snapshots_and_series():
+    h = SessionSpeedHistory(capacity=10)
+    ticks = [(100.0 + i, {"eth0": (float(i), 2.0 * i), **({"wlan0": (5.0, 6.0)} if i % 2 else {})})
+             for i in range(6)]
+    _feed(h, ticks)
+    assert len(h) == 6
+    assert [s.speeds for s in h.snapshots()] == [sp for _, sp in ticks]
+    assert h[0] == SpeedDataSnapshot(ticks[0][1], datetime.fromtimestamp(100.0))
+    assert h[-1].speeds == ticks[-1][1]
+    assert h.series("wlan0") == [(101.0, 5.0, 6.0), (103.0, 5.0, 6.0), (105.0, 5.0, 6.0)]   # only ticks it reported
+    assert h.series("eth0", 102.0, 104.0) == [(102.0, 2.0, 4.0), (103.0, 3.0, 6.0), (104.0, 4.0, 8.0)]
+    assert h.series("nope") == [] and h.interfaces() == ["eth0", "wlan0"]
+
+
+def test_wraps_and_resizes_keeping_the_newest_ticks():
+    h = SessionSpeedHistory(capacity=4)
+    _feed(h, [(float(i), {"eth0": (float(i), 0.0)}) for i in range(10)])
+    assert [t for t, _, _ in h.series("eth0")] == [6.0, 7.0, 8.0, 9.0]
+    h.resize(2)
+    assert [t for t, _, _ in h.series("eth0")] == [8.0, 9.0]
+    h.resize(5)
+    h.append(10.0, {"eth0": (10.0, 0.0)})
+    assert [t for t, _, _ in h.series("eth0")] == [8.0, 9.0, 10.0]
+    with pytest.raises(IndexError):
+        h[3]
+
+
+def test_vacated_slots_are_reused_before_widening():
+    h = SessionSpeedHistory(capacity=3, width=2)
+    _feed(h, [(0.0, {"a": (1.0, 1.0), "b": (1.0, 1.0)})])
+    _feed(h, [(float(t), {"a": (1.0, 1.0)}) for t in range(1, 4)])      # "b" has scrolled out
+    h.append(4.0, {"a": (1.0, 1.0), "c": (2.0, 2.0)})
+    assert h.width == 2 and h.interfaces() == ["a", "c"]
+    h.append(5.0, {"a": (1.0, 1.0), "c": (2.0, 2.0), "d": (3.0, 3.0), "e": (4.0, 4.0)})
+    assert h.width == 4                                                  # all four live: it had to widen
+    assert h[-1].speeds == {"a": (1.0, 1.0), "c": (2.0, 2.0), "d": (3.0, 3.0), "e": (4.0, 4.0)}
+    assert h.series("c") == [(4.0, 2.0, 2.0), (5.0, 2.0, 2.0)]
+
+
+def test_new_interfaces_in_one_tick_never_share_a_slot():
+    h = SessionSpeedHistory(capacity=2, width=1)
+    h.append(0.0, {"a": (1.0, 1.0)})
+    h.append(1.0, {"b": (2.0, 2.0), "c": (3.0, 3.0)})
+    assert h[-1].speeds == {"b": (2.0, 2.0), "c": (3.0, 3.0)}
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> Iterator[WidgetState]:
+    with patch.object(QThread, "start", lambda self: None):
+        with patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+            ws = WidgetState(constants.config.defaults.DEFAULT_CONFIG.copy())
+    ws.batch_persist_timer.stop()
+    yield ws
+    ws.cleanup()
+
+
+def test_widget_state_serves_per_nic_session_history(state):
+    t0 = datetime(2026, 5, 1, 12)
+    for i in range(5):
+        state.add_speed_data({"Wi-Fi": (1000.0 * i, 2000.0 * i), "Ethernet": (1.0, 2.0)}, now=t0 + timedelta(seconds=i))
+    assert state.get_session_interfaces() == ["Ethernet", "Wi-Fi"]
+    got = state.get_session_speed_history("Wi-Fi", t0 + timedelta(seconds=1), t0 + timedelta(seconds=3))
+    assert got == [((t0 + timedelta(seconds=i)).timestamp(), 1000.0 * i, 2000.0 * i) for i in (1, 2, 3)]
+    assert [s.speeds["Ethernet"] for s in state.get_in_memory_speed_history()] == [(1.0, 2.0)] * 5
@@ -35,6 +35,13 @@ def test_advanced_round_trips_hover_and_pause_toggles(page):
     assert out["pause_in_menu"] is True
 
 
+def test_advanced_round_trips_diagnostics_toggle(page):
+    page.load_settings({"diagnostics_enabled": True})
+    assert page.get_settings()["diagnostics_enabled"] is True
+    page.load_settings({})
+    assert page.get_settings()["diagnostics_enabled"] is False
+
+
 @pytest.fixture
 def dialog(qtbot, monkeypatch):
     monkeypatch.setattr(QMessageBox, "critical", lambda *a, **k: None)
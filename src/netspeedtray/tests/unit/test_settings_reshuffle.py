@@ -57,6 +57,7 @@ MANAGED_KEYS = {
     "arrow_font_weight",
     # Advanced
     "keep_data", "reduce_motion", "show_usage_on_hover", "show_hover_tips", "pause_in_menu",
+    "diagnostics_enabled",
 }
 
 # High-risk keys for the reshuffle: the ones that MOVE pages, the segmented enums (int/string
@@ -0,0 +1,116 @@
+"""
+Staged startup: the DB worker signals `ready` after init, WidgetState buffers samples (and odometer
+bytes) in memory until then, the startup maintenance pass is deferred, and the widget measures
+time-to-first-number.
+"""
+import threading
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt6.QtCore import QThread, Qt
+
+from netspeedtray import constants
+from netspeedtray.core.database import DatabaseWorker
+from netspeedtray.core.widget_state import WidgetState
+
+
+@pytest.fixture
+def state(tmp_path, q_app):
+    """A WidgetState whose worker thread is never started; tests drive the 'initializing' state."""
+    with patch.object(QThread, "start", lambda self: None):
+        with patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+            ws = WidgetState(constants.config.defaults.DEFAULT_CONFIG.copy())
+    ws.db_worker.enqueue_task = MagicMock()
+    yield ws
+    ws.startup_maintenance_timer.stop()
+    ws.batch_persist_timer.stop()
+    ws.maintenance_timer.stop()
+
+
+def _initializing(ws):
+    ws.db_worker.isRunning = lambda: True
+    ws.db_worker.is_ready = lambda: False
+
+
+def test_worker_signals_ready_after_schema_init(tmp_path):
+    worker = DatabaseWorker(tmp_path / "ready.db")
+    assert not worker.is_ready()
+    fired = threading.Event()
+    worker.ready.connect(fired.set, Qt.ConnectionType.DirectConnection)
+    worker.start()
+    try:
+        assert fired.wait(5.0), "ready was never emitted"
+        assert worker.is_ready()
+    finally:
+        worker.stop()
+        worker.wait(3000)
+
+
+def test_construction_does_not_run_maintenance(state):
+    calls = [c for c in state.db_worker.enqueue_task.call_args_list if c.args[0] == "maintenance"]
+    assert calls == [], "the startup maintenance pass must wait until the DB is ready"
+    assert not state.startup_maintenance_timer.isActive()
+
+
+def test_samples_are_buffered_until_ready(state):
+    _initializing(state)
+    state.add_speed_data({"eth0": (5000.0, 9000.0)})
+    state.add_hardware_stat("cpu", 12.0)
+    state.flush_batch()                              # the 10 s timer firing mid-init
+    state.db_worker.enqueue_task.assert_not_called()
+    assert len(state._db_batch) == 1 and len(state._hw_batch) == 1
+
+    state.db_worker.is_ready = lambda: True
+    state._on_db_ready()
+    calls = state.db_worker.enqueue_task.call_args_list
+    assert [c.args[0] for c in calls] == ["persist_batch"]          # one transaction for both tiers
+    assert len(calls[0].args[1].speed) == 1 and len(calls[0].args[1].hardware) == 1
+    assert state._db_batch == [] and state._hw_batch == []
+    assert state.startup_maintenance_timer.isActive()
+    assert state.startup_maintenance_timer.interval() == constants.timeouts.STARTUP_MAINTENANCE_DELAY_MS
+
+
+def test_forced_flush_enqueues_while_initializing(state):
+    """Shutdown / a reader waiting on the FIFO barrier must not leave samples behind in memory."""
+    _initializing(state)
+    state.add_speed_data({"eth0": (5000.0, 9000.0)})
+    state.flush_batch(force=True)
+    assert state.db_worker.enqueue_task.call_args.args[0] == "persist_batch"
+
+
+def test_usage_bytes_are_kept_until_the_odometer_loads(state):
+    _initializing(state)
+    state._try_load_usage = MagicMock(return_value=False)
+    state.add_usage_bytes(1000.0, 4000.0)
+    state.add_usage_bytes(-5.0, 1000.0)              # negative deltas are still clamped
+    state._try_load_usage.assert_not_called()        # no SQLite on the GUI thread mid-migration
+    assert state.get_usage_this_period() == (0.0, 0.0)
+    assert (state._usage_pending_up, state._usage_pending_down) == (1000.0, 5000.0)
+
+
+def test_pending_usage_is_folded_into_the_loaded_counter(state, tmp_path):
+    worker = DatabaseWorker(tmp_path / "speed_history.db")
+    worker._initialize_connection()
+    worker._check_and_create_schema()
+    worker._persist_usage((100.0, 200.0, 0.0, 0.0, "2000-01-01", 1))
+    worker._close_connection()
+    state._db_path = tmp_path / "speed_history.db"
+    state._usage_pending_up, state._usage_pending_down = 50.0, 25.0
+    assert state._try_load_usage()
+    assert state._usage["cumulative_up"] == 150.0 and state._usage["cumulative_down"] == 225.0
+    assert state._usage_pending_up == state._usage_pending_down == 0.0
+
+
+def test_time_to_first_number_is_recorded_once():
+    pytest.importorskip("win32api")
+    from netspeedtray.views.widget.main import NetworkSpeedWidget
+    f = types.SimpleNamespace(is_paused=False, upload_speed=0.0, download_speed=0.0,
+                              update=lambda: None, logger=MagicMock(),
+                              _startup_t0=0.0, time_to_first_number_ms=None)
+    f._record_first_number = NetworkSpeedWidget._record_first_number.__get__(f)
+    NetworkSpeedWidget.update_display_speeds(f, 1.0, 2.0)
+    first = f.time_to_first_number_ms
+    assert first is not None and first > 0
+    NetworkSpeedWidget.update_display_speeds(f, 3.0, 4.0)
+    assert f.time_to_first_number_ms == first
@@ -0,0 +1,105 @@
+"""
+Startup profiler (``--profile-startup``): flag parsing, per-module import timing via the meta-path hook,
+constructor phases / first-paint marks, and the one-shot JSON report.
+"""
+import json
+import sys
+import threading
+
+import pytest
+
+from netspeedtray.utils.startup_profiler import StartupProfiler, parse_profile_flag, FIRST_PAINT
+
+
+@pytest.fixture
+def prof():
+    p = StartupProfiler()
+    yield p
+    p.disable()
+
+
+def test_parse_profile_flag():
+    assert parse_profile_flag(["monitor.py"]) == (False, None)
+    assert parse_profile_flag(["monitor.py", "--profile-startup"]) == (True, None)
+    wanted, path = parse_profile_flag(["--profile-startup=C:/tmp/p.json"])
+    assert wanted and path is not None and path.name == "p.json"
+
+
+def test_disabled_profiler_records_nothing(prof):
+    with prof.phase("_init_core_components"):
+        pass
+    prof.mark(FIRST_PAINT)
+    report = prof.report()
+    assert report["phases"] == [] and report["marks"] == {}
+    assert prof.write_report() is None, "a profiler that was never enabled must not write a report"
+
+
+def test_phases_and_marks_are_recorded(prof, tmp_path):
+    prof.enable(tmp_path / "profile.json")
+    with prof.phase("_init_managers"):
+        pass
+    with prof.phase("_setup_timers"):
+        pass
+    prof.mark(FIRST_PAINT)
+    first = prof.report()["marks"][FIRST_PAINT]
+    prof.mark(FIRST_PAINT)                       # one-shot: later marks are ignored
+    report = prof.report()
+    assert [p["name"] for p in report["phases"]] == ["_init_managers", "_setup_timers"]
+    assert all(p["duration_ms"] >= 0 for p in report["phases"])
+    assert report["marks"][FIRST_PAINT] == first
+
+
+def test_import_times_are_recorded_with_self_time(prof, tmp_path, monkeypatch):
+    pkg = tmp_path / "nst_prof_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from nst_prof_pkg import child\n")
+    (pkg / "child.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    prof.enable(tmp_path / "profile.json")
+    try:
+        import nst_prof_pkg  # noqa: F401
+    finally:
+        prof.disable()
+        for name in ("nst_prof_pkg", "nst_prof_pkg.child"):
+            sys.modules.pop(name, None)
+    rows = {r["module"]: r for r in prof.report()["imports"]}
+    assert "nst_prof_pkg" in rows and "nst_prof_pkg.child" in rows
+    child, parent = rows["nst_prof_pkg.child"], rows["nst_prof_pkg"]
+    assert child["self_ms"] >= 15.0
+    # The parent's cumulative time includes the child's; its self time does not.
+    assert parent["cumulative_ms"] >= child["cumulative_ms"]
+    assert parent["self_ms"] < child["self_ms"]
+
+
+def test_disable_removes_the_meta_path_hook(prof, tmp_path):
+    prof.enable(tmp_path / "profile.json")
+    hooks_before = len(sys.meta_path)
+    prof.disable()
+    assert len(sys.meta_path) == hooks_before - 1
+
+
+def test_finish_writes_the_report_once(prof, tmp_path):
+    target = tmp_path / "out" / "profile.json"
+    prof.enable(target)
+    with prof.phase("_init_core_components"):
+        pass
+    assert prof.finish(FIRST_PAINT) == target
+    data = json.loads(target.read_text(encoding="utf-8"))
+    assert FIRST_PAINT in data["marks"]
+    assert data["phases"][0]["name"] == "_init_core_components"
+    assert "deferred_modules_loaded" in data
+    assert prof.finish(FIRST_PAINT) is None, "the report is written once"
+    assert not prof.enabled
+
+
+def test_imports_on_another_thread_do_not_charge_the_gui_threads_parent(prof):
+    # The GUI thread is inside "gui_parent" when a worker thread imports "worker_mod": the worker's
+    # time is its own, not a child of the import the GUI thread has open.
+    prof._import_started()
+    worker = threading.Thread(target=lambda: (prof._import_started(), prof._import_finished("worker_mod", 0.5)))
+    worker.start()
+    worker.join()
+    prof._import_finished("gui_parent", 1.0)
+    by_name = {i["module"]: i for i in prof._imports}
+    assert by_name["gui_parent"]["self_ms"] == 1000.0
+    assert by_name["worker_mod"]["self_ms"] == 500.0
@@ -46,6 +46,12 @@ class _WS:
             return [(self._t0, 33.0), (self._t0 + timedelta(seconds=1), 44.0)]
         return []
 
+    def get_hardware_history_arrays(self, stat, start, end):
+        import numpy as np
+        pairs = self.get_hardware_history(stat, start, end)
+        return (np.array([int(t.timestamp()) for t, _ in pairs], dtype=np.int64),
+                np.array([v for _, v in pairs], dtype=float))
+
 
 def _cfg(**over):
     c = {"update_rate": 1.0, "unit_type": "bits_decimal", "decimal_places": 1}
@@ -43,6 +43,16 @@ class _WS:
             return [(self._t0, 7.0)]
         return []
 
+    # The exporter streams through these; they yield what the list APIs above return, as unix seconds.
+    def iter_speed_history(self, start, end, iface, resolution='auto'):
+        self.speed_reads = getattr(self, "speed_reads", 0) + 1
+        for ts, up, down in self.get_speed_history(start, end, iface, resolution):
+            yield int(ts.timestamp()), up, down
+
+    def iter_hardware_history(self, stat, start, end):
+        for ts, value in self.get_hardware_history(stat, start, end):
+            yield int(ts.timestamp()), value
+
 
 @pytest.fixture
 def out(tmp_path):
@@ -131,3 +141,32 @@ def test_raw_is_long_format_sorted(out):
     # download raw is in Mbps too (10 MB/s -> 80 Mbps)
     dl = [r for r in rows if r["metric"] == "download"]
     assert float(dl[0]["value"]) == pytest.approx(80.0)
+
+
+def test_raw_series_is_merged_by_timestamp_and_reads_network_once(out):
+    ws = _WS()
+    ws.summarize_network = lambda direction, *a: summarize_raw([1.0, 2.0])   # both directions present
+    paths = SE.export_window(ws, datetime(2026, 6, 28, 11), datetime(2026, 6, 28, 12), "Last hour", out, "nst")
+    rows = [(int(r["timestamp_unix"]), r["metric"]) for r in _rows(paths["raw_csv"])]
+    t0 = int(ws._t0.timestamp())
+    assert rows == [(t0, "cpu"), (t0, "download"), (t0, "latency_gw"), (t0, "upload"),
+                    (t0 + 1, "cpu"), (t0 + 1, "download"), (t0 + 1, "upload")]
+    assert ws.speed_reads == 1
+
+
+def test_raw_series_is_streamed_not_accumulated(out):
+    """A long window must never be held in memory: the writer consumes each source lazily."""
+    ws = _WS()
+    pulled = []
+
+    def endless_cpu(stat, start, end):
+        for i in range(50_000):
+            pulled.append(i)
+            yield int(ws._t0.timestamp()) + i, 10.0
+
+    ws.iter_hardware_history = endless_cpu
+    rows = SE._raw_rows(ws, datetime(2026, 6, 28, 11), datetime(2026, 6, 28, 12), None, {"cpu"})
+    first = [next(rows) for _ in range(3)]
+    assert [r[2] for r in first] == ["cpu"] * 3
+    assert len(pulled) <= 4, "rows must be pulled on demand, not materialized up front"
+    rows.close()
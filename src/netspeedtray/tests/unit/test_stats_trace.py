@@ -0,0 +1,120 @@
+"""
+core.stats_trace - recording the monitor thread's stats_ready payloads and replaying them into the
+pipeline on trace time.
+
+A trace must give back exactly what was recorded (counters, scalars, None, the network identity), stop
+cleanly at the last whole record of a truncated file, and a replay - however compressed - must feed the
+controller the recorded intervals, timestamps and primary interface instead of the live ones.
+"""
+import gzip
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from netspeedtray import constants
+from netspeedtray.core import stats_trace as ST
+from netspeedtray.core.controller import StatsController
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.utils.network_utils import NetworkIdentity
+
+
+class _Clock:
+    def __init__(self, t=500.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+
+def _payload(i):
+    return {"network": {"Wi-Fi": ST.NetIOCounters(1000 * i, 5000 * i, i, i),
+                        "Ethernet": ST.NetIOCounters(10 * i, 20 * i)},
+            "cpu": 12.5 + i, "ram_used": 7.25, "ram_total": 16.0, "gpu_present": True, "cpu_temp": None}
+
+
+def _record(path, ticks=5, step=1.0, primary_at=None):
+    clock = _Clock()
+    rec = ST.TraceRecorder(path, {"update_rate": step}, clock=clock)
+    for i in range(ticks):
+        rec.record(_payload(i))
+        if i == primary_at:
+            rec.note_primary("Wi-Fi")
+        clock.t += step
+    rec.close()
+
+
+def test_round_trips_payloads_and_offsets(tmp_path):
+    path = tmp_path / "t.nst"
+    clock = _Clock()
+    rec = ST.TraceRecorder(path, {"update_rate": 1.0}, clock=clock)
+    ident = NetworkIdentity(name="home", band="5G", is_wireless=True)
+    rec.record(dict(_payload(1), network_identity=ident, odd=object()))    # unsupported value: dropped
+    clock.t += 2.5
+    rec.record(_payload(2))
+    rec.close()
+
+    reader = ST.TraceReader(path)
+    assert reader.meta["update_rate"] == 1.0 and reader.meta["version"] == ST.FORMAT_VERSION
+    events = list(reader)
+    assert [e.t for e in events] == [0.0, 2.5]
+    first = events[0].value
+    assert first["network"] == _payload(1)["network"] and first["network_identity"] == ident
+    assert "odd" not in first and first["cpu_temp"] is None and first["gpu_present"] is True
+    assert events[1].value == _payload(2)
+
+
+def test_truncated_trace_replays_its_whole_records(tmp_path):
+    path = tmp_path / "t.nst"
+    _record(path, ticks=20)
+    raw = gzip.decompress(path.read_bytes())
+    path.write_bytes(gzip.compress(raw[:-7]))                             # a crash mid-record
+    assert len(list(ST.TraceReader(path))) == 19
+    (tmp_path / "bad.nst").write_bytes(gzip.compress(b"not a trace"))
+    with pytest.raises(ST.TraceFormatError):
+        ST.TraceReader(tmp_path / "bad.nst")
+
+
+def test_replay_drives_the_controller_on_trace_time(tmp_path, q_app):
+    path = tmp_path / "t.nst"
+    _record(path, ticks=6, step=2.0, primary_at=1)
+    state = MagicMock(spec=WidgetState)
+    controller = StatsController(config=dict(constants.config.defaults.DEFAULT_CONFIG, update_rate=2.0),
+                                 widget_state=state)
+    wall = datetime(2026, 3, 1, 8)
+    source = ST.TraceReplaySource(path, speed=None, wall_start=wall)
+    source.attach(controller)
+    with patch("netspeedtray.core.controller.get_primary_interface_name",
+               side_effect=AssertionError("replay must not do the live routing lookup")):
+        assert source.run() == 6
+
+    calls = state.add_speed_data.call_args_list
+    assert len(calls) == 5                                                # first tick only primes
+    assert all(c.kwargs["interval"] == pytest.approx(2.0) for c in calls)
+    assert [c.kwargs["now"] for c in calls] == [wall + timedelta(seconds=2.0 * i) for i in range(1, 6)]
+    assert calls[0].args[0]["Wi-Fi"] == (500, 2500)                       # bytes / recorded interval
+    assert calls[0].kwargs["aggregated_down"] == 2500                     # primary came from the trace
+    assert state.add_hardware_stat.call_args.kwargs["now"] == wall + timedelta(seconds=10.0)
+
+
+def test_event_loop_replay_is_paced_and_finishes(tmp_path, q_app):
+    path = tmp_path / "t.nst"
+    _record(path, ticks=4, step=1.0)
+    source = ST.TraceReplaySource(path, speed=100.0)
+    got, done = [], []
+    source.stats_ready.connect(got.append)
+    source.finished.connect(lambda: done.append(True))
+    source.start()
+    import time
+    deadline = time.monotonic() + 5
+    while not done and time.monotonic() < deadline:
+        q_app.processEvents()
+        time.sleep(0.002)
+    assert done and [p["cpu"] for p in got] == [12.5, 13.5, 14.5, 15.5]
+    assert source.clock.t == 3.0
+
+
+def test_flag_parsing():
+    assert ST.parse_trace_flag(["monitor.py"]) == (False, None)
+    assert ST.parse_trace_flag(["monitor.py", "--record-trace"]) == (True, None)
+    assert ST.parse_trace_flag(["--record-trace=C:/t.nst"])[1].name == "t.nst"
@@ -65,6 +65,9 @@ class TestStructure:
         assert "config.json" in names
         assert "MANIFEST.txt" in names
         assert any(n.startswith("logs/") for n in names), names
+        assert "diagnostics.json" in names
+        diagnostics = json.loads(_open_zip_entry(dest, "diagnostics.json"))
+        assert {"enabled", "spans", "counters", "gauges"} <= set(diagnostics)
 
     def test_manifest_documents_exclusions(self, q_app, tmp_path, fake_config, fake_log_dir):
         dest = tmp_path / "bundle.zip"
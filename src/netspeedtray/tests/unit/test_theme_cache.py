@@ -0,0 +1,153 @@
+"""
+Theme cache (utils.theme_cache): QSS and icon PNGs are addressed by (builder, args, theme key, app
+version, style sources), served from memory, then disk across sessions, and the disk store stays under
+its budget without evicting anything a cached stylesheet still references.
+"""
+import os
+
+from netspeedtray.utils import theme_cache as tc
+from netspeedtray.utils.theme_cache import ThemeCache, ThemeKey
+
+DARK = ThemeKey(dark=True, accent="#0078D4")
+LIGHT = ThemeKey(dark=False, accent="#0078D4")
+
+
+class _Builder:
+    def __init__(self, text="QWidget { color: red; }"):
+        self.text, self.calls = text, 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.text
+
+
+def test_memory_then_disk_hits_skip_the_builder(tmp_path):
+    build = _Builder()
+    cache = ThemeCache(tmp_path, salt="1.0")
+    assert cache.get_text("dialog_style", DARK, (), build) == build.text
+    assert cache.get_text("dialog_style", DARK, (), build) == build.text
+    assert build.calls == 1 and cache.stats["memory_hits"] == 1
+
+    restarted = ThemeCache(tmp_path, salt="1.0")          # a new session, same app-data dir
+    assert restarted.get_text("dialog_style", DARK, (), build) == build.text
+    assert build.calls == 1 and restarted.stats["disk_hits"] == 1
+
+
+def test_key_components_address_different_entries(tmp_path):
+    build = _Builder()
+    cache = ThemeCache(tmp_path, salt="1.0")
+    for key in (DARK, LIGHT, ThemeKey(True, "#FF0000"), ThemeKey(True, "#0078D4", dpr=1.5),
+                ThemeKey(True, "#0078D4", rtl=True)):
+        cache.get_text("dialog_style", key, (), build)
+    cache.get_text("button_style", DARK, ((True,), ()), build)
+    assert build.calls == 6
+    assert len(list(tmp_path.glob("*.qss"))) == 6
+
+
+def test_new_release_does_not_reuse_old_entries(tmp_path):
+    build = _Builder()
+    ThemeCache(tmp_path, salt="1.0").get_text("slider_style", DARK, (), build)
+    ThemeCache(tmp_path, salt="1.1").get_text("slider_style", DARK, (), build)
+    assert build.calls == 2
+
+
+def test_edited_style_sources_do_not_reuse_old_entries(tmp_path, monkeypatch):
+    # No explicit salt: the default one covers the style modules' sources, not just the version.
+    styles = tmp_path / "fake_styles.py"
+    styles.write_text("ACCENT = '#0078D4'\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(tc, "STYLE_SOURCES", ("fake_styles",))
+    build = _Builder()
+    ThemeCache(tmp_path / "store").get_text("slider_style", DARK, (), build)
+    ThemeCache(tmp_path / "store").get_text("slider_style", DARK, (), build)
+    assert build.calls == 1
+    styles.write_text("ACCENT = '#FF0000'\n")                          # edited, same app version
+    ThemeCache(tmp_path / "store").get_text("slider_style", DARK, (), build)
+    assert build.calls == 2
+    assert tc.style_sources_digest(("no_such_module_xyz",)) == ""      # frozen: version only
+
+
+def test_stylesheet_with_a_missing_image_is_rebuilt(tmp_path):
+    img = tmp_path / "img.png"
+    img.write_bytes(b"png")
+    build = _Builder(f'QComboBox::down-arrow {{ image: url("{img.as_posix()}"); }}')
+    ThemeCache(tmp_path, salt="1.0").get_text("dialog_style", DARK, (), build)
+    img.unlink()
+    ThemeCache(tmp_path, salt="1.0").get_text("dialog_style", DARK, (), build)
+    assert build.calls == 2
+
+
+def test_icon_is_rendered_once_across_sessions(tmp_path):
+    renders = []
+
+    def render(path):
+        renders.append(path)
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG")
+
+    first = ThemeCache(tmp_path, salt="1.0").icon_path("combo_chevron", 1.0, (0xE70D, 14, "#C8C8C8"), render)
+    again = ThemeCache(tmp_path, salt="1.0").icon_path("combo_chevron", 1.0, (0xE70D, 14, "#C8C8C8"), render)
+    assert first == again and os.path.exists(first) and "\\" not in first
+    assert len(renders) == 1
+    hidpi = ThemeCache(tmp_path, salt="1.0").icon_path("combo_chevron", 2.0, (0xE70D, 14, "#C8C8C8"), render)
+    assert hidpi != first and len(renders) == 2
+
+
+def test_failed_render_degrades_to_no_image(tmp_path):
+    def render(path):
+        raise OSError("disk full")
+    cache = ThemeCache(tmp_path, salt="1.0")
+    assert cache.icon_path("spin_arrow", 1.0, (0xE70E, 10, "#505050"), render) == ""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_lru_is_size_bounded(tmp_path):
+    cache = ThemeCache(tmp_path, salt="1.0", memory_budget=250)
+    for i in range(5):
+        cache.get_text(f"style_{i}", DARK, (), _Builder("x" * 100))
+    assert cache._memory_bytes <= 250 and len(cache._memory) == 2
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    old = ThemeCache(tmp_path, salt="1.0")
+    for i in range(4):
+        old.get_text(f"style_{i}", DARK, (), _Builder(f"/*{i}*/" + "x" * 1000))
+    paths = sorted(tmp_path.glob("*.qss"), key=lambda p: p.stat().st_mtime_ns)
+    for n, p in enumerate(paths):                         # make the write order unambiguous
+        os.utime(p, ns=(n * 10**9, n * 10**9))
+    oldest = paths[0]
+
+    cache = ThemeCache(tmp_path, salt="1.0", disk_budget=3500)
+    cache.get_text("style_new", DARK, (), _Builder("y" * 1000))
+    assert cache.disk_usage() <= 3500
+    assert not oldest.exists()
+    assert cache.stats["evictions"] >= 1
+    assert len(list(tmp_path.glob("*.qss"))) == 3
+
+
+def test_cached_builder_decorator_uses_the_module_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(tc, "theme_cache", ThemeCache(tmp_path, salt="1.0"))
+    calls = []
+    theme = {"key": DARK}
+
+    @tc.cached_builder("toggle_style", lambda: theme["key"])
+    def toggle_style(w, h):
+        calls.append((w, h))
+        return f"QCheckBox {{ width: {w}px; height: {h}px; }}"
+
+    assert toggle_style(40, 20) == toggle_style(40, 20)
+    toggle_style(44, 22)
+    theme["key"] = LIGHT                                  # an OS theme switch is a new address
+    toggle_style(40, 20)
+    assert calls == [(40, 20), (44, 22), (40, 20)]
+    assert toggle_style.uncached(40, 20) == "QCheckBox { width: 40px; height: 20px; }"
+
+
+def test_unwritable_store_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ThemeCache(blocker / "theme", salt="1.0")
+    build = _Builder()
+    cache.get_text("dialog_style", DARK, (), build)
+    cache.get_text("dialog_style", DARK, (), build)
+    assert build.calls == 1 and cache.root is None
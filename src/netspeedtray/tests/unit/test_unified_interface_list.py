@@ -0,0 +1,21 @@
+"""
+NetworkSpeedWidget.get_unified_interface_list - the Network tab's NIC dropdown: live interfaces, the
+ones that reported this session (the in-memory session buffer) and the database's history, merged and
+sorted. Driven against a minimal fake ``self``, as in test_update_manual_check_wiring.
+"""
+import logging
+import types
+from unittest.mock import MagicMock
+
+from netspeedtray.views.widget.main import NetworkSpeedWidget
+
+
+def test_session_interfaces_are_listed_before_they_reach_the_database():
+    controller = MagicMock()
+    controller.get_available_interfaces.return_value = ["Wi-Fi"]
+    state = MagicMock()
+    state.get_session_interfaces.return_value = ["USB Tether", "Wi-Fi"]   # went down, not yet persisted
+    state.get_distinct_interfaces.return_value = ["Ethernet"]
+    fake = types.SimpleNamespace(controller=controller, widget_state=state,
+                                 logger=logging.getLogger("test"))
+    assert NetworkSpeedWidget.get_unified_interface_list(fake) == ["Ethernet", "USB Tether", "Wi-Fi"]
@@ -42,7 +42,23 @@ def test_manual_check_does_not_reconnect_update_available():
     uc.check_now.assert_called_once()
 
 
-def test_manual_check_no_op_without_checker():
-    """Guard: no update_checker (feature off / not yet built) is a safe no-op."""
-    fake = types.SimpleNamespace(update_checker=None)
+def test_manual_check_before_deferred_startup_builds_the_checker():
+    """A click during the staged-startup window (checker not built yet) must still run a check."""
+    fake = _fake_widget()
+    built = fake.update_checker
+    fake.update_checker = None
+
+    def ensure():
+        fake.update_checker = built
+        return built
+
+    fake._ensure_update_checker = ensure
+    NetworkSpeedWidget.check_for_updates(fake)
+    built.check_now.assert_called_once()
+    built.up_to_date.connect.assert_called_once()
+
+
+def test_manual_check_no_op_when_checker_cannot_be_built():
+    """Guard: a checker that fails to build (logged) leaves the click a safe no-op."""
+    fake = types.SimpleNamespace(update_checker=None, _ensure_update_checker=lambda: None)
     NetworkSpeedWidget.check_for_updates(fake)  # must not raise
@@ -49,7 +49,8 @@ def _fake_state(reset_day=1, period_key="2026-06-01"):
     s._usage = {"cumulative_up": 0.0, "cumulative_down": 0.0,
                 "anchor_up": 0.0, "anchor_down": 0.0, "period_key": period_key}
     s._usage_loaded = True
-    s._usage_last_persist = 1e18  # far future -> no persist during the test
+    s._usage_dirty = False
+    s._write_scheduler = MagicMock()
     s._persist_usage_now = WidgetState._persist_usage_now.__get__(s)
     s._maybe_reanchor = WidgetState._maybe_reanchor.__get__(s)
     return s
@@ -113,15 +114,21 @@ def test_backward_period_does_not_reanchor():
     assert up == 1500.0 and down == 1500.0          # nothing wiped
 
 
-def test_persist_enqueues_when_due():
+def test_usage_row_rides_the_next_write_batch():
     s = _fake_state()
     s._compute_period_key = lambda *a, **k: "2026-06-01"
-    s._usage_last_persist = 0.0  # due immediately
     WidgetState.add_usage_bytes(s, 10.0, 10.0)
-    assert s.db_worker.enqueue_task.called
-    task, payload = s.db_worker.enqueue_task.call_args[0]
-    assert task == "persist_usage"
-    assert len(payload) == 6  # cum_up, cum_down, anchor_up, anchor_down, period_key, ts
+    assert s._usage_dirty                           # flushed with the samples, one transaction
+    s.db_worker.enqueue_task.assert_not_called()    # no separate odometer write
+    s._write_scheduler.request_prompt_flush.assert_not_called()
+    assert len(WidgetState._usage_row(s)) == 6      # cum_up, cum_down, anchor_up, anchor_down, period_key, ts
+
+
+def test_period_rollover_requests_a_prompt_flush():
+    s = _fake_state(period_key="2026-05-01")
+    s._compute_period_key = lambda *a, **k: "2026-06-01"
+    WidgetState.add_usage_bytes(s, 10.0, 10.0)
+    s._write_scheduler.request_prompt_flush.assert_called()
 
 
 # --- DB persist round-trip ---------------------------------------------------
@@ -162,7 +162,7 @@ def test_database_initialization_creates_correct_schema(managed_widget_state):
     # 1. Check if all tables were created
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
     tables = {row[0] for row in cursor.fetchall()}
-    expected_tables = {'metadata', 'speed_history_raw', 'speed_history_minute', 'speed_history_hour', 'bandwidth_history', 'hardware_stats_raw', 'hardware_stats_minute', 'hardware_stats_hour', 'usage_counter'}
+    expected_tables = {'metadata', 'speed_history_raw', 'speed_history_minute', 'speed_history_hour', 'bandwidth_history', 'hardware_stats_raw', 'hardware_stats_minute', 'hardware_stats_hour', 'usage_counter', 'raw_partitions'}
     assert tables == expected_tables, "Incorrect set of tables were created."
 
     # 2. Check the database version in the metadata table
@@ -179,6 +179,7 @@ def test_database_initialization_creates_correct_schema(managed_widget_state):
         'interface_name': ('TEXT', 2),
         'upload_bytes_sec': ('REAL', 0),
         'download_bytes_sec': ('REAL', 0),
+        'interval_sec': ('REAL', 0),
     }
     assert columns_raw == expected_raw, "Schema for 'speed_history_raw' is incorrect."
 
@@ -193,6 +194,9 @@ def test_database_initialization_creates_correct_schema(managed_widget_state):
         'upload_max': ('REAL', 0),
         'download_max': ('REAL', 0),
         'sample_count': ('INTEGER', 0),
+        'upload_bytes': ('REAL', 0),
+        'download_bytes': ('REAL', 0),
+        'covered_sec': ('REAL', 0),
     }
     assert columns_minute == expected_minute_hour, "Schema for 'speed_history_minute' is incorrect."
     
@@ -297,8 +301,8 @@ def test_flush_batch_sends_data_to_worker(managed_widget_state):
         # 2. Assert that it was called with the correct arguments.
         #    call_args[0] is the tuple of positional arguments.
         call_args = mock_enqueue_task.call_args[0]
-        assert call_args[0] == "persist_speed", "The task name should be 'persist_speed'."
-        assert call_args[1] == expected_batch, "The data passed to the worker does not match the batch."
+        assert call_args[0] == "persist_batch", "The task name should be 'persist_batch'."
+        assert call_args[1].speed == expected_batch, "The data passed to the worker does not match the batch."
 
         # 3. Assert that the internal batch was cleared after flushing.
         assert len(state._db_batch) == 0, "The internal batch should be empty after flushing."
@@ -351,7 +355,7 @@ def test_aggregation_raw_to_minute(managed_widget_state, mock_config):
     recent_timestamp_base = (int((now - timedelta(hours=1)).timestamp()) // 60) * 60
     recent_data = [ (recent_timestamp_base + 1, "Wi-Fi", 1000.0, 2000.0) ]
     
-    cursor.executemany("INSERT INTO speed_history_raw VALUES (?, ?, ?, ?)", old_data + recent_data)
+    cursor.executemany("INSERT INTO speed_history_raw (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, ?, ?, ?)", old_data + recent_data)
     conn.commit()
     conn.close()
 
@@ -415,7 +419,7 @@ def test_aggregation_minute_to_hour(managed_widget_state, mock_config):
     recent_timestamp_base = (int((now - timedelta(days=10)).timestamp()) // 3600) * 3600
     recent_data_minute = [ (recent_timestamp_base + 60, "Wi-Fi", 1000.0, 2000.0, 1500.0, 2500.0, 60) ]
     
-    cursor.executemany("INSERT INTO speed_history_minute VALUES (?, ?, ?, ?, ?, ?, ?)", old_data_minute + recent_data_minute)
+    cursor.executemany("INSERT INTO speed_history_minute (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, ?, ?, ?, ?, ?, ?)", old_data_minute + recent_data_minute)
     conn.commit()
     conn.close()
 
@@ -470,8 +474,8 @@ def test_pruning_with_grace_period(managed_widget_state, mock_config):
     recent_timestamp = int((now - timedelta(days=10)).timestamp())
     
     # Insert placeholder data into the hour table (the target for pruning)
-    cursor.execute("INSERT INTO speed_history_hour VALUES (?, 'Wi-Fi', 0, 0, 0, 0, 1)", (very_old_timestamp,))
-    cursor.execute("INSERT INTO speed_history_hour VALUES (?, 'Wi-Fi', 0, 0, 0, 0, 1)", (recent_timestamp,))
+    cursor.execute("INSERT INTO speed_history_hour (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'Wi-Fi', 0, 0, 0, 0, 1)", (very_old_timestamp,))
+    cursor.execute("INSERT INTO speed_history_hour (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'Wi-Fi', 0, 0, 0, 0, 1)", (recent_timestamp,))
     
     # Set the initial, long retention period in the database metadata
     cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('current_retention_days', '365')")
@@ -538,13 +542,13 @@ def test_get_speed_history_unified_tiers(managed_widget_state):
     now_ts = int(now.timestamp())
     
     # Tier 1: Raw (10 seconds ago - will bin to current minute)
-    cursor.execute("INSERT INTO speed_history_raw VALUES (?, 'eth0', 100, 200)", (now_ts - 10,))
+    cursor.execute("INSERT INTO speed_history_raw (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, 'eth0', 100, 200)", (now_ts - 10,))
     
     # Tier 2: Minute (2 days ago - distinct from current minute)
-    cursor.execute("INSERT INTO speed_history_minute VALUES (?, 'eth0', 50, 60, 70, 80, 60)", (now_ts - 2 * 86400,))
+    cursor.execute("INSERT INTO speed_history_minute (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'eth0', 50, 60, 70, 80, 60)", (now_ts - 2 * 86400,))
     
     # Tier 3: Hour (40 days ago - distinct from recent time)
-    cursor.execute("INSERT INTO speed_history_hour VALUES (?, 'eth0', 10, 20, 30, 40, 60)", (now_ts - 40 * 86400,))
+    cursor.execute("INSERT INTO speed_history_hour (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'eth0', 10, 20, 30, 40, 60)", (now_ts - 40 * 86400,))
     
     conn.commit()
     conn.close()
@@ -602,11 +606,11 @@ def test_get_speed_history_merges_overlapping_tiers_without_double_count(managed
 
     # One second represented in raw + the rest of the minute represented in minute tier.
     cursor.execute(
-        "INSERT INTO speed_history_raw VALUES (?, 'eth0', 100.0, 200.0)",
+        "INSERT INTO speed_history_raw (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, 'eth0', 100.0, 200.0)",
         (minute_start + 59,)
     )
     cursor.execute(
-        "INSERT INTO speed_history_minute VALUES (?, 'eth0', 100.0, 200.0, 100.0, 200.0, 59)",
+        "INSERT INTO speed_history_minute (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'eth0', 100.0, 200.0, 100.0, 200.0, 59)",
         (minute_start,)
     )
     conn.commit()
@@ -642,11 +646,11 @@ def test_minute_to_hour_aggregation_uses_weighted_average(managed_widget_state,
 
     # Same hour, very different sample counts.
     cursor.execute(
-        "INSERT INTO speed_history_minute VALUES (?, 'Wi-Fi', 100.0, 100.0, 100.0, 100.0, 60)",
+        "INSERT INTO speed_history_minute (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'Wi-Fi', 100.0, 100.0, 100.0, 100.0, 60)",
         (hour_start + 60,)
     )
     cursor.execute(
-        "INSERT INTO speed_history_minute VALUES (?, 'Wi-Fi', 1000.0, 1000.0, 1000.0, 1000.0, 1)",
+        "INSERT INTO speed_history_minute (timestamp, interface_name, upload_avg, download_avg, upload_max, download_max, sample_count) VALUES (?, 'Wi-Fi', 1000.0, 1000.0, 1000.0, 1000.0, 1)",
         (hour_start + 120,)
     )
     conn.commit()
@@ -682,8 +686,8 @@ def test_get_speed_history_peak_is_consistent_across_resolutions(managed_widget_
     hour_start = (now_ts // 3600) * 3600
 
     # Two samples in the same minute/hour/day bin: one low, one peak.
-    cursor.execute("INSERT INTO speed_history_raw VALUES (?, 'eth0', 1.0, 2.0)", (hour_start + 10,))
-    cursor.execute("INSERT INTO speed_history_raw VALUES (?, 'eth0', 200.0, 400.0)", (hour_start + 20,))
+    cursor.execute("INSERT INTO speed_history_raw (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, 'eth0', 1.0, 2.0)", (hour_start + 10,))
+    cursor.execute("INSERT INTO speed_history_raw (timestamp, interface_name, upload_bytes_sec, download_bytes_sec) VALUES (?, 'eth0', 200.0, 400.0)", (hour_start + 20,))
     conn.commit()
     conn.close()
 
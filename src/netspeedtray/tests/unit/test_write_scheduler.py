@@ -0,0 +1,102 @@
+"""
+Adaptive write path (core.write_scheduler): the flush deadline follows read pressure, each flush is one
+WriteBatch committed in a single transaction, and readers with nothing outstanding skip the FIFO barrier.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from netspeedtray import constants
+from netspeedtray.core.database import DatabaseWorker
+from netspeedtray.core.widget_state import WidgetState
+from netspeedtray.core.write_scheduler import WriteBatch, WriteScheduler
+
+
+def _scheduler():
+    return WriteScheduler(deadline_sec=10.0, min_deadline_sec=1.0, max_deadline_sec=30.0,
+                          pressure_window_sec=15.0, idle_after_sec=120.0, max_rows=50)
+
+
+def test_deadline_follows_read_pressure():
+    s = _scheduler()
+    t0 = s._last_activity
+    assert s.mode(t0 + 1) == WriteScheduler.MODE_STEADY and s.deadline(t0 + 1) == 10.0
+    s.note_read(t0 + 2)
+    assert s.deadline(t0 + 3) == 1.0                                # a graph is being viewed
+    assert s.deadline(t0 + 2 + 16) == 10.0                          # pressure window over
+    assert s.mode(t0 + 2 + 121) == WriteScheduler.MODE_IDLE and s.deadline(t0 + 2 + 121) == 30.0
+
+
+def test_due_on_deadline_row_cap_or_prompt_request():
+    s = _scheduler()
+    t0 = s._last_activity
+    assert not s.due(t0 + 100)                                      # nothing pending
+    s.note_rows(3, now=t0)
+    assert not s.due(t0 + 9) and s.due(t0 + 10)
+    s.flushed()
+    s.note_rows(50, now=t0 + 11)
+    assert s.due(t0 + 11), "a full batch flushes without waiting for the deadline"
+    s.flushed()
+    s.request_prompt_flush()
+    assert s.due(t0 + 12)
+    s.flushed()
+    assert not s.due(t0 + 12)
+
+
+def test_one_transaction_per_flush(tmp_path):
+    w = DatabaseWorker(tmp_path / "batch.db")
+    w._initialize_connection()
+    w._check_and_create_schema()
+    commits = []
+    real_conn = w.conn
+    w.conn = MagicMock(wraps=real_conn)
+    w.conn.commit.side_effect = lambda: (commits.append(1), real_conn.commit())
+    ts = int(datetime.now().timestamp())
+    batch = WriteBatch([(ts, "eth0", 100.0, 200.0, 1.0), (ts, "wlan0", 5.0, 6.0, 1.0)],
+                       [(ts, "cpu", 12.0, 1.0)],
+                       (10.0, 20.0, 0.0, 0.0, "2026-06-01", ts))
+    w._execute_task("persist_batch", batch)
+    assert len(commits) == 1
+    assert real_conn.execute(f"SELECT COUNT(*) FROM {constants.data.SPEED_TABLE_RAW}").fetchone()[0] == 2
+    assert real_conn.execute(f"SELECT value FROM {constants.data.HARDWARE_STATS_TABLE_RAW}").fetchone()[0] == 12.0
+    assert real_conn.execute(f"SELECT cumulative_up FROM {constants.data.USAGE_COUNTER_TABLE}").fetchone()[0] == 10.0
+    m = w.write_metrics.snapshot()
+    assert (m["batches"], m["last_batch_rows"]) == (1, 4) and m["last_commit_ms"] >= 0.0
+    real_conn.close()
+
+
+@pytest.fixture
+def state(tmp_path, q_app):
+    with patch.object(QThread, "start", lambda self: None), \
+         patch("netspeedtray.core.widget_state.get_app_data_path", return_value=tmp_path):
+        ws = WidgetState(constants.config.defaults.DEFAULT_CONFIG.copy())
+    ws.db_worker.is_ready = lambda: True
+    ws.db_worker.enqueue_task = MagicMock()
+    yield ws
+    ws.batch_persist_timer.stop()
+    ws.maintenance_timer.stop()
+    ws.startup_maintenance_timer.stop()
+
+
+def test_tick_flushes_only_when_due(state):
+    state.add_speed_data({"eth0": (5000.0, 9000.0)}, interval=1.0)
+    state.add_hardware_stat("cpu", 12.0, interval=1.0)
+    state._on_flush_tick()
+    state.db_worker.enqueue_task.assert_not_called()               # young batch, steady deadline
+    state._write_scheduler._oldest_pending -= constants.timeouts.DB_FLUSH_DEADLINE_SEC
+    state._on_flush_tick()
+    task, batch = state.db_worker.enqueue_task.call_args.args
+    assert task == "persist_batch" and batch.rows == 2
+    assert state._write_scheduler.pending_rows == 0
+
+
+def test_reader_skips_the_barrier_when_nothing_is_outstanding(state):
+    with patch.object(state.db_worker, "isRunning", return_value=True), \
+         patch.object(state.db_worker, "outstanding_writes", return_value=0):
+        state.flush_and_wait(timeout=5.0)
+    assert "__signal__" not in [c.args[0] for c in state.db_worker.enqueue_task.call_args_list]
+    metrics = state.get_write_metrics()
+    assert {"mode", "deadline_sec", "pending_rows", "avg_commit_ms", "queue_depth"} <= set(metrics)
+    assert metrics["queue_depth"] == state.db_worker.queue_depth()
@@ -2,11 +2,29 @@
 Utilities submodule for NetSpeedTray.
 
 Provides helper functions and configuration management.
+
+The package-level names below are resolved on first access (PEP 562) rather than imported here:
+importing any ``netspeedtray.utils.<module>`` runs this file first, and eagerly pulling in the database
+worker, the config manager and the registry-backed styles made even the stdlib-only helpers (the
+startup profiler, the summaries) pay for PyQt and pywin32.
 """
 
-from netspeedtray.core.database import DatabaseWorker
-from netspeedtray.utils.config import ConfigManager
-from netspeedtray.utils.helpers import get_app_data_path
-from netspeedtray.utils.styles import is_dark_mode
+import importlib
+
+_LAZY_EXPORTS = {
+    "DatabaseWorker": "netspeedtray.core.database",
+    "ConfigManager": "netspeedtray.utils.config",
+    "get_app_data_path": "netspeedtray.utils.helpers",
+    "is_dark_mode": "netspeedtray.utils.styles",
+}
 
 __all__ = ["ConfigManager", "DatabaseWorker", "get_app_data_path", "is_dark_mode"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
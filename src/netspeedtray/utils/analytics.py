@@ -0,0 +1,138 @@
+"""
+NumPy-native building blocks for the window analytics in ``utils.summaries``.
+
+The summaries used to walk every (timestamp, value) pair in Python - a try/except and a
+``hasattr(ts, "timestamp")`` per sample - over whole-window ``get_hardware_history`` results (a month
+is tens of thousands of bins; a raw-tier window far more). Here the same work is a handful of array
+passes over (timestamps, values) arrays:
+
+* ``run_bounds``     - run-length encoding of a boolean mask via ``np.diff`` (event / outage runs)
+* ``hour_of_day`` + ``hourly_means`` - clock-hour profiles via ``np.bincount``
+* ``quantiles``      - every percentile of a summary in one ``np.quantile`` call
+
+plus the converters that turn the pair lists callers still hand around into those arrays once. Timestamps
+are unix seconds (float64); a missing or unparsable value is NaN, which every function here skips.
+
+Pure functions, no DB/Qt. numpy is a registered deferred import (utils.lazy_import), bound lazily like
+``summaries`` so importing this module stays free.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, Sequence, Tuple
+
+from netspeedtray.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# Granularity at which a window that crosses a DST change re-reads the local UTC offset. Quarter-hours
+# cover every real offset (e.g. +5:45) and every transition instant.
+_OFFSET_STEP_SEC = 900
+# Spacing of the probes that decide whether the offset is constant over a window at all. DST changes are
+# months apart, so a change back and forth between two probes can't happen.
+_OFFSET_PROBE_SEC = 6 * 3600
+
+
+def _to_float(v: Any) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def as_float_array(values: Sequence[Any]) -> "np.ndarray":
+    """``values`` as float64, with None / unparsable entries as NaN. One C-level conversion for the
+    usual all-numeric input; falls back to a per-element pass only when that conversion fails."""
+    if isinstance(values, np.ndarray):
+        return values.astype(float, copy=False)
+    try:
+        return np.asarray(values, dtype=float)     # None -> NaN here already
+    except (TypeError, ValueError):
+        return np.fromiter((_to_float(v) for v in values), dtype=float, count=len(values))
+
+
+def _ts_seconds(ts: Any) -> float:
+    try:
+        return ts.timestamp() if isinstance(ts, datetime) else float(ts)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return float("nan")
+
+
+def timestamps_array(timestamps: Sequence[Any]) -> "np.ndarray":
+    """Unix seconds (float64) for a sequence of datetimes and/or numbers; unparsable entries are NaN."""
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind in "fiu":
+        return timestamps.astype(float, copy=False)
+    if len(timestamps) and not isinstance(timestamps[0], datetime):
+        try:
+            return np.asarray(timestamps, dtype=float)
+        except (TypeError, ValueError):
+            pass
+    return np.fromiter((_ts_seconds(t) for t in timestamps), dtype=float, count=len(timestamps))
+
+
+def pairs_to_arrays(pairs: Sequence[Tuple[Any, Any]]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """(timestamps, values) arrays from (timestamp, value) pairs - the one conversion at the edge."""
+    if not len(pairs):
+        return np.empty(0, dtype=float), np.empty(0, dtype=float)
+    return timestamps_array([p[0] for p in pairs]), as_float_array([p[1] for p in pairs])
+
+
+def run_bounds(mask: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Start and end indices (inclusive) of each run of True in ``mask``, via ``np.diff`` on the mask
+    padded with False at both ends: +1 marks a run opening, -1 the sample after it closes."""
+    m = np.asarray(mask, dtype=bool)
+    if m.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    edges = np.diff(np.concatenate(([0], m.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def _utc_offset(ts: float) -> int:
+    return time.localtime(ts).tm_gmtoff
+
+
+def hour_of_day(ts: "np.ndarray", utc: bool = False) -> "np.ndarray":
+    """Clock hour (0..23) of each unix timestamp - local time by default, the same hour a
+    ``datetime.fromtimestamp(ts).hour`` reads - or -1 where the timestamp is NaN. The local offset is
+    probed every few hours across the window; when it never changes (the usual case) it is one add,
+    otherwise it is read per quarter-hour actually present."""
+    t = np.asarray(ts, dtype=float)
+    ok = np.isfinite(t)
+    out = np.full(t.shape, -1, dtype=np.int64)
+    if not ok.any():
+        return out
+    tv = t[ok]
+    if not utc:
+        t0, t1 = float(tv.min()), float(tv.max())
+        probes = {_utc_offset(p) for p in np.append(np.arange(t0, t1, _OFFSET_PROBE_SEC), t1).tolist()}
+        if len(probes) == 1:
+            tv = tv + probes.pop()
+        else:
+            steps = np.floor(tv / _OFFSET_STEP_SEC)
+            uniq, inverse = np.unique(steps, return_inverse=True)
+            offsets = np.fromiter((_utc_offset(float(s) * _OFFSET_STEP_SEC) for s in uniq),
+                                  dtype=float, count=uniq.size)
+            tv = tv + offsets[inverse]
+    out[ok] = (np.floor(tv / 3600.0) % 24).astype(np.int64)
+    return out
+
+
+def hourly_means(hours: "np.ndarray", values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """(means, counts) per clock hour, each of length 24, from ``np.bincount``; samples with hour -1 or a
+    NaN value are skipped, and an hour without samples has mean NaN and count 0."""
+    h = np.asarray(hours, dtype=np.int64)
+    v = np.asarray(values, dtype=float)
+    ok = (h >= 0) & np.isfinite(v)
+    counts = np.bincount(h[ok], minlength=24)
+    sums = np.bincount(h[ok], weights=v[ok], minlength=24)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    return means, counts
+
+
+def quantiles(values: "np.ndarray", qs: Sequence[float]) -> "np.ndarray":
+    """All requested quantiles (0..1) of ``values`` in one ``np.quantile`` call - one partition of the
+    data instead of one per percentile. Same linear interpolation as ``np.percentile``."""
+    return np.quantile(np.asarray(values, dtype=float), np.asarray(qs, dtype=float))
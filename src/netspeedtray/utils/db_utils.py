@@ -64,7 +64,7 @@ def get_speed_history(db_path: Union[str, Path], start_time: Optional[datetime]
         if not start_time or end_time > aggregation_cutoff_time:
             raw_start_ts = int(max(start_time, aggregation_cutoff_time).timestamp()) if start_time else int(aggregation_cutoff_time.timestamp())
             raw_end_ts = int(end_time.timestamp())
-            raw_q = f"SELECT timestamp, upload_bytes_sec, download_bytes_sec FROM {constants.data.SPEED_TABLE_RAW} WHERE timestamp BETWEEN ? AND ?"
+            raw_q = f"SELECT timestamp, upload_bytes_sec, download_bytes_sec FROM {constants.data.SPEED_TABLE_RAW_ALL} WHERE timestamp BETWEEN ? AND ?"
             raw_params = [raw_start_ts, raw_end_ts]
             if interface_name:
                 raw_q += " AND interface_name = ?"
@@ -6,6 +6,10 @@ writes, without opening any window - schedulable from Task Scheduler / an RMM. I
 history DB in READ-ONLY mode (no second write thread against the live app, no maintenance/VACUUM), so it
 is safe to run while NetSpeedTray is already running.
 
+`--format archive` writes the whole history in the window as one columnar `.npz` history archive
+(utils.history_archive) instead of the CSV pair - the compact form for month/all-time exports. An
+archive holds every interface and the hardware tiers, so `--interface` is rejected with it.
+
 Returns an exit code when `--export-csv` is present (the caller then exits), or None to let the normal
 GUI launch proceed.
 """
@@ -63,6 +67,8 @@ def _parse(argv: List[str]) -> Optional[argparse.Namespace]:
     p.add_argument("--out", default=".", help="output folder (default: current directory)")
     p.add_argument("--interface", default=None, help="interface name (default: all)")
     p.add_argument("--basename", default=None, help="override the export file basename")
+    p.add_argument("--format", default="csv", choices=("csv", "archive"),
+                   help="csv (summary + raw CSV, default) or archive (columnar .npz of every tier)")
     ns, _unknown = p.parse_known_args(argv)
     return ns
 
@@ -81,6 +87,10 @@ def run_export_cli(argv: Optional[List[str]] = None) -> Optional[int]:
         _emit(sys.stderr, f"Unknown --period '{ns.period}'. Valid: {', '.join(sorted(_PERIOD_TOKENS))}\n",
               level=logging.ERROR)
         return 2
+    if ns.format == "archive" and ns.interface:
+        _emit(sys.stderr, "--interface can't be combined with --format archive: an archive holds every "
+                          "interface.\n", level=logging.ERROR)
+        return 2
 
     # Imports kept inside the function so the GUI path never pays for them.
     from netspeedtray import constants, __version__
@@ -124,9 +134,15 @@ def run_export_cli(argv: Optional[List[str]] = None) -> Optional[int]:
         out_dir = os.path.abspath(ns.out)
         poll = float(config.get("update_rate", 1.0) or 1.0)
 
-        paths = stats_exporter.export_window(
-            ws, start, now, label, out_dir, basename,
-            machine_id=machine, app_version=__version__, interface=ns.interface, poll_interval=poll)
+        if ns.format == "archive":
+            os.makedirs(out_dir, exist_ok=True)
+            archive_path = os.path.join(out_dir, f"{basename}.npz")
+            ws.export_archive(archive_path, start, now, app_version=__version__)
+            paths = {"archive": archive_path}
+        else:
+            paths = stats_exporter.export_window(
+                ws, start, now, label, out_dir, basename,
+                machine_id=machine, app_version=__version__, interface=ns.interface, poll_interval=poll)
     except Exception as e:
         logger.error("Headless export failed: %s", e, exc_info=True)
         _emit(sys.stderr, f"Export failed: {e}\n", level=logging.ERROR)
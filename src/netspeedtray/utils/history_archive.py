@@ -0,0 +1,251 @@
+"""
+History archive - a columnar, compressed copy of the history tiers that can be merged back in.
+
+The CSV exports (stats_exporter's long-format raw file, DataExporter's history CSV) write one text row
+per sample, an ISO string on each. For a month or all-time window that is hundreds of MB, built row by
+row. An archive keeps the tiers as they are stored instead: one typed NumPy column per field, written
+in chunks of ARCHIVE_CHUNK_ROWS straight from a cursor (fetchmany), so memory stays bounded by one
+chunk however long the window is.
+
+Layout - a plain ``.npz`` (a deflated zip of ``.npy`` members), readable with nothing but NumPy:
+  ``manifest``                      a 0-d string array holding the JSON manifest (format, version, window,
+                                    per-tier table/columns/row+chunk counts, key dictionaries)
+  ``<tier>/<chunk>/<column>``       one array per column per chunk: int64 timestamps/counts, float64
+                                    values (NULL stored as NaN), int32 codes for the interface_name /
+                                    stat_type keys (dictionary-encoded; the dictionary is in the manifest)
+
+Import merges an archive into a database without ever double counting: every tier is INSERT OR IGNORE
+on its primary key (importing the same archive twice is a no-op), and the raw and minute tiers guard
+each other. Maintenance MERGES raw rows into existing minute buckets, so a raw row whose minute is
+already aggregated in the target is skipped, and so is an archived minute row for a minute the target
+still holds raw rows for - either would let the next roll-up count that minute twice. Both guards look
+at the target as it was before the import (the minute guard reads a snapshot taken first), so an
+archive's own raw and minute rows never shadow each other. Raw rows land in the hot raw table; those
+past the raw window are rolled up by the next maintenance pass like any other backlog.
+
+Parquet would be the obvious format for this, but pyarrow would add a large dependency to the frozen
+build for a feature NumPy (already required) covers.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from netspeedtray import constants
+
+logger = logging.getLogger("NetSpeedTray.HistoryArchive")
+
+ARCHIVE_FORMAT = "netspeedtray-history-archive"
+ARCHIVE_VERSION = 1
+
+# Column kinds: "ts"/"int" -> int64, "real" -> float64 (NULL as NaN), "key" -> int32 dictionary codes.
+_Column = Tuple[str, str]
+
+_SPEED_RAW_COLUMNS: List[_Column] = [
+    ("timestamp", "ts"), ("interface_name", "key"),
+    ("upload_bytes_sec", "real"), ("download_bytes_sec", "real"), ("interval_sec", "real"),
+]
+_SPEED_AGG_COLUMNS: List[_Column] = [
+    ("timestamp", "ts"), ("interface_name", "key"),
+    ("upload_avg", "real"), ("download_avg", "real"), ("upload_max", "real"), ("download_max", "real"),
+    ("sample_count", "int"), ("upload_bytes", "real"), ("download_bytes", "real"), ("covered_sec", "real"),
+]
+_HW_RAW_COLUMNS: List[_Column] = [
+    ("timestamp", "ts"), ("stat_type", "key"), ("value", "real"), ("interval_sec", "real"),
+]
+_HW_AGG_COLUMNS: List[_Column] = [
+    ("timestamp", "ts"), ("stat_type", "key"), ("avg_value", "real"), ("max_value", "real"),
+    ("sample_count", "int"), ("covered_sec", "real"),
+]
+
+# (tier name, table read on export, table written on import, columns, table guarding the import).
+# Raw tiers are read through the partition views and imported into the hot tables, guarded by the
+# target's minute table; minute tiers are guarded by the target's raw rows (the raw views). Order
+# matters on import: raw first, so the minute-bucket guard only sees what the target already aggregated.
+_TIERS: List[Tuple[str, str, str, List[_Column], Optional[str]]] = [
+    ("speed_raw", constants.data.SPEED_TABLE_RAW_ALL, constants.data.SPEED_TABLE_RAW,
+     _SPEED_RAW_COLUMNS, constants.data.SPEED_TABLE_MINUTE),
+    ("speed_minute", constants.data.SPEED_TABLE_MINUTE, constants.data.SPEED_TABLE_MINUTE, _SPEED_AGG_COLUMNS,
+     constants.data.SPEED_TABLE_RAW_ALL),
+    ("speed_hour", constants.data.SPEED_TABLE_HOUR, constants.data.SPEED_TABLE_HOUR, _SPEED_AGG_COLUMNS, None),
+    ("hardware_raw", constants.data.HARDWARE_STATS_TABLE_RAW_ALL, constants.data.HARDWARE_STATS_TABLE_RAW,
+     _HW_RAW_COLUMNS, constants.data.HARDWARE_STATS_TABLE_MINUTE),
+    ("hardware_minute", constants.data.HARDWARE_STATS_TABLE_MINUTE, constants.data.HARDWARE_STATS_TABLE_MINUTE,
+     _HW_AGG_COLUMNS, constants.data.HARDWARE_STATS_TABLE_RAW_ALL),
+    ("hardware_hour", constants.data.HARDWARE_STATS_TABLE_HOUR, constants.data.HARDWARE_STATS_TABLE_HOUR,
+     _HW_AGG_COLUMNS, None),
+]
+
+_DTYPES = {"ts": np.int64, "int": np.int64, "real": np.float64, "key": np.int32}
+
+
+@dataclass
+class ArchiveImport:
+    """An import handed to the DatabaseWorker ("import_archive" task); ``done`` is set when it finishes,
+    with ``result`` (rows inserted per tier) or ``error`` filled in."""
+    path: str
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[Dict[str, int]] = None
+    error: Optional[str] = None
+
+
+def _member(tier: str, chunk: int, column: str) -> str:
+    return f"{tier}/{chunk:05d}/{column}.npy"
+
+
+def _write_array(zf: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+    with zf.open(name, "w", force_zip64=True) as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+
+def _read_array(zf: zipfile.ZipFile, name: str) -> np.ndarray:
+    with zf.open(name) as f:
+        return np.lib.format.read_array(f, allow_pickle=False)
+
+
+def export_archive(conn: sqlite3.Connection, path: str, start: Optional[datetime] = None,
+                   end: Optional[datetime] = None, app_version: str = "",
+                   chunk_rows: int = constants.export.ARCHIVE_CHUNK_ROWS) -> Dict[str, int]:
+    """
+    Write every history tier in [start, end] (all of it when omitted) to an archive at ``path``.
+    Streams each tier in ``chunk_rows`` chunks; returns the rows written per tier.
+    """
+    start_ts = int(start.timestamp()) if start else 0
+    end_ts = int(end.timestamp()) if end else 2 ** 62
+    manifest: Dict[str, Any] = {
+        "format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION, "app_version": app_version,
+        "created_iso": datetime.now().isoformat(timespec="seconds"),
+        "start_ts": start_ts if start else None, "end_ts": end_ts if end else None, "tiers": {},
+    }
+    written: Dict[str, int] = {}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for tier, source, table, columns, _guard in _TIERS:
+            names = [c for c, _ in columns]
+            keys: Dict[str, Dict[str, int]] = {c: {} for c, kind in columns if kind == "key"}
+            cur = conn.cursor()
+            try:
+                cur.execute(f"SELECT {', '.join(names)} FROM {source} WHERE timestamp BETWEEN ? AND ? "
+                            f"ORDER BY timestamp", (start_ts, end_ts))
+                rows_total = chunks = 0
+                while True:
+                    rows = cur.fetchmany(chunk_rows)
+                    if not rows:
+                        break
+                    for (name, kind), values in zip(columns, zip(*rows)):
+                        if kind == "key":
+                            codes = keys[name]
+                            values = [codes.setdefault(v, len(codes)) for v in values]
+                        _write_array(zf, _member(tier, chunks, name), np.array(values, dtype=_DTYPES[kind]))
+                    rows_total += len(rows)
+                    chunks += 1
+            finally:
+                cur.close()
+            manifest["tiers"][tier] = {
+                "table": table, "columns": columns, "rows": rows_total, "chunks": chunks,
+                "keys": {name: list(codes) for name, codes in keys.items()},   # insertion order = code
+            }
+            written[tier] = rows_total
+        _write_array(zf, "manifest.npy", np.array(json.dumps(manifest)))
+    logger.info("Wrote history archive %s (%s)", path,
+                ", ".join(f"{t}={n}" for t, n in written.items()))
+    return written
+
+
+def read_manifest(path: str) -> Dict[str, Any]:
+    """The archive's manifest; raises ValueError if ``path`` isn't an archive this version can read."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(_read_array(zf, "manifest.npy").item())
+    except (KeyError, zipfile.BadZipFile, ValueError, OSError) as e:
+        raise ValueError(f"Not a NetSpeedTray history archive: {e}") from e
+    if manifest.get("format") != ARCHIVE_FORMAT:
+        raise ValueError("Not a NetSpeedTray history archive.")
+    if int(manifest.get("version", 0)) > ARCHIVE_VERSION:
+        raise ValueError(f"Archive version {manifest.get('version')} is newer than this app supports.")
+    return manifest
+
+
+def _snapshot_raw_minutes(cur: sqlite3.Cursor, tier: str, raw_view: str, key_col: str) -> str:
+    """Copy the (minute, key) pairs the target holds raw rows for into a temp table, before any raw
+    row is imported; the minute tier's guard reads this instead of the live view."""
+    temp = f"import_{tier}_raw_minutes"
+    cur.execute(f"DROP TABLE IF EXISTS temp.{temp}")
+    cur.execute(f"CREATE TEMP TABLE {temp} (timestamp INTEGER NOT NULL, {key_col} TEXT NOT NULL, "
+                f"PRIMARY KEY (timestamp, {key_col})) WITHOUT ROWID")
+    cur.execute(f"INSERT OR IGNORE INTO temp.{temp} SELECT (timestamp / 60) * 60, {key_col} FROM {raw_view}")
+    return temp
+
+
+def import_archive(conn: sqlite3.Connection, path: str) -> Dict[str, int]:
+    """
+    Merge an archive into the database on ``conn`` (the writer's connection) in one transaction.
+    Rows already present are kept; returns the rows inserted per tier.
+    """
+    manifest = read_manifest(path)
+    inserted: Dict[str, int] = {}
+    snapshots: Dict[str, str] = {}
+    with zipfile.ZipFile(path) as zf:
+        cur = conn.cursor()
+        try:
+            if not conn.in_transaction:
+                cur.execute("BEGIN")
+            for tier, _source, _table, columns, guard in _TIERS:
+                if tier.endswith("_minute") and guard and manifest["tiers"].get(tier):
+                    snapshots[tier] = _snapshot_raw_minutes(cur, tier, guard, columns[1][0])
+            for tier, _source, table, columns, guard in _TIERS:
+                meta = manifest["tiers"].get(tier)
+                if not meta:
+                    continue
+                names = [c for c, _ in columns]
+                archived = {name for name, _ in meta["columns"]}
+                if archived != set(names):
+                    raise ValueError(f"Archive tier '{tier}' has columns {sorted(archived)}, expected {names}.")
+                key_col = columns[1][0]
+                placeholders = ", ".join("?" * len(names))
+                if tier in snapshots:
+                    sql = (f"INSERT OR IGNORE INTO {table} ({', '.join(names)}) SELECT {placeholders} "
+                           f"WHERE NOT EXISTS (SELECT 1 FROM temp.{snapshots[tier]} WHERE timestamp = ?1 "
+                           f"AND {key_col} = ?2)")
+                elif guard:
+                    sql = (f"INSERT OR IGNORE INTO {table} ({', '.join(names)}) SELECT {placeholders} "
+                           f"WHERE NOT EXISTS (SELECT 1 FROM {guard} WHERE timestamp = (?1 / 60) * 60 "
+                           f"AND {key_col} = ?2)")
+                else:
+                    sql = f"INSERT OR IGNORE INTO {table} ({', '.join(names)}) VALUES ({placeholders})"
+                before = conn.total_changes
+                for chunk in range(int(meta["chunks"])):
+                    decoded = []
+                    for name, kind in columns:
+                        arr = _read_array(zf, _member(tier, chunk, name))
+                        if kind == "key":
+                            dictionary = meta["keys"][name]
+                            decoded.append([dictionary[i] for i in arr.tolist()])
+                        elif kind == "real":
+                            decoded.append([None if math.isnan(v) else v for v in arr.tolist()])
+                        else:
+                            decoded.append(arr.tolist())
+                    cur.executemany(sql, zip(*decoded))
+                inserted[tier] = conn.total_changes - before
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            for temp in snapshots.values():
+                try:
+                    cur.execute(f"DROP TABLE IF EXISTS temp.{temp}")
+                except sqlite3.Error:
+                    pass
+            cur.close()
+    logger.info("Merged history archive %s (%s)", path,
+                ", ".join(f"{t}={n}" for t, n in inserted.items()))
+    return inserted
@@ -0,0 +1,270 @@
+"""
+Hot-path instrumentation for NetSpeedTray: where the time goes at runtime, on the user's own machine.
+
+A slow-machine report ("the widget stutters", "the Monitor takes seconds to open") used to arrive with
+nothing but a log. This module keeps a small registry of named measurements that the hot paths feed
+while the app runs, so the Monitor's Diagnostics tab - and the support bundle - can show real numbers:
+
+* **spans** - monotonic-clock durations (``time.perf_counter_ns``) folded into a ``Histogram`` per name:
+  the stats thread's tick, ``StatsController.handle_stats``, the widget's paint, each DatabaseWorker task
+  type and history read, the graph worker's ``process_data`` and ``GraphRenderer.render``;
+* **counters** - monotonically increasing event counts (stats-thread errors, failed DB tasks);
+* **gauges** - a current value plus its peak (the DatabaseWorker's queue depth).
+
+Cost model. Collection is off unless ``diagnostics_enabled`` is set (Settings > Advanced), and can be
+switched on and off at runtime. Disabled, a hook is one attribute check - ``begin()`` returns 0 and
+``end()`` ignores it. Enabled, a span is two clock reads and four integer updates: a histogram is a
+fixed array of power-of-two buckets (about 1 µs to 17 s) indexed by ``int.bit_length``, so recording
+never allocates, searches or grows anything, and a snapshot's percentiles are bucket-accurate (within
+a factor of two), which is what "is this 2 ms or 200 ms" needs. Updates are deliberately unlocked: each
+measurement is fed by one or two threads, and a rare lost increment under contention is a better trade
+than a lock on every paint.
+
+Stdlib-only and free of Qt, like the startup profiler, so any layer (the stats thread, the DB worker,
+the graph package) can import it. Names are code paths, never user data, so a snapshot is safe to ship.
+"""
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger("NetSpeedTray.Instrumentation")
+
+BUCKETS = 25                 # bucket i < BUCKETS-1 holds durations below BUCKET_BASE_NS << i
+BUCKET_BASE_NS = 1024        # ~1 µs; the last bucket is open-ended (>= ~17 s)
+_SHIFT = BUCKET_BASE_NS.bit_length() - 1
+_NS_PER_MS = 1_000_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def bucket_index(ns: int) -> int:
+    """The histogram bucket for a duration of ``ns`` nanoseconds."""
+    i = (ns >> _SHIFT).bit_length()
+    return i if i < BUCKETS else BUCKETS - 1
+
+
+def bucket_upper_ms(index: int) -> Optional[float]:
+    """Exclusive upper bound of bucket ``index`` in ms; None for the open-ended last bucket."""
+    if index >= BUCKETS - 1:
+        return None
+    return (BUCKET_BASE_NS << index) / _NS_PER_MS
+
+
+class Histogram:
+    """Latency distribution of one span: fixed power-of-two buckets plus count / total / max."""
+
+    __slots__ = ("name", "counts", "count", "total_ns", "max_ns")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, ns: int) -> None:
+        i = (ns >> _SHIFT).bit_length()
+        self.counts[i if i < BUCKETS else BUCKETS - 1] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def end(self, started: int) -> None:
+        """Record the span begun by ``Instrumentation.begin()`` (a 0 start - collection off - is ignored)."""
+        if started:
+            self.add(time.perf_counter_ns() - started)
+
+    def reset(self) -> None:
+        for i in range(BUCKETS):
+            self.counts[i] = 0
+        self.count = self.total_ns = self.max_ns = 0
+
+    def percentile_ms(self, q: float) -> float:
+        """The ``q`` quantile (0..1) as its bucket's upper bound, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for i in range(BUCKETS):
+            seen += self.counts[i]
+            if seen >= rank:
+                upper = bucket_upper_ms(i)
+                max_ms = self.max_ns / _NS_PER_MS
+                return max_ms if upper is None else min(upper, max_ms)
+        return self.max_ns / _NS_PER_MS
+
+    def snapshot(self) -> Dict[str, Any]:
+        n = self.count
+        return {
+            "count": n,
+            "total_ms": round(self.total_ns / _NS_PER_MS, 3),
+            "mean_ms": round(self.total_ns / n / _NS_PER_MS, 4) if n else 0.0,
+            "p50_ms": round(self.percentile_ms(0.50), 4),
+            "p95_ms": round(self.percentile_ms(0.95), 4),
+            "p99_ms": round(self.percentile_ms(0.99), 4),
+            "max_ms": round(self.max_ns / _NS_PER_MS, 4),
+            # Non-empty buckets only, keyed by upper bound ("inf" for the open-ended one).
+            "buckets": {("inf" if bucket_upper_ms(i) is None else f"{bucket_upper_ms(i):g}"): c
+                        for i, c in enumerate(self.counts) if c},
+        }
+
+
+class Counter:
+    """A monotonically increasing event count."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+
+    def add(self, n: int = 1) -> None:
+        self.value += n
+
+
+class Gauge:
+    """A sampled level (e.g. a queue depth): the latest value and the peak since the last reset."""
+
+    __slots__ = ("name", "value", "peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+        self.peak = 0
+
+    def set(self, value: int) -> None:
+        self.value = value
+        if value > self.peak:
+            self.peak = value
+
+
+class Instrumentation:
+    """The registry: named histograms, counters and gauges, and the runtime on/off switch."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self._lock = threading.Lock()          # guards creation only; updates are lock-free
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._since = time.monotonic()
+
+    # --- switch ----------------------------------------------------------------------------------
+    def set_enabled(self, on: bool) -> None:
+        """Turn collection on or off. What was collected is kept (and shown) until ``reset()``."""
+        on = bool(on)
+        if on == self.enabled:
+            return
+        self.enabled = on
+        if on and not any(h.count for h in list(self._histograms.values())):
+            self._since = time.monotonic()
+        logger.info("Hot-path instrumentation %s", "enabled" if on else "disabled")
+
+    def reset(self) -> None:
+        """Zero every measurement; registered names are kept so they still show with no samples."""
+        with self._lock:
+            for h in self._histograms.values():
+                h.reset()
+            for c in self._counters.values():
+                c.value = 0
+            for g in self._gauges.values():
+                g.value = g.peak = 0
+            self._since = time.monotonic()
+
+    # --- registration ----------------------------------------------------------------------------
+    def histogram(self, name: str) -> Histogram:
+        h = self._histograms.get(name)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(name, Histogram(name))
+        return h
+
+    def counter(self, name: str) -> Counter:
+        c = self._counters.get(name)
+        if c is None:
+            with self._lock:
+                c = self._counters.setdefault(name, Counter(name))
+        return c
+
+    def gauge(self, name: str) -> Gauge:
+        g = self._gauges.get(name)
+        if g is None:
+            with self._lock:
+                g = self._gauges.setdefault(name, Gauge(name))
+        return g
+
+    # --- the hot-path API ------------------------------------------------------------------------
+    def begin(self) -> int:
+        """Start a span: the monotonic clock in ns, or 0 when collection is off."""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def end(self, name: str, started: int) -> None:
+        """Record the span ``started`` by ``begin()`` under ``name`` (no-op for a 0 start)."""
+        if started:
+            self.histogram(name).add(time.perf_counter_ns() - started)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counter(name).add(n)
+
+    def level(self, name: str, value: int) -> None:
+        """Sample gauge ``name`` (a queue depth, a pool occupancy)."""
+        if self.enabled:
+            self.gauge(name).set(value)
+
+    def read_hook(self, query: str, elapsed_ms: float, wait_ms: float) -> None:
+        """WidgetState.add_read_hook adapter: each history/summary read as ``database.read.<query>``."""
+        if self.enabled:
+            self.histogram(f"database.read.{query}").add(int(elapsed_ms * _NS_PER_MS))
+
+    # --- output ----------------------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """Everything collected, JSON-ready (the Diagnostics tab and the support bundle's diagnostics.json)."""
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        return {
+            "enabled": self.enabled,
+            "window_sec": round(time.monotonic() - self._since, 1),
+            "spans": {name: histograms[name].snapshot() for name in sorted(histograms)},
+            "counters": {name: counters[name].value for name in sorted(counters)},
+            "gauges": {name: {"value": gauges[name].value, "peak": gauges[name].peak}
+                       for name in sorted(gauges)},
+        }
+
+    def busiest(self, limit: Optional[int] = None) -> List[str]:
+        """Span names ordered by total time spent, busiest first (the Diagnostics tab's row order)."""
+        names = sorted(self._histograms, key=lambda n: self._histograms[n].total_ns, reverse=True)
+        return names if limit is None else names[:limit]
+
+
+registry = Instrumentation()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator: time every call of the wrapped function as span ``name`` on the shared registry.
+
+    The histogram is registered at decoration time, so the span is listed (with no samples) from the
+    moment its module is imported."""
+    def decorate(fn: F) -> F:
+        hist = registry.histogram(name)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            started = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.add(time.perf_counter_ns() - started)
+
+        return wrapper  # type: ignore[return-value]
+    return decorate
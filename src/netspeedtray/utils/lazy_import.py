@@ -0,0 +1,114 @@
+"""
+Deferred-import registry for NetSpeedTray.
+
+Most launches only ever show the taskbar widget, so anything that is not needed to paint the first
+number stays off the startup import path: matplotlib (the graph), numpy (pulled in by the pro-stats
+summaries), and the Monitor / Settings view packages. Before this module that rule lived only in
+comments and in one firewall test for the Monitor package.
+
+``DEFERRED_IMPORTS`` is the declarative list of those modules, with the reason each one is deferred.
+Code that needs one of them at module scope binds a ``lazy_import()`` proxy instead of importing it, so
+the real import runs on first attribute access. The unit tests import the startup modules in a clean
+interpreter and check ``leaked_deferred_modules()`` stays empty.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import threading
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("NetSpeedTray.LazyImport")
+
+
+@dataclass(frozen=True)
+class DeferredImport:
+    """One module that must not be imported while the widget starts."""
+
+    module: str          # top-level or dotted module name
+    reason: str          # why it is deferred (shown in the startup profile report)
+
+
+DEFERRED_IMPORTS: Tuple[DeferredImport, ...] = (
+    DeferredImport("matplotlib", "graph rendering only; ~30-50 MB RAM and ~0.5 s of import time"),
+    DeferredImport("numpy", "pro-stats summaries and graph data; not needed for the live numbers"),
+    DeferredImport("netspeedtray.views.graph", "matplotlib-backed graph window, built on first open"),
+    DeferredImport("netspeedtray.views.monitor", "Monitor window, built on first open"),
+    DeferredImport("netspeedtray.views.settings", "Settings dialog, built on first open"),
+)
+
+
+def deferred_module_names() -> List[str]:
+    """The registered module names, in registry order."""
+    return [entry.module for entry in DEFERRED_IMPORTS]
+
+
+def is_deferred(name: str) -> bool:
+    """True if ``name`` is a registered deferred module or one of its submodules."""
+    return any(name == d or name.startswith(d + ".") for d in deferred_module_names())
+
+
+def leaked_deferred_modules(loaded: Optional[Iterable[str]] = None) -> List[str]:
+    """Registered deferred modules that are already imported (``loaded`` defaults to ``sys.modules``).
+
+    Only the registered names themselves are reported, not every submodule, so the list reads as
+    "which registry entries leaked"."""
+    names = set(sys.modules if loaded is None else loaded)
+    return [d for d in deferred_module_names() if d in names]
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the real module on first attribute access.
+
+    ``np = lazy_import("numpy")`` costs nothing at import time; ``np.percentile(...)`` imports numpy once
+    and then forwards every attribute. After the first load the proxy caches the real module, so the
+    per-access cost is one dict lookup plus ``getattr``."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _lazy_load(self) -> ModuleType:
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            with self.__dict__["_lazy_lock"]:
+                target = self.__dict__["_lazy_target"]
+                if target is None:
+                    logger.debug("Loading deferred module %s on first use", self.__name__)
+                    target = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = target
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_target"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._lazy_load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self.__name__!r} ({state})>"
+
+
+_proxies: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a (shared) proxy for ``name`` that imports it on first attribute access.
+
+    Only registered deferred modules may be proxied - the registry is the single list of what startup
+    defers, so an unregistered name is a programming error rather than a silent eager import."""
+    if not is_deferred(name):
+        raise ValueError(f"{name!r} is not in DEFERRED_IMPORTS; register it before lazy-importing it")
+    proxy = _proxies.get(name)
+    if proxy is None:
+        proxy = _proxies.setdefault(name, LazyModule(name))
+    return proxy
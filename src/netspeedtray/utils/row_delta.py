@@ -0,0 +1,54 @@
+"""
+Keyed row deltas for the Monitor's per-app / per-process samplers.
+
+The AppActivityWorker and HardwareActivityWorker sample every 2 s and used to hand the list a brand-new
+snapshot each time, so the view could not tell the one process whose CPU moved from the hundreds that
+didn't. ``RowDeltaTracker`` sits at the end of a worker's ``sample()``: rows equal to last tick's are
+replaced by last tick's *object* (so an unchanged row is the identical dict on both sides of the thread
+boundary), and a small ``delta`` is attached to the payload::
+
+    {"base": 41, "seq": 42, "changed": [keys added or modified], "removed": [keys gone]}
+
+A consumer that saw ``base`` can trust ``changed`` and skip comparing the other rows; one that didn't
+(it connected late, or the worker was recreated) simply diffs the rows itself. Stdlib-only.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def row_key(row: Dict[str, Any]) -> str:
+    """A row's identity: the program's ``identity_key``, falling back to its display name."""
+    return str(row.get("identity_key", row.get("display_name", "")))
+
+
+class RowDeltaTracker:
+    """Remembers the previous tick's rows per key and computes the next delta."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+
+    def previous(self, key: str) -> Optional[Dict[str, Any]]:
+        """Last tick's row for ``key`` (lets a worker reuse it without rebuilding), or None."""
+        return self._rows.get(key)
+
+    def commit(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Intern unchanged rows to last tick's objects and return ``(rows, delta)``."""
+        current: Dict[str, Dict[str, Any]] = {}
+        out: List[Dict[str, Any]] = []
+        changed: List[str] = []
+        for row in rows:
+            key = row_key(row)
+            old = self._rows.get(key)
+            if old is not None and (old is row or old == row):
+                row = old
+            else:
+                changed.append(key)
+            current[key] = row
+            out.append(row)
+        removed = [k for k in self._rows if k not in current]
+        delta = {"base": self._seq, "seq": self._seq + 1, "changed": changed, "removed": removed}
+        self._seq += 1
+        self._rows = current
+        return out, delta
@@ -0,0 +1,241 @@
+"""
+Startup profiler for NetSpeedTray (``--profile-startup``).
+
+Measures where cold start goes: the import time of every module loaded after the profiler is enabled,
+the widget constructor phases (``_init_managers``, ``_init_core_components``, ``_setup_connections``,
+``_setup_timers``), the first paint and the first real number (time-to-first-number). The result is
+written once, as JSON, when the first number arrives (or after ``REPORT_TIMEOUT_MS``), to
+``startup_profile.json`` in the app-data folder, or to the path given as ``--profile-startup=<path>``.
+
+Stdlib-only and importable before PyQt / pywin32, because ``monitor.py`` has to enable it before its
+own heavy imports. When disabled (the normal case) every hook is a cheap no-op.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger("NetSpeedTray.StartupProfiler")
+
+PROFILE_FLAG = "--profile-startup"
+REPORT_FILENAME = "startup_profile.json"
+FIRST_PAINT = "first_paint"
+FIRST_NUMBER = "first_number"      # first real speed on screen (time-to-first-number)
+REPORT_TIMEOUT_MS = 30000          # write the report anyway if no first number arrives by then
+
+
+class _ImportTimingFinder(MetaPathFinder):
+    """Meta-path hook that times each module's ``exec_module``.
+
+    It never loads anything itself: it asks the remaining finders for the spec and wraps the returned
+    loader's ``exec_module`` on that loader instance only. Class-level loaders (builtins, frozen) are
+    shared across modules, so those are left alone and simply not timed."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+        self._resolving: set = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._resolving:
+            return None
+        self._resolving.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._resolving.discard(fullname)
+
+        loader = spec.loader
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        original = loader.exec_module
+        profiler = self._profiler
+
+        def exec_module(module, _original=original, _name=fullname):
+            profiler._import_started()
+            start = time.perf_counter()
+            try:
+                _original(module)
+            finally:
+                profiler._import_finished(_name, time.perf_counter() - start)
+
+        try:
+            loader.exec_module = exec_module
+        except (AttributeError, TypeError):
+            pass   # read-only loader (e.g. a C extension type); leave untimed
+        return spec
+
+
+class StartupProfiler:
+    """Collects import timings, named phases and one-shot marks, relative to ``enable()``."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.report_path: Optional[Path] = None
+        self._t0: float = time.perf_counter()
+        self._finder: Optional[_ImportTimingFinder] = None
+        self._imports: List[Dict[str, Any]] = []
+        # Child import time accumulated per open import, one stack per thread: the DB worker and stats
+        # thread import while the GUI thread does, and a shared stack would charge their imports to
+        # whatever the GUI thread happens to have open.
+        self._local = threading.local()
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._started: bool = False
+        self._written: bool = False
+
+    # --- lifecycle -------------------------------------------------------------------------------
+    def enable(self, report_path: Optional[Path] = None) -> None:
+        """Start collecting. Modules already imported before this call are not timed."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._started = True
+        self.report_path = Path(report_path) if report_path else None
+        self._t0 = time.perf_counter()
+        self._finder = _ImportTimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        logger.info("Startup profiling enabled")
+
+    def disable(self) -> None:
+        """Stop collecting (collected data is kept and can still be written)."""
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+        self.enabled = False
+
+    # --- collection ------------------------------------------------------------------------------
+    def _child_stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _import_started(self) -> None:
+        self._child_stack().append(0.0)
+
+    def _import_finished(self, name: str, elapsed: float) -> None:
+        stack = self._child_stack()
+        children = stack.pop() if stack else 0.0
+        if stack:
+            stack[-1] += elapsed
+        self._imports.append({
+            "module": name,
+            "cumulative_ms": round(elapsed * 1000.0, 3),
+            "self_ms": round(max(0.0, elapsed - children) * 1000.0, 3),
+        })
+
+    def _now_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000.0, 3)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named block. Phases may nest; each records its start offset and duration."""
+        if not self.enabled:
+            yield
+            return
+        start_ms = self._now_ms()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append({
+                "name": name,
+                "start_ms": start_ms,
+                "duration_ms": round((time.perf_counter() - start) * 1000.0, 3),
+            })
+
+    def mark(self, name: str) -> None:
+        """Record the first time ``name`` happens (e.g. the first paint). Later calls are ignored."""
+        if self.enabled and name not in self._marks:
+            self._marks[name] = self._now_ms()
+
+    def has_mark(self, name: str) -> bool:
+        return name in self._marks
+
+    # --- output ----------------------------------------------------------------------------------
+    def report(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """The collected profile as a JSON-ready dict. ``top`` limits the import list."""
+        imports = sorted(self._imports, key=lambda r: r["self_ms"], reverse=True)
+        if top is not None:
+            imports = imports[:top]
+        deferred_leaks: List[str] = []
+        try:
+            from netspeedtray.utils.lazy_import import leaked_deferred_modules
+            deferred_leaks = leaked_deferred_modules()
+        except Exception:   # the report must never fail because of the registry
+            pass
+        return {
+            "elapsed_ms": self._now_ms(),
+            "import_count": len(self._imports),
+            "import_total_ms": round(sum(r["self_ms"] for r in self._imports), 3),
+            "imports": imports,
+            "phases": list(self._phases),
+            "marks": dict(self._marks),
+            "deferred_modules_loaded": deferred_leaks,
+        }
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Write the JSON report (once). Returns the path written, or None if disabled / on error."""
+        if not self._started or self._written:
+            return None
+        target = Path(path) if path else self.report_path
+        try:
+            if target is None:
+                from netspeedtray.utils.helpers import get_app_data_path
+                target = Path(get_app_data_path()) / REPORT_FILENAME
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+            self._written = True
+            logger.info("Startup profile written to %s", target)
+            return target
+        except Exception as e:
+            logger.error("Could not write startup profile: %s", e, exc_info=True)
+            return None
+
+    def finish(self, mark_name: Optional[str] = None) -> Optional[Path]:
+        """Record ``mark_name`` (if given), stop collecting and write the report."""
+        if not self.enabled:
+            return None
+        if mark_name:
+            self.mark(mark_name)
+        self.disable()
+        return self.write_report()
+
+
+def parse_profile_flag(argv: Sequence[str]) -> "tuple[bool, Optional[Path]]":
+    """``--profile-startup`` -> (True, None); ``--profile-startup=<path>`` -> (True, path)."""
+    for arg in argv:
+        if arg == PROFILE_FLAG:
+            return True, None
+        if arg.startswith(PROFILE_FLAG + "="):
+            value = arg.split("=", 1)[1].strip()
+            return True, Path(value) if value else None
+    return False, None
+
+
+def enable_from_argv(argv: Optional[Sequence[str]] = None) -> bool:
+    """Enable the shared profiler if ``--profile-startup`` is on the command line."""
+    wanted, path = parse_profile_flag(sys.argv if argv is None else argv)
+    if wanted:
+        profiler.enable(path)
+    return wanted
+
+
+profiler = StartupProfiler()
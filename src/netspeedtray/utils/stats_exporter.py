@@ -11,17 +11,21 @@ The honesty spine (non-negotiable): percentiles/min/stddev are EXACT only inside
 that they are written as empty with a `summary_method_note` saying so - never a fabricated p95. Every
 row carries sample_count + coverage_pct. Units are human/standard at the boundary: Mbps, ms, W, °C, %.
 No phone-home - bytes leave only on the user's explicit action; this module just writes local files.
+
+The raw file is written as a stream: one history cursor per metric (network read once for both
+directions), k-way merged by timestamp and fed straight to the CSV writer or zip entry, so memory stays
+flat for a month or all-time window.
 """
 from __future__ import annotations
 
 import csv
+import heapq
+import io
 import json
 import os
-import shutil
-import tempfile
 import zipfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO, Tuple
 
 # (key, kind, unit, label). kind: "net_down"/"net_up" read via summarize_network; "hw" via summarize_hardware.
 _METRICS: List[Tuple[str, str, str, str]] = [
@@ -56,16 +60,11 @@ def _r(v: Optional[float]) -> Optional[float]:
     return None if v is None else round(float(v), 2)
 
 
-def export_window(widget_state, start: datetime, end: datetime, window_label: str,
-                  out_dir: str, basename: str, machine_id: str = "", app_version: str = "",
-                  interface: Optional[str] = None, poll_interval: float = 1.0) -> Dict[str, str]:
-    """Write {basename}.summary.csv / .raw.csv / .summary.json into out_dir. Returns the paths written."""
-    os.makedirs(out_dir, exist_ok=True)
+def _summary_rows(widget_state, start: datetime, end: datetime, window_label: str, machine_id: str,
+                  app_version: str, interface: Optional[str], poll_interval: float) -> List[Dict[str, Any]]:
+    """One summary row per metric that has samples in the window (see the honesty spine above)."""
     iface_label = interface or "all"
-
     summary_rows: List[Dict[str, Any]] = []
-    raw_rows: List[Tuple[int, str, str, Any]] = []   # (ts_unix, iso, metric, value)
-
     for key, kind, unit, _label in _METRICS:
         if kind == "net_down":
             s = widget_state.summarize_network("download", start, end, interface, poll_interval)
@@ -92,44 +91,89 @@ def export_window(widget_state, start: datetime, end: datetime, window_label: st
             "p95": conv(s.p95), "p99": conv(s.p99), "stddev": conv(s.stddev), "loss_pct": loss,
             "machine_id": machine_id, "app_version": app_version, "summary_method_note": s.note,
         })
+    return summary_rows
+
+
+def _network_rows(widget_state, start: datetime, end: datetime, interface: Optional[str],
+                  metrics: Set[str]) -> Iterator[Tuple[int, str, Optional[float]]]:
+    """Download AND upload from one pass over the speed history - (ts, metric, Mbps), in (ts, metric) order."""
+    want_down, want_up = "download" in metrics, "upload" in metrics
+    for ts, up, down in widget_state.iter_speed_history(start, end, interface, resolution='auto'):
+        if want_down:
+            yield ts, "download", _bps_to_mbps(down)
+        if want_up:
+            yield ts, "upload", _bps_to_mbps(up)
+
+
+def _hardware_rows(widget_state, key: str, start: datetime,
+                   end: datetime) -> Iterator[Tuple[int, str, Optional[float]]]:
+    for ts, value in widget_state.iter_hardware_history(key, start, end):
+        yield ts, key, _r(value)
+
+
+def _raw_rows(widget_state, start: datetime, end: datetime, interface: Optional[str],
+              metrics: Set[str]) -> Iterator[Tuple[int, str, str, Optional[float]]]:
+    """
+    The long-format raw series for ``metrics``: (ts_unix, iso, metric, value) sorted by (ts, metric).
+
+    Each source is a streaming cursor already in time order, so a k-way heapq.merge yields the sorted
+    series directly - nothing is accumulated or sorted in memory, however long the window. (This used
+    to collect every row of every metric into one list and sort it, and read the network history once
+    per direction.)
+    """
+    streams: List[Iterator[Tuple[int, str, Optional[float]]]] = []
+    if metrics & {"download", "upload"}:
+        streams.append(_network_rows(widget_state, start, end, interface, metrics))
+    for key, kind, _unit, _label in _METRICS:
+        if kind == "hw" and key in metrics:
+            streams.append(_hardware_rows(widget_state, key, start, end))
+    try:
+        last_ts, iso = None, ""
+        for ts, metric, value in heapq.merge(*streams, key=lambda r: (r[0], r[1])):
+            if ts != last_ts:   # rows arrive grouped by timestamp: format each ISO string once
+                last_ts, iso = ts, datetime.fromtimestamp(ts).isoformat()
+            yield ts, iso, metric, value
+    finally:
+        for stream in streams:   # release their pooled read connection even if the writer failed
+            stream.close()
 
-        # Raw series (long format) for the same window.
-        if kind in ("net_down", "net_up"):
-            net = widget_state.get_speed_history(start, end, interface, resolution='auto')
-            idx = 2 if kind == "net_down" else 1   # (ts, up, dn)
-            for row in net:
-                ts = row[0]
-                tsec = int(ts.timestamp()) if isinstance(ts, datetime) else int(ts)
-                raw_rows.append((tsec, datetime.fromtimestamp(tsec).isoformat(), key, _bps_to_mbps(row[idx])))
-        else:
-            for ts, val in widget_state.get_hardware_history(key, start, end):
-                tsec = int(ts.timestamp()) if isinstance(ts, datetime) else int(ts)
-                raw_rows.append((tsec, datetime.fromtimestamp(tsec).isoformat(), key, _r(val)))
 
-    paths: Dict[str, str] = {}
-    sp = os.path.join(out_dir, f"{basename}.summary.csv")
-    with open(sp, "w", newline="", encoding="utf-8") as f:
+def _write_export(open_text: Callable[[str], TextIO], widget_state, start: datetime, end: datetime,
+                  window_label: str, basename: str, machine_id: str, app_version: str,
+                  interface: Optional[str], poll_interval: float) -> Dict[str, str]:
+    """Write the three files through ``open_text(filename)``; returns {kind: filename}."""
+    summary_rows = _summary_rows(widget_state, start, end, window_label, machine_id, app_version,
+                                 interface, poll_interval)
+    names = {"summary_csv": f"{basename}.summary.csv", "summary_json": f"{basename}.summary.json",
+             "raw_csv": f"{basename}.raw.csv"}
+
+    with open_text(names["summary_csv"]) as f:
         w = csv.DictWriter(f, fieldnames=_SUMMARY_FIELDS)
         w.writeheader()
         for r in summary_rows:
             w.writerow(r)
-    paths["summary_csv"] = sp
 
-    jp = os.path.join(out_dir, f"{basename}.summary.json")
-    with open(jp, "w", encoding="utf-8") as f:
+    with open_text(names["summary_json"]) as f:
         json.dump({"generated_iso": end.isoformat(), "machine_id": machine_id,
                    "app_version": app_version, "rows": summary_rows}, f, ensure_ascii=False, indent=2)
-    paths["summary_json"] = jp
 
-    rp = os.path.join(out_dir, f"{basename}.raw.csv")
-    raw_rows.sort(key=lambda r: (r[0], r[2]))
-    with open(rp, "w", newline="", encoding="utf-8") as f:
+    # Raw series (long format) for the same window and the same metrics, streamed row by row.
+    with open_text(names["raw_csv"]) as f:
         w = csv.writer(f)
         w.writerow(["timestamp_unix", "timestamp_iso", "metric", "value"])
-        w.writerows(raw_rows)
-    paths["raw_csv"] = rp
+        w.writerows(_raw_rows(widget_state, start, end, interface, {r["metric"] for r in summary_rows}))
+    return names
+
 
-    return paths
+def export_window(widget_state, start: datetime, end: datetime, window_label: str,
+                  out_dir: str, basename: str, machine_id: str = "", app_version: str = "",
+                  interface: Optional[str] = None, poll_interval: float = 1.0) -> Dict[str, str]:
+    """Write {basename}.summary.csv / .raw.csv / .summary.json into out_dir. Returns the paths written."""
+    os.makedirs(out_dir, exist_ok=True)
+    names = _write_export(
+        lambda name: open(os.path.join(out_dir, name), "w", newline="", encoding="utf-8"),
+        widget_state, start, end, window_label, basename, machine_id, app_version, interface, poll_interval)
+    return {kind: os.path.join(out_dir, name) for kind, name in names.items()}
 
 
 def export_window_zip(widget_state, start: datetime, end: datetime, window_label: str,
@@ -137,18 +181,12 @@ def export_window_zip(widget_state, start: datetime, end: datetime, window_label
                       interface: Optional[str] = None, poll_interval: float = 1.0) -> str:
     """Write the same summary/raw/json export as :func:`export_window`, but bundle the three files into a
     single ``.zip`` at ``zip_path`` (one tidy archive instead of three loose files in a folder). Returns
-    the zip path. The files are built in a temp dir and deflated in; the temp dir is always cleaned up."""
-    tmp = tempfile.mkdtemp(prefix="nst_export_")
-    try:
-        paths = export_window(widget_state, start, end, window_label, tmp, basename,
-                              machine_id=machine_id, app_version=app_version,
-                              interface=interface, poll_interval=poll_interval)
-        parent = os.path.dirname(zip_path)
-        if parent:
-            os.makedirs(parent, exist_ok=True)
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for p in paths.values():
-                zf.write(p, arcname=os.path.basename(p))
-        return zip_path
-    finally:
-        shutil.rmtree(tmp, ignore_errors=True)
+    the zip path. Each file is streamed straight into its deflated zip entry - no temp copies."""
+    parent = os.path.dirname(zip_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        _write_export(
+            lambda name: io.TextIOWrapper(zf.open(name, "w", force_zip64=True), encoding="utf-8", newline=""),
+            widget_state, start, end, window_label, basename, machine_id, app_version, interface, poll_interval)
+    return zip_path
@@ -7,13 +7,13 @@ to build dynamic stylesheets for different application components.
 
 from PyQt6.QtGui import QColor, QFont, QFontDatabase, QIcon, QPixmap, QPainter
 from PyQt6.QtCore import Qt, QSize
-import os
-import hashlib
+from functools import lru_cache
 import winreg
 
 # Import the design tokens (raw values) and other UI constants
 from netspeedtray.constants import styles as style_constants
 from netspeedtray.constants import ui, color as color_constants
+from netspeedtray.utils.theme_cache import ThemeKey, cached_builder, theme_cache
 
 _variable_present = None  # lazy cache: is "Segoe UI Variable" installed?
 
@@ -25,7 +25,16 @@ def fluent_icon(codepoint: int, size: int = 16, color: str = "#FFFFFF") -> QIcon
     Win10 degrade. The glyph is drawn to a transparent pixmap in ``color`` so it can be tinted per state
     (e.g. text_secondary at rest → accent when a tab/nav row is selected). Uses setPixelSize for a
     DPI-crisp icon optically matched to the label's px font. NEVER pass an emoji - only Fluent codepoints.
+
+    Memoized per (glyph, size, colour, pixel ratio): the tab bar, settings nav and tray menu re-tint
+    the same handful of glyphs on every selection change, and QIcon is implicitly shared, so handing
+    out the same instance is free.
     """
+    return _render_fluent_icon(codepoint, size, color, _device_pixel_ratio())
+
+
+@lru_cache(maxsize=256)
+def _render_fluent_icon(codepoint: int, size: int, color: str, dpr: float) -> QIcon:
     pm = QPixmap(size, size)
     pm.fill(Qt.GlobalColor.transparent)
     p = QPainter(pm)
@@ -41,28 +50,27 @@ def fluent_icon(codepoint: int, size: int = 16, color: str = "#FFFFFF") -> QIcon
     return QIcon(pm)
 
 
+def _glyph_png_renderer(codepoint: int, px: int, color_hex: str):
+    """A ``render(path)`` callback for ThemeCache.icon_path that rasterizes one glyph to PNG."""
+    def render(path: str) -> None:
+        if not fluent_icon(codepoint, px, color_hex).pixmap(QSize(px, px)).save(path, "PNG"):
+            raise OSError(f"QPixmap.save failed for {path}")
+    return render
+
+
 def combo_chevron_url(color_hex: str) -> str:
     """Render the Fluent ChevronDown to a small cached PNG and return a QSS-friendly (forward-slash)
     path for ``QComboBox::down-arrow {{ image: url(...) }}``.
 
     Qt drops a combo's native arrow as soon as ``::drop-down`` is QSS-styled, which left every styled
     dropdown looking like a bare box. Supplying our own themed glyph restores the affordance with the
-    native Win11 chevron. Rendered at 2× then scaled by QSS for crispness; cached per color so it's
-    written once. Degrades to no-arrow (empty string) if the app-data dir can't be written.
+    native Win11 chevron. Rendered at the on-screen size (QSS clips rather than scales a ::down-arrow
+    image, so a larger source would show only a cropped fragment - the "little square" bug). The PNG
+    lives in the content-addressed theme cache, so it is rendered once per colour/DPI across sessions.
+    Degrades to no-arrow (empty string) if the app-data dir can't be written.
     """
-    try:
-        from netspeedtray.utils.helpers import get_app_data_path
-        key = hashlib.md5(color_hex.encode("utf-8")).hexdigest()[:8]
-        cache_dir = os.path.join(get_app_data_path(), "cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        # Render at the on-screen size (QSS clips rather than scales a ::down-arrow image, so a larger
-        # source would show only a cropped fragment - the "little square" bug).
-        path = os.path.join(cache_dir, f"chevron_{key}_v2.png")
-        if not os.path.exists(path):
-            fluent_icon(0xE70D, 14, color_hex).pixmap(QSize(14, 14)).save(path, "PNG")
-        return path.replace("\\", "/")
-    except Exception:
-        return ""
+    return theme_cache.icon_path("combo_chevron", _device_pixel_ratio(), (0xE70D, 14, color_hex),
+                                 _glyph_png_renderer(0xE70D, 14, color_hex))
 
 
 def spin_arrow_url(up: bool, color_hex: str) -> str:
@@ -74,18 +82,26 @@ def spin_arrow_url(up: bool, color_hex: str) -> str:
     root of #169 ("down arrow works, up arrow doesn't"), since the native side-by-side layout puts the
     up-button under the edit field's right edge. Degrades to no image (empty string) on failure.
     """
+    codepoint = 0xE70E if up else 0xE70D  # Fluent ChevronUp / ChevronDown
+    return theme_cache.icon_path("spin_arrow", _device_pixel_ratio(), (codepoint, 10, color_hex),
+                                 _glyph_png_renderer(codepoint, 10, color_hex))
+
+
+def _device_pixel_ratio() -> float:
+    """The primary screen's device pixel ratio (1.0 without a GUI application)."""
     try:
-        from netspeedtray.utils.helpers import get_app_data_path
-        codepoint = 0xE70E if up else 0xE70D  # Fluent ChevronUp / ChevronDown
-        key = hashlib.md5(f"{codepoint}_{color_hex}".encode("utf-8")).hexdigest()[:8]
-        cache_dir = os.path.join(get_app_data_path(), "cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        path = os.path.join(cache_dir, f"spin_{key}_v1.png")
-        if not os.path.exists(path):
-            fluent_icon(codepoint, 10, color_hex).pixmap(QSize(10, 10)).save(path, "PNG")
-        return path.replace("\\", "/")
+        from PyQt6.QtGui import QGuiApplication
+        app = QGuiApplication.instance()
+        screen = app.primaryScreen() if app is not None else None
+        return float(screen.devicePixelRatio()) if screen is not None else 1.0
     except Exception:
-        return ""
+        return 1.0
+
+
+def theme_key() -> ThemeKey:
+    """The (theme, accent, DPI, RTL) key the stylesheet cache is addressed by."""
+    return ThemeKey(dark=is_dark_mode(), accent=get_accent_color().name(),
+                    dpr=_device_pixel_ratio(), rtl=_is_rtl())
 
 
 def _is_rtl() -> bool:
@@ -203,6 +219,7 @@ def get_accent_color() -> QColor:
         return QColor(style_constants.UI_ACCENT_FALLBACK)
 
 
+@cached_builder("dialog_style", theme_key)
 def dialog_style() -> str:
     """Style for the main SettingsDialog."""
     dark_mode_active = is_dark_mode()
@@ -375,6 +392,7 @@ def dialog_style() -> str:
     """
 
 
+@cached_builder("collapsible_section_style", theme_key)
 def collapsible_section_style() -> str:
     """Style for CollapsibleSection header widget."""
     dark_mode_active = is_dark_mode()
@@ -406,6 +424,7 @@ def collapsible_section_style() -> str:
     """
 
 
+@cached_builder("sidebar_style", theme_key)
 def sidebar_style() -> str:
     """Style for the sidebar (QListWidget) in the main SettingsDialog."""
     dark_mode_active = is_dark_mode()
@@ -459,6 +478,7 @@ def sidebar_style() -> str:
     """
 
 
+@cached_builder("graph_settings_panel_style", theme_key)
 def graph_settings_panel_style() -> str:
     """
     Returns a single, scoped stylesheet for the graph's settings panel.
@@ -519,6 +539,7 @@ def graph_settings_panel_style() -> str:
     """
 
 
+@cached_builder("graph_tooltip_style", theme_key)
 def graph_tooltip_style() -> str:
     """Returns the stylesheet for the graph's live data tooltip."""
     return """
@@ -533,6 +554,7 @@ def graph_tooltip_style() -> str:
     """
 
 
+@cached_builder("zoom_hint_style", theme_key)
 def zoom_hint_style() -> str:
     """Returns the stylesheet for the 'Double-click to Reset' hint."""
     return """
@@ -548,6 +570,7 @@ def zoom_hint_style() -> str:
     """
 
 
+@cached_builder("graph_overlay_style", theme_key)
 def graph_overlay_style() -> str:
     """
     Returns a stylesheet for the overlay elements on the graph (hamburger button).
@@ -571,6 +594,7 @@ def graph_overlay_style() -> str:
     """
 
 
+@cached_builder("graph_stats_bar_style", theme_key)
 def graph_stats_bar_style() -> str:
     """
     Returns a stylesheet for the graph stats bar container.
@@ -584,6 +608,7 @@ def graph_stats_bar_style() -> str:
     """
 
 
+@cached_builder("graph_stats_card_style", theme_key)
 def graph_stats_card_style() -> str:
     """Style for an individual stat card container."""
     return """
@@ -594,6 +619,7 @@ def graph_stats_card_style() -> str:
     """
 
 
+@cached_builder("graph_stats_title_style", theme_key)
 def graph_stats_title_style() -> str:
     """Style for the uppercase title of a stat card."""
     return """
@@ -608,6 +634,7 @@ def graph_stats_title_style() -> str:
     """
 
 
+@cached_builder("graph_stats_value_style", theme_key)
 def graph_stats_value_style() -> str:
     """Style for the large monospace value in a stat card."""
     return """
@@ -621,6 +648,7 @@ def graph_stats_value_style() -> str:
     """
 
 
+@cached_builder("timeline_pills_style", theme_key)
 def timeline_pills_style() -> str:
     """
     Returns stylesheet for the segmented timeline control (Time Pills).
@@ -670,6 +698,7 @@ def timeline_pills_style() -> str:
     """
 
 
+@cached_builder("segmented_pills_style", theme_key)
 def segmented_pills_style(dark: bool) -> str:
     """Theme-aware variant of timeline_pills_style() for the Monitor's period control.
 
@@ -728,6 +757,7 @@ def segmented_pills_style(dark: bool) -> str:
 
 
 
+@cached_builder("toggle_style", theme_key)
 def toggle_style(total_track_width: int, total_track_height: int) -> str:
     """
     Style for the QCheckBox acting as the track in Win11Toggle.
@@ -779,6 +809,7 @@ def toggle_style(total_track_width: int, total_track_height: int) -> str:
     """
 
 
+@cached_builder("slider_style", theme_key)
 def slider_style() -> str:
     """Style for the internal QSlider in Win11Slider."""
     dark_mode_active = is_dark_mode()
@@ -866,6 +897,7 @@ def slider_style() -> str:
     """
 
 
+@cached_builder("button_style", theme_key)
 def button_style(accent: bool = False) -> str:
     """Generic button style, can be for standard or accent buttons."""
     dark_mode_active = is_dark_mode()
@@ -911,6 +943,7 @@ def button_style(accent: bool = False) -> str:
     """
 
 
+@cached_builder("color_button_style", theme_key)
 def color_button_style(color_hex: str) -> str:
     """Style for color picker preview buttons."""
     if not (isinstance(color_hex, str) and color_hex.startswith("#") and len(color_hex) == 7):
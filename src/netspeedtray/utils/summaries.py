@@ -8,14 +8,22 @@ samples, kept ~24h). The per-minute / per-hour rollups store only avg + max (+ s
 the raw window we return weighted-avg + max and mark percentiles UNAVAILABLE - never fabricate a p95
 from minute-buckets, and always carry sample_count + coverage so a figure is admissible as evidence.
 
-Pure functions, no DB/Qt - the stats engine reads the right tier and hands the data here.
+Pure functions, no DB/Qt - the stats engine reads the right tier and hands the data here. numpy is a
+registered deferred import (utils.lazy_import): it loads on the first summary, not when this module is
+imported, so callers no longer need their own function-local import to keep it off the startup path.
+The array work itself (run-length encoding, clock-hour bincounts, one-call quantiles) lives in
+``utils.analytics``; the functions here keep their pair-based signatures and convert once at the edge.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from datetime import datetime
 from typing import Dict, List, Optional, Sequence
 
-import numpy as np
+from netspeedtray.utils import analytics as A
+from netspeedtray.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
 
 
 @dataclass(frozen=True)
@@ -53,17 +61,25 @@ def coverage_pct(sample_count: int, window_seconds: float, sample_interval_secon
     return float(max(0.0, min(100.0, (sample_count / expected) * 100.0))) if expected > 0 else 0.0
 
 
+def covered_pct(covered_seconds: float, window_seconds: float) -> float:
+    """Coverage from the seconds samples actually spanned (their recorded capture intervals) - exact
+    where ``coverage_pct`` has to assume every sample was one nominal poll interval long."""
+    if window_seconds <= 0:
+        return 0.0
+    return float(max(0.0, min(100.0, covered_seconds / window_seconds * 100.0)))
+
+
 def summarize_raw(values: Sequence[float], coverage: float = 100.0) -> WindowSummary:
     """Exact summary from raw per-sample values (the raw tier, ≤24h)."""
-    arr = np.asarray([float(v) for v in values], dtype=float)
+    arr = A.as_float_array(values)
     arr = arr[np.isfinite(arr)]
     if arr.size == 0:
         return _empty("raw")
+    p50, p95, p99 = A.quantiles(arr, (0.50, 0.95, 0.99)).tolist()
     return WindowSummary(
         count=int(arr.size), coverage_pct=round(float(coverage), 1), tier="raw", exact=True,
         avg=float(arr.mean()), min=float(arr.min()), max=float(arr.max()),
-        p50=float(np.percentile(arr, 50)), p95=float(np.percentile(arr, 95)),
-        p99=float(np.percentile(arr, 99)), stddev=float(arr.std()),
+        p50=p50, p95=p95, p99=p99, stddev=float(arr.std()),
         note="exact from raw samples")
 
 
@@ -72,11 +88,11 @@ def summarize_rollup(avgs: Sequence[float], maxes: Sequence[float],
                      coverage: float = 100.0) -> WindowSummary:
     """Summary from a per-minute/hour rollup tier, which stores only avg + max (+ sample count). avg is
     sample-weighted (the honest mean); max is the true peak; min/percentiles/stddev are UNAVAILABLE."""
-    a = np.asarray([float(x) for x in avgs], dtype=float)
-    m = np.asarray([float(x) for x in maxes], dtype=float)
+    a = A.as_float_array(avgs)
+    m = A.as_float_array(maxes)
     if a.size == 0:
         return _empty(tier)
-    c = np.asarray([float(x) for x in counts], dtype=float) if counts is not None and len(counts) else np.ones_like(a)
+    c = A.as_float_array(counts) if counts is not None and len(counts) else np.ones_like(a)
     total = float(c.sum())
     weighted_avg = float((a * c).sum() / total) if total > 0 else float(a.mean())
     return WindowSummary(
@@ -94,7 +110,7 @@ def loss_pct(timeouts: int, total_probes: int) -> Optional[float]:
 
 def pct_below(values: Sequence[float], threshold: float) -> Optional[float]:
     """Fraction of raw samples below a threshold (e.g. % of time under the advertised plan speed)."""
-    arr = np.asarray([float(v) for v in values], dtype=float)
+    arr = A.as_float_array(values)
     arr = arr[np.isfinite(arr)]
     if arr.size == 0:
         return None
@@ -103,54 +119,53 @@ def pct_below(values: Sequence[float], threshold: float) -> Optional[float]:
 
 def time_above(values: Sequence[float], threshold: float, sample_interval_seconds: float) -> float:
     """Seconds spent at/above a threshold (e.g. time above the throttle temperature)."""
-    arr = np.asarray([float(v) for v in values], dtype=float)
+    arr = A.as_float_array(values)
     arr = arr[np.isfinite(arr)]
     return float((arr >= threshold).sum() * max(0.0, sample_interval_seconds))
 
 
 def hourly_profile(pairs: Sequence) -> Dict[int, float]:
     """Mean value per clock-hour (0..23) from (timestamp, value) pairs. The honest, data-driven basis
-    for "your busiest hour" - no assumed ISP peak band, just when this machine was actually busy."""
-    sums: Dict[int, float] = {}
-    counts: Dict[int, int] = {}
-    for ts, v in pairs:
+    for "your busiest hour" - no assumed ISP peak band, just when this machine was actually busy.
+    Datetimes are bucketed by their (local) clock hour; plain unix seconds by UTC hour-of-day."""
+    if not len(pairs):
+        return {}
+    ts = [p[0] for p in pairs]
+    if isinstance(ts[0], datetime) and isinstance(ts[-1], datetime):
+        # Reading .hour off the datetimes is cheaper than converting them to unix seconds first.
         try:
-            fv = float(v)
-            if not np.isfinite(fv):
-                continue
-            hour = ts.hour if hasattr(ts, "hour") else int((float(ts) // 3600) % 24)
-        except (TypeError, ValueError):
-            continue
-        sums[hour] = sums.get(hour, 0.0) + fv
-        counts[hour] = counts.get(hour, 0) + 1
-    return {h: sums[h] / counts[h] for h in sums if counts[h]}
+            hours = np.fromiter((t.hour for t in ts), dtype=np.int64, count=len(ts))
+        except AttributeError:
+            hours = A.hour_of_day(A.timestamps_array(ts))
+    else:
+        hours = A.hour_of_day(A.timestamps_array(ts), utc=True)
+    means, counts = A.hourly_means(hours, A.as_float_array([p[1] for p in pairs]))
+    return {int(h): float(means[h]) for h in np.flatnonzero(counts)}
 
 
 def event_runs(pairs: Sequence, is_bad) -> List[tuple]:
     """Contiguous runs where ``is_bad(value)`` holds, as (start_ts, end_ts) pairs - the basis for
     "internet went bad then good" events you'd otherwise only catch live. ``pairs`` is (timestamp,
     value) in time order; ``is_bad`` is a predicate on the value."""
-    runs: List[tuple] = []
-    start = None
-    prev_ts = None
-    for ts, v in pairs:
-        bad = bool(is_bad(v))
-        if bad and start is None:
-            start = ts
-        elif not bad and start is not None:
-            runs.append((start, prev_ts if prev_ts is not None else ts))
-            start = None
-        prev_ts = ts
-    if start is not None:
-        runs.append((start, prev_ts if prev_ts is not None else start))
-    return runs
+    pairs = pairs if isinstance(pairs, (list, tuple)) else list(pairs)
+    mask = np.fromiter((bool(is_bad(v)) for _, v in pairs), dtype=bool, count=len(pairs))
+    return _runs_from_mask(pairs, mask)
+
+
+def _runs_from_mask(pairs: Sequence, mask) -> List[tuple]:
+    """(start_ts, end_ts) of each run of True in ``mask``, with the caller's own timestamp objects."""
+    starts, ends = A.run_bounds(mask)
+    return [(pairs[s][0], pairs[e][0]) for s, e in zip(starts.tolist(), ends.tolist())]
 
 
 def outage_summary(timeout_pairs: Sequence) -> Dict[str, object]:
     """Connection-drop events from the gateway-timeout series (value >= 0.5 == a lost ping). Returns
     {count, last_start, total_down_seconds, runs} - an honest outage log, not a fabricated SLA."""
-    runs = event_runs(timeout_pairs, lambda v: v is not None and float(v) >= 0.5)
-    total = 0.0
+    pairs = timeout_pairs if isinstance(timeout_pairs, (list, tuple)) else list(timeout_pairs)
+    values = A.as_float_array([v for _, v in pairs])
+    with np.errstate(invalid="ignore"):
+        runs = _runs_from_mask(pairs, values >= 0.5)        # NaN (a missing reading) is never a drop
+    total = 0.0                                             # per run, not per sample - runs are few
     for s, e in runs:
         try:
             if hasattr(s, "timestamp") and hasattr(e, "timestamp"):
@@ -163,6 +178,20 @@ def outage_summary(timeout_pairs: Sequence) -> Dict[str, object]:
             "total_down_seconds": total, "runs": runs}
 
 
+def outage_summary_arrays(timestamps: Sequence, values: Sequence) -> Dict[str, object]:
+    """outage_summary over (unix seconds, value) columns, e.g. WidgetState.get_hardware_history_arrays -
+    the runs and their durations straight from the arrays; only each run's bounds become datetimes."""
+    ts = A.timestamps_array(timestamps)
+    vals = A.as_float_array(values)
+    with np.errstate(invalid="ignore"):
+        starts, ends = A.run_bounds(vals >= 0.5)             # NaN (a missing reading) is never a drop
+    total = float(np.maximum(ts[ends] - ts[starts], 0.0).sum()) if starts.size else 0.0
+    runs = [(datetime.fromtimestamp(s), datetime.fromtimestamp(e))
+            for s, e in zip(ts[starts].tolist(), ts[ends].tolist())]
+    return {"count": len(runs), "last_start": runs[-1][0] if runs else None,
+            "total_down_seconds": total, "runs": runs}
+
+
 def peak_offpeak(pairs: Sequence) -> Optional[Dict[str, float]]:
     """Busiest vs quietest clock-hour by mean value. Returns {peak_hour, peak_avg, offpeak_hour,
     offpeak_avg} or None if fewer than two distinct hours have data (a split would be meaningless)."""
@@ -1,9 +1,10 @@
 """
 Support Bundle generator.
 
-Bundles the user's log files + config + system info into a single zip that
-they can attach to a GitHub issue. Designed to make bug reports self-
-contained so triage doesn't stall waiting for log/config follow-ups.
+Bundles the user's log files + config + system info + hot-path timings into
+a single zip that they can attach to a GitHub issue. Designed to make bug
+reports self-contained so triage doesn't stall waiting for log/config
+follow-ups - and so a "it's slow on my machine" report comes with numbers.
 
 Privacy:
 - Log files are passed through ObfuscatingFormatter one final time before
@@ -223,7 +224,15 @@ def build_support_bundle(
             scrubbed = _scrub_log_text(raw)
             zf.writestr(f"logs/{log_path.name}", scrubbed)
 
-        # 4. Manifest
+        # 4. Hot-path timings (utils.instrumentation). Always written: "enabled": false with no samples
+        # tells triage the user never turned Diagnostics on. Span names are code paths, not user data.
+        try:
+            from netspeedtray.utils.instrumentation import registry
+            zf.writestr("diagnostics.json", json.dumps(registry.snapshot(), indent=2, sort_keys=True))
+        except Exception as e:   # never let the timings cost the user their bundle
+            logger.warning("Could not snapshot diagnostics: %s", e)
+
+        # 5. Manifest
         manifest = (
             "NetSpeedTray Support Bundle\n"
             f"Generated: {datetime.now().isoformat(timespec='seconds')}\n"
@@ -232,6 +241,7 @@ def build_support_bundle(
             "  system_info.txt   - App version, OS, monitor layout (no display names)\n"
             "  config.json       - Your settings (preferences only, no PII)\n"
             "  logs/             - Log files, scrubbed for paths/IPs/MACs/GUIDs/hostnames\n"
+            "  diagnostics.json  - Timings of the app's hot paths (Settings > Advanced > Diagnostics)\n"
             "\n"
             "NOT included:\n"
             "  - App Activity per-process / per-connection data\n"
@@ -0,0 +1,321 @@
+"""
+Persistent, content-addressed cache for generated stylesheets and rasterized Fluent icons.
+
+``utils.styles`` builds its QSS with large f-strings and, for the combo/spinbox chevrons, renders
+glyphs to PNG files. Every Settings / Monitor / flyout construction used to redo all of that. This
+module memoizes both per *theme key* - (dark mode, accent colour, device pixel ratio, RTL) - plus the
+builder's own arguments:
+
+* in memory, as an LRU bounded by the total size of the cached text;
+* on disk, under ``<app data>/cache/theme/``, one file per entry named by the SHA-256 of everything
+  that determines its content (builder name, arguments, theme key, app version, the style sources,
+  cache schema). A different theme, a new release or an edited style module simply addresses different
+  files; nothing is ever "invalidated".
+
+The app version alone isn't enough: running from source, or editing a style token or builder without a
+version bump, would keep serving the stylesheet the old code built. So the salt also carries a hash of
+the modules that produce the QSS (``STYLE_SOURCES``); a frozen build has no ``.py`` sources to read and
+falls back to the version, which every release bumps.
+
+The disk store is size-bounded: after a write, the least-recently-used files (by mtime, which a disk
+hit refreshes) are removed until the store is back under ``DISK_BUDGET_BYTES``. Files referenced this
+session are never evicted, and a cached stylesheet whose ``url(...)`` images have gone missing is
+treated as a miss and rebuilt, so eviction can't leave a dialog without its chevrons.
+
+This module must stay importable without ``winreg`` / a QApplication: ``utils.styles`` supplies the
+theme key and the render callbacks.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger("NetSpeedTray.ThemeCache")
+
+CACHE_SCHEMA = 1
+CACHE_DIRNAME = "theme"
+MEMORY_BUDGET_BYTES = 1024 * 1024
+DISK_BUDGET_BYTES = 4 * 1024 * 1024
+
+# Modules whose source determines every cached stylesheet: the tokens and the builders.
+STYLE_SOURCES: Tuple[str, ...] = ("netspeedtray.constants.styles", "netspeedtray.utils.styles")
+
+_URL_RE = re.compile(r"""url\(\s*["']?([^"')]+)["']?\s*\)""")
+
+
+@dataclass(frozen=True)
+class ThemeKey:
+    """Everything outside a builder's arguments that can change its output."""
+    dark: bool
+    accent: str
+    dpr: float = 1.0
+    rtl: bool = False
+
+    def token(self) -> str:
+        return f"{'dark' if self.dark else 'light'}|{self.accent.lower()}|{self.dpr:g}|{'rtl' if self.rtl else 'ltr'}"
+
+
+def style_sources_digest(modules: Optional[Tuple[str, ...]] = None) -> str:
+    """SHA-256 (short) of the style modules' ``.py`` sources (default ``STYLE_SOURCES``); "" when none
+    can be read (frozen build)."""
+    import importlib.util
+    h = hashlib.sha256()
+    found = False
+    for name in (STYLE_SOURCES if modules is None else modules):
+        try:
+            spec = importlib.util.find_spec(name)
+            origin = spec.origin if spec is not None else None
+            if not origin or not origin.endswith(".py"):
+                continue
+            with open(origin, "rb") as f:
+                h.update(name.encode("utf-8") + b"\0" + f.read())
+            found = True
+        except (ImportError, OSError, ValueError) as e:
+            logger.debug("Style source %s not hashed: %s", name, e)
+    return h.hexdigest()[:16] if found else ""
+
+
+class ThemeCache:
+    """Two-level (memory LRU + on-disk, content-addressed) cache for QSS text and icon PNGs."""
+
+    def __init__(self, root: Optional[Path] = None, salt: Optional[str] = None,
+                 memory_budget: int = MEMORY_BUDGET_BYTES, disk_budget: int = DISK_BUDGET_BYTES) -> None:
+        self._root = Path(root) if root is not None else None
+        self._root_resolved = root is not None
+        self._salt = salt
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_bytes = 0
+        self._icons: Dict[str, str] = {}      # digest -> forward-slash path, verified this session
+        self._pinned: Set[str] = set()        # file names used this session; never evicted
+        self._lock = threading.RLock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    # --- addressing ------------------------------------------------------------------------------
+    @property
+    def root(self) -> Optional[Path]:
+        """The on-disk store, created on first use; None when the app-data dir isn't writable."""
+        if not self._root_resolved:
+            self._root_resolved = True
+            try:
+                from netspeedtray.utils.helpers import get_app_data_path
+                self._root = Path(get_app_data_path()) / "cache" / CACHE_DIRNAME
+            except Exception as e:
+                logger.debug("No app-data path for the theme cache (%s); memory only.", e)
+                self._root = None
+        if self._root is not None:
+            try:
+                self._root.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.debug("Theme cache dir %s unavailable (%s); memory only.", self._root, e)
+                self._root = None
+        return self._root
+
+    def _version_salt(self) -> str:
+        if self._salt is None:
+            try:
+                import netspeedtray
+                version = str(netspeedtray.__version__)
+            except Exception:
+                version = ""
+            self._salt = f"{version}|{style_sources_digest()}"
+        return self._salt
+
+    def digest(self, namespace: str, token: str, args: Tuple = ()) -> str:
+        material = repr((CACHE_SCHEMA, self._version_salt(), namespace, token, args))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    # --- stylesheets -----------------------------------------------------------------------------
+    def get_text(self, namespace: str, key: ThemeKey, args: Tuple, build: Callable[[], str]) -> str:
+        """The cached output of ``build()`` for (namespace, key, args), building and storing on a miss."""
+        digest = self.digest(namespace, key.token(), args)
+        with self._lock:
+            text = self._memory.get(digest)
+            if text is not None:
+                self._memory.move_to_end(digest)
+                self.stats["memory_hits"] += 1
+                return text
+
+        text = self._read_text(digest)
+        if text is not None:
+            with self._lock:
+                self.stats["disk_hits"] += 1
+                self._remember(digest, text)
+            return text
+
+        text = build()
+        with self._lock:
+            self.stats["misses"] += 1
+            self._remember(digest, text)
+        self._write(f"{digest}.qss", text.encode("utf-8"))
+        return text
+
+    def _remember(self, digest: str, text: str) -> None:
+        size = len(text)
+        if size > self.memory_budget:
+            return
+        old = self._memory.pop(digest, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[digest] = text
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_budget and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _read_text(self, digest: str) -> Optional[str]:
+        root = self.root
+        if root is None:
+            return None
+        path = root / f"{digest}.qss"
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        for ref in _URL_RE.findall(text):
+            if not os.path.exists(ref):
+                logger.debug("Cached stylesheet %s references missing %s; rebuilding.", path.name, ref)
+                return None
+            self._touch(Path(ref))
+        self._touch(path)
+        return text
+
+    # --- icons -----------------------------------------------------------------------------------
+    def icon_path(self, namespace: str, dpr: float, args: Tuple, render: Callable[[str], None]) -> str:
+        """Forward-slash path of a PNG rendered once by ``render(path)`` and reused across sessions.
+
+        An icon's colour is one of its ``args``, so only the pixel ratio is taken from the theme key -
+        switching accent or theme doesn't duplicate every glyph on disk. Returns "" when there is no
+        writable store or rendering fails (callers then omit the image)."""
+        digest = self.digest(namespace, f"{dpr:g}", args)
+        with self._lock:
+            cached = self._icons.get(digest)
+        if cached is not None:
+            self.stats["memory_hits"] += 1
+            return cached
+
+        root = self.root
+        if root is None:
+            return ""
+        path = root / f"{digest}.png"
+        if path.exists():
+            self._touch(path)
+            self.stats["disk_hits"] += 1
+        else:
+            tmp = root / f"{digest}.{os.getpid()}.tmp.png"
+            try:
+                render(str(tmp))
+                os.replace(tmp, path)
+            except Exception as e:
+                logger.debug("Could not render cached icon %s: %s", path.name, e)
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+                return ""
+            self.stats["misses"] += 1
+            self._pinned.add(path.name)
+            self._evict_disk()
+        result = str(path).replace("\\", "/")
+        with self._lock:
+            self._pinned.add(path.name)
+            self._icons[digest] = result
+        return result
+
+    # --- disk store ------------------------------------------------------------------------------
+    def _write(self, name: str, data: bytes) -> None:
+        root = self.root
+        if root is None:
+            return
+        path = root / name
+        tmp = root / f"{name}.{os.getpid()}.tmp"
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("Could not persist %s: %s", name, e)
+            return
+        with self._lock:
+            self._pinned.add(name)
+        self._evict_disk()
+
+    def _touch(self, path: Path) -> None:
+        """Mark ``path`` recently used for eviction; once per file per session."""
+        with self._lock:
+            if path.name in self._pinned:
+                return
+            self._pinned.add(path.name)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def disk_usage(self) -> int:
+        root = self.root
+        if root is None:
+            return 0
+        total = 0
+        for entry in os.scandir(root):
+            if entry.is_file():
+                total += entry.stat().st_size
+        return total
+
+    def _evict_disk(self) -> None:
+        """Drop least-recently-used files until the store fits ``disk_budget``."""
+        root = self.root
+        if root is None:
+            return
+        try:
+            entries = [(e.stat().st_mtime_ns, e.stat().st_size, e.name, e.path)
+                       for e in os.scandir(root) if e.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _, _ in entries)
+        if total <= self.disk_budget:
+            return
+        for _, size, name, path in sorted(entries):
+            if total <= self.disk_budget:
+                break
+            if name in self._pinned:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats["evictions"] += 1
+        logger.debug("Theme cache trimmed to %d bytes.", total)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._icons.clear()
+
+
+theme_cache = ThemeCache()
+
+
+def cached_builder(namespace: str, key_fn: Callable[[], ThemeKey]):
+    """Decorator: serve a QSS builder's output from the module-level ``theme_cache``.
+
+    ``key_fn`` returns the current ThemeKey; the builder's arguments are part of the address, so they
+    must have a stable ``repr`` (ints, bools, strings). The original builder stays reachable as
+    ``.uncached``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            args_key = (args, tuple(sorted(kwargs.items())))
+            return theme_cache.get_text(namespace, key_fn(), args_key, lambda: fn(*args, **kwargs))
+        wrapper.uncached = fn
+        return wrapper
+    return decorate
@@ -5,9 +5,26 @@ Contains the UI-related classes: NetworkSpeedWidget (the taskbar widget), Settin
 unified Monitor (views/monitor/, imported lazily by the widget). The standalone Graph and App Activity
 windows were retired in 2.0 - the Monitor replaced them; their reusable engine/worker live on under
 views/graph/ and views/app_activity/ and are imported directly where needed.
+
+The package-level names are resolved on first access (PEP 562): importing the widget runs this file
+first, and an eager ``SettingsDialog`` import put the whole settings package on the startup path even
+though it is a registered deferred import (utils.lazy_import).
 """
 
-from netspeedtray.views.widget import NetworkSpeedWidget
-from netspeedtray.views.settings import SettingsDialog
+import importlib
+
+_LAZY_EXPORTS = {
+    "NetworkSpeedWidget": "netspeedtray.views.widget",
+    "SettingsDialog": "netspeedtray.views.settings",
+}
 
 __all__ = ["NetworkSpeedWidget", "SettingsDialog"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,9 @@ only what it can measure exactly and for free: the live network *connections* ea
 their count, how many are established, the distinct remote hosts, and TCP/UDP split - rolled up
 by application identity (one row per program, not per PID). Every number here is exact.
 
+Each payload also carries a ``delta`` (utils.row_delta): apps whose connection table didn't change
+keep last tick's row object, so the Monitor's keyed list repaints only the apps that did.
+
 Runs in a dedicated QThread, only while the App Activity window is open.
 """
 
@@ -23,6 +26,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import psutil
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
+from netspeedtray.utils.row_delta import RowDeltaTracker
+
 
 class AppActivityWorker(QObject):
     """Collects live network connections grouped by application identity. No byte estimates."""
@@ -34,6 +39,8 @@ class AppActivityWorker(QObject):
         super().__init__()
         self.logger = logging.getLogger("NetSpeedTray.AppActivityWorker")
         self._name_cache: Dict[int, str] = {}
+        self._tracker = RowDeltaTracker()
+        self._signatures: Dict[str, Tuple] = {}   # identity_key -> last tick's (name, pids, connections)
 
     @pyqtSlot()
     def sample(self) -> None:
@@ -41,51 +48,37 @@ class AppActivityWorker(QObject):
         try:
             pid_conns, access_limited = self._collect_connections_by_pid()
 
-            # Aggregate connections by application identity (roll up all PIDs of one program).
-            agg: Dict[str, Dict[str, Any]] = defaultdict(self._new_agg)
+            # Group connections by application identity (roll up all PIDs of one program).
+            groups: Dict[str, Dict[str, Any]] = {}
             for pid, conns in pid_conns.items():
                 name = self._process_name(pid)
-                key = name.casefold()
-                a = agg[key]
-                a["display_name"] = name
-                a["pids"].add(pid)
-                for conn in conns:
-                    a["conn_count"] += 1
-                    proto = self._get_protocol_name(getattr(conn, "type", 0))
-                    if proto == "TCP":
-                        a["tcp_count"] += 1
-                    elif proto == "UDP":
-                        a["udp_count"] += 1
-                    status = str(getattr(conn, "status", "") or "").upper()
-                    if status == "ESTABLISHED":
-                        a["established_count"] += 1
-                    host = self._remote_host(conn)
-                    if host:
-                        a["hosts"].add(host)
-                    a["endpoints"].append(self._format_connection(conn))
-
+                g = groups.setdefault(name.casefold(), {"display_name": name, "pids": set(), "conns": []})
+                g["display_name"] = name
+                g["pids"].add(pid)
+                g["conns"].extend(conns)
+
+            # An app whose connection table is identical to last tick's keeps last tick's row object:
+            # its host list is not re-sorted nor its endpoint strings re-formatted, and the delta below
+            # reports it unchanged, so the list view doesn't repaint it.
             rows: List[Dict[str, Any]] = []
-            for key, a in agg.items():
-                hosts = sorted(a["hosts"])
-                rows.append({
-                    "identity_key": key,
-                    "display_name": a["display_name"],
-                    "pids": sorted(a["pids"]),
-                    "conn_count": a["conn_count"],
-                    "tcp_count": a["tcp_count"],
-                    "udp_count": a["udp_count"],
-                    "established_count": a["established_count"],
-                    "distinct_hosts": hosts,
-                    "host_count": len(hosts),
-                    "endpoints": a["endpoints"],
-                    "is_idle": a["established_count"] == 0,
-                })
+            signatures: Dict[str, Tuple] = {}
+            for key, g in groups.items():
+                sig = (g["display_name"], tuple(sorted(g["pids"])), tuple(g["conns"]))
+                signatures[key] = sig
+                prev = self._tracker.previous(key)
+                if prev is not None and self._signatures.get(key) == sig:
+                    rows.append(prev)
+                else:
+                    rows.append(self._build_row(key, g["display_name"], g["pids"], g["conns"]))
+            self._signatures = signatures
 
             rows.sort(key=self._sort_key)
+            rows, delta = self._tracker.commit(rows)
 
             self.data_ready.emit({
                 "updated_at": datetime.now().strftime("%H:%M:%S"),
                 "rows": rows,
+                "delta": delta,
                 "app_count": len(rows),
                 "active_app_count": sum(1 for r in rows if r["established_count"] > 0),
                 "total_conn_count": sum(r["conn_count"] for r in rows),
@@ -95,11 +88,37 @@ class AppActivityWorker(QObject):
             self.logger.error("Failed to sample app activity: %s", exc, exc_info=True)
             self.error.emit(str(exc))
 
-    @staticmethod
-    def _new_agg() -> Dict[str, Any]:
+    def _build_row(self, key: str, display_name: str, pids, conns: List[Any]) -> Dict[str, Any]:
+        """Roll one app's live connections up into its payload row."""
+        tcp = udp = established = 0
+        hosts = set()
+        endpoints: List[str] = []
+        for conn in conns:
+            proto = self._get_protocol_name(getattr(conn, "type", 0))
+            if proto == "TCP":
+                tcp += 1
+            elif proto == "UDP":
+                udp += 1
+            status = str(getattr(conn, "status", "") or "").upper()
+            if status == "ESTABLISHED":
+                established += 1
+            host = self._remote_host(conn)
+            if host:
+                hosts.add(host)
+            endpoints.append(self._format_connection(conn))
+        distinct = sorted(hosts)
         return {
-            "display_name": "", "pids": set(), "conn_count": 0, "tcp_count": 0,
-            "udp_count": 0, "established_count": 0, "hosts": set(), "endpoints": [],
+            "identity_key": key,
+            "display_name": display_name,
+            "pids": sorted(pids),
+            "conn_count": len(conns),
+            "tcp_count": tcp,
+            "udp_count": udp,
+            "established_count": established,
+            "distinct_hosts": distinct,
+            "host_count": len(distinct),
+            "endpoints": endpoints,
+            "is_idle": established == 0,
         }
 
     @staticmethod
@@ -0,0 +1,155 @@
+"""
+Progressive, cache-backed loading for long network timelines (Week / Month / All / a long uptime).
+
+A long window used to be one query: every tier UNIONed and binned to the target resolution (hour or
+day) before anything was drawn - and, with live updates on, the same full query again every
+REALTIME_UPDATE_INTERVAL_MS. The raw tier (the most recent ~24h, per-second rows) dominates that cost.
+
+GraphDataWorker now loads such a window in three steps, using the helpers here:
+
+1. **Preview** - the window read from the rollup tiers only (minute/hour; no raw tier, no overlay),
+   binned to the target resolution. One cheap query; painted immediately. It lacks only what is still
+   in the raw tier, i.e. the recent end.
+2. **Refine** - the exact bins, fetched in ``PROGRESSIVE_CHUNKS`` bin-aligned chunks, newest first (so
+   the piece the preview lacks lands first), each swapped into the preview and re-painted. A chunk is
+   the normal all-tier query over a bin-aligned range, so the refined series is bin-for-bin the one the
+   single query returned.
+3. **Reuse** - the exact bins stay in a ``LoadedSeries`` per (interface, resolution). A later request
+   whose window falls inside it (a zoom, or the next live refresh of the same period) fetches only what
+   is missing: the open bin at the live edge and anything newer, or an older head.
+
+Bins that started before the fetch's current bin are final (the raw-tier overlay already covers
+uncommitted samples, and tier moves preserve per-bucket maxima), so only the bin holding "now" is ever
+re-read. Entries expire after SERIES_CACHE_TTL_SEC all the same, so retention pruning and imports show
+up without reopening the view.
+"""
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+Range = Tuple[int, int]          # [lo, hi) in unix seconds, bin-aligned
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray]    # (ts int64, up float64, down float64)
+
+
+def align(ts: float, interval: int) -> int:
+    """Start of the bin holding ``ts`` (the binning every speed-history query uses)."""
+    return int(math.floor(ts / interval)) * interval
+
+
+def bin_range(start_ts: float, end_ts: float, interval: int) -> Range:
+    """The bin-aligned range covering [start_ts, end_ts]: from the bin holding start up to and
+    including the bin holding end."""
+    return align(start_ts, interval), align(end_ts, interval) + interval
+
+
+def split_newest_first(ranges: List[Range], interval: int, chunks: int) -> List[Range]:
+    """Cut ``ranges`` into about ``chunks`` bin-aligned pieces of equal bin count, newest piece first.
+    Each piece ends where the next-newer one starts, so loading them in order keeps the loaded span
+    contiguous."""
+    total_bins = sum((hi - lo) // interval for lo, hi in ranges)
+    if total_bins <= 0:
+        return []
+    step = max(1, math.ceil(total_bins / max(1, chunks))) * interval
+    out: List[Range] = []
+    for lo, hi in sorted(ranges, key=lambda r: r[1], reverse=True):
+        while hi > lo:
+            out.append((max(lo, hi - step), hi))
+            hi -= step
+    return out
+
+
+@dataclass
+class LoadedSeries:
+    """
+    The exact bins loaded so far for one (interface, resolution): every bin in [lo, hi), of which
+    those starting before ``closed`` are final. The span is always contiguous - plan() only ever asks
+    for ranges that touch it.
+    """
+    interface: Optional[str]
+    resolution: str
+    interval: int
+    lo: int = 0
+    hi: int = 0
+    closed: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+    ts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    up: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    down: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+
+    @property
+    def empty(self) -> bool:
+        return self.hi <= self.lo
+
+    def expired(self, ttl: float, now: Optional[float] = None) -> bool:
+        return ((time.monotonic() if now is None else now) - self.loaded_at) > ttl
+
+    def plan(self, want: Range) -> Optional[List[Range]]:
+        """The ranges still to fetch for ``want``: an older head before ``lo`` and/or a tail from
+        ``closed`` on (the open bin is always re-read). None when ``want`` doesn't touch what is loaded
+        - the caller starts over."""
+        w_lo, w_hi = want
+        if self.empty or w_hi < self.lo or w_lo > self.closed:
+            return None
+        missing: List[Range] = []
+        if w_lo < self.lo:
+            missing.append((w_lo, self.lo))
+        if w_hi > self.closed:
+            missing.append((self.closed, w_hi))
+        return missing
+
+    def merge(self, rng: Range, columns: Columns, now_ts: Optional[float] = None) -> None:
+        """Replace the bins in ``rng`` with ``columns`` (freshly fetched for exactly that range) and
+        extend the loaded span. ``now_ts`` is the wall-clock time of the fetch: bins starting before its
+        bin are final from here on."""
+        lo, hi = rng
+        ts, up, down = columns
+        keep = (self.ts < lo) | (self.ts >= hi)
+        ts = np.concatenate((self.ts[keep], np.asarray(ts, dtype=np.int64)))
+        order = np.argsort(ts, kind="stable")
+        self.ts = ts[order]
+        self.up = np.concatenate((self.up[keep], np.asarray(up, dtype=np.float64)))[order]
+        self.down = np.concatenate((self.down[keep], np.asarray(down, dtype=np.float64)))[order]
+        if self.empty:
+            self.lo, self.hi = lo, hi
+        else:
+            self.lo, self.hi = min(self.lo, lo), max(self.hi, hi)
+        # Only a fetch reaching up to ``hi`` can close bins, and only those before the fetch's own bin.
+        now_bin = align(time.time() if now_ts is None else now_ts, self.interval)
+        self.closed = max(self.closed, min(hi, now_bin), self.lo)
+
+    def window(self, want: Range, preview: Optional[Columns] = None) -> Columns:
+        """The bins of ``want``: the exact ones loaded, plus - outside the loaded span only - the
+        ``preview`` bins standing in for what hasn't been refined yet."""
+        w_lo, w_hi = want
+        m = (self.ts >= w_lo) & (self.ts < w_hi)
+        parts = [(self.ts[m], self.up[m], self.down[m])]
+        if preview is not None:
+            p_ts, p_up, p_down = preview
+            pm = (p_ts >= w_lo) & (p_ts < w_hi)
+            if not self.empty:
+                pm &= (p_ts < self.lo) | (p_ts >= self.hi)
+            parts.append((p_ts[pm], p_up[pm], p_down[pm]))
+        if len(parts) == 1:
+            return parts[0]
+        ts = np.concatenate([p[0] for p in parts])
+        order = np.argsort(ts, kind="stable")
+        return (ts[order], np.concatenate([p[1] for p in parts])[order],
+                np.concatenate([p[2] for p in parts])[order])
+
+
+def to_points(columns: Columns, start_ts: Optional[int], end_ts: int) -> List[Tuple[int, float, float]]:
+    """(ts, up, down) tuples as get_speed_history(return_raw=True) returns them, including its
+    zero-valued edge points where the first/last bin doesn't reach the window edge. Empty stays empty."""
+    ts, up, down = columns
+    points = list(zip(ts.tolist(), up.tolist(), down.tolist()))
+    if points:
+        if start_ts is not None and points[0][0] > start_ts:
+            points.insert(0, (start_ts, 0.0, 0.0))
+        if points[-1][0] < end_ts:
+            points.append((end_ts, 0.0, 0.0))
+    return points
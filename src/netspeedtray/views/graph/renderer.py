@@ -18,6 +18,7 @@ from netspeedtray import constants
 from netspeedtray.constants import styles as style_constants
 from netspeedtray.constants.renderer import RendererConstants
 from netspeedtray.utils.helpers import calculate_monotone_cubic_interpolation, format_decimal
+from netspeedtray.utils.instrumentation import timed
 from netspeedtray.utils.mpl_fonts import configure_cjk_font
 import matplotlib.colors as mcolors
 from matplotlib.patches import PathPatch
@@ -536,6 +537,7 @@ class GraphRenderer(QObject):
             self.logger.debug(f"Could not add/update event marker: {e}")
 
 
+    @timed("graph.render")
     def render(self, history_data, start_time: datetime, end_time: datetime, period_key: str, boot_time: Optional[datetime] = None, force_rebuild: bool = False, stat_type: str = "network", hw_styles: Optional[dict] = None):
         """
         Renders the graph.
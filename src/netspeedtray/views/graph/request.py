@@ -28,6 +28,10 @@ class DataRequest:
         interface_name: Specific interface to filter, or None for all interfaces
         is_session_view: True if viewing current session data (affects aggregation)
         sequence_id: Request ID for deduplicating stale responses
+        stat_type: 'network', a hardware stat ('cpu', 'gpu', 'hwcombined', ...) or 'overview'
+        preview: For a progressive network load, paint the rollup preview and the partial
+            refinements before the exact series. Off when the host has already painted a cached
+            copy of the view, and for the Monitor's prefetch jobs (nobody sees their emissions).
     
     Example:
         >>> request = DataRequest(
@@ -46,6 +50,7 @@ class DataRequest:
     is_session_view: bool
     sequence_id: int
     stat_type: str = "network" # Added for hardware stats (e.g., 'cpu', 'gpu')
+    preview: bool = True
     
     def __post_init__(self):
         """Validate request parameters."""
@@ -69,6 +74,9 @@ class DataRequest:
 
         if not isinstance(self.stat_type, str):
             raise TypeError(f"stat_type must be str, got {type(self.stat_type)}")
+
+        if not isinstance(self.preview, bool):
+            raise TypeError(f"preview must be bool, got {type(self.preview)}")
     
     def __hash__(self):
         """Allow DataRequest to be used in sets/dicts if needed."""
@@ -3,9 +3,12 @@ from PyQt6.QtCore import QObject, pyqtSignal
 import logging
 import time
 from typing import List, Tuple, Dict, Any
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 from datetime import datetime
+from netspeedtray import constants
+from netspeedtray.views.graph import progressive as P
 from netspeedtray.views.graph.request import DataRequest
+from netspeedtray.utils.instrumentation import timed
 
 class GraphDataWorker(QObject):
     """
@@ -17,6 +20,8 @@ class GraphDataWorker(QObject):
     """
     # NOTE: Overview emits a dict payload (multi-dataset), while other tabs emit a list of tuples.
     # Using `object` avoids PyQt type coercion issues that can silently break live updates on Overview.
+    # A progressive network load emits several times for one sequence_id (preview, refined chunks,
+    # final); every emission but the last carries NaN totals - "not computed yet".
     data_ready = pyqtSignal(object, float, float, int) # history_data, total_up, total_down, sequence_id
     error = pyqtSignal(str)
 
@@ -54,13 +59,94 @@ class GraphDataWorker(QObject):
         self.widget_state = widget_state
         self.logger = logging.getLogger(__name__)
         self._last_received_id = -1
-        
-        # Timeline data cache: {period_key: (data, total_up, total_down, timestamp)}
-        # Cache expires after 30 seconds to ensure data freshness
-        self._cache: Dict[str, tuple] = {}
-        self._cache_ttl = 30.0  # seconds
+        # Newest sequence_id the host has issued (note_requested, written from the GUI thread). A
+        # progressive load checks it between chunks and stops once a newer request is queued.
+        self._latest_requested = -1
+
+        # Exact bins loaded for long network timelines, per (interface, resolution) - see
+        # views/graph/progressive.py. Reused by later requests inside the loaded span.
+        self._series: Dict[Tuple[Optional[str], str], P.LoadedSeries] = {}
+        # An extra stop condition for progressive loads, checked with _latest_requested: the Monitor's
+        # idle prefetcher sets it to its own cancellation check on the worker it runs jobs on.
+        self.should_stop: Optional[Callable[[], bool]] = None
+
+    def note_requested(self, sequence_id: int) -> None:
+        """Record that the host has issued ``sequence_id`` (called on the GUI thread, before the
+        request is queued), so an in-progress progressive load for an older request can stop early."""
+        if sequence_id > self._latest_requested:
+            self._latest_requested = sequence_id
+
+    def _superseded(self, request: DataRequest) -> bool:
+        return (self._latest_requested > request.sequence_id
+                or (self.should_stop is not None and self.should_stop()))
+
+    def _cap_points(self, history_data: List[Tuple[float, float, float]], stat_type: str) -> List[Tuple[float, float, float]]:
+        """Smart Downsampling: cap at MAX_DATA_POINTS for rendering performance."""
+        if len(history_data) > self.MAX_DATA_POINTS:
+            stride = len(history_data) // self.MAX_DATA_POINTS
+            downsampled = history_data[::stride]
+            if stat_type == "network":
+                return self._preserve_global_peaks(history_data, downsampled)
+            return downsampled
+        return history_data
+
+    def _load_network_progressive(self, request: DataRequest, resolution: str) -> Optional[List[Tuple[int, float, float]]]:
+        """
+        The network series for a long (hour/day resolution) DB timeline, via progressive.py: a
+        rollup-tier preview painted first when a lot is missing, then the exact bins in chunks (newest
+        first, each painted), all kept for reuse. Returns the final exact points - padded like
+        get_speed_history(return_raw=True) - or None if a newer request superseded this one midway.
+        """
+        ws = self.widget_state
+        interval = constants.data.history_period.RESOLUTION_SECONDS[resolution]
+        start_ts = int(request.start_time.timestamp())
+        end_ts = int(request.end_time.timestamp())
+        want = P.bin_range(start_ts, end_ts, interval)
+        key = (request.interface_name, resolution)
+
+        entry = self._series.get(key)
+        expired = entry is not None and entry.expired(constants.graph.SERIES_CACHE_TTL_SEC)
+        missing = entry.plan(want) if entry is not None and not expired else None
+        if missing is None:
+            entry = P.LoadedSeries(request.interface_name, resolution, interval)
+            self._series[key] = entry
+            missing = [want]
+
+        def fetch(lo: int, hi: int, rollups_only: bool = False):
+            return ws.get_speed_history_arrays(datetime.fromtimestamp(lo), datetime.fromtimestamp(hi - 1),
+                                               request.interface_name, resolution, rollups_only=rollups_only)
 
+        def paint(columns) -> None:
+            points = P.to_points(columns, start_ts, end_ts)
+            if len(points) >= 2:
+                self.data_ready.emit(self._cap_points(points, "network"), float("nan"), float("nan"),
+                                     request.sequence_id)
 
+        # A preview only when the view is new (or moved far), not when a live view's cache merely expired:
+        # that reload is silent, so the graph doesn't flash back to the preview every few minutes. A
+        # request that asked for no preview (the view is already painted from a cached copy, or nobody
+        # is watching) still loads in chunks - the stop checks between them - but paints only the end.
+        preview = None
+        span = sum(hi - lo for lo, hi in missing)
+        if span > constants.graph.PROGRESSIVE_MIN_SPAN_SEC and not expired:
+            if request.preview:
+                preview = fetch(min(lo for lo, _ in missing), max(hi for _, hi in missing), rollups_only=True)
+                paint(entry.window(want, preview))
+            chunks = P.split_newest_first(missing, interval, constants.graph.PROGRESSIVE_CHUNKS)
+        else:
+            chunks = missing
+        for i, (lo, hi) in enumerate(chunks):
+            if self._superseded(request):
+                self.logger.debug("Progressive load for request %d superseded after %d/%d chunks.",
+                                  request.sequence_id, i, len(chunks))
+                return None
+            entry.merge((lo, hi), fetch(lo, hi), now_ts=time.time())
+            if preview is not None and i < len(chunks) - 1:
+                paint(entry.window(want, preview))
+        return P.to_points(entry.window(want), start_ts, end_ts)
+
+
+    @timed("graph.process_data")
     def process_data(self, request: DataRequest):
         """
         Processes speed history data in a background thread.
@@ -83,10 +169,15 @@ class GraphDataWorker(QObject):
                 self.error.emit("Data source (WidgetState) not available.")
                 return
 
-            # The fast in-memory session path only has the ALL-interfaces aggregate, so it can't honor a
-            # per-NIC filter. When the user scopes the graph to one interface, fall through to the DB path
-            # (which is per-interface) even for the session range. "all"/None keeps the in-memory path.
+            # The session range is served from memory: the all-interfaces aggregate for "all"/None, and
+            # one NIC's column of the per-interface session buffer when the graph is scoped to it. Only a
+            # NIC that hasn't reported this session (a historical adapter picked from the list) falls
+            # through to the DB path.
             net_use_memory = request.is_session_view and not request.interface_name
+            nic_session = []
+            if request.is_session_view and request.interface_name and request.stat_type == "network":
+                nic_session = self.widget_state.get_session_speed_history(
+                    request.interface_name, request.start_time, request.end_time)
 
             if request.stat_type == "overview":
                 # Multi-dataset fetch for Overview tab
@@ -179,7 +270,7 @@ class GraphDataWorker(QObject):
 
             elif net_use_memory:
                 # OPTIMIZATION: Use the pre-calculated aggregated history from WidgetState.
-                # (Only when not scoped to a single NIC - see net_use_memory; per-NIC falls to the DB path.)
+                # (Only when not scoped to a single NIC - see net_use_memory; one NIC is served by nic_session.)
                 aggregated_data = self.widget_state.get_aggregated_speed_history()
                 
                 start_ts = request.start_time.timestamp() if request.start_time else 0
@@ -201,14 +292,27 @@ class GraphDataWorker(QObject):
                     total_down += down
                 
                 history_data = processed_history
+            elif nic_session:
+                history_data = nic_session
+                total_up = sum(up for _, up, _ in nic_session)
+                total_down = sum(down for _, _, down in nic_session)
             else:
-                # For all other timelines, get data from the database.
-                history_data = self.widget_state.get_speed_history(
-                    start_time=request.start_time,
-                    end_time=request.end_time,
-                    interface_name=request.interface_name,
-                    return_raw=True
-                )
+                # For all other timelines, get data from the database. Long (hour/day resolution) windows
+                # load progressively and incrementally (see _load_network_progressive); anything it
+                # can't serve - no start, or nothing recorded - takes the single-query path.
+                history_data = None
+                resolution = constants.data.history_period.get_target_resolution(request.start_time, request.end_time)
+                if request.start_time is not None and resolution in ('hour', 'day'):
+                    history_data = self._load_network_progressive(request, resolution)
+                    if history_data is None:
+                        return
+                if not history_data:
+                    history_data = self.widget_state.get_speed_history(
+                        start_time=request.start_time,
+                        end_time=request.end_time,
+                        interface_name=request.interface_name,
+                        return_raw=True
+                    )
 
                 # Fetch totals from DB as well (DURING the worker thread to avoid UI freeze)
                 total_up, total_down = self.widget_state.get_total_bandwidth_for_period(
@@ -217,14 +321,7 @@ class GraphDataWorker(QObject):
                     interface_name=request.interface_name
                 )
 
-            # Smart Downsampling: Cap at MAX_DATA_POINTS for rendering performance
-            if len(history_data) > self.MAX_DATA_POINTS:
-                stride = len(history_data) // self.MAX_DATA_POINTS
-                downsampled = history_data[::stride]
-                if request.stat_type == "network":
-                    history_data = self._preserve_global_peaks(history_data, downsampled)
-                else:
-                    history_data = downsampled
+            history_data = self._cap_points(history_data, request.stat_type)
 
             if not history_data or len(history_data) < 2:
                 self.data_ready.emit([], 0.0, 0.0, request.sequence_id)
@@ -0,0 +1,164 @@
+"""
+DiagnosticsTab - the Monitor's Diagnostics tab: live hot-path timings from utils.instrumentation.
+
+Shown only while Settings > Advanced > Diagnostics (``diagnostics_enabled``) is on - the same switch that
+turns collection on - so a normal user never sees an empty engineering table. One row per instrumented
+code path (busiest first by total time): calls, mean, p50 / p95 / p99 and max, in milliseconds; below it
+the counters and gauges (stats-thread errors, DB queue depth). Refreshed once a second while the tab is
+visible; Reset zeroes the registry so a slow action can be measured on its own.
+
+Percentiles come from the registry's power-of-two buckets, so they are bucket upper bounds (capped at the
+observed max) - good to within a factor of two, which the caption says. The same snapshot goes into the
+support bundle as diagnostics.json. Qt + utils only; nothing here imports the graph package.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView,
+)
+
+from netspeedtray import constants
+from netspeedtray.utils import styles as su
+from netspeedtray.constants.styles import styles as tokens
+from netspeedtray.utils.instrumentation import Instrumentation, registry as default_registry
+
+REFRESH_MS = 1000
+_STAT_COLUMNS = ("count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+def format_ms(value: float) -> str:
+    """Milliseconds at a readable precision: 0.042, 3.18, 27.4, 1250."""
+    if value >= 100:
+        return f"{value:.0f}"
+    if value >= 10:
+        return f"{value:.1f}"
+    if value >= 1:
+        return f"{value:.2f}"
+    return f"{value:.3f}"
+
+
+class DiagnosticsTab(QWidget):
+    """The hot-path timing table + counters line. Refreshes on a 1 s timer while visible."""
+
+    def __init__(self, config: Dict[str, Any], i18n, parent: Optional[QWidget] = None,
+                 registry: Optional[Instrumentation] = None) -> None:
+        super().__init__(parent)
+        self._config = config
+        self._i18n = i18n
+        self._registry = registry if registry is not None else default_registry
+        c = su.semantic_colors()
+
+        _m = constants.layout.MONITOR_BODY_MARGIN
+        root = QVBoxLayout(self)
+        root.setContentsMargins(_m, 0, _m, _m)
+        root.setSpacing(8)
+
+        # Header band: the caption (units + precision) left, Reset right - same height as the other tabs.
+        band = QHBoxLayout()
+        band.setContentsMargins(0, 0, 0, 0)
+        self._note = QLabel(self._tr("DIAGNOSTICS_TIMES_NOTE",
+                                     "Times in milliseconds; percentiles are accurate to within a factor of two."))
+        self._note.setFont(su.font(tokens.TYPE_CAPTION))
+        self._note.setWordWrap(True)
+        self._note.setStyleSheet(f"color: {c['text_secondary']}; background: transparent;")
+        band.addWidget(self._note, 1)
+        self._reset = QPushButton(self._tr("DIAGNOSTICS_RESET_BUTTON", "Reset"))
+        self._reset.setStyleSheet(su.button_style())
+        self._reset.clicked.connect(self._on_reset)
+        band.addWidget(self._reset, 0, Qt.AlignmentFlag.AlignVCenter)
+        band_host = QWidget()
+        band_host.setFixedHeight(constants.layout.MONITOR_HEADER_BAND_HEIGHT)
+        band_host.setLayout(band)
+        root.addWidget(band_host)
+
+        headers = [self._tr("DIAGNOSTICS_COL_PATH", "Code path"), self._tr("DIAGNOSTICS_COL_CALLS", "Calls"),
+                   self._tr("DIAGNOSTICS_COL_MEAN", "Mean"), "p50", "p95", "p99",
+                   self._tr("DIAGNOSTICS_COL_MAX", "Max")]
+        self._table = QTableWidget(0, len(headers))
+        self._table.setHorizontalHeaderLabels(headers)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._table.verticalHeader().setVisible(False)
+        self._table.setShowGrid(False)
+        self._table.setAlternatingRowColors(True)
+        hh = self._table.horizontalHeader()
+        hh.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, len(headers)):
+            hh.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self._table.setStyleSheet(
+            f"QTableWidget {{ background: {c['card_bg']}; alternate-background-color: {c['subtle_fill']};"
+            f" color: {c['text_primary']}; border: 1px solid {c['card_stroke']};"
+            f" border-radius: {tokens.RADIUS_CARD}px; }}"
+            f" QHeaderView::section {{ background: transparent; color: {c['text_secondary']};"
+            f" border: none; padding: 4px 8px; }}")
+        self._table.setAccessibleName(self._tr("MONITOR_TAB_DIAGNOSTICS", "Diagnostics"))
+        root.addWidget(self._table, 1)
+
+        self._empty = QLabel(self._tr("DIAGNOSTICS_EMPTY", "No measurements yet - they appear as the app runs."))
+        self._empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._empty.setStyleSheet(f"color: {c['text_secondary']}; background: transparent;")
+        root.addWidget(self._empty)
+
+        self._levels = QLabel()
+        self._levels.setFont(su.font(tokens.TYPE_CAPTION))
+        self._levels.setWordWrap(True)
+        self._levels.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self._levels.setStyleSheet(f"color: {c['text_secondary']}; background: transparent;")
+        root.addWidget(self._levels)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def _tr(self, key: str, default: str) -> str:
+        return str(getattr(self._i18n, key, default)) if self._i18n is not None else default
+
+    # ------------------------------------------------------------------ data
+
+    def refresh(self) -> None:
+        """Re-read the registry into the table (busiest code path first) and the counters line."""
+        snap = self._registry.snapshot()
+        spans = snap["spans"]
+        order = [name for name in self._registry.busiest() if spans.get(name, {}).get("count")]
+        self._table.setRowCount(len(order))
+        for row, name in enumerate(order):
+            s = spans[name]
+            cells = [name, str(s["count"])] + [format_ms(s[k]) for k in _STAT_COLUMNS[1:]]
+            for col, text in enumerate(cells):
+                item = self._table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if col:
+                        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    self._table.setItem(row, col, item)
+                item.setText(text)
+        self._empty.setVisible(not order)
+
+        parts = [f"{name}: {value}" for name, value in snap["counters"].items()]
+        parts += [f"{name}: {g['value']} (peak {g['peak']})" for name, g in snap["gauges"].items()]
+        self._levels.setText("   ·   ".join(parts))
+        self._levels.setVisible(bool(parts))
+
+    def _on_reset(self) -> None:
+        self._registry.reset()
+        self.refresh()
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def teardown(self) -> None:
+        self._timer.stop()
@@ -19,10 +19,11 @@ graph import is lazy (inside ensure_loaded / the refresh methods).
 from __future__ import annotations
 
 import logging
+import math
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, Qt, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 
 from netspeedtray.utils import styles as su   # matplotlib-free; OK at module scope under the firewall
@@ -105,6 +106,13 @@ class GraphHost(QObject):
         self._cached_boot_time = None         # fetched once for the uptime range (mirrors GraphWindow)
         self._cached_earliest_db = None
 
+        # The Monitor's IdlePrefetcher (views/monitor/prefetch.py), set by MonitorWindow. Its cache gives
+        # a period/tab switch an instant first paint; its jobs run on a private worker of our own.
+        self.prefetcher = None
+        self._view_key = None                 # (stat, interface, period) of the last request issued
+        self._prefetch_worker = None
+        self._prefetch_seq = 0
+
         # shims the coordinator drives (matplotlib-free)
         self.ui = _UiShim()
         self.interaction = _InteractionShim()
@@ -145,18 +153,27 @@ class GraphHost(QObject):
         self.worker.data_ready.connect(self._on_data_ready)
         self.worker.error.connect(lambda msg: self.logger.debug("graph worker error: %s", msg))
         self.request_data_processing.connect(self.worker.process_data)
+        # Delete the worker on ITS OWN loop while quit() drains it (same as the Network tab's app feed):
+        # a deleteLater() posted once the loop has stopped is never processed, and the surviving worker's
+        # error connection above kept this host - and with it the whole closed Monitor - alive.
+        self._thread.finished.connect(self.worker.deleteLater)
         self._thread.start()
 
         # Coordinator drives THIS object as its host (unchanged coordinator.py).
         self.coordinator = GraphCoordinator(self)
 
         # Lightweight, stat-agnostic hover readout (the one real thing the old graph window had that the
-        # Monitor lacked). Reads the live plotted lines, so it works for both the network and hardware
-        # graphs and survives a re-render without managing any matplotlib artists.
+        # Monitor lacked). It indexes whatever each render plotted (see _on_data_ready), so it works for
+        # both the network and hardware graphs without managing any matplotlib artists.
         from netspeedtray.views.monitor.graph_hover import GraphHoverTooltip
         self._hover = GraphHoverTooltip(self)
         self._hover.attach()
 
+        # Chart-tab prefetch jobs are only offered from here on: building one needs the graph package.
+        if self.prefetcher is not None:
+            for tab in ("network", "hardware"):
+                self.prefetcher.set_provider(tab, lambda key, tab=tab: self._prefetch_job(tab, key))
+
         self._loaded = True
 
     # ------------------------------------------------------------------ canvas hosting
@@ -240,6 +257,8 @@ class GraphHost(QObject):
         self._accept_from_seq = self._current_request_id + 1
         from netspeedtray.views.graph.logic import GraphLogic
         period_key = GraphLogic.get_period_key(self._history_period_value)
+        if self.prefetcher is not None:
+            self.prefetcher.note_view(period=self._history_period_value)
         try:
             self.coordinator.handle_timeline_change(period_key)
         except Exception as e:
@@ -251,23 +270,92 @@ class GraphHost(QObject):
     # ------------------------------------------------------------------ host surface: refresh
 
     def update_graph(self, show_loading: bool = True) -> None:
-        """Build a DataRequest for the active stat_type + dispatch to the worker thread."""
+        """Build a DataRequest for the active stat_type + dispatch to the worker thread. When the view
+        (stat, interface, period) just changed and the prefetch cache holds it, that copy is painted
+        first and the request only replaces it - no progressive preview in between."""
         if self._is_closing or not self._loaded:
             return
+        self._current_request_id += 1
+        request = self._make_request(self._history_period_value, self._current_stat, self._current_request_id)
+        view_key = self._cache_key(request, self._history_period_value)
+        cached = None
+        if self.prefetcher is not None:
+            if view_key != self._view_key and not request.is_session_view:
+                cached = self.prefetcher.cache.get(view_key)
+            self.prefetcher.note_request()
+        self._view_key = view_key
+        request.preview = cached is None
+        # Tell the worker first (a plain attribute write): a progressive load it is busy with for an
+        # older request stops at its next chunk instead of finishing work nobody will see.
+        self.worker.note_requested(request.sequence_id)
+        self.request_data_processing.emit(request)
+        if cached is not None:
+            self._on_data_ready(*cached, request.sequence_id)
+
+    def _make_request(self, period_value: int, stat_type: str, sequence_id: int):
         from netspeedtray.views.graph.request import DataRequest
         from netspeedtray.views.graph.logic import GraphLogic
-        start, end = self._time_range()
-        period_key = GraphLogic.get_period_key(self._history_period_value)
-        self._current_request_id += 1
-        request = DataRequest(
+        start, end = self._time_range(period_value)
+        period_key = GraphLogic.get_period_key(period_value)
+        return DataRequest(
             start_time=start,
             end_time=end,
             interface_name=None if self.interface_filter in (None, "all") else self.interface_filter,
             is_session_view=(period_key == "TIMELINE_SESSION"),
-            sequence_id=self._current_request_id,
-            stat_type=self._current_stat,
+            sequence_id=sequence_id,
+            stat_type=stat_type,
         )
-        self.request_data_processing.emit(request)
+
+    @staticmethod
+    def _cache_key(request, period_value: int) -> tuple:
+        """The prefetch-cache key of a request's view: (stat, interface, period)."""
+        return ("graph", request.stat_type, request.interface_name, int(period_value))
+
+    # ------------------------------------------------------------------ idle prefetch
+
+    def _hardware_stat(self) -> str:
+        """The stat the Hardware tab shows: the active one if it is a hardware stat, else the
+        configured graph mode (mirrors HardwareTab._resolve_stat, CPU for the toggle mode)."""
+        if self._current_stat in ("hwcombined", "hwseparate", "cpu", "gpu"):
+            return self._current_stat
+        mode = str(self.config.get("monitor_hw_graph_mode", "combined"))
+        return {"separate": "hwseparate", "toggle": "cpu"}.get(mode, "hwcombined")
+
+    def _prefetch_job(self, tab: str, period_key: str):
+        """The IdlePrefetcher's job for ``tab`` at ``period_key``: the request the tab would issue,
+        run on a private worker (its own progressive-series cache; no previews) on the prefetch thread.
+        The result is the final (data, total_up, total_down) emission, under the request's cache key."""
+        if self._is_closing or not self._loaded:
+            return None
+        from netspeedtray.views.graph.worker import GraphDataWorker
+        from netspeedtray.views.monitor.prefetch import period_value
+        stat = "network" if tab == "network" else self._hardware_stat()
+        self._prefetch_seq += 1
+        request = self._make_request(period_value(period_key), stat, self._prefetch_seq)
+        request.preview = False
+        if self._prefetch_worker is None:
+            self._prefetch_worker = GraphDataWorker(self._main_widget.widget_state)
+        worker = self._prefetch_worker
+
+        def run(cancelled):
+            got = []
+
+            def keep(data, up, down, _seq):
+                got.append((data, up, down))
+
+            worker.should_stop = cancelled
+            worker.data_ready.connect(keep, Qt.ConnectionType.DirectConnection)
+            try:
+                worker.process_data(request)
+            finally:
+                worker.data_ready.disconnect(keep)
+                worker.should_stop = None
+            # A superseded progressive load never emits its final (non-NaN totals) result.
+            if not got or math.isnan(got[-1][1]):
+                return None
+            return got[-1]
+
+        return self._cache_key(request, period_value(period_key)), run
 
     def update_graph_range(self, start, end) -> None:
         # Zoom is disabled in the Monitor graph for now; a range request just refreshes the view.
@@ -298,9 +386,11 @@ class GraphHost(QObject):
                 "smoothing": bool(self.config.get("monitor_graph_smoothing", False)),
                 "fixed_axis": bool(self.config.get("monitor_graph_fixed_axis", True))}
 
-    def _time_range(self):
+    def _time_range(self, period_value: Optional[int] = None):
         from netspeedtray.views.graph.logic import GraphLogic
-        period_key = GraphLogic.get_period_key(self._history_period_value)
+        if period_value is None:
+            period_value = self._history_period_value
+        period_key = GraphLogic.get_period_key(period_value)
         # Fetch boot/earliest ONCE for the uptime range. These are UI-thread DB calls and _time_range
         # runs on every refresh + realtime tick - GraphWindow caches them the same way (and the cache
         # is naturally fresh each session, since GraphHost is recreated per Monitor window).
@@ -310,7 +400,7 @@ class GraphHost(QObject):
                 self._cached_earliest_db = self._main_widget.widget_state.get_earliest_data_timestamp()
             except Exception:
                 self._cached_boot_time = self._cached_earliest_db = None
-        return GraphLogic.get_time_range(self._history_period_value, self.session_start_time,
+        return GraphLogic.get_time_range(period_value, self.session_start_time,
                                          self._cached_boot_time, self._cached_earliest_db)
 
     def _on_data_ready(self, data, total_up, total_down, sequence_id) -> None:
@@ -334,14 +424,24 @@ class GraphHost(QObject):
                 return
             if self._current_stat not in dict_stats and isinstance(data, dict):
                 return
-            self.renderer.render(data, start, end, period_key,
-                                 boot_time=self._cached_boot_time, stat_type=self._current_stat,
-                                 hw_styles=self._hw_styles())
+            rendered = self.renderer.render(data, start, end, period_key,
+                                            boot_time=self._cached_boot_time, stat_type=self._current_stat,
+                                            hw_styles=self._hw_styles())
+            # The hover's lookup index is rebuilt here, once per render - never per mouse move.
+            if self._hover is not None:
+                self._hover.set_rendered(rendered)
             # Surface the worker's period totals to the Network header. For ranged periods these are
             # machine-wide (interface filter None sums every NIC); for SESSION they reflect the active
             # interface mode (auto/selected/...), mirroring the standalone graph's session aggregation.
-            if self._current_stat == "network":
+            # A progressive load's preview/partial renders carry NaN totals (not computed yet): keep the
+            # header on its previous figures until the final render brings them.
+            final = not (math.isnan(total_up) or math.isnan(total_down))
+            if self._current_stat == "network" and final:
                 self.network_totals_ready.emit(float(total_up or 0.0), float(total_down or 0.0), period_key)
+            # Keep the newest final render of a ranged view, so switching back to it paints at once.
+            if (final and self.prefetcher is not None and sequence_id == self._current_request_id
+                    and self._view_key is not None and period_key != "TIMELINE_SESSION"):
+                self.prefetcher.cache.put(self._view_key, (data, total_up, total_down))
         except Exception as e:
             self.logger.error("GraphHost render error: %s", e, exc_info=True)
 
@@ -374,6 +474,7 @@ class GraphHost(QObject):
         try:
             if self.worker is not None:
                 self.worker.data_ready.disconnect(self._on_data_ready)
+                self.worker.error.disconnect()
                 self.request_data_processing.disconnect(self.worker.process_data)
         except Exception:
             pass
@@ -402,16 +503,16 @@ class GraphHost(QObject):
         except Exception:
             pass
 
-        # Release the worker + thread (only after wait() confirmed the thread stopped).
+        # Release the thread (only after wait() confirmed it stopped); the worker was deleted on its own
+        # loop via finished.
         try:
-            if self.worker is not None:
-                self.worker.deleteLater()
             if self._thread is not None:
                 self._thread.deleteLater()
         except Exception:
             pass
         self.worker = None
         self._thread = None
+        self._prefetch_worker = None
 
         # Drop the heavy references so the figure / Line2D arrays / canvas and the host↔coordinator
         # reference cycle can be reclaimed promptly instead of lingering until a later GC pass - the
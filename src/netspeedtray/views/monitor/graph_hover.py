@@ -5,8 +5,14 @@ The old standalone Graph window had a rich hover layer (crosshair + focus dots +
 wired to the network download/upload dual-axis. The Monitor graph is multi-stat (network OR cpu/gpu/ram),
 so instead of porting that, this is a clean Qt-label tooltip that reads whatever lines are currently
 plotted in the axis under the cursor and shows their value at the nearest time - so it works for the
-network graph AND the hardware graphs, and survives a re-render (it reads the live Line2D data each move,
-caches no artists, and triggers no matplotlib redraw, so it stays cheap).
+network graph AND the hardware graphs. It caches no artists and triggers no matplotlib redraw.
+
+Lookups are O(log n): the host calls ``set_rendered`` after every render, which builds a small index
+once - sorted float x arrays per series, from the arrays ``GraphRenderer.render`` returns (network) or a
+one-off snapshot of the labelled lines (hardware, whose render returns nothing) - and each hover is then
+an ``np.searchsorted`` per series. Motion events are coalesced to the display refresh: a move only
+records the cursor, and a single-shot timer handles the latest position once per frame, so a fast drag
+over a dense 6-hour raw graph does one lookup per frame instead of one per event.
 
 matplotlib is already loaded by the time this attaches (GraphHost.ensure_loaded built the canvas), so the
 top-level matplotlib import here is fine - this module is only imported from inside ensure_loaded().
@@ -14,19 +20,56 @@ top-level matplotlib import here is fine - this module is only imported from ins
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
 import matplotlib.dates as mdates
-from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtCore import QObject, Qt, QTimer
+from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWidgets import QLabel
 
+from netspeedtray import constants
 from netspeedtray.utils import styles as su
 from netspeedtray.constants.styles import styles as tokens
 from netspeedtray.utils.helpers import format_speed
 
 # Don't pop a tooltip when the cursor is miles from any point (in axis-fraction of the x-range).
 _MAX_SNAP_FRAC = 0.04
+# Fallback frame interval for coalescing motion events when the screen doesn't report a refresh rate.
+_DEFAULT_REFRESH_HZ = 60.0
+
+
+@dataclass
+class HoverSeries:
+    """One hoverable series: x in matplotlib date numbers, sorted ascending, with its y values.
+    ``axes`` limits it to the axes it is drawn in; None means every axes of the figure (the network
+    graph's download and upload panes both read out both directions)."""
+    label: str
+    color: str
+    x: np.ndarray
+    y: np.ndarray
+    axes: Any = None
+
+    @classmethod
+    def build(cls, label: str, color: str, x, y, axes: Any = None) -> Optional["HoverSeries"]:
+        xd = np.asarray(x, dtype=float)
+        yd = np.asarray(y, dtype=float)
+        if xd.size == 0 or yd.size != xd.size:
+            return None
+        if xd.size > 1 and np.any(xd[1:] < xd[:-1]):      # searchsorted needs ascending x
+            order = np.argsort(xd, kind="stable")
+            xd, yd = xd[order], yd[order]
+        return cls(label, color, xd, yd, axes)
+
+    def nearest(self, x: float) -> Tuple[int, float]:
+        """(index, |dx|) of the sample closest to ``x`` - a binary search plus one neighbour check."""
+        i = int(np.searchsorted(self.x, x))
+        if i >= self.x.size:
+            i = self.x.size - 1
+        elif i > 0 and (x - self.x[i - 1]) <= (self.x[i] - x):
+            i -= 1
+        return i, abs(float(self.x[i]) - x)
 
 
 class GraphHoverTooltip(QObject):
@@ -40,6 +83,12 @@ class GraphHoverTooltip(QObject):
         self._cid_move = None
         self._cid_leave = None
         self._attached = False
+        self._series: List[HoverSeries] = []
+        self._pending: Optional[Tuple[Any, float, float, float]] = None   # (axes, xdata, x px, y px)
+        self._last: Optional[Tuple[Any, float, float, float]] = None      # the position last shown
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._process_pending)
 
     # ------------------------------------------------------------------ lifecycle
     def attach(self) -> None:
@@ -58,11 +107,15 @@ class GraphHoverTooltip(QObject):
             f"#graphHover {{ background: {c['card_bg']}; color: {c['text_primary']};"
             f" border: 1px solid {c['card_stroke']}; border-radius: 6px; padding: 4px 8px; }}")
         self._label.setFont(su.font(tokens.TYPE_CAPTION))
+        self._frame_timer.setInterval(self._frame_interval_ms())
         self._cid_move = canvas.mpl_connect("motion_notify_event", self._on_move)
         self._cid_leave = canvas.mpl_connect("axes_leave_event", lambda _e: self._hide())
         self._attached = True
 
     def detach(self) -> None:
+        self._frame_timer.stop()
+        self._pending = self._last = None
+        self._series = []
         canvas = getattr(self._host.renderer, "canvas", None)
         try:
             if canvas is not None:
@@ -80,39 +133,106 @@ class GraphHoverTooltip(QObject):
         self._label = None
         self._attached = False
 
+    @staticmethod
+    def _frame_interval_ms() -> int:
+        screen = QGuiApplication.primaryScreen()
+        hz = screen.refreshRate() if screen is not None else 0.0
+        return max(1, int(1000.0 / (hz if hz and hz > 1.0 else _DEFAULT_REFRESH_HZ)))
+
+    # ------------------------------------------------------------------ index
+    def set_rendered(self, rendered: Optional[tuple]) -> None:
+        """Rebuild the hover index after a render. ``rendered`` is what ``GraphRenderer.render``
+        returned: (timestamps, x coords, upload, download) in bytes/sec for the network graph, which
+        is indexed directly; anything else (the hardware renders return None) falls back to one
+        snapshot of the labelled lines now on the figure."""
+        series: List[HoverSeries] = []
+        try:
+            if (self._host._current_stat == "network" and rendered is not None
+                    and len(rendered) == 4 and rendered[1] is not None):
+                _ts, xs, up, down = rendered
+                renderer = self._host.renderer
+                for lbl_key, lbl_default, line, fallback, ys in (
+                        ("DOWNLOAD_LABEL", "Download", getattr(renderer, "line_download", None),
+                         constants.graph.DOWNLOAD_LINE_COLOR, down),
+                        ("UPLOAD_LABEL", "Upload", getattr(renderer, "line_upload", None),
+                         constants.graph.UPLOAD_LINE_COLOR, up)):
+                    if ys is None:
+                        continue
+                    color = line.get_color() if line is not None else fallback
+                    s = HoverSeries.build(self._tr(lbl_key, lbl_default), color, xs, ys)
+                    if s is not None:
+                        series.append(s)
+            else:
+                for ax in getattr(self._host.renderer.figure, "axes", []):
+                    for line in ax.get_lines():
+                        lbl = line.get_label()
+                        if not lbl or lbl.startswith("_"):     # skip crosshairs / non-legend helper lines
+                            continue
+                        s = HoverSeries.build(str(lbl), line.get_color(),
+                                              mdates.date2num(line.get_xdata()) if self._is_dates(line)
+                                              else line.get_xdata(), line.get_ydata(), ax)
+                        if s is not None:
+                            series.append(s)
+        except Exception as e:
+            self.logger.debug("hover index rebuild failed: %s", e)
+            series = []
+        self._series = series
+        # A readout left on screen described the old data: refresh it at the same cursor position.
+        if self._last is not None and self._label is not None and self._label.isVisible():
+            self._pending = self._pending or self._last
+            if not self._frame_timer.isActive():
+                self._frame_timer.start()
+
+    @staticmethod
+    def _is_dates(line) -> bool:
+        xd = line.get_xdata()
+        return len(xd) > 0 and not isinstance(xd[0], (int, float, np.number))
+
+    def lookup(self, ax, xdata: float) -> Tuple[Optional[float], List[Tuple[str, float, str]]]:
+        """(nearest x, rows of (label, y, color)) for the cursor at ``xdata`` in ``ax`` - only series
+        with a sample within _MAX_SNAP_FRAC of the visible x-range contribute."""
+        xmin, xmax = ax.get_xlim()
+        span = (xmax - xmin) or 1.0
+        rows: List[Tuple[str, float, str]] = []
+        nearest_x = None
+        best_dx = None
+        for s in self._series:
+            if s.axes is not None and s.axes is not ax:
+                continue
+            idx, dx = s.nearest(xdata)
+            if dx > span * _MAX_SNAP_FRAC:          # cursor too far from this series' samples
+                continue
+            rows.append((s.label, float(s.y[idx]), s.color))
+            if best_dx is None or dx < best_dx:
+                best_dx, nearest_x = dx, float(s.x[idx])
+        return nearest_x, rows
+
     # ------------------------------------------------------------------ hover
     def _on_move(self, event) -> None:
+        """Record the cursor; the frame timer handles the latest position once per display frame."""
+        if event.inaxes is None or event.xdata is None or self._label is None:
+            self._pending = self._last = None
+            self._frame_timer.stop()
+            self._hide()
+            return
+        self._pending = (event.inaxes, float(event.xdata), float(event.x), float(event.y))
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _process_pending(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None or self._label is None:
+            return
+        ax, xdata, px, py = pending
+        self._last = pending
         try:
-            ax = event.inaxes
-            if ax is None or event.xdata is None or self._label is None:
-                self._hide()
-                return
-            xmin, xmax = ax.get_xlim()
-            span = (xmax - xmin) or 1.0
-            rows: List[Tuple[str, float, str]] = []   # (label, y, color)
-            nearest_x = None
-            best_dx = None
-            for line in ax.get_lines():
-                lbl = line.get_label()
-                if not lbl or lbl.startswith("_"):     # skip crosshairs / non-legend helper lines
-                    continue
-                xd = np.asarray(line.get_xdata(), dtype=float)
-                yd = np.asarray(line.get_ydata(), dtype=float)
-                if xd.size == 0 or yd.size != xd.size:
-                    continue
-                idx = int(np.argmin(np.abs(xd - event.xdata)))
-                dx = abs(xd[idx] - event.xdata)
-                if dx > span * _MAX_SNAP_FRAC:          # cursor too far from this line's samples
-                    continue
-                rows.append((str(lbl), float(yd[idx]), line.get_color()))
-                if best_dx is None or dx < best_dx:
-                    best_dx, nearest_x = dx, xd[idx]
+            nearest_x, rows = self.lookup(ax, xdata)
             if not rows or nearest_x is None:
                 self._hide()
                 return
             self._label.setText(self._format(nearest_x, rows))
             self._label.adjustSize()
-            self._place(event)
+            self._place(px, py)
             self._label.setVisible(True)
         except Exception as e:
             self.logger.debug("hover move skipped: %s", e)
@@ -135,20 +255,24 @@ class GraphHoverTooltip(QObject):
                             unit_type=cfg.get("unit_type", "bits_decimal"),
                             short_labels=cfg.get("short_unit_labels", False))
 
-    def _place(self, event) -> None:
+    def _place(self, px: float, py: float) -> None:
         """Position the label near the cursor (matplotlib pixels are bottom-left; Qt is top-left),
         flipping/clamping so it stays inside the canvas."""
         canvas = self._host.renderer.canvas
         cw, ch = canvas.width(), canvas.height()
         lw, lh = self._label.width(), self._label.height()
-        x = int(event.x) + 14
-        y = int(ch - event.y) - lh - 14
+        x = int(px) + 14
+        y = int(ch - py) - lh - 14
         if x + lw > cw:
-            x = int(event.x) - lw - 14
+            x = int(px) - lw - 14
         if y < 0:
-            y = int(ch - event.y) + 14
+            y = int(ch - py) + 14
         self._label.move(max(0, min(x, cw - lw)), max(0, min(y, ch - lh)))
 
     def _hide(self) -> None:
         if self._label is not None and self._label.isVisible():
             self._label.setVisible(False)
+
+    def _tr(self, key: str, default: str) -> str:
+        i18n = getattr(self._host, "i18n", None)
+        return str(getattr(i18n, key, default)) if i18n is not None else default
@@ -2,24 +2,23 @@
 HardwareBarList - the per-process CPU / RAM / GPU list for the Monitor's Hardware tab.
 
 One row per program: name, a CPU bar (relative to the busiest process so the heaviest reads clearly),
-and precise CPU% / Memory / GPU% figures. Rows are keyed by program identity and updated in place;
-ordering is by CPU% (busiest first) - like Task Manager, where the busy process leading the list is
-the point. Reuses the connection list's _ActivityBar; matplotlib-free.
+and precise CPU% / Memory / GPU% figures. Rows live in a KeyedRowModel painted by a delegate
+(views/monitor/keyed_list.py) and are diffed by program identity each tick, so with hundreds of
+processes only the rows whose figures moved repaint and a re-sort is expressed as row moves; ordering
+is by CPU% (busiest first) - like Task Manager, where the busy process leading the list is the point.
+Matplotlib-free.
 """
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFontMetrics
-from PyQt6.QtWidgets import (
-    QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
-)
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 
 from netspeedtray.utils import styles as su
 from netspeedtray.constants.styles import styles as tokens
 from netspeedtray.utils.helpers import format_data_size, format_decimal
-from netspeedtray.views.monitor.network.app_list import _ActivityBar
+from netspeedtray.views.monitor.keyed_list import BarRowDelegate, KeyedListView, KeyedRowModel, RowCells
 
 _NAME_W = 168
 _CPU_W = 50
@@ -36,79 +35,48 @@ def _is_busy(row: Dict[str, Any]) -> bool:
     return float(row.get("cpu_pct", 0.0)) >= _ACTIVE_CPU or float(row.get("gpu_pct", 0.0)) >= _ACTIVE_CPU
 
 
-class HardwareRow(QFrame):
-    """name | CPU bar | CPU% | Memory | GPU%."""
-
-    def __init__(self, i18n, parent: Optional[QWidget] = None) -> None:
-        super().__init__(parent)
-        self._i18n = i18n
-        c = su.semantic_colors()
-        lay = QHBoxLayout(self)
-        lay.setContentsMargins(8, 5, 8, 5)
-        lay.setSpacing(10)
+def _row_figures(row: Dict[str, Any], i18n, gpu_available: bool):
+    """(name, cpu, "RAM value", "RAM unit", gpu, cpu text, ram text, gpu text) for one row."""
+    name = str(row.get("display_name", "-"))
+    cpu = float(row.get("cpu_pct", 0.0))
+    gpu = float(row.get("gpu_pct", 0.0))
+    rv, ru = format_data_size(int(row.get("rss_bytes", 0)), i18n, precision=1)
+    rv_s = format_decimal(rv, i18n, 1)   # locale separator (matches the Overview/UsageTile)
+    gpu_text = f"{gpu:.0f}%" if (gpu_available and gpu >= _GPU_SHOW_MIN) else "-"
+    return name, cpu, rv_s, ru, gpu, f"{cpu:.0f}%", f"{rv_s} {ru}", gpu_text
 
-        self._name = QLabel("")
-        self._name.setFont(su.font(tokens.TYPE_BODY))
-        self._name.setFixedWidth(_NAME_W)
 
-        self._bar = _ActivityBar()
+def _row_summary(i18n, row: Dict[str, Any]) -> str:
+    name, cpu, rv_s, ru, gpu, *_ = _row_figures(row, i18n, True)
+    return f"{name} - CPU {cpu:.0f}% · RAM {rv_s} {ru} · GPU {gpu:.0f}%"
 
-        self._cpu = self._num(_CPU_W, c)
-        self._ram = self._num(_RAM_W, c)
-        self._gpu = self._num(_GPU_W, c)
 
-        lay.addWidget(self._name)
-        lay.addWidget(self._bar, 1)
-        lay.addWidget(self._cpu)
-        lay.addWidget(self._ram)
-        lay.addWidget(self._gpu)
-
-    def _num(self, width: int, c: dict) -> QLabel:
-        lbl = QLabel("-")
-        lbl.setFont(su.font(tokens.TYPE_BODY))
-        lbl.setFixedWidth(width)
-        lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        lbl.setStyleSheet(f"color: {c['text_secondary']}; background: transparent;")
-        return lbl
-
-    def update_row(self, row: Dict[str, Any], max_cpu: float, gpu_available: bool) -> None:
-        name = str(row.get("display_name", "-"))
-        cpu = float(row.get("cpu_pct", 0.0))
-        rss = int(row.get("rss_bytes", 0))
-        gpu = float(row.get("gpu_pct", 0.0))
-        busy = _is_busy(row)
+class _HardwareRowDelegate(BarRowDelegate):
+    """name | CPU bar | CPU% | Memory | GPU%."""
 
-        c = su.semantic_colors()
-        text = c["text_primary"] if busy else c["text_secondary"]
-        fm = QFontMetrics(self._name.font())
-        self._name.setText(fm.elidedText(name, Qt.TextElideMode.ElideRight, _NAME_W))
-        # Emphasise/recede the WHOLE row together (name + numbers), not just the name, so a busy row
-        # doesn't read as half-disabled. Re-resolved each tick -> picks up a theme switch.
-        for lbl in (self._name, self._cpu, self._ram, self._gpu):
-            lbl.setStyleSheet(f"color: {text}; background: transparent;")
+    def __init__(self, i18n, parent=None) -> None:
+        super().__init__(_NAME_W, (_CPU_W, _RAM_W, _GPU_W), spacing=10, parent=parent)
+        self._i18n = i18n
 
+    def cells(self, row: Dict[str, Any], context: Dict[str, Any]) -> RowCells:
+        name, cpu, _, _, _, cpu_t, ram_t, gpu_t = _row_figures(
+            row, self._i18n, bool(context.get("gpu_available", False)))
+        max_cpu = float(context.get("max_cpu", 0.0))
         # CPU bar is RELATIVE to the busiest process (the heavy hitter should lead) but the
         # denominator is floored so an idle desktop's small leader isn't drawn as a full bar; the
         # number column carries the absolute value.
-        self._bar.set_value((cpu / max(max_cpu, _BAR_FLOOR_PCT)) if max_cpu > 0 else 0.0, busy)
-        self._cpu.setText(f"{cpu:.0f}%")
-        rv, ru = format_data_size(rss, self._i18n, precision=1)
-        rv_s = format_decimal(rv, self._i18n, 1)   # locale separator (matches the Overview/UsageTile)
-        self._ram.setText(f"{rv_s} {ru}")
-        self._gpu.setText(f"{gpu:.0f}%" if (gpu_available and gpu >= _GPU_SHOW_MIN) else "-")
-
-        summary = f"{name} - CPU {cpu:.0f}% · RAM {rv_s} {ru} · GPU {gpu:.0f}%"
-        self.setToolTip(summary)
-        self.setAccessibleName(summary)   # tooltips aren't exposed to screen readers; accessible name is
+        frac = (cpu / max(max_cpu, _BAR_FLOOR_PCT)) if max_cpu > 0 else 0.0
+        # Emphasise/recede the WHOLE row together (name + numbers), not just the name, so a busy row
+        # doesn't read as half-disabled.
+        return RowCells(name, _is_busy(row), frac, (cpu_t, ram_t, gpu_t), numbers_follow_active=True)
 
 
 class HardwareBarList(QWidget):
-    """Header + summary + a scrollable, in-place-updated per-process CPU/RAM/GPU list."""
+    """Header + summary + a keyed, delegate-painted per-process CPU/RAM/GPU list."""
 
     def __init__(self, i18n, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._i18n = i18n
-        self._rows: Dict[str, HardwareRow] = {}
         c = su.semantic_colors()
 
         root = QVBoxLayout(self)
@@ -134,55 +102,33 @@ class HardwareBarList(QWidget):
         self._summary.setContentsMargins(8, 0, 8, 0)
         root.addWidget(self._summary)
 
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._content = QWidget()
-        self._list_layout = QVBoxLayout(self._content)
-        self._list_layout.setContentsMargins(0, 0, 0, 0)
-        self._list_layout.setSpacing(2)
-        self._list_layout.addStretch(1)
-        self._scroll.setWidget(self._content)
-        root.addWidget(self._scroll, 1)
+        self._model = KeyedRowModel(summary_fn=lambda row: _row_summary(self._i18n, row), parent=self)
+        self._delegate = _HardwareRowDelegate(i18n, self)
+        self._model.set_render_key(self._delegate.render_key)
+        self._view = KeyedListView()
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(self._delegate)
+        self._view.setAccessibleName(self._tr("APP_ACTIVITY_PROCESS_HEADER", "Process"))
+        root.addWidget(self._view, 1)
 
     def set_payload(self, payload: Dict[str, Any]) -> None:
         rows: List[Dict[str, Any]] = payload.get("rows", []) if isinstance(payload, dict) else []
         if not rows:
             self._summary.setText(self._tr("HARDWARE_NO_DATA_MESSAGE", "No process data."))
             return
-        gpu_available = bool(payload.get("gpu_available", False))
-        max_cpu = max((float(r.get("cpu_pct", 0.0)) for r in rows), default=0.0)
+        delta = payload.get("delta")
+        self._delegate.refresh_theme()   # once per tick -> picks up a theme switch
+        self._model.set_context(gpu_available=bool(payload.get("gpu_available", False)),
+                                max_cpu=max((float(r.get("cpu_pct", 0.0)) for r in rows), default=0.0))
 
         # Freeze the row ORDER while the pointer is over the list - CPU% is volatile, and a busiest-
         # first re-sort every 2s would slide the row you're reading out from under the cursor. Values
         # still update live in place; membership/order resettle on the next tick after the mouse leaves.
-        if self._scroll.viewport().underMouse():
-            for r in rows:
-                w = self._rows.get(str(r.get("identity_key", r.get("display_name", ""))))
-                if w is not None:
-                    w.update_row(r, max_cpu, gpu_available)
-            self._summary.setText(self._summary_text(payload))
-            return
-
-        seen = set()
-        ordered: List[HardwareRow] = []
-        for r in rows:
-            key = str(r.get("identity_key", r.get("display_name", "")))
-            seen.add(key)
-            w = self._rows.get(key)
-            if w is None:
-                w = HardwareRow(self._i18n)
-                self._rows[key] = w
-            w.update_row(r, max_cpu, gpu_available)
-            ordered.append(w)
-        for i in reversed(range(self._list_layout.count())):
-            if self._list_layout.itemAt(i).widget() is not None:
-                self._list_layout.takeAt(i)
-        for key in [k for k in self._rows if k not in seen]:
-            self._rows.pop(key).deleteLater()
-        for j, w in enumerate(ordered):
-            self._list_layout.insertWidget(j, w)
+        if self._view.viewport().underMouse():
+            self._model.update_values(rows, delta)
+        else:
+            self._model.apply(rows, delta)
         self._summary.setText(self._summary_text(payload))
 
     def set_unavailable(self, reason: str) -> None:
@@ -28,6 +28,8 @@ from typing import Any, Dict
 import psutil
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
+from netspeedtray.utils.row_delta import RowDeltaTracker
+
 try:
     import win32pdh
 except ImportError:  # pragma: no cover - non-Windows / missing pywin32
@@ -63,6 +65,7 @@ class HardwareActivityWorker(QObject):
         self._gpu_counter = None
         self._poll_count = 0
         self._uss_cache: Dict[str, int] = {}   # identity_key -> summed USS, refreshed every Nth poll
+        self._tracker = RowDeltaTracker()      # per-tick keyed delta for the Hardware tab's list
 
     @pyqtSlot()
     def sample(self) -> None:
@@ -133,11 +136,13 @@ class HardwareActivityWorker(QObject):
                     "gpu_pct": min(100.0, a["gpu"]),   # max-of-engines is already 0-100; clamp is belt-and-braces
                 })
             rows.sort(key=lambda r: (-r["cpu_pct"], -r["gpu_pct"], r["display_name"].casefold()))
+            rows, delta = self._tracker.commit(rows)   # unchanged programs keep last tick's row object
 
             total_cpu = min(100.0, sum(r["cpu_pct"] for r in rows))
             self.data_ready.emit({
                 "updated_at": datetime.now().strftime("%H:%M:%S"),
                 "rows": rows,
+                "delta": delta,
                 "proc_count": len(rows),
                 "total_cpu_pct": total_cpu,
                 "total_rss_bytes": sum(r["rss_bytes"] for r in rows),
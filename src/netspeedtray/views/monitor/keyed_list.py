@@ -0,0 +1,409 @@
+"""
+Keyed model/view plumbing for the Monitor's bar lists (Network tab apps, Hardware tab processes).
+
+The lists used to be one QFrame + three QLabels + a bar widget per row, and every 2 s tick detached all
+row widgets from the layout and re-inserted them - with hundreds of processes that relayout (and the
+per-row stylesheet re-parse) dominated the Monitor's frame time. Here a row is just a dict in a
+``KeyedRowModel``; ``apply()`` diffs the incoming ordered rows against what the view already has, by
+key, and tells Qt exactly what happened:
+
+* gone keys      -> ``beginRemoveRows`` (contiguous runs),
+* reordered keys -> ``beginMoveRows`` (one row at a time, so the view keeps scroll + hover),
+* new keys       -> ``beginInsertRows``,
+* changed rows   -> ``dataChanged`` over contiguous runs only.
+
+When the payload carries a ``delta`` from ``utils.row_delta`` that continues the sequence this model
+last applied, its ``changed`` list is trusted and unchanged rows are not even compared. A
+``BarRowDelegate`` paints a row (name, activity bar, fixed-width number columns) straight from the
+dict, so nothing per-row lives outside the model. Graph-free + matplotlib-free.
+
+A list-wide value (the busiest row's count / CPU%) moves nearly every tick. Repainting every row for it
+would undo the keyed diff, so the model asks the delegate's ``render_key`` what each row would paint and
+repaints only the rows whose output actually differs - usually the few near the top.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QRect, QRectF, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFontMetrics, QPainter
+from PyQt6.QtWidgets import QFrame, QListView, QStyle, QStyledItemDelegate
+
+from netspeedtray.utils import styles as su
+from netspeedtray.utils.row_delta import row_key
+from netspeedtray.constants.styles import styles as tokens
+
+KEY_ROLE = Qt.ItemDataRole.UserRole + 1
+ROW_ROLE = Qt.ItemDataRole.UserRole + 2
+SELECTED_ROLE = Qt.ItemDataRole.UserRole + 3
+
+
+def css_color(value: str) -> QColor:
+    """QColor from a design token - ``#RRGGBB`` or the CSS ``rgba(r, g, b, a)`` form the surface tokens
+    use (QColor's own parser doesn't accept it and would paint an opaque black overlay)."""
+    value = value.strip()
+    if value.startswith("rgba(") and value.endswith(")"):
+        try:
+            r, g, b, a = (part.strip() for part in value[5:-1].split(","))
+            return QColor(int(r), int(g), int(b), round(float(a) * 255))
+        except ValueError:
+            return QColor(Qt.GlobalColor.transparent)
+    return QColor(value)
+
+
+def paint_activity_bar(p: QPainter, rect: QRect, frac: float, active: bool, colors: Dict[str, str]) -> None:
+    """A rounded track + fill sized to a 0..1 fraction; accent when active, muted when idle."""
+    h = min(rect.height(), 8)
+    y = rect.top() + (rect.height() - h) / 2.0
+    r = h / 2.0
+    p.setPen(Qt.PenStyle.NoPen)
+    p.setBrush(QColor(colors["card_stroke"]))
+    p.drawRoundedRect(QRectF(rect.left(), int(y), rect.width(), h), r, r)
+    fill_w = int(rect.width() * max(0.0, min(1.0, frac)))
+    if fill_w > 0:
+        # Solid muted fill for idle (an alpha override washed it out on the light track); floor at
+        # 4px (not a full-height circle) so small counts stay distinguishable.
+        p.setBrush(QColor(colors["accent"]) if active else QColor(colors["text_secondary"]))
+        p.drawRoundedRect(QRectF(rect.left(), int(y), max(fill_w, 4), h), r, r)
+
+
+class KeyedRowModel(QAbstractListModel):
+    """An ordered list of row dicts addressed by ``identity_key``, updated by keyed diff."""
+
+    def __init__(self, summary_fn: Optional[Callable[[Dict[str, Any]], str]] = None, parent=None) -> None:
+        super().__init__(parent)
+        self._keys: List[str] = []
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._summary_fn = summary_fn
+        self._selected: Optional[str] = None
+        self._seq: Optional[int] = None          # last applied delta seq (None = no trusted baseline)
+        self.context: Dict[str, Any] = {}        # list-wide values the delegate reads (max, flags)
+        self._render_key: Optional[Callable[[Dict[str, Any], Dict[str, Any]], Any]] = None
+        self.last_stats: Dict[str, int] = {}
+
+    # --- QAbstractListModel ----------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._keys)):
+            return None
+        key = self._keys[index.row()]
+        row = self._rows[key]
+        if role == ROW_ROLE:
+            return row
+        if role == KEY_ROLE:
+            return key
+        if role == SELECTED_ROLE:
+            return key == self._selected
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(row.get("display_name", "-"))
+        if role in (Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.AccessibleTextRole):
+            # Qt does NOT expose a tooltip to screen readers, so the accessible text carries the same
+            # summary - otherwise an assistive reader announces only the bare name.
+            return self._summary_fn(row) if self._summary_fn is not None else None
+        return None
+
+    # --- lookups ---------------------------------------------------------------------------------
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def row(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._rows.get(key)
+
+    def index_of(self, key: Optional[str]) -> QModelIndex:
+        try:
+            return self.index(self._keys.index(key), 0) if key is not None else QModelIndex()
+        except ValueError:
+            return QModelIndex()
+
+    # --- list-wide state -------------------------------------------------------------------------
+    def set_context(self, **values: Any) -> None:
+        """Update values every row's painting depends on (e.g. the busiest row's count). Nothing repaints
+        if no value changed; with a ``render_key`` only rows whose painted output changed repaint,
+        without one every row does."""
+        if all(self.context.get(k) == v for k, v in values.items()):
+            return
+        if self._render_key is None:
+            self.context.update(values)
+            if self._keys:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(self._keys) - 1, 0))
+            return
+        before = [self._render_key(self._rows[k], self.context) for k in self._keys]
+        self.context.update(values)
+        dirty = [i for i, k in enumerate(self._keys) if self._render_key(self._rows[k], self.context) != before[i]]
+        for first, last in _runs(dirty):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0))
+
+    def set_render_key(self, fn: Optional[Callable[[Dict[str, Any], Dict[str, Any]], Any]]) -> None:
+        """``fn(row, context)`` -> a comparable value that changes whenever the row's painting would
+        (``BarRowDelegate.render_key``); lets ``set_context`` skip rows a context change leaves alone."""
+        self._render_key = fn
+
+    def set_selected_key(self, key: Optional[str]) -> None:
+        old, self._selected = self._selected, key
+        if old == key:
+            return
+        for k in (old, key):
+            idx = self.index_of(k)
+            if idx.isValid():
+                self.dataChanged.emit(idx, idx, [SELECTED_ROLE])
+
+    def selected_key(self) -> Optional[str]:
+        return self._selected
+
+    # --- keyed diff ------------------------------------------------------------------------------
+    def apply(self, rows: Sequence[Dict[str, Any]], delta: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+        """Make the model hold ``rows`` in this order, emitting the minimal set of change signals."""
+        incoming: Dict[str, Dict[str, Any]] = {}
+        order: List[str] = []
+        for r in rows:
+            k = row_key(r)
+            if k not in incoming:
+                incoming[k] = r
+                order.append(k)
+        trusted = self._trusted_changes(delta)
+        stats = {"removed": 0, "moved": 0, "inserted": 0, "changed": 0}
+
+        # 1. removals, back to front, as contiguous runs
+        gone = [i for i, k in enumerate(self._keys) if k not in incoming]
+        for first, last in reversed(list(_runs(gone))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for k in self._keys[first:last + 1]:
+                self._rows.pop(k, None)
+            del self._keys[first:last + 1]
+            self.endRemoveRows()
+            stats["removed"] += last - first + 1
+
+        # 2. moves + inserts, front to back: position ``target`` is final once visited
+        inserted: Set[str] = set()
+        pos = {k: i for i, k in enumerate(self._keys)}
+        for target, key in enumerate(order):
+            if target < len(self._keys) and self._keys[target] == key:
+                continue
+            cur = pos.get(key)
+            if cur is not None:
+                cur = self._keys.index(key, target)      # positions >= target shift as we go
+                self.beginMoveRows(QModelIndex(), cur, cur, QModelIndex(), target)
+                self._keys.insert(target, self._keys.pop(cur))
+                self.endMoveRows()
+                stats["moved"] += 1
+            else:
+                self.beginInsertRows(QModelIndex(), target, target)
+                self._keys.insert(target, key)
+                self._rows[key] = incoming[key]
+                self.endInsertRows()
+                inserted.add(key)
+                stats["inserted"] += 1
+
+        # 3. value changes, as contiguous dataChanged runs
+        dirty: List[int] = []
+        for i, key in enumerate(self._keys):
+            new = incoming[key]
+            if key in inserted:
+                continue
+            old = self._rows.get(key)
+            if trusted is not None:
+                is_changed = key in trusted
+            else:
+                is_changed = old is not new and old != new
+            self._rows[key] = new
+            if is_changed:
+                dirty.append(i)
+        for first, last in _runs(dirty):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0))
+        stats["changed"] = len(dirty)
+
+        self._seq = delta.get("seq") if isinstance(delta, dict) else None
+        self.last_stats = stats
+        return stats
+
+    def update_values(self, rows: Iterable[Dict[str, Any]], delta: Optional[Dict[str, Any]] = None) -> int:
+        """Refresh existing rows in place without adding, removing or reordering any (used while the
+        pointer is over a list so nothing slides under it). Returns the number of rows repainted."""
+        trusted = self._trusted_changes(delta)
+        dirty: List[int] = []
+        pos = {k: i for i, k in enumerate(self._keys)}
+        for r in rows:
+            key = row_key(r)
+            i = pos.get(key)
+            if i is None:
+                continue
+            old = self._rows[key]
+            changed = (key in trusted) if trusted is not None else (old is not r and old != r)
+            self._rows[key] = r
+            if changed:
+                dirty.append(i)
+        for first, last in _runs(sorted(dirty)):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0))
+        self._seq = delta.get("seq") if isinstance(delta, dict) else None
+        return len(dirty)
+
+    def clear(self) -> None:
+        if self._keys:
+            self.beginResetModel()
+            self._keys.clear()
+            self._rows.clear()
+            self.endResetModel()
+        self._seq = None
+
+    def _trusted_changes(self, delta: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        """The delta's changed keys if it continues the sequence this model last applied, else None."""
+        if not isinstance(delta, dict) or self._seq is None or delta.get("base") != self._seq:
+            return None
+        return set(delta.get("changed", ()))
+
+
+def _runs(indices: Sequence[int]):
+    """Yield (first, last) for each run of consecutive integers in ascending ``indices``."""
+    start = prev = None
+    for i in indices:
+        if start is None:
+            start = prev = i
+        elif i == prev + 1:
+            prev = i
+        else:
+            yield start, prev
+            start = prev = i
+    if start is not None:
+        yield start, prev
+
+
+class RowCells(NamedTuple):
+    """What a bar-list row shows: name, whether it's emphasised, its bar and right-aligned numbers."""
+    name: str
+    active: bool
+    frac: float
+    numbers: Sequence[str]
+    numbers_follow_active: bool = False   # dim the numbers with the name (Hardware) or keep them muted
+
+
+class BarRowDelegate(QStyledItemDelegate):
+    """Paints ``name | activity bar | numbers...`` for one row dict; subclasses supply ``cells()``.
+
+    Colours and the body font are resolved once per tick (``refresh_theme``) rather than per row paint:
+    ``semantic_colors()`` reads the registry, and a full repaint touches every visible row."""
+
+    MARGIN_X = 8
+    MARGIN_Y = 5
+
+    def __init__(self, name_width: int, number_widths: Sequence[int], spacing: int, parent=None) -> None:
+        super().__init__(parent)
+        self.name_width = name_width
+        self.number_widths = tuple(number_widths)
+        self.spacing = spacing
+        self._font = su.font(tokens.TYPE_BODY)
+        self._fm = QFontMetrics(self._font)
+        self._colors: Dict[str, str] = {}
+        self._bar_width: Optional[int] = None    # last painted bar track width (uniform across rows)
+        self.refresh_theme()
+
+    def refresh_theme(self) -> None:
+        self._colors = su.semantic_colors()
+
+    def cells(self, row: Dict[str, Any], context: Dict[str, Any]) -> RowCells:
+        raise NotImplementedError
+
+    def render_key(self, row: Dict[str, Any], context: Dict[str, Any]) -> RowCells:
+        """The row's cells with the bar reduced to its painted fill width, so a scale change that moves a
+        bar by less than a pixel compares equal. Before the first paint the fraction is compared as is."""
+        cells = self.cells(row, context)
+        if self._bar_width is None:
+            return cells
+        return cells._replace(frac=int(self._bar_width * max(0.0, min(1.0, cells.frac))))
+
+    def sizeHint(self, option, index) -> QSize:  # noqa: N802
+        width = (2 * self.MARGIN_X + self.name_width + sum(self.number_widths)
+                 + self.spacing * (len(self.number_widths) + 1) + 40)
+        return QSize(width, max(self._fm.height(), 8) + 2 * self.MARGIN_Y)
+
+    def paint(self, p: QPainter, option, index: QModelIndex) -> None:
+        row = index.data(ROW_ROLE)
+        if row is None:
+            return
+        cells = self.cells(row, index.model().context)
+        c = self._colors
+        state = option.state
+        selected = bool(index.data(SELECTED_ROLE))
+        hover = bool(state & QStyle.StateFlag.State_MouseOver)
+        focus = bool(state & QStyle.StateFlag.State_HasFocus)
+        rect = option.rect
+        direction = option.direction
+
+        def visual(r: QRect) -> QRect:
+            return QStyle.visualRect(direction, rect, r)
+
+        p.save()
+        try:
+            p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            # Selected row gets a subtle fill + a left accent stripe; hover a lighter fill so the whole
+            # list reads as clickable; keyboard focus looks like selection.
+            if selected or hover or focus:
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(css_color(c["subtle_fill"]))
+                p.drawRoundedRect(QRectF(rect), tokens.RADIUS_CONTROL, tokens.RADIUS_CONTROL)
+            if selected or focus:
+                p.fillRect(visual(QRect(rect.left(), rect.top(), 2, rect.height())), QColor(c["accent"]))
+
+            inner = rect.adjusted(self.MARGIN_X, self.MARGIN_Y, -self.MARGIN_X, -self.MARGIN_Y)
+            p.setFont(self._font)
+            primary, secondary = QColor(c["text_primary"]), QColor(c["text_secondary"])
+            name_color = primary if cells.active else secondary
+            num_color = name_color if cells.numbers_follow_active else secondary
+
+            name_rect = QRect(inner.left(), inner.top(), self.name_width, inner.height())
+            p.setPen(name_color)
+            p.drawText(visual(name_rect), int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeading),
+                       self._fm.elidedText(cells.name, Qt.TextElideMode.ElideRight, self.name_width))
+
+            right = inner.right() + 1
+            p.setPen(num_color)
+            for width, text in reversed(list(zip(self.number_widths, cells.numbers))):
+                num_rect = QRect(right - width, inner.top(), width, inner.height())
+                p.drawText(visual(num_rect), int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignTrailing), text)
+                right -= width + self.spacing
+
+            bar_left = name_rect.right() + 1 + self.spacing
+            self._bar_width = max(0, right - bar_left)
+            if right > bar_left:
+                paint_activity_bar(p, visual(QRect(bar_left, inner.top(), right - bar_left, inner.height())),
+                                   cells.frac, cells.active, c)
+        finally:
+            p.restore()
+
+
+class KeyedListView(QListView):
+    """A calm, frameless list of delegate-painted rows. Press (mouse) or Enter/Space (keyboard) on a
+    row emits ``row_activated`` with its key - the rows are the tabs' primary control, so they must be
+    operable without a mouse."""
+
+    row_activated = pyqtSignal(str)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)                 # hover highlight
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)   # the owner pins its own selection
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setSpacing(1)
+        self.setStyleSheet("QListView { background: transparent; }")
+        self.viewport().setAutoFillBackground(False)
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        super().mousePressEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton:
+            index = self.indexAt(event.position().toPoint())
+            if index.isValid():
+                self.setCurrentIndex(index)
+                self.row_activated.emit(str(index.data(KEY_ROLE)))
+
+    def keyPressEvent(self, event) -> None:  # noqa: N802
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Space):
+            index = self.currentIndex()
+            if index.isValid():
+                self.row_activated.emit(str(index.data(KEY_ROLE)))
+                event.accept()
+                return
+        super().keyPressEvent(event)
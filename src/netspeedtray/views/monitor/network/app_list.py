@@ -3,11 +3,15 @@ AppBarList - the per-app connection list for the Monitor's Network tab.
 
 Renders the AppActivityWorker's honest payload (live connections per app, never estimated bytes) as
 a calm bar list: one row per app, an activity bar sized (log scale) to its share of live
-connections, active apps in the accent color and idle apps muted. Rows are keyed by app identity
-and reused across ticks (no flicker); ordering is stable (selected-first, then active-first, then by
-name), so a row only moves when its active/idle state actually flips - never because its connection
-count jittered. The selected row is pinned to the top so its highlight (and the detail panel reading
-it) never slides out from under the user when its active/idle state flips.
+connections, active apps in the accent color and idle apps muted. The list is a KeyedRowModel +
+delegate (views/monitor/keyed_list.py): each tick is diffed by app identity, so only apps whose
+numbers changed repaint and a reorder is a row move, not a relayout of every row widget. Ordering is
+stable (selected-first, then active-first, then by name), so a row only moves when its active/idle
+state actually flips - never because its connection count jittered. The selected row is pinned to the
+top so its highlight (and the detail panel reading it) never slides out from under the user when its
+active/idle state flips.
+
+AppRow (a standalone row widget) remains for the Overview's fixed five-row Busiest Apps card.
 
 Graph-free + matplotlib-free.
 """
@@ -17,13 +21,17 @@ import math
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QFontMetrics
+from PyQt6.QtGui import QPainter, QFontMetrics
 from PyQt6.QtWidgets import (
-    QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QSizePolicy,
+    QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy,
 )
 
 from netspeedtray.utils import styles as su
+from netspeedtray.utils.row_delta import row_key as _row_key
 from netspeedtray.constants.styles import styles as tokens
+from netspeedtray.views.monitor.keyed_list import (
+    BarRowDelegate, KeyedListView, KeyedRowModel, RowCells, paint_activity_bar,
+)
 
 _NAME_W = 180
 _COUNT_W = 64
@@ -36,8 +44,17 @@ def _is_active(row: Dict[str, Any]) -> bool:
     return int(row.get("established_count", 0)) > 0 or int(row.get("host_count", 0)) > 0
 
 
-def _row_key(row: Dict[str, Any]) -> str:
-    return str(row.get("identity_key", row.get("display_name", "")))
+def _bar_fraction(conn: int, max_conn: int) -> float:
+    # Perceptual (log) scale, not linear: one system process (svchost, 70-300+ conns) would
+    # otherwise squash every user app's bar to a stub. log1p keeps small counts differentiated.
+    return (math.log1p(conn) / math.log1p(max_conn)) if max_conn > 0 else 0.0
+
+
+def _row_summary(i18n, row: Dict[str, Any]) -> str:
+    tmpl = str(getattr(i18n, "APP_ROW_TOOLTIP", "{name} - {conn} connections, {active} active, {hosts} hosts")) \
+        if i18n is not None else "{name} - {conn} connections, {active} active, {hosts} hosts"
+    return tmpl.format(name=str(row.get("display_name", "-")), conn=int(row.get("conn_count", 0)),
+                       active=int(row.get("established_count", 0)), hosts=int(row.get("host_count", 0)))
 
 
 class _ActivityBar(QWidget):
@@ -56,24 +73,10 @@ class _ActivityBar(QWidget):
         self.update()
 
     def paintEvent(self, event) -> None:  # noqa: N802
-        c = su.semantic_colors()
-        h = min(self.height(), 8)
-        y = (self.height() - h) / 2.0
-        r = h / 2.0
         p = QPainter(self)
         try:
             p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-            p.setPen(Qt.PenStyle.NoPen)
-            track = QColor(c["card_stroke"])
-            p.setBrush(track)
-            p.drawRoundedRect(0, int(y), self.width(), h, r, r)
-            fill_w = int(self.width() * self._frac)
-            if fill_w > 0:
-                # Solid muted fill for idle (an alpha override washed it out on the light track);
-                # floor at 4px (not a full-height circle) so small counts stay distinguishable.
-                fill = QColor(c["accent"]) if self._active else QColor(c["text_secondary"])
-                p.setBrush(fill)
-                p.drawRoundedRect(0, int(y), max(fill_w, 4), h, r, r)
+            paint_activity_bar(p, self.rect(), self._frac, self._active, su.semantic_colors())
         finally:
             p.end()
 
@@ -155,14 +158,10 @@ class AppRow(QFrame):
         self._key = str(row.get("identity_key", row.get("display_name", "")))
         name = str(row.get("display_name", "-"))
         conn = int(row.get("conn_count", 0))
-        est = int(row.get("established_count", 0))
-        hosts = int(row.get("host_count", 0))
         active = _is_active(row)
         self._active = active
 
-        # Perceptual (log) scale, not linear: one system process (svchost, 70-300+ conns) would
-        # otherwise squash every user app's bar to a stub. log1p keeps small counts differentiated.
-        frac = (math.log1p(conn) / math.log1p(max_conn)) if max_conn > 0 else 0.0
+        frac = _bar_fraction(conn, max_conn)
 
         fm = QFontMetrics(self._name.font())
         self._name.setText(fm.elidedText(name, Qt.TextElideMode.ElideRight, _NAME_W))
@@ -176,8 +175,7 @@ class AppRow(QFrame):
         self._apply_row_style()   # keep selection/hover styling fresh across theme changes
         # Qt does NOT expose a tooltip to screen readers, so also set the accessible name from the same
         # content - otherwise an assistive reader announces a blank frame for the tab's primary control.
-        summary = self._tr("APP_ROW_TOOLTIP", "{name} - {conn} connections, {active} active, {hosts} hosts") \
-            .format(name=name, conn=conn, active=est, hosts=hosts)
+        summary = _row_summary(self._i18n, row)
         self.setToolTip(summary)
         self.setAccessibleName(summary)
 
@@ -185,8 +183,21 @@ class AppRow(QFrame):
         return str(getattr(self._i18n, key, default)) if self._i18n is not None else default
 
 
+class _AppRowDelegate(BarRowDelegate):
+    """name | log-scaled connection bar | live-connection count."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(_NAME_W, (_COUNT_W,), spacing=12, parent=parent)
+
+    def cells(self, row: Dict[str, Any], context: Dict[str, Any]) -> RowCells:
+        conn = int(row.get("conn_count", 0))
+        active = _is_active(row)
+        return RowCells(str(row.get("display_name", "-")), active,
+                        _bar_fraction(conn, int(context.get("max_conn", 0))), (str(conn),))
+
+
 class AppBarList(QWidget):
-    """Header + summary + a scrollable, in-place-updated list of per-app activity rows. Rows are
+    """Header + summary + a keyed, delegate-painted list of per-app activity rows. Rows are
     clickable; the currently-selected app's identity_key is surfaced via ``row_selected`` so an
     owning view (the Monitor's Network tab) can show that app's connection detail."""
 
@@ -195,8 +206,6 @@ class AppBarList(QWidget):
     def __init__(self, i18n, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._i18n = i18n
-        self._rows: Dict[str, AppRow] = {}
-        self._row_data: Dict[str, Dict[str, Any]] = {}   # latest payload row per identity_key
         self._selected_key: Optional[str] = None
         self._scroll_pending = False   # one-shot: bring a freshly-selected row into view after relayout
         c = su.semantic_colors()
@@ -225,63 +234,43 @@ class AppBarList(QWidget):
         self._summary.setContentsMargins(8, 0, 8, 0)
         root.addWidget(self._summary)
 
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setFrameShape(QFrame.Shape.NoFrame)
+        self._model = KeyedRowModel(summary_fn=lambda row: _row_summary(self._i18n, row), parent=self)
+        self._delegate = _AppRowDelegate(self)
+        self._model.set_render_key(self._delegate.render_key)
+        self._view = KeyedListView()
         # AsNeeded (not AlwaysOff): the tab pins a min width, but if the user still drags the
         # master-detail handle narrow, recover the fixed count column by scrolling vs silent clipping.
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self._content = QWidget()
-        self._list_layout = QVBoxLayout(self._content)
-        self._list_layout.setContentsMargins(0, 0, 0, 0)
-        self._list_layout.setSpacing(2)
-        self._list_layout.addStretch(1)   # single trailing stretch, kept across refreshes
-        self._scroll.setWidget(self._content)
-        root.addWidget(self._scroll, 1)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(self._delegate)
+        self._view.setAccessibleName(self._tr("APP_ACTIVITY_PROCESS_HEADER", "Process"))
+        self._view.row_activated.connect(self._on_row_clicked)
+        root.addWidget(self._view, 1)
 
     # --- inputs -----------------------------------------------------------------
     def set_payload(self, payload: Dict[str, Any]) -> None:
         rows: List[Dict[str, Any]] = payload.get("rows", []) if isinstance(payload, dict) else []
-        # Refresh the keyed data store (used by the detail panel to re-read the selected app live).
-        self._row_data = {_row_key(r): r for r in rows}
+        delta = payload.get("delta") if isinstance(payload, dict) else None
         sel = self._selected_key
-        max_conn = max((int(r.get("conn_count", 0)) for r in rows), default=0)
         if rows:
             # STABLE order: selected-first (so the highlighted/detail row never slides), then
             # active-first, then by name - NOT by the second-to-second-jittery conn_count.
             rows = sorted(rows, key=lambda r: (0 if _row_key(r) == sel else 1,
                                                0 if _is_active(r) else 1,
                                                str(r.get("display_name", "")).casefold()))
-        seen = set()
-        ordered: List[AppRow] = []
-        for r in rows:
-            key = _row_key(r)
-            seen.add(key)
-            w = self._rows.get(key)
-            if w is None:
-                w = AppRow(self._i18n)
-                w.clicked.connect(self._on_row_clicked)
-                self._rows[key] = w
-            w.update_row(r, max_conn)
-            w.set_selected(key == sel)
-            ordered.append(w)
-        # Relayout: detach only the row widgets (keep the single trailing stretch), prune gone rows
-        # (an EMPTY payload prunes them all - no stale last-seen apps linger), re-insert before the
-        # stretch so no QSpacerItem is leaked per tick.
-        for i in reversed(range(self._list_layout.count())):
-            if self._list_layout.itemAt(i).widget() is not None:
-                self._list_layout.takeAt(i)
-        for key in [k for k in self._rows if k not in seen]:
-            self._rows.pop(key).deleteLater()
-        for j, w in enumerate(ordered):
-            self._list_layout.insertWidget(j, w)
+        # Re-resolve colors once per tick so a mid-session light/dark switch is picked up.
+        self._delegate.refresh_theme()
+        self._model.set_context(max_conn=max((int(r.get("conn_count", 0)) for r in rows), default=0))
+        # Keyed diff: gone apps are removed (an EMPTY payload prunes them all - no stale last-seen
+        # apps linger), reorders become row moves, and only apps whose numbers changed repaint.
+        self._model.apply(rows, delta)
         self._summary.setText(self._summary_text(payload, rows) if rows else self._empty_text(payload))
         # One-shot after a fresh click: bring the now-pinned selected row into view (without yanking
         # the scroll back every 2 s tick if the user has since scrolled away to browse other apps).
         if self._scroll_pending:
-            w = self._rows.get(sel) if sel else None
-            if w is not None:
-                self._scroll.ensureWidgetVisible(w)
+            idx = self._model.index_of(sel)
+            if idx.isValid():
+                self._view.scrollTo(idx)
             self._scroll_pending = False
 
     def _empty_text(self, payload: Dict[str, Any]) -> str:
@@ -294,21 +283,19 @@ class AppBarList(QWidget):
     def _on_row_clicked(self, key: str) -> None:
         self._selected_key = key
         self._scroll_pending = True   # next relayout pins this row to the top + scrolls it into view
-        for k, w in self._rows.items():
-            w.set_selected(k == key)
+        self._model.set_selected_key(key)
         self.row_selected.emit(key)
 
     def get_row(self, key: str) -> Optional[Dict[str, Any]]:
         """The latest payload data for ``key`` (None once the app drops off the list)."""
-        return self._row_data.get(key)
+        return self._model.row(key)
 
     def selected_key(self) -> Optional[str]:
         return self._selected_key
 
     def clear_selection(self) -> None:
         self._selected_key = None
-        for w in self._rows.values():
-            w.set_selected(False)
+        self._model.set_selected_key(None)
 
     def set_unavailable(self, reason: str) -> None:
         if reason == "rdp":
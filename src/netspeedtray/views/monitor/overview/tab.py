@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import logging
 from collections import deque
-from typing import Any, Deque, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 from datetime import datetime, timedelta
 
@@ -29,10 +29,12 @@ from netspeedtray.utils import styles as su
 from netspeedtray.constants.styles import styles as tokens
 from netspeedtray.utils.helpers import format_speed, format_data_size, format_duration_short
 from netspeedtray.utils.widget_paint import WidgetMetrics   # reuse its Mbps→bytes/sec converter (DRY)
-# NOTE: `summaries` imports numpy at module scope. To honor the Monitor's import firewall (a glance at
-# the default Overview must not eagerly pull the heavy compute deps), it is imported LAZILY inside
-# _reload_window - the one place it's used - NOT here. Keep it that way.
-from netspeedtray.views.monitor.overview.tiles import StatTile, UsageTile, NetworkHero, dynamic_range
+# NOTE: `summaries` is only used by the window snapshot, so it is imported LAZILY there, NOT here. Its numpy
+# is itself a registered deferred import (utils.lazy_import), but keeping the module off this import path
+# too means a glance at the default Overview never touches the compute layer. Keep it that way.
+from netspeedtray.views.monitor.overview.tiles import (
+    StatTile, UsageTile, NetworkHero, SlidingRange, dynamic_range, fit_range,
+)
 from netspeedtray.views.monitor.overview.busiest_apps import BusiestAppsCard
 from netspeedtray.views.monitor.timeline_selector import TimelineSelector
 # stats_detail imports `summaries` (-> numpy). It's only needed when the user opens the detail sheet or
@@ -57,14 +59,91 @@ _HISTORY_MS = 6000        # DB window reload (sparklines + avg/peak) - cheap, of
 _NARROW_BP = 760          # below this content width: reflow to the compact layout (2×2 tiles, stacked cards)
 
 
+def period_window(main_widget, key: str, now: Optional[datetime] = None):
+    """(start, end, is_session) of the Overview window for the period ``key``."""
+    hp = constants.data.history_period
+    now = now or datetime.now()
+    session_start = getattr(main_widget, "session_start_time", None)
+    ws = getattr(main_widget, "widget_state", None)
+    earliest = None
+    if key in ("TIMELINE_ALL", "TIMELINE_SYSTEM_UPTIME") and ws is not None:
+        try:
+            earliest = ws.get_earliest_data_timestamp()
+        except Exception:
+            earliest = None
+    start = hp.get_start_time(key, now, session_start, None, earliest)
+    if start is None:
+        start = now - timedelta(hours=24)
+    return start, now, (key == "TIMELINE_SESSION")
+
+
+def load_window_snapshot(ws, start: datetime, end: datetime, poll: float, latency_enabled: bool,
+                         cancelled: Optional[Callable[[], bool]] = None) -> Optional[Dict[str, Any]]:
+    """Everything a DB-backed Overview window shows - sparkline series, their ranges + the network
+    peak, the window summaries and the outage log - read in one go. Pure reads, so it runs on the GUI
+    thread (_reload_window) as well as on the Monitor's prefetch thread; there ``cancelled`` is checked
+    between the reads and a cancelled load returns None."""
+    # Safe on the GUI thread: history reads never wait on the DB worker (unflushed samples come from
+    # the read-your-writes overlay).
+    net = ws.get_speed_history(start, end, None, resolution='auto')
+    series: Dict[str, Any] = {"down": [r[2] for r in net], "up": [r[1] for r in net]}
+    for key in ("cpu", "gpu", "ram"):
+        if cancelled is not None and cancelled():
+            return None
+        # Only the values are drawn: read them as columns (no datetime/tuple per bin).
+        series[key] = ws.get_hardware_history_arrays(key, start, end)[1].tolist()
+    return _complete_snapshot(ws, series, start, end, poll, latency_enabled, cancelled)
+
+
+def _complete_snapshot(ws, series: Dict[str, Any], start: datetime, end: datetime, poll: float,
+                       latency_enabled: bool, cancelled: Optional[Callable[[], bool]] = None) -> Optional[Dict[str, Any]]:
+    """The snapshot for ``series`` (DB or Session): ranges, peak, summaries and the outage log."""
+    win_summ: Dict[str, Any] = {}
+    for name, read in (("down", lambda: ws.summarize_network("download", start, end, None, poll)),
+                       ("up", lambda: ws.summarize_network("upload", start, end, None, poll)),
+                       ("cpu", lambda: ws.summarize_hardware("cpu", start, end, poll)),
+                       ("gpu", lambda: ws.summarize_hardware("gpu", start, end, poll)),
+                       ("ram", lambda: ws.summarize_hardware("ram", start, end, poll))):
+        if cancelled is not None and cancelled():
+            return None
+        win_summ[name] = read()
+    # Connection-drop events over the window (from the persisted gateway-timeout series), so a latency
+    # blip you missed live is still counted. Cheap; off the 1 Hz path.
+    latency_events: Dict[str, Any] = {}
+    if latency_enabled:
+        from netspeedtray.utils import summaries as S   # lazy: keeps numpy off the import path
+        latency_events = S.outage_summary_arrays(*ws.get_hardware_history_arrays("latency_gw_timeout", start, end))
+    return {
+        "series": series,
+        "ranges": {k: dynamic_range(series.get(k, [])) for k in ("cpu", "gpu", "ram")},
+        "net_peak": max(max(series.get("down", []), default=0.0), max(series.get("up", []), default=0.0)),
+        "win_summ": win_summ,
+        "latency_events": latency_events,
+    }
+
+
+def prefetch_job(main_widget, config: Dict[str, Any], key: str):
+    """The Monitor prefetcher's job for the Overview at period ``key`` (see views/monitor/prefetch.py):
+    the window snapshot, under ("overview", key). None for Session (in-memory) or with no data source."""
+    ws = getattr(main_widget, "widget_state", None)
+    if ws is None or key == "TIMELINE_SESSION":
+        return None
+    start, end, _ = period_window(main_widget, key)
+    poll = float(config.get("update_rate", 1.0) or 1.0)
+    latency = bool(config.get("latency_enabled", True))
+    return ("overview", key), (lambda cancelled: load_window_snapshot(ws, start, end, poll, latency, cancelled))
+
+
 class OverviewTab(QWidget):
     """Overview tab content - the control center. Matplotlib-free by contract."""
 
     stat_type = "overview"
 
-    def __init__(self, main_widget, config: Dict[str, Any], i18n, parent: Optional[QWidget] = None) -> None:
+    def __init__(self, main_widget, config: Dict[str, Any], i18n, parent: Optional[QWidget] = None,
+                 prefetcher=None) -> None:
         super().__init__(parent)
         self._main_widget = main_widget
+        self._prefetcher = prefetcher   # the Monitor's IdlePrefetcher (its cache + cancel), if any
         self._config = config
         self._i18n = i18n
         self.logger = logging.getLogger("NetSpeedTray.OverviewTab")
@@ -72,6 +151,7 @@ class OverviewTab(QWidget):
         # RAM/VRAM have no WidgetState history deque, so the tab keeps its own rolling buffer.
         self._ram_series: Deque[float] = deque(maxlen=120)
         self._vram_series: Deque[float] = deque(maxlen=120)
+        self._vram_range = SlidingRange(120)    # the VRAM buffer's min/max, kept as samples arrive
 
         dark = su.is_dark_mode()
 
@@ -84,6 +164,10 @@ class OverviewTab(QWidget):
         self._period_index = int(config.get("history_period_slider_value", 2) or 2)
         self._series: Dict[str, Any] = {}     # latest per-metric sparkline series for the active window
         self._win_summ: Dict[str, Any] = {}   # latest per-metric WindowSummary for the active window
+        # Per-series stats the 1 Hz render needs but that only change when the series do: each hardware
+        # tile's dynamic_range window and the network peak. Filled by _reload_window, not per tick.
+        self._ranges: Dict[str, Tuple[float, float]] = {}
+        self._net_peak: float = 0.0
 
         # The tab itself holds ONLY a scroll area; all cards live in an inner content widget. When the
         # window is shorter than the content needs, it scrolls instead of squeezing widgets past their
@@ -274,28 +358,16 @@ class OverviewTab(QWidget):
                 {"history_period_slider_value": self._period_index}, apply_and_repaint=False)
         except Exception:
             pass
-        self._reload_window()
+        if self._prefetcher is not None:
+            self._prefetcher.note_view(period=self._period_index)
+        self._reload_window(prefer_cached=True)
 
     def _period_key(self) -> str:
         return constants.data.history_period.PERIOD_MAP.get(self._period_index, "TIMELINE_24_HOURS")
 
     def _window(self):
         """(start, end, is_session) for the active period."""
-        hp = constants.data.history_period
-        key = self._period_key()
-        now = datetime.now()
-        session_start = getattr(self._main_widget, "session_start_time", None)
-        ws = getattr(self._main_widget, "widget_state", None)
-        earliest = None
-        if key in ("TIMELINE_ALL", "TIMELINE_SYSTEM_UPTIME") and ws is not None:
-            try:
-                earliest = ws.get_earliest_data_timestamp()
-            except Exception:
-                earliest = None
-        start = hp.get_start_time(key, now, session_start, None, earliest)
-        if start is None:
-            start = now - timedelta(hours=24)
-        return start, now, (key == "TIMELINE_SESSION")
+        return period_window(self._main_widget, self._period_key())
 
     # ----------------------------------------------------------------- lifecycle
 
@@ -311,7 +383,8 @@ class OverviewTab(QWidget):
                 self._timeline.set_period_index(idx, emit=False)
         except Exception:
             pass
-        self._reload_window()   # load the window's DB series + summaries, then paint immediately
+        # Load the window's DB series + summaries (or take a prefetched copy), then paint immediately.
+        self._reload_window(prefer_cached=True)
         self._timer.start()
         self._hist_timer.start()
         self._busiest.start()   # start the per-app connection sampler (idles again on hide)
@@ -336,10 +409,14 @@ class OverviewTab(QWidget):
 
     # ----------------------------------------------------------------- refresh
 
-    def _reload_window(self) -> None:
+    def _reload_window(self, prefer_cached: bool = False) -> None:
         """Load the selected window's series (sparklines) + honest summaries (avg/peak) from the DB -
         or the live in-memory deques for the Session window - then repaint. Runs every few seconds and
-        on a period change, NOT on the 1 Hz tick, so the DB read never touches the current-value path."""
+        on a period change, NOT on the 1 Hz tick, so the DB read never touches the current-value path.
+
+        With ``prefer_cached`` (a period switch, re-showing the tab) a snapshot the Monitor's prefetcher
+        - or an earlier reload - left in its cache is painted instead of reading; the next periodic
+        reload brings it up to date."""
         if not self.isVisible():
             return
         ws = getattr(self._main_widget, "widget_state", None)
@@ -348,40 +425,31 @@ class OverviewTab(QWidget):
             return
         start, end, is_session = self._window()
         poll = float(self._config.get("update_rate", 1.0) or 1.0)
+        latency = bool(self._config.get("latency_enabled", True))
         try:
             if is_session:
                 agg = ws.get_aggregated_speed_history()
-                self._series = {
+                snap = _complete_snapshot(ws, {
                     "down": [a.download for a in agg], "up": [a.upload for a in agg],
                     "cpu": [s.value for s in ws.get_cpu_history()],
                     "gpu": [s.value for s in ws.get_gpu_history()],
                     "ram": [s.value for s in ws.get_ram_history()],
-                }
-            else:
-                # wait_for_flush=False: this runs on the GUI thread on a periodic timer - never block the
-                # UI on the DB-worker drain for a last second that's invisible at multi-hour resolution.
-                net = ws.get_speed_history(start, end, None, resolution='auto', wait_for_flush=False)
-                self._series = {
-                    "down": [r[2] for r in net], "up": [r[1] for r in net],
-                    "cpu": [v for _, v in ws.get_hardware_history("cpu", start, end)],
-                    "gpu": [v for _, v in ws.get_hardware_history("gpu", start, end)],
-                    "ram": [v for _, v in ws.get_hardware_history("ram", start, end)],
-                }
-            self._win_summ = {
-                "down": ws.summarize_network("download", start, end, None, poll),
-                "up": ws.summarize_network("upload", start, end, None, poll),
-                "cpu": ws.summarize_hardware("cpu", start, end, poll),
-                "gpu": ws.summarize_hardware("gpu", start, end, poll),
-                "ram": ws.summarize_hardware("ram", start, end, poll),
-            }
-            # Connection-drop events over the window (from the persisted gateway-timeout series), so a
-            # latency blip you missed live is still counted. Cheap; off the 1 Hz path.
-            if self._config.get("latency_enabled", True):
-                from netspeedtray.utils import summaries as S   # lazy: keeps numpy off the import path
-                self._latency_events = S.outage_summary(
-                    ws.get_hardware_history("latency_gw_timeout", start, end))
+                }, start, end, poll, latency)
             else:
-                self._latency_events = {}
+                cache = self._prefetcher.cache if self._prefetcher is not None else None
+                cache_key = ("overview", self._period_key())
+                snap = cache.get(cache_key) if (cache is not None and prefer_cached) else None
+                if snap is None:
+                    if self._prefetcher is not None:
+                        self._prefetcher.note_request()   # a real read: the prefetch thread stands aside
+                    snap = load_window_snapshot(ws, start, end, poll, latency)
+                    if cache is not None:
+                        cache.put(cache_key, snap)
+            self._series = snap["series"]
+            self._ranges = snap["ranges"]
+            self._net_peak = snap["net_peak"]
+            self._win_summ = snap["win_summ"]
+            self._latency_events = snap["latency_events"]
         except Exception as e:
             # Log the FIRST failure loudly (with traceback) so a broken Overview leaves a diagnostic in
             # the support bundle; rate-limit the rest to DEBUG so the few-second timer doesn't spam.
@@ -417,7 +485,7 @@ class OverviewTab(QWidget):
                 upload_mbps=float(getattr(mw, "upload_speed", 0.0) or 0.0),
                 download_mbps=float(getattr(mw, "download_speed", 0.0) or 0.0)).net_bytes()
             down_series, up_series = ser.get("down", []), ser.get("up", [])
-            peak_v = max(max(down_series, default=0.0), max(up_series, default=0.0))
+            peak_v = self._net_peak
             sd, su_ = summ.get("down"), summ.get("up")
             sub = ""
             if sd is not None and su_ is not None and sd.count:
@@ -436,8 +504,9 @@ class OverviewTab(QWidget):
             # Each utilization sparkline auto-zooms to its own active band (dynamic_range), so a
             # low-but-varying metric (e.g. CPU mostly 5-20%) reads in detail instead of as a flat
             # squiggle against a fixed 0-100% - with a minimum span so a steady metric isn't blown up.
+            # The ranges come from _reload_window (they only move when the series do).
             cpu_series = ser.get("cpu", [])
-            cpu_lo, cpu_hi = dynamic_range(cpu_series)
+            cpu_lo, cpu_hi = self._ranges.get("cpu") or fit_range(None, None)
             self._tiles["cpu"].set(f"{float(getattr(mw, 'cpu_usage', 0.0) or 0.0):.0f}%",
                                    cpu_series, vmax=cpu_hi, vmin=cpu_lo,
                                    sub_text=self._hw_sub(getattr(mw, "cpu_temp", None),
@@ -448,7 +517,7 @@ class OverviewTab(QWidget):
                 gpu_word = self._tr("ORDER_TYPE_GPU", "GPU")
                 self._tiles["gpu"].set_label(("i" + gpu_word) if integrated else gpu_word)
                 gpu_series = ser.get("gpu", [])
-                gpu_lo, gpu_hi = dynamic_range(gpu_series)
+                gpu_lo, gpu_hi = self._ranges.get("gpu") or fit_range(None, None)
                 self._tiles["gpu"].set(f"{float(getattr(mw, 'gpu_usage', 0.0) or 0.0):.0f}%",
                                        gpu_series, vmax=gpu_hi, vmin=gpu_lo,
                                        sub_text=self._hw_sub(getattr(mw, "gpu_temp", None),
@@ -456,7 +525,7 @@ class OverviewTab(QWidget):
 
             ru, rt = getattr(mw, "ram_used", None), getattr(mw, "ram_total", None)
             ram_series = ser.get("ram", [])
-            ram_lo, ram_hi = dynamic_range(ram_series)
+            ram_lo, ram_hi = self._ranges.get("ram") or fit_range(None, None)
             self._tiles["ram"].set(f"{self._pct(ru, rt):.0f}%", ram_series, vmax=ram_hi, vmin=ram_lo,
                                    sub_text=self._mem_sub(ru, rt))
 
@@ -466,8 +535,9 @@ class OverviewTab(QWidget):
             if vram_reading:
                 vpct = self._pct(vu, vt)
                 self._vram_series.append(vpct)
+                self._vram_range.push(vpct)
                 if vt:
-                    vlo, vhi = dynamic_range(list(self._vram_series))
+                    vlo, vhi = fit_range(*self._vram_range.bounds())
                     self._tiles["vram"].set(f"{vpct:.0f}%", list(self._vram_series),
                                             vmax=vhi, vmin=vlo, sub_text=self._mem_sub(vu, vt))
                 else:
@@ -5,8 +5,8 @@ Three small, self-contained widgets used by OverviewTab:
 
 * ``Sparkline``  - a tiny, antialiased trend line + soft fill. Deliberately standalone: it does
   NOT reuse ``WidgetRenderer.draw_mini_graph`` (whose point cache is keyed to the single taskbar
-  widget; sharing it across five tiles would thrash it). A sparkline is a handful of line
-  segments - cheaper and safer to paint directly than to bend the widget's cache.
+  widget; sharing it across five tiles would thrash it). It keeps its own cache instead: paths
+  built from a per-pixel-column envelope of the series, reused until the data or size changes.
 * ``StatTile``  - label + big current value (+ optional sub-line) over a sparkline.
 * ``UsageTile`` - Today / This-month byte totals and, when a data cap is set, a progress bar.
 
@@ -15,12 +15,13 @@ By contract this module imports only Qt + app utils - never matplotlib (it backs
 from __future__ import annotations
 
 import calendar
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Tuple
 
 from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
 from PyQt6.QtGui import (
-    QPainter, QColor, QPen, QPainterPath, QPolygonF, QLinearGradient, QFont, QFontMetrics,
+    QPainter, QColor, QPen, QPainterPath, QLinearGradient, QFont, QFontMetrics,
 )
 from PyQt6.QtWidgets import (
     QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QSizePolicy,
@@ -30,19 +31,15 @@ from netspeedtray.utils import styles as su
 from netspeedtray.constants.styles import styles as tokens
 from netspeedtray.utils.helpers import format_data_size, format_decimal
 
-_SPARK_POINTS = 120  #: cap the series so an all-day session can't grow the polyline unbounded
 
-
-def dynamic_range(series: List[float], min_span: float = 15.0,
-                  hard_min: Optional[float] = 0.0, hard_max: Optional[float] = 100.0,
-                  headroom: float = 0.08) -> Tuple[float, float]:
-    """A (vmin, vmax) window fitted to the data so low-but-varying activity reads in detail instead of
-    as a flat line against 0-100. Enforces a minimum span (so a genuinely steady metric isn't blown up
-    into dramatic noise), adds a little top headroom, and clamps to any hard bounds (0-100 for a %)."""
-    vals = [float(v) for v in series if v is not None and float(v) == float(v)]
-    if not vals:
+def fit_range(lo: Optional[float], hi: Optional[float], min_span: float = 15.0,
+              hard_min: Optional[float] = 0.0, hard_max: Optional[float] = 100.0,
+              headroom: float = 0.08) -> Tuple[float, float]:
+    """The (vmin, vmax) window for data spanning [lo, hi] (None when there is no data) - the fitting
+    half of ``dynamic_range``, split out so a caller that already knows its extremes (``SlidingRange``,
+    a reload that scanned the series once) doesn't rescan the list to get them."""
+    if lo is None or hi is None:
         return (hard_min or 0.0, (hard_min or 0.0) + min_span)
-    lo, hi = min(vals), max(vals)
     if hi - lo < min_span:                      # too flat to fill - widen to the minimum span
         pad = (min_span - (hi - lo)) / 2.0
         lo, hi = lo - pad, hi + pad
@@ -56,8 +53,76 @@ def dynamic_range(series: List[float], min_span: float = 15.0,
     return (lo, hi)
 
 
+def dynamic_range(series: List[float], min_span: float = 15.0,
+                  hard_min: Optional[float] = 0.0, hard_max: Optional[float] = 100.0,
+                  headroom: float = 0.08) -> Tuple[float, float]:
+    """A (vmin, vmax) window fitted to the data so low-but-varying activity reads in detail instead of
+    as a flat line against 0-100. Enforces a minimum span (so a genuinely steady metric isn't blown up
+    into dramatic noise), adds a little top headroom, and clamps to any hard bounds (0-100 for a %)."""
+    vals = [float(v) for v in series if v is not None and float(v) == float(v)]
+    if not vals:
+        return fit_range(None, None, min_span, hard_min, hard_max, headroom)
+    return fit_range(min(vals), max(vals), min_span, hard_min, hard_max, headroom)
+
+
+class SlidingRange:
+    """Min/max of the last ``maxlen`` values, kept incrementally with two monotonic deques - O(1)
+    amortized per ``push`` instead of rescanning the window every tick (the VRAM tile's rolling buffer
+    feeds ``fit_range`` from this once a second). None/NaN readings are skipped, as in dynamic_range."""
+
+    def __init__(self, maxlen: int) -> None:
+        self._maxlen = maxlen
+        self._count = 0                          # values pushed so far (their index is the position)
+        self._mins: Deque[Tuple[int, float]] = deque()   # increasing values, oldest first
+        self._maxs: Deque[Tuple[int, float]] = deque()   # decreasing values, oldest first
+
+    def push(self, value: Optional[float]) -> None:
+        i = self._count
+        self._count += 1
+        oldest = i - self._maxlen + 1
+        for dq in (self._mins, self._maxs):
+            while dq and dq[0][0] < oldest:
+                dq.popleft()
+        if value is None or value != value:
+            return
+        v = float(value)
+        while self._mins and self._mins[-1][1] >= v:
+            self._mins.pop()
+        self._mins.append((i, v))
+        while self._maxs and self._maxs[-1][1] <= v:
+            self._maxs.pop()
+        self._maxs.append((i, v))
+
+    def bounds(self) -> Tuple[Optional[float], Optional[float]]:
+        """(min, max) over the window, or (None, None) when it holds no readings."""
+        if not self._mins:
+            return (None, None)
+        return (self._mins[0][1], self._maxs[0][1])
+
+
+def column_envelope(series: List[float], columns: int) -> List[Tuple[float, float]]:
+    """Reduce ``series`` to at most ``columns`` buckets of consecutive samples - one per pixel column -
+    each kept as its (min, max) in the order they occur, so a one-sample spike still reaches its true
+    height and the trace still reads left to right. A series that already fits comes back one
+    ``(v, v)`` pair per sample, so short series draw exactly as before."""
+    n = len(series)
+    if columns < 1 or n <= columns:
+        return [(v, v) for v in series]
+    out: List[Tuple[float, float]] = []
+    for c in range(columns):
+        chunk = series[c * n // columns:(c + 1) * n // columns]
+        lo, hi = min(chunk), max(chunk)
+        out.append((lo, hi) if chunk.index(lo) <= chunk.index(hi) else (hi, lo))
+    return out
+
+
 class Sparkline(QWidget):
-    """A tiny trend line with a soft gradient fill, in a single accent color."""
+    """A tiny trend line with a soft gradient fill, in a single accent color.
+
+    The input can be a whole window (thousands of samples for a Session or a week), but a tile is only
+    a few hundred pixels wide: the paths are built from a per-pixel-column min/max envelope
+    (``column_envelope``) and cached until the data or the widget size changes, so a repaint is two
+    ``drawPath`` calls however long the series is. The data extremes are taken once, in the setters."""
 
     def __init__(self, color: str, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -70,21 +135,44 @@ class Sparkline(QWidget):
         self._scale_label: str = ""              # optional top-of-scale readout (e.g. "16.9 Mbps")
         self._curve: float = 1.0                 # 1.0 = linear; <1 (e.g. 0.5) warps the axis so a single
                                                  # spike doesn't flatten the baseline (sqrt-style)
+        self._data_max: float = 0.0              # max over both traces, taken once per set_*
+        self._sources: Tuple[object, ...] = ()   # the objects last passed in + scale params (see _unchanged)
+        self._paths: Optional[Tuple[QPainterPath, QPainterPath, Optional[QPainterPath]]] = None
+        self._paths_key: Optional[Tuple[int, int]] = None
         self.setMinimumHeight(36)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
+    def _unchanged(self, sources: Tuple[object, ...]) -> bool:
+        """True when the caller handed back the very same series objects with the same scale - the
+        Overview re-sets every tile on its 1 Hz tick but only reloads the series every few seconds, so
+        most calls change nothing. Holding the references keeps their ids from being recycled."""
+        scalar = (str, int, float, type(None))
+        if len(sources) == len(self._sources) and all(
+                (a == b) if isinstance(a, scalar) else (a is b) for a, b in zip(sources, self._sources)):
+            return True
+        self._sources = sources
+        return False
+
+    def _data_changed(self) -> None:
+        self._data_max = max(max(self._series, default=0.0), max(self._series2, default=0.0))
+        self._paths = None
+        self.update()
+
     def set_series(self, series: List[float], vmax: Optional[float] = None, vmin: float = 0.0,
                    curve: float = 1.0) -> None:
         """Replace the data. ``vmax`` fixes the top of the scale (None auto-scales to the data max);
         ``vmin`` is the bottom - pass a non-zero value to "zoom" the trend into its active band so a
         low-but-varying metric shows detail instead of a flat line near the floor. ``curve`` < 1 bends
-        the height axis (0.5 = square-root) so brief spikes don't squash the everyday band flat."""
-        self._series = list(series)[-_SPARK_POINTS:]
+        the height axis (0.5 = square-root) so brief spikes don't squash the everyday band flat.
+        The series is treated as a snapshot: pass a new list rather than mutating one in place."""
+        if self._unchanged((series, vmax, vmin, curve)):
+            return
+        self._series = list(series)
         self._series2 = []
         self._vmax = vmax
         self._vmin = float(vmin or 0.0)
         self._curve = float(curve or 1.0)
-        self.update()
+        self._data_changed()
 
     def set_dual(self, primary: List[float], secondary: List[float], color2: str,
                  vmax: Optional[float] = None, scale_label: str = "", curve: float = 1.0) -> None:
@@ -92,14 +180,16 @@ class Sparkline(QWidget):
         line in ``color2``. Both auto-scale to their combined max unless ``vmax`` is fixed.
         ``scale_label`` (e.g. "16.9 Mbps") is drawn at the top-of-scale so the trend has magnitude.
         ``curve`` < 1 bends the axis (0.5 = sqrt) so an occasional peak doesn't flatten normal traffic."""
-        self._series = list(primary)[-_SPARK_POINTS:]
-        self._series2 = list(secondary)[-_SPARK_POINTS:]
+        if self._unchanged((primary, secondary, color2, vmax, scale_label, curve)):
+            return
+        self._series = list(primary)
+        self._series2 = list(secondary)
         self._color2 = QColor(color2)
         self._vmax = vmax
         self._vmin = 0.0          # network reads from a true zero floor (a 0-baseline burst is meaningful)
         self._scale_label = scale_label
         self._curve = float(curve or 1.0)
-        self.update()
+        self._data_changed()
 
     def _height_for(self, v: float, vmin: float, vmax: float, gh: float) -> float:
         """Map a value to a pixel height above the baseline, applying the (optional) axis curve."""
@@ -109,6 +199,52 @@ class Sparkline(QWidget):
             t = t ** self._curve
         return t * gh
 
+    def _trace(self, series: List[float], pad: float, gw: float, gh: float,
+               vmin: float, vmax: float, fill: bool) -> Tuple[QPainterPath, Optional[QPainterPath]]:
+        """The line path for one trace over its column envelope, plus (``fill``) the closed area under
+        it - whose top edge follows each column's max so a decimated spike is filled to its peak."""
+        env = column_envelope(series, max(2, int(gw)))
+        step = gw / (len(env) - 1)
+        base_y = pad + gh
+        line = QPainterPath()
+        area = QPainterPath() if fill else None
+        for i, (a, b) in enumerate(env):
+            x = pad + i * step
+            ya = base_y - self._height_for(a, vmin, vmax, gh)
+            if i == 0:
+                line.moveTo(x, ya)
+            else:
+                line.lineTo(x, ya)
+            if b != a:
+                line.lineTo(x, base_y - self._height_for(b, vmin, vmax, gh))
+            if area is not None:
+                if i == 0:
+                    area.moveTo(x, base_y)
+                area.lineTo(x, base_y - self._height_for(max(a, b), vmin, vmax, gh))
+        if area is not None:
+            area.lineTo(pad + gw, base_y)
+            area.closeSubpath()
+        return line, area
+
+    def _build_paths(self, pad: float, gw: float, gh: float
+                     ) -> Tuple[QPainterPath, QPainterPath, Optional[QPainterPath]]:
+        """(fill, line, second line) for the current data at the current size - built on a miss only."""
+        key = (self.width(), self.height())
+        if self._paths is not None and self._paths_key == key:
+            return self._paths
+        # Both traces share one scale so up/down read at true relative magnitude. vmin lets a tile
+        # "zoom" into a low band (e.g. CPU 5-20%) so the trend isn't a flat squiggle against 0-100.
+        vmin = self._vmin
+        vmax = self._vmax if (self._vmax and self._vmax > vmin) else self._data_max
+        if vmax <= vmin:
+            vmax = vmin + 1.0
+        line, fill = self._trace(self._series, pad, gw, gh, vmin, vmax, fill=True)
+        line2 = None
+        if self._series2 and self._color2 is not None and len(self._series2) >= 2:
+            line2, _ = self._trace(self._series2, pad, gw, gh, vmin, vmax, fill=False)
+        self._paths, self._paths_key = (fill, line, line2), key
+        return self._paths
+
     def paintEvent(self, event) -> None:  # noqa: N802 (Qt override)
         n = len(self._series)
         pad = 2.0
@@ -138,30 +274,13 @@ class Sparkline(QWidget):
                 p.end()
             return
 
-        # Both traces share one scale so up/down read at true relative magnitude. vmin lets a tile
-        # "zoom" into a low band (e.g. CPU 5-20%) so the trend isn't a flat squiggle against 0-100.
-        data_max = max(max(self._series, default=0.0), max(self._series2, default=0.0))
-        vmin = self._vmin
-        vmax = self._vmax if (self._vmax and self._vmax > vmin) else data_max
-        if vmax <= vmin:
-            vmax = vmin + 1.0
-        step = gw / (n - 1)
-        pts = [
-            QPointF(pad + i * step, base_y - self._height_for(v, vmin, vmax, gh))
-            for i, v in enumerate(self._series)
-        ]
+        fill_path, line_path, line2_path = self._build_paths(pad, gw, gh)
 
         p = QPainter(self)
         try:
             p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
             # Soft fill under the line.
-            fill_path = QPainterPath()
-            fill_path.moveTo(pts[0].x(), base_y)
-            for pt in pts:
-                fill_path.lineTo(pt)
-            fill_path.lineTo(pts[-1].x(), base_y)
-            fill_path.closeSubpath()
             grad = QLinearGradient(0.0, pad, 0.0, base_y)
             top = QColor(self._color); top.setAlpha(64)
             bot = QColor(self._color); bot.setAlpha(0)
@@ -175,22 +294,17 @@ class Sparkline(QWidget):
             pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
             pen.setCapStyle(Qt.PenCapStyle.RoundCap)
             p.setPen(pen)
-            p.drawPolyline(QPolygonF(pts))
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.drawPath(line_path)
 
             # Optional second trace (upload), same scale, thinner line, no fill.
-            if self._series2 and self._color2 is not None and len(self._series2) >= 2:
-                n2 = len(self._series2)
-                step2 = gw / (n2 - 1)
-                pts2 = [
-                    QPointF(pad + i * step2, base_y - self._height_for(v, vmin, vmax, gh))
-                    for i, v in enumerate(self._series2)
-                ]
+            if line2_path is not None:
                 pen2 = QPen(self._color2)
                 pen2.setWidthF(1.4)
                 pen2.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
                 pen2.setCapStyle(Qt.PenCapStyle.RoundCap)
                 p.setPen(pen2)
-                p.drawPolyline(QPolygonF(pts2))
+                p.drawPath(line2_path)
 
             # Scale readout: a faint top-of-scale rule + the max value at top-left, plus a "0" baseline
             # - so the hero trend has magnitude at a glance instead of a scaleless squiggle.
@@ -0,0 +1,328 @@
+"""
+Idle-time prefetch for the Monitor: warm the views the user is most likely to open next.
+
+Every Monitor view - a (tab, period) pair such as Network/Week - is loaded only when it is shown: the
+Overview reads its window synchronously on the GUI thread, the chart tabs through GraphHost's worker.
+Switching to a long period therefore always waits on the database, even though the same few switches
+(24h -> Week, Overview -> Network) make up most of what a user does.
+
+This module closes that gap with three pieces:
+
+* ``ViewPredictor`` - learns from the user's recent view choices (persisted in config as
+  ``monitor_recent_views``): a recency-weighted count of each view, a bonus for views that followed the
+  current one before, and a small prior for its neighbours (the adjacent periods of the same tab, the
+  same period on the other tabs) so a fresh install still prefetches something sensible.
+* ``ResultCache`` - a small, thread-safe TTL map the real loads consult before touching the database.
+  GraphHost and OverviewTab also store what they render there, so switching *back* is instant too.
+* ``IdlePrefetcher`` - after the Monitor's first paint, and again whenever the real loads have been
+  quiet for PREFETCH_IDLE_MS, asks the registered per-tab providers for a job per predicted view and
+  runs them one at a time on a lowest-priority QThread. Any real load cancels it: the running job stops
+  at its next query/chunk boundary and nothing more is started until the next quiet period.
+
+A cached result is only ever a first paint: the real load still runs and replaces it, so a view is
+never shown staler than PREFETCH_CACHE_TTL_SEC for longer than its own load takes. Chart-tab jobs are
+only offered once GraphHost has loaded (the graph package imports matplotlib, and a glance at the
+Overview must not), and the Session period is never prefetched - it is served from memory anyway.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from netspeedtray import constants
+from netspeedtray.views.monitor.timeline_selector import TimelineSelector
+
+logger = logging.getLogger("NetSpeedTray.MonitorPrefetch")
+
+TABS: Tuple[str, ...] = ("overview", "network", "hardware")
+RECENT_VIEWS_KEY = "monitor_recent_views"
+SESSION_KEY = "TIMELINE_SESSION"
+STOP_WAIT_MS = 2000                         # stop()'s bounded wait before it waits the job out
+
+View = Tuple[str, str]                      # (tab_id, period_key)
+JobSpec = Tuple[Hashable, Callable[[Callable[[], bool]], Any]]   # (cache key, run(cancelled) -> result)
+Provider = Callable[[str], Optional[JobSpec]]                     # period_key -> job for that tab, or None
+
+# Predictor weights: a choice's weight decays by _DECAY per later choice; a view that directly followed
+# the current one counts _TRANSITION_WEIGHT times extra; neighbours get a flat prior.
+_DECAY = 0.8
+_TRANSITION_WEIGHT = 2.0
+_NEIGHBOUR_PRIOR = 0.5
+
+
+def view_id(view: View) -> str:
+    """The persisted form of a view: ``"network:TIMELINE_WEEK"``."""
+    return f"{view[0]}:{view[1]}"
+
+
+def parse_view(text: Any) -> Optional[View]:
+    """A persisted view back as (tab, period_key); None for anything malformed or out of date."""
+    if not isinstance(text, str) or ":" not in text:
+        return None
+    tab, key = text.split(":", 1)
+    if tab not in TABS or key not in constants.data.history_period.PERIOD_MAP.values():
+        return None
+    return tab, key
+
+
+def period_key(period_value: int) -> str:
+    return constants.data.history_period.PERIOD_MAP.get(int(period_value), constants.data.history_period.DEFAULT_PERIOD)
+
+
+def period_value(key: str) -> int:
+    for value, k in constants.data.history_period.PERIOD_MAP.items():
+        if k == key:
+            return value
+    raise KeyError(key)
+
+
+class ViewPredictor:
+    """Ranks the views the user is likely to open next from their recent choices."""
+
+    def __init__(self, history: Sequence[Any] = (), max_len: int = constants.graph.PREFETCH_HISTORY_LEN) -> None:
+        self.max_len = max_len
+        self.history: List[str] = [view_id(v) for v in map(parse_view, history) if v is not None][-max_len:]
+
+    def record(self, view: View) -> bool:
+        """Note that the user chose ``view``. Returns False (and records nothing) if it is already the
+        latest choice - re-showing the same view is not a new choice."""
+        vid = view_id(view)
+        if self.history and self.history[-1] == vid:
+            return False
+        self.history.append(vid)
+        del self.history[:-self.max_len]
+        return True
+
+    def predict(self, current: View, limit: int) -> List[View]:
+        """Up to ``limit`` views other than ``current``, most likely first. Session is never returned."""
+        cur = view_id(current)
+        scores: Dict[str, float] = {}
+        n = len(self.history)
+        prev = None
+        for i, vid in enumerate(self.history):
+            w = _DECAY ** (n - 1 - i)
+            scores[vid] = scores.get(vid, 0.0) + w * (1.0 + (_TRANSITION_WEIGHT if prev == cur else 0.0))
+            prev = vid
+
+        tab, key = current
+        order = [period_key(v) for v in TimelineSelector._ORDER]    # the dropdown's order = "adjacent"
+        order = [k for k in order if k != SESSION_KEY]
+        if key in order:
+            i = order.index(key)
+            for j in (i - 1, i + 1):
+                if 0 <= j < len(order):
+                    nid = view_id((tab, order[j]))
+                    scores[nid] = scores.get(nid, 0.0) + _NEIGHBOUR_PRIOR
+            for other in TABS:
+                if other != tab:
+                    nid = view_id((other, key))
+                    scores[nid] = scores.get(nid, 0.0) + _NEIGHBOUR_PRIOR / 2
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)    # stable: ties keep order
+        out: List[View] = []
+        for vid, _ in ranked:
+            view = parse_view(vid)
+            if view is None or vid == cur or view[1] == SESSION_KEY:
+                continue
+            out.append(view)
+            if len(out) >= limit:
+                break
+        return out
+
+
+class ResultCache:
+    """A thread-safe key -> value map whose entries expire ``ttl`` seconds after they were stored.
+    Bounded to ``max_entries`` (oldest dropped first); values are never copied."""
+
+    def __init__(self, ttl: float = constants.graph.PREFETCH_CACHE_TTL_SEC, max_entries: int = 16) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), value)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            if time.monotonic() - hit[0] > self.ttl:
+                del self._entries[key]
+                return None
+            return hit[1]
+
+    def fresh(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class PrefetchJob:
+    """One speculative load: ``run(cancelled)`` does the reads (on the prefetch thread, checking
+    ``cancelled()`` between them) and returns the value stored under ``key``, or None."""
+    view: View
+    key: Hashable
+    run: Callable[[Callable[[], bool]], Any]
+    cancelled: Callable[[], bool]
+
+
+class _PrefetchRunner(QObject):
+    """Lives on the prefetch thread; runs one job per submit and reports back."""
+
+    finished = pyqtSignal(object, object)   # job, result (None if cancelled or failed)
+
+    def run(self, job: PrefetchJob) -> None:
+        result = None
+        if not job.cancelled():
+            try:
+                result = job.run(job.cancelled)
+            except Exception as e:
+                logger.debug("Prefetch of %s failed: %s", view_id(job.view), e)
+        self.finished.emit(job, result)
+
+
+class IdlePrefetcher(QObject):
+    """
+    Warms ``cache`` with the predicted next views while the Monitor is idle. Owned by MonitorWindow;
+    all methods are called on the GUI thread.
+    """
+
+    _submit = pyqtSignal(object)
+
+    def __init__(self, config: Dict[str, Any], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._config = config
+        self.cache = ResultCache()
+        self.predictor = ViewPredictor(config.get(RECENT_VIEWS_KEY) or [])
+        self._providers: Dict[str, Provider] = {}
+        self._view: View = ("overview", period_key(config.get("history_period_slider_value", 2) or 2))
+        self.learned = False      # recorded a new choice this session (config needs saving)
+        self._generation = 0
+        self._queue: List[PrefetchJob] = []
+        self._busy = False
+        self._started = False
+        self._stopped = False
+        self._thread: Optional[QThread] = None
+        self._runner: Optional[_PrefetchRunner] = None
+        self._idle = QTimer(self)
+        self._idle.setSingleShot(True)
+        self._idle.timeout.connect(self._plan)
+
+    # ------------------------------------------------------------------ wiring
+
+    def set_provider(self, tab: str, provider: Provider) -> None:
+        """Register how to build a prefetch job for ``tab`` (see JobSpec)."""
+        self._providers[tab] = provider
+
+    @property
+    def view(self) -> View:
+        return self._view
+
+    def start(self, tab: Optional[str] = None) -> None:
+        """Begin after the Monitor's first paint: record the opening view, prefetch after a short delay."""
+        if self._started or self._stopped:
+            return
+        self._started = True
+        self.note_view(tab=tab)
+        self._idle.start(constants.graph.PREFETCH_START_DELAY_MS)
+
+    # ------------------------------------------------------------------ signals from the views
+
+    def note_view(self, tab: Optional[str] = None, period: Optional[int] = None) -> None:
+        """The user switched tab and/or period: learn from it and re-plan for the new view."""
+        tab = tab if tab is not None else self._view[0]
+        key = period_key(period) if period is not None else self._view[1]
+        if tab not in TABS:
+            return
+        self._view = (tab, key)
+        if self.predictor.record(self._view):
+            self._config[RECENT_VIEWS_KEY] = list(self.predictor.history)
+            self.learned = True
+        self.note_request()
+
+    def note_request(self) -> None:
+        """A real load is about to run: stop speculating and wait for the next quiet period."""
+        self.cancel()
+        if self._started and not self._stopped:
+            self._idle.start(constants.graph.PREFETCH_IDLE_MS)
+
+    def cancel(self) -> None:
+        self._generation += 1
+        self._queue.clear()
+
+    # ------------------------------------------------------------------ the work
+
+    def _plan(self) -> None:
+        if self._stopped:
+            return
+        generation = self._generation
+        self._queue = []
+        for view in self.predictor.predict(self._view, constants.graph.PREFETCH_MAX_VIEWS):
+            provider = self._providers.get(view[0])
+            if provider is None:
+                continue
+            try:
+                spec = provider(view[1])
+            except Exception as e:
+                logger.debug("No prefetch job for %s: %s", view_id(view), e)
+                spec = None
+            if spec is None or self.cache.fresh(spec[0]):
+                continue
+            self._queue.append(PrefetchJob(view, spec[0], spec[1],
+                                           lambda g=generation: self._generation != g or self._stopped))
+        self._next()
+
+    def _next(self) -> None:
+        if self._busy or not self._queue or self._stopped:
+            return
+        if self._thread is None:
+            self._thread = QThread()
+            self._runner = _PrefetchRunner()
+            self._runner.moveToThread(self._thread)
+            self._submit.connect(self._runner.run)
+            self._runner.finished.connect(self._on_finished)
+            self._thread.finished.connect(self._runner.deleteLater)   # on its own loop, during quit()
+            self._thread.start(QThread.Priority.LowestPriority)
+        self._busy = True
+        self._submit.emit(self._queue.pop(0))
+
+    def _on_finished(self, job: PrefetchJob, result: Any) -> None:
+        self._busy = False
+        if result is not None:
+            # Even a job finishing after a cancel holds a complete, valid window - keep it.
+            self.cache.put(job.key, result)
+            logger.debug("Prefetched %s", view_id(job.view))
+        self._next()
+
+    def stop(self) -> None:
+        """Cancel everything and stop the thread (MonitorWindow.closeEvent)."""
+        self._stopped = True
+        self._idle.stop()
+        self.cancel()
+        if self._thread is not None:
+            # A job can sit in one long read (the read pool's checkout and SQLite's busy timeout can
+            # each outlast the bounded wait). Never drop a still-running thread - destroying a running
+            # QThread aborts the process - so fall back to an unbounded wait, as GraphHost.teardown does.
+            self._thread.quit()
+            if not self._thread.wait(STOP_WAIT_MS):
+                logger.debug("Prefetch thread still busy after %d ms; waiting for its job to finish.",
+                             STOP_WAIT_MS)
+                self._thread.wait()
+            self._thread.deleteLater()
+            self._thread = None
+            self._runner = None
+        self.cache.clear()
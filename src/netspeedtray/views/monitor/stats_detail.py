@@ -242,8 +242,8 @@ class StatsDetailSheet(QDialog):
             if loss is not None and loss > 0:
                 bits.append(f"{loss:.1f}% {self._tr('STATS_DETAIL_LOSS', 'packet loss')}")
             try:
-                o = S.outage_summary(self._ws.get_hardware_history("latency_gw_timeout",
-                                                                   self._start, self._end))
+                o = S.outage_summary_arrays(*self._ws.get_hardware_history_arrays("latency_gw_timeout",
+                                                                                  self._start, self._end))
                 if o["count"]:
                     last = o["last_start"]
                     lt = last.strftime("%H:%M") if hasattr(last, "strftime") else ""
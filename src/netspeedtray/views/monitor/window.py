@@ -1,5 +1,5 @@
 """
-MonitorWindow - the unified Monitor (Overview / Network / Hardware).
+MonitorWindow - the unified Monitor (Overview / Network / Hardware, + Diagnostics when enabled).
 
 The shell: native Win11 chrome, remembered geometry, a flat pivot tab-bar over a lazy
 QStackedWidget. Each resource tab starts as a cheap placeholder; the real page (and, for chart
@@ -48,6 +48,11 @@ class MonitorWindow(QWidget):
         self._is_closing = False
         self._graph_host = None  # one shared graph engine, built on first chart-tab activation
         self._settings_flyout = None  # one reusable display-settings popup (not rebuilt per click)
+        # Warms the likely next views (tab + period) while the Monitor idles - see prefetch.py. The chart
+        # tabs' jobs are registered by GraphHost once it has loaded; the Overview's is available at once.
+        from netspeedtray.views.monitor.prefetch import IdlePrefetcher
+        self._prefetcher = IdlePrefetcher(config, self)
+        self._prefetcher.set_provider("overview", self._overview_prefetch_job)
 
         # Prefix the app name so the taskbar/Alt-Tab entry reads "NetSpeedTray Monitor" - consistent
         # with the Settings window ("NetSpeedTray Settings …").
@@ -80,9 +85,11 @@ class MonitorWindow(QWidget):
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 8, 0)
         header.setSpacing(0)
-        # Segoe Fluent Icons per tab (Win10-safe MDL2 codepoints): Home / NetworkTower / DeveloperTools.
+        # Segoe Fluent Icons per tab (Win10-safe MDL2 codepoints): Home / NetworkTower / DeveloperTools /
+        # Diagnostic.
         self._tab_bar = FlatTabBar([(d.tab_id, d.label) for d in self._descriptors],
-                                   icons={"overview": 0xE80F, "network": 0xEC05, "hardware": 0xEC7A})
+                                   icons={"overview": 0xE80F, "network": 0xEC05, "hardware": 0xEC7A,
+                                          "diagnostics": 0xE9D9})
         self._tab_bar.tab_selected.connect(self._on_tab_changed)
         header.addWidget(self._tab_bar)
         header.addStretch(1)
@@ -114,7 +121,8 @@ class MonitorWindow(QWidget):
 
         # Apply per-tab visibility. NOTE: the Hardware tab is intentionally ALWAYS visible - its
         # descriptor uses the default is_visible (lambda cfg: True) because the Monitor force-enables
-        # hardware collection while it's open (see _build_descriptors). No tab is config-gated today.
+        # hardware collection while it's open (see _build_descriptors). Only Diagnostics is config-gated;
+        # refresh_tab_visibility re-runs this when settings are applied with the Monitor open.
         for d in self._descriptors:
             self._tab_bar.set_tab_visible(d.tab_id, d.is_visible(self.config))
 
@@ -154,8 +162,25 @@ class MonitorWindow(QWidget):
                               factory=self._make_network, needs_graph=True),
             LazyTabDescriptor("hardware", self._tr("MONITOR_TAB_HARDWARE", "Hardware"),
                               factory=self._make_hardware, needs_graph=True),
+            # Hot-path timings - only while Settings > Advanced > Diagnostics is collecting them.
+            LazyTabDescriptor("diagnostics", self._tr("MONITOR_TAB_DIAGNOSTICS", "Diagnostics"),
+                              factory=self._make_diagnostics, needs_graph=False,
+                              is_visible=lambda cfg: bool(cfg.get("diagnostics_enabled", False))),
         ]
 
+    def refresh_tab_visibility(self) -> None:
+        """Re-evaluate the config-gated tabs (Diagnostics) after settings were applied while the Monitor
+        is open (ConfigController.apply_all_settings). If the active tab was just hidden, move to the
+        first visible one so the stack never shows a page with no tab selected."""
+        if self._is_closing:
+            return
+        for d in self._descriptors:
+            self._tab_bar.set_tab_visible(d.tab_id, d.is_visible(self.config))
+        idx = self._stack.currentIndex()
+        if 0 <= idx < len(self._descriptors) and not self._descriptors[idx].is_visible(self.config):
+            first = next((i for i, d in enumerate(self._descriptors) if d.is_visible(self.config)), 0)
+            self._tab_bar.setCurrentIndex(first)
+
     def select_tab(self, tab_id: str) -> None:
         """Programmatically switch tabs (e.g. an Overview hardware tile click drills into Hardware)."""
         for i, d in enumerate(self._descriptors):
@@ -187,6 +212,7 @@ class MonitorWindow(QWidget):
         self._gear.setVisible(is_hw)
         if not is_hw and self._settings_flyout is not None:
             self._settings_flyout.hide()
+        self._prefetcher.note_view(tab=d.tab_id)
         # Remember the active tab so the Monitor reopens where the user left it.
         try:
             mgr = getattr(self._main_widget, "config_manager", None)
@@ -200,7 +226,11 @@ class MonitorWindow(QWidget):
 
     def _make_overview(self) -> QWidget:
         from netspeedtray.views.monitor.overview.tab import OverviewTab
-        return OverviewTab(self._main_widget, self.config, self.i18n, self)
+        return OverviewTab(self._main_widget, self.config, self.i18n, self, prefetcher=self._prefetcher)
+
+    def _overview_prefetch_job(self, period_key: str):
+        from netspeedtray.views.monitor.overview.tab import prefetch_job
+        return prefetch_job(self._main_widget, self.config, period_key)
 
     def _make_network(self) -> QWidget:
         from netspeedtray.views.monitor.network.tab import NetworkTab
@@ -214,12 +244,17 @@ class MonitorWindow(QWidget):
             self._graph_host = GraphHost(
                 self._main_widget, self.config, self.i18n,
                 session_start_time=getattr(self._main_widget, "session_start_time", None))
+            self._graph_host.prefetcher = self._prefetcher
         return self._graph_host
 
     def _make_hardware(self) -> QWidget:
         from netspeedtray.views.monitor.hardware.tab import HardwareTab
         return HardwareTab(self._ensure_graph_host(), self._main_widget, self.config, self.i18n, self)
 
+    def _make_diagnostics(self) -> QWidget:
+        from netspeedtray.views.monitor.diagnostics import DiagnosticsTab
+        return DiagnosticsTab(self.config, self.i18n, self)
+
     # ----------------------------------------------------------------- settings flyout
 
     def _open_settings_flyout(self) -> None:
@@ -310,15 +345,26 @@ class MonitorWindow(QWidget):
             pass
         # Always-on-top (#213) - same native flip the Settings dialog uses.
         set_window_always_on_top(self, bool(self.config.get("keep_windows_on_top", False)))
+        # Start prefetching after the first paint (a no-op on later shows).
+        idx = self._stack.currentIndex()
+        self._prefetcher.start(self._descriptors[idx].tab_id if 0 <= idx < len(self._descriptors) else None)
 
     def closeEvent(self, event) -> None:
         self._is_closing = True
         self._set_force_hardware(False)
+        self._prefetcher.stop()   # before the tabs/host tear down: its jobs read through them
         self.window_closed.emit()  # let the owner drop its ref before WA_DeleteOnClose destroys us
         try:
             save_window_geometry(self, self._main_widget, _POS_KEY)
         except Exception:
             pass
+        # The recent-view history the prefetcher learned from this session (kept in self.config).
+        try:
+            mgr = getattr(self._main_widget, "config_manager", None)
+            if mgr is not None and self._prefetcher.learned:
+                mgr.save(self.config)
+        except Exception:
+            pass
         for d in self._descriptors:
             if d.page is not None and hasattr(d.page, "teardown"):
                 try:
@@ -3,7 +3,7 @@ Advanced Settings Page (2.0 IA) - data history, app-behavior flags, and a fresh
 
 The progressive-disclosure valve for genuinely low-frequency / destructive items:
 data retention, the app-wide reduce-motion flag (also read by the Monitor window's
-hold-still logic), and reset affordances.
+hold-still logic), the opt-in performance diagnostics, and reset affordances.
 """
 from typing import Dict, Any, Callable, Optional
 
@@ -69,6 +69,15 @@ class AdvancedPage(QWidget):
         self.pause_in_menu.toggled.connect(self.on_change)
         layout.addWidget(SettingCard(self.i18n.PAUSE_IN_MENU_LABEL, control=self.pause_in_menu))
 
+        # --- Diagnostics ---
+        # Hot-path timings (utils.instrumentation): off by default, applied live, shown on the Monitor's
+        # Diagnostics tab and written into the support bundle.
+        layout.addWidget(section_header(self.i18n.DIAGNOSTICS_GROUP))
+        self.diagnostics_enabled = Win11Toggle(label_text="")
+        self.diagnostics_enabled.toggled.connect(self.on_change)
+        layout.addWidget(SettingCard(self.i18n.DIAGNOSTICS_LABEL, self.i18n.DIAGNOSTICS_SUB,
+                                     control=self.diagnostics_enabled))
+
         # --- Reset ---
         layout.addWidget(section_header(self.i18n.ADVANCED_RESET_GROUP))
         note = QLabel(self.i18n.ADVANCED_RESET_NOTE)
@@ -109,6 +118,7 @@ class AdvancedPage(QWidget):
         self.show_usage_hover.setChecked(bool(config.get("show_usage_on_hover", True)))
         self.show_hover_tips.setChecked(bool(config.get("show_hover_tips", True)))
         self.pause_in_menu.setChecked(bool(config.get("pause_in_menu", False)))
+        self.diagnostics_enabled.setChecked(bool(config.get("diagnostics_enabled", False)))
 
     def get_settings(self) -> Dict[str, Any]:
         return {
@@ -118,4 +128,5 @@ class AdvancedPage(QWidget):
             "show_usage_on_hover": self.show_usage_hover.isChecked(),
             "show_hover_tips": self.show_hover_tips.isChecked(),
             "pause_in_menu": self.pause_in_menu.isChecked(),
+            "diagnostics_enabled": self.diagnostics_enabled.isChecked(),
         }
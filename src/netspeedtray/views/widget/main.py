@@ -47,6 +47,8 @@ from netspeedtray.views.widget.theme import WidgetThemeManager
 from netspeedtray.core.startup_manager import StartupManager
 from netspeedtray.core.config_controller import ConfigController
 from netspeedtray.core.update_checker import UpdateChecker
+from netspeedtray.utils.startup_profiler import profiler as startup_profiler, FIRST_PAINT, FIRST_NUMBER
+from netspeedtray.utils.instrumentation import registry as instrumentation, timed
 
 # --- Type Checking ---
 if TYPE_CHECKING:
@@ -80,6 +82,9 @@ class NetworkSpeedWidget(QWidget):
         super().__init__(parent)
         self.logger = logging.getLogger(f"{constants.app.APP_NAME}.{self.__class__.__name__}")
         self.logger.debug("Initializing NetworkSpeedWidget...")
+        # Staged startup: the clock for time-to-first-number (construction -> first real speed painted).
+        self._startup_t0: float = time.monotonic()
+        self.time_to_first_number_ms: Optional[float] = None
         self.settings_dialog: Optional[SettingsDialog] = None
 
         # --- Core Application State ---
@@ -101,7 +106,8 @@ class NetworkSpeedWidget(QWidget):
         self.current_font: QFont = None
         self.current_metrics: QFontMetrics = None
 
-        self._init_managers() # Initialize managers first
+        with startup_profiler.phase("_init_managers"):
+            self._init_managers() # Initialize managers first
         self.theme_manager.apply_theme_aware_defaults()
 
         # --- Declare all instance attributes for clarity ---
@@ -177,6 +183,14 @@ class NetworkSpeedWidget(QWidget):
         # self._tray_watcher_timer moved to PositionManager
         self._state_watcher_timer = QTimer(self) # The "Safety Net" timer
 
+        # Staged startup: services that are not needed for the first number (update checker, usage
+        # alerts) are built by _start_deferred_services once the widget is live.
+        self._deferred_services_timer = QTimer(self)
+        self._deferred_services_timer.setSingleShot(True)
+        self._deferred_services_timer.timeout.connect(self._start_deferred_services)
+        self._usage_alert = None
+        self._usage_alert_timer: Optional[QTimer] = None
+
         # Hover usage card - a Win11 flyout we position ourselves (above the taskbar) so it is
         # never clipped, unlike Qt's built-in tooltip. Shown after a short rest on the widget.
         self._hover_card = None
@@ -192,14 +206,18 @@ class NetworkSpeedWidget(QWidget):
         # --- Initialization Steps ---
         try:
             self.layout_manager.setup_window_properties()
-            self._init_ui_components()
-            self._init_core_components()
+            with startup_profiler.phase("_init_ui_components"):
+                self._init_ui_components()
+            with startup_profiler.phase("_init_core_components"):
+                self._init_core_components()
             
             # Now that all components are initialized, perform the initial resize.
             self.layout_manager.resize_widget_for_font()
             
-            self._setup_connections()
-            self._setup_timers()
+            with startup_profiler.phase("_setup_connections"):
+                self._setup_connections()
+            with startup_profiler.phase("_setup_timers"):
+                self._setup_timers()
             self.position_manager.update_position()
             self._synchronize_startup_task()
             
@@ -225,6 +243,18 @@ class NetworkSpeedWidget(QWidget):
         self._state_watcher_timer.start()
         self.logger.debug(f"Safety net state watcher timer started ({constants.timeouts.STATE_WATCHER_INTERVAL_MS}ms).")
 
+        # Update checker + data-cap usage alerts are deferred (staged startup): neither is needed to
+        # paint the first number, and the update checker's first check is 5 s out anyway.
+        self._deferred_services_timer.start(constants.timeouts.DEFERRED_SERVICES_DELAY_MS)
+
+        # Cycle Timer
+        if self.config.get("widget_display_mode") == "cycle":
+            self._cycle_timer.start(constants.renderer.CYCLE_INTERVAL_MS)
+            self.logger.debug("Cycle timer started.")
+
+
+    def _start_deferred_services(self) -> None:
+        """Second startup stage: build the services the first paint / first number don't need."""
         # Data-cap usage alerts: check usage-vs-cap on a slow cadence (cheap; no-op unless
         # the cap + alerts are enabled). Notifies via the flyout (no system-tray icon).
         try:
@@ -243,16 +273,22 @@ class NetworkSpeedWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Could not start usage-alert controller: {e}", exc_info=True)
 
-        # Update Checker - delayed startup check
-        self.update_checker = UpdateChecker(self.config, self)
-        self.update_checker.update_available.connect(self._on_update_available)
-        if self.update_checker.should_check():
-            QTimer.singleShot(5000, self.update_checker.check_now)
+        # Update Checker - delayed startup check (a manual check may already have built it)
+        checker = self._ensure_update_checker()
+        if checker is not None and checker.should_check():
+            QTimer.singleShot(constants.timeouts.UPDATE_CHECK_DELAY_MS, checker.check_now)
 
-        # Cycle Timer
-        if self.config.get("widget_display_mode") == "cycle":
-            self._cycle_timer.start(constants.renderer.CYCLE_INTERVAL_MS)
-            self.logger.debug("Cycle timer started.")
+    def _ensure_update_checker(self) -> Optional[UpdateChecker]:
+        """The UpdateChecker, built on first use: by the deferred startup stage, or earlier by a manual
+        "Check for updates" clicked before that stage ran (which would otherwise do nothing at all)."""
+        if self.update_checker is None:
+            try:
+                self.update_checker = UpdateChecker(self.config, self)
+                self.update_checker.update_available.connect(self._on_update_available)
+            except Exception as e:
+                self.update_checker = None
+                self.logger.error(f"Could not start update checker: {e}", exc_info=True)
+        return self.update_checker
 
 
     def _init_core_components(self) -> None:
@@ -586,8 +622,18 @@ class NetworkSpeedWidget(QWidget):
             return
         self.upload_speed = upload_mbps
         self.download_speed = download_mbps
+        if getattr(self, "time_to_first_number_ms", 0.0) is None:   # first real number this session
+            self._record_first_number()
         self.update() # Trigger a repaint
 
+    def _record_first_number(self) -> None:
+        """Time-to-first-number: construction -> the first real speed reaching the widget. Always
+        logged; with --profile-startup it is also the point the startup report is written."""
+        self.time_to_first_number_ms = (time.monotonic() - self._startup_t0) * 1000.0
+        self.logger.info("Time to first number: %.0f ms", self.time_to_first_number_ms)
+        if startup_profiler.enabled:
+            startup_profiler.finish(FIRST_NUMBER)
+
 
     def update_cpu_usage(self, usage: float) -> None:
         """Update CPU usage and trigger repaint."""
@@ -764,6 +810,21 @@ class NetworkSpeedWidget(QWidget):
             # nothing, so a stalled monitor died silently; now it surfaces a calm flyout.
             self.monitor_thread.error_occurred.connect(self._on_monitor_error)
 
+            # --record-trace: capture every stats_ready payload for replay (core.stats_trace). Direct
+            # connection, so the write happens on the monitor thread, stamped when the tick was taken.
+            from netspeedtray.core.stats_trace import recorder_from_argv
+            self._trace_recorder = recorder_from_argv(sys.argv, self.config)
+            if self._trace_recorder is not None:
+                self.monitor_thread.stats_ready.connect(self._trace_recorder.record,
+                                                        Qt.ConnectionType.DirectConnection)
+                self.controller.trace_recorder = self._trace_recorder
+
+            # Hot-path instrumentation (utils.instrumentation): on while Settings > Advanced >
+            # Diagnostics is set (ConfigController re-applies it live). History reads report through
+            # the read pool's hook; every other hot path records itself.
+            instrumentation.set_enabled(bool(self.config.get("diagnostics_enabled", False)))
+            self.widget_state.add_read_hook(instrumentation.read_hook)
+
             # Start the monitoring thread
             self.monitor_thread.start()
 
@@ -826,6 +887,7 @@ class NetworkSpeedWidget(QWidget):
 
 
 
+    @timed("widget.paint")
     def paintEvent(self, event: QPaintEvent) -> None:
         """
         Handles all painting for the widget via the shared `render_widget` path so the
@@ -854,6 +916,8 @@ class NetworkSpeedWidget(QWidget):
                 network_width=getattr(self.layout_manager, "_network_width", None),
                 font=self.current_font,
             )
+            if startup_profiler.enabled:
+                startup_profiler.mark(FIRST_PAINT)
         except Exception as e:
             self.logger.error(f"Error in paintEvent: {e}", exc_info=True)
         finally:
@@ -1398,6 +1462,10 @@ class NetworkSpeedWidget(QWidget):
 
     def check_for_updates(self) -> None:
         """Manually trigger an update check (from menu)."""
+        # During the staged-startup window the checker isn't built yet; build it now rather than
+        # swallow the click.
+        if self.update_checker is None:
+            self._ensure_update_checker()
         if self.update_checker:
             # update_available is already wired to _on_update_available at construction
             # (persistent, see __init__). Do NOT connect a second handler here: on a manual
@@ -1685,7 +1753,8 @@ class NetworkSpeedWidget(QWidget):
     def get_unified_interface_list(self) -> List[str]:
         """
         Returns a comprehensive, sorted list of network interfaces by combining
-        currently active interfaces with all interfaces found in the history database.
+        currently active interfaces, the interfaces that reported this session (the
+        in-memory session buffer), and all interfaces found in the history database.
         This serves as the single source of truth for all UI elements.
         """
         if not self.controller or not self.widget_state:
@@ -1695,12 +1764,17 @@ class NetworkSpeedWidget(QWidget):
         try:
             # Call the controller directly, as it is the true source of the live list.
             live_interfaces = set(self.controller.get_available_interfaces())
+
+            # Interfaces with speeds in the session buffer: a NIC that reported this session but has
+            # since gone down, or whose rows haven't reached the database yet, stays selectable - and
+            # its Session graph is served from the buffer rather than the database.
+            session_interfaces = set(self.widget_state.get_session_interfaces())
             
             # Get interfaces from the database history
             historical_interfaces = set(self.widget_state.get_distinct_interfaces())
             
             # Combine them, which automatically handles duplicates, then sort for a consistent UI.
-            unified_list = sorted(list(live_interfaces.union(historical_interfaces)))
+            unified_list = sorted(live_interfaces | session_interfaces | historical_interfaces)
             
             self.logger.debug(f"Unified interface list created with {len(unified_list)} items.")
             return unified_list
@@ -1742,11 +1816,15 @@ class NetworkSpeedWidget(QWidget):
                 self.position_manager.stop_monitoring()
             
             if self._state_watcher_timer.isActive(): self._state_watcher_timer.stop()
+            if getattr(self, '_deferred_services_timer', None): self._deferred_services_timer.stop()
+            if getattr(self, '_usage_alert_timer', None): self._usage_alert_timer.stop()
             
             # --- Stop the background monitor thread ---
             if hasattr(self, 'monitor_thread') and self.monitor_thread:
                 self.logger.debug("Stopping StatsMonitorThread...")
                 self.monitor_thread.stop()
+            if getattr(self, '_trace_recorder', None):
+                self._trace_recorder.close()
 
             # --- Stop the latency probe thread ---
             if getattr(self, 'latency_probe', None):